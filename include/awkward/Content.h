@@ -41,6 +41,7 @@ namespace awkward {
     virtual const std::shared_ptr<Content> getitem_field(const std::string& key) const = 0;
     virtual const std::shared_ptr<Content> getitem_fields(const std::vector<std::string>& keys) const = 0;
     virtual const std::shared_ptr<Content> getitem(const Slice& where) const;
+    virtual const std::shared_ptr<Content> getitem_mask(const SliceMask& mask) const;
     virtual const std::shared_ptr<Content> getitem_next(const std::shared_ptr<SliceItem>& head, const Slice& tail, const Index64& advanced) const;
     virtual const std::shared_ptr<Content> getitem_next_jagged(const Index64& slicestarts, const Index64& slicestops, const std::shared_ptr<SliceItem>& slicecontent, const Slice& tail) const;
     virtual const std::shared_ptr<Content> carry(const Index64& carry) const = 0;
@@ -72,6 +73,7 @@ namespace awkward {
     const std::string tostring() const;
     const std::string tojson(bool pretty, int64_t maxdecimals) const;
     void tojson(FILE* destination, bool pretty, int64_t maxdecimals, int64_t buffersize) const;
+    void tojson(const std::function<void(const char*, int64_t)>& destination, bool lines, int64_t maxdecimals, int64_t buffersize) const;
     int64_t nbytes() const;
     const std::shared_ptr<Content> reduce(const Reducer& reducer, int64_t axis, bool mask, bool keepdims) const;
 
@@ -100,6 +102,7 @@ namespace awkward {
     virtual const std::shared_ptr<Content> getitem_next_jagged(const Index64& slicestarts, const Index64& slicestops, const SliceJagged64& slicecontent, const Slice& tail) const = 0;
 
   protected:
+    const std::shared_ptr<Content> getitem_first_mask(const SliceMask& mask, const Slice& tail) const;
     const std::shared_ptr<Content> getitem_next_array_wrap(const std::shared_ptr<Content>& outcontent, const std::vector<int64_t>& shape) const;
     const std::string parameters_tostring(const std::string& indent, const std::string& pre, const std::string& post) const;
 
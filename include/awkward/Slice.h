@@ -89,6 +89,26 @@ namespace awkward {
 
   typedef SliceArrayOf<int64_t> SliceArray64;
 
+  class EXPORT_SYMBOL SliceMask: public SliceItem {
+  public:
+    SliceMask(const IndexU8& mask, int64_t length, bool bitmask, bool lsb_order);
+    const IndexU8 mask() const;
+    int64_t length() const;
+    bool bitmask() const;
+    bool lsb_order() const;
+    int64_t numtrue() const;
+    const Index64 tocarry(int64_t lenarray) const;
+    const std::shared_ptr<SliceArray64> toarray() const;
+    const std::shared_ptr<SliceItem> shallow_copy() const override;
+    const std::string tostring() const override;
+    bool preserves_type(const Index64& advanced) const override;
+  private:
+    const IndexU8 mask_;
+    const int64_t length_;
+    const bool bitmask_;
+    const bool lsb_order_;
+  };
+
   class EXPORT_SYMBOL SliceField: public SliceItem {
   public:
     SliceField(const std::string& key);
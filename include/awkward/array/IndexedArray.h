@@ -17,9 +17,17 @@ namespace awkward {
   class EXPORT_SYMBOL IndexedArrayOf: public Content {
   public:
     IndexedArrayOf<T, ISOPTION>(const std::shared_ptr<Identities>& identities, const util::Parameters& parameters, const IndexOf<T>& index, const std::shared_ptr<Content>& content);
+    // isdeferred marks a RecordArray field whose carry hasn't been applied:
+    // further carries compose its index and reading the field projects it
+    IndexedArrayOf<T, ISOPTION>(const std::shared_ptr<Identities>& identities, const util::Parameters& parameters, const IndexOf<T>& index, const std::shared_ptr<Content>& content, bool isdeferred);
+    // iscategorical marks a content of distinct values (from a categorical
+    // StringBuilder), so equal values have equal indexes
+    IndexedArrayOf<T, ISOPTION>(const std::shared_ptr<Identities>& identities, const util::Parameters& parameters, const IndexOf<T>& index, const std::shared_ptr<Content>& content, bool isdeferred, bool iscategorical);
     const IndexOf<T> index() const;
     const std::shared_ptr<Content> content() const;
     bool isoption() const;
+    bool isdeferred() const;
+    bool iscategorical() const;
     const std::shared_ptr<Content> project() const;
     const std::shared_ptr<Content> project(const Index8& mask) const;
     const Index8 bytemask() const;
@@ -89,6 +97,8 @@ namespace awkward {
   private:
     const IndexOf<T> index_;
     const std::shared_ptr<Content> content_;
+    const bool isdeferred_;
+    const bool iscategorical_;
   };
 
   typedef IndexedArrayOf<int32_t, false>  IndexedArray32;
@@ -76,6 +76,7 @@ namespace awkward {
     const std::shared_ptr<Content> getitem_field(const std::string& key) const override;
     const std::shared_ptr<Content> getitem_fields(const std::vector<std::string>& keys) const override;
     const std::shared_ptr<Content> getitem(const Slice& where) const override;
+    const std::shared_ptr<Content> getitem_mask(const SliceMask& mask) const override;
     const std::shared_ptr<Content> getitem_next(const std::shared_ptr<SliceItem>& head, const Slice& tail, const Index64& advanced) const override;
     const std::shared_ptr<Content> carry(const Index64& carry) const override;
     const std::string purelist_parameter(const std::string& key) const override;
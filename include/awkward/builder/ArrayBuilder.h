@@ -13,13 +13,18 @@
 namespace awkward {
   class EXPORT_SYMBOL ArrayBuilder {
   public:
+    static const std::shared_ptr<Content> merge(const std::vector<const ArrayBuilder*>& builders);
+    static const std::shared_ptr<Content> merge_snapshots(const std::vector<std::shared_ptr<Content>>& snapshots);
+
     ArrayBuilder(const ArrayBuilderOptions& options);
+    ArrayBuilder(const std::shared_ptr<Type>& type, const ArrayBuilderOptions& options);
 
     const std::string tostring() const;
     int64_t length() const;
     void clear();
     const std::shared_ptr<Type> type(const std::map<std::string, std::string>& typestrs) const;
     const std::shared_ptr<Content> snapshot() const;
+    const std::shared_ptr<Content> finalize();
     const std::shared_ptr<Content> getitem_at(int64_t at) const;
     const std::shared_ptr<Content> getitem_range(int64_t start, int64_t stop) const;
     const std::shared_ptr<Content> getitem_field(const std::string& key) const;
@@ -30,6 +35,9 @@ namespace awkward {
     void boolean(bool x);
     void integer(int64_t x);
     void real(double x);
+    void booleans(const bool* x, int64_t length);
+    void integers(const int64_t* x, int64_t length);
+    void reals(const double* x, int64_t length);
     void bytestring(const char* x);
     void bytestring(const char* x, int64_t length);
     void bytestring(const std::string& x);
@@ -59,6 +67,7 @@ namespace awkward {
     static const char* no_encoding;
     static const char* utf8_encoding;
 
+    const ArrayBuilderOptions options_;
     std::shared_ptr<Builder> builder_;
   };
 }
@@ -12,12 +12,17 @@ namespace awkward {
   class EXPORT_SYMBOL ArrayBuilderOptions {
   public:
     ArrayBuilderOptions(int64_t initial, double resize);
+    ArrayBuilderOptions(int64_t initial, double resize, bool narrow, bool categorical);
     int64_t initial() const;
     double resize() const;
+    bool narrow() const;
+    bool categorical() const;
 
   private:
     int64_t initial_;
     double resize_;
+    bool narrow_;
+    bool categorical_;
   };
 }
 
@@ -18,6 +18,7 @@ namespace awkward {
     virtual const std::string classname() const = 0;
     virtual int64_t length() const = 0;
     virtual void clear() = 0;
+    virtual void shrink_to_fit() = 0;
     virtual const std::shared_ptr<Content> snapshot() const = 0;
 
     virtual bool active() const = 0;
@@ -36,6 +37,11 @@ namespace awkward {
     virtual const std::shared_ptr<Builder> endrecord() = 0;
     virtual const std::shared_ptr<Builder> append(const std::shared_ptr<Content>& array, int64_t at) = 0;
 
+    // bulk versions of boolean/integer/real; the defaults fill one by one
+    virtual const std::shared_ptr<Builder> booleans(const bool* x, int64_t length);
+    virtual const std::shared_ptr<Builder> integers(const int64_t* x, int64_t length);
+    virtual const std::shared_ptr<Builder> reals(const double* x, int64_t length);
+
     void setthat(const std::shared_ptr<Builder>& that);
 
   protected:
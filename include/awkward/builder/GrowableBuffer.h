@@ -5,6 +5,7 @@
 
 #include <cmath>
 #include <cstring>
+#include <vector>
 
 #include "awkward/cpu-kernels/util.h"
 #include "awkward/builder/ArrayBuilderOptions.h"
@@ -26,15 +27,35 @@ namespace awkward {
     void set_length(int64_t newlength);
     int64_t reserved() const;
     void set_reserved(int64_t minreserved);
+    void shrink_to_fit();
     void clear();
     void append(T datum);
+    void extend(const T* ptr, int64_t length);
     T getitem_at_nowrap(int64_t at) const;
 
+    template <typename TO>
+    const std::shared_ptr<TO> copy_as() const {
+      const T* raw = ptr().get();
+      std::shared_ptr<TO> out(new TO[(size_t)length_], util::array_deleter<TO>());
+      TO* rawout = out.get();
+      for (int64_t i = 0;  i < length_;  i++) {
+        rawout[i] = (TO)raw[i];
+      }
+      return out;
+    }
+
   private:
+    void addchunk(int64_t minreserve);
+    void flatten(int64_t reserved) const;
+
     const ArrayBuilderOptions options_;
-    std::shared_ptr<T> ptr_;
+    // filled chunks are never moved; ptr_ is the one being filled
+    mutable std::vector<std::shared_ptr<T>> chunks_;
+    mutable std::vector<int64_t> chunkstarts_;
+    mutable std::shared_ptr<T> ptr_;
+    mutable int64_t ptrstart_;
     int64_t length_;
-    int64_t reserved_;
+    mutable int64_t reserved_;
   };
 }
 
@@ -21,6 +21,7 @@ namespace awkward {
 
     int64_t length() const override;
     void clear() override;
+    void shrink_to_fit() override;
 
     bool active() const override;
     const std::shared_ptr<Builder> null() override;
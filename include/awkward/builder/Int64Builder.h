@@ -19,6 +19,7 @@ namespace awkward {
     const std::string classname() const override;
     int64_t length() const override;
     void clear() override;
+    void shrink_to_fit() override;
     const std::shared_ptr<Content> snapshot() const override;
 
     bool active() const override;
@@ -36,6 +37,7 @@ namespace awkward {
     const std::shared_ptr<Builder> field(const char* key, bool check) override;
     const std::shared_ptr<Builder> endrecord() override;
     const std::shared_ptr<Builder> append(const std::shared_ptr<Content>& array, int64_t at) override;
+    const std::shared_ptr<Builder> integers(const int64_t* x, int64_t length) override;
 
   private:
     const ArrayBuilderOptions options_;
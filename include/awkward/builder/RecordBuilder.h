@@ -4,6 +4,7 @@
 #define AWKWARD_RECORDBUILDER_H_
 
 #include <vector>
+#include <unordered_map>
 
 #include "awkward/cpu-kernels/util.h"
 #include "awkward/builder/ArrayBuilderOptions.h"
@@ -24,6 +25,7 @@ namespace awkward {
     const std::string classname() const override;
     int64_t length() const override;
     void clear() override;
+    void shrink_to_fit() override;
     const std::shared_ptr<Content> snapshot() const override;
 
     bool active() const override;
@@ -41,6 +43,9 @@ namespace awkward {
     const std::shared_ptr<Builder> field(const char* key, bool check) override;
     const std::shared_ptr<Builder> endrecord() override;
     const std::shared_ptr<Builder> append(const std::shared_ptr<Content>& array, int64_t at) override;
+    const std::shared_ptr<Builder> booleans(const bool* x, int64_t length) override;
+    const std::shared_ptr<Builder> integers(const int64_t* x, int64_t length) override;
+    const std::shared_ptr<Builder> reals(const double* x, int64_t length) override;
 
   private:
     const std::shared_ptr<Builder> field_fast(const char* key);
@@ -56,7 +61,10 @@ namespace awkward {
     bool begun_;
     int64_t nextindex_;
     int64_t nexttotry_;
+    std::unordered_map<std::string, int64_t> keyslots_;
+    std::unordered_map<const char*, int64_t> pointerslots_;
 
+    const std::shared_ptr<Builder> newfield(const char* key, const char* pointer);
     void maybeupdate(int64_t i, const std::shared_ptr<Builder>& tmp);
   };
 }
@@ -3,6 +3,9 @@
 #ifndef AWKWARD_STRINGBUILDER_H_
 #define AWKWARD_STRINGBUILDER_H_
 
+#include <string>
+#include <unordered_map>
+
 #include "awkward/cpu-kernels/util.h"
 #include "awkward/builder/ArrayBuilderOptions.h"
 #include "awkward/builder/GrowableBuffer.h"
@@ -19,6 +22,7 @@ namespace awkward {
     const std::string classname() const override;
     int64_t length() const override;
     void clear() override;
+    void shrink_to_fit() override;
     const std::shared_ptr<Content> snapshot() const override;
 
     bool active() const override;
@@ -42,6 +46,10 @@ namespace awkward {
     GrowableBuffer<int64_t> offsets_;
     GrowableBuffer<uint8_t> content_;
     const char* encoding_;
+    // in categorical mode, offsets_ and content_ hold each distinct string once
+    GrowableBuffer<int32_t> index_;
+    std::unordered_map<std::string, int32_t> dictionary_;
+    std::string key_;
   };
 }
 
@@ -0,0 +1,53 @@
+// BSD 3-Clause License; see https://github.com/jpivarski/awkward-1.0/blob/master/LICENSE
+
+#ifndef AWKWARD_TYPEDBUILDER_H_
+#define AWKWARD_TYPEDBUILDER_H_
+
+#include <memory>
+#include <vector>
+
+#include "awkward/cpu-kernels/util.h"
+#include "awkward/builder/ArrayBuilderOptions.h"
+#include "awkward/builder/Builder.h"
+
+namespace awkward {
+  class EXPORT_SYMBOL TypedBuilder: public Builder {
+  public:
+    static const std::shared_ptr<Builder> fromtype(const std::shared_ptr<Type>& type, const ArrayBuilderOptions& options);
+
+    TypedBuilder(const std::shared_ptr<Type>& type, const ArrayBuilderOptions& options);
+    ~TypedBuilder();
+    const std::shared_ptr<Type> type() const;
+    const std::shared_ptr<Content> concatenate(const std::vector<const TypedBuilder*>& parts) const;
+    const std::shared_ptr<Builder> uinteger(uint64_t x);
+
+    const std::string classname() const override;
+    int64_t length() const override;
+    void clear() override;
+    void shrink_to_fit() override;
+    const std::shared_ptr<Content> snapshot() const override;
+
+    bool active() const override;
+    const std::shared_ptr<Builder> null() override;
+    const std::shared_ptr<Builder> boolean(bool x) override;
+    const std::shared_ptr<Builder> integer(int64_t x) override;
+    const std::shared_ptr<Builder> real(double x) override;
+    const std::shared_ptr<Builder> string(const char* x, int64_t length, const char* encoding) override;
+    const std::shared_ptr<Builder> beginlist() override;
+    const std::shared_ptr<Builder> endlist() override;
+    const std::shared_ptr<Builder> begintuple(int64_t numfields) override;
+    const std::shared_ptr<Builder> index(int64_t index) override;
+    const std::shared_ptr<Builder> endtuple() override;
+    const std::shared_ptr<Builder> beginrecord(const char* name, bool check) override;
+    const std::shared_ptr<Builder> field(const char* key, bool check) override;
+    const std::shared_ptr<Builder> endrecord() override;
+    const std::shared_ptr<Builder> append(const std::shared_ptr<Content>& array, int64_t at) override;
+
+  private:
+    const std::shared_ptr<Type> type_;
+    class Impl;
+    std::unique_ptr<Impl> impl_;
+  };
+}
+
+#endif // AWKWARD_TYPEDBUILDER_H_
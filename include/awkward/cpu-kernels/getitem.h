@@ -153,6 +153,13 @@ extern "C" {
 
   EXPORT_SYMBOL struct Error awkward_bytemaskedarray_toindexedarray_64(int64_t* toindex, const int8_t* mask, int64_t maskoffset, int64_t length, bool validwhen);
 
+  EXPORT_SYMBOL struct Error awkward_slicemask_numtrue(int64_t* numtrue, const uint8_t* mask, int64_t maskoffset, int64_t length, bool bitmask, bool lsb_order);
+  EXPORT_SYMBOL struct Error awkward_slicemask_nonzero_64(int64_t* tocarry, const uint8_t* mask, int64_t maskoffset, int64_t length, bool bitmask, bool lsb_order, int64_t lenarray);
+  EXPORT_SYMBOL struct Error awkward_numpyarray_getitem_slicemask(uint8_t* toptr, const uint8_t* fromptr, int64_t byteoffset, int64_t stride, int64_t lenarray, const uint8_t* mask, int64_t maskoffset, int64_t length, bool bitmask, bool lsb_order);
+  EXPORT_SYMBOL struct Error awkward_listoffsetarray32_getitem_slicemask(int32_t* tostarts, int32_t* tostops, const int32_t* fromoffsets, int64_t offsetsoffset, int64_t lenarray, const uint8_t* mask, int64_t maskoffset, int64_t length, bool bitmask, bool lsb_order);
+  EXPORT_SYMBOL struct Error awkward_listoffsetarrayU32_getitem_slicemask(uint32_t* tostarts, uint32_t* tostops, const uint32_t* fromoffsets, int64_t offsetsoffset, int64_t lenarray, const uint8_t* mask, int64_t maskoffset, int64_t length, bool bitmask, bool lsb_order);
+  EXPORT_SYMBOL struct Error awkward_listoffsetarray64_getitem_slicemask(int64_t* tostarts, int64_t* tostops, const int64_t* fromoffsets, int64_t offsetsoffset, int64_t lenarray, const uint8_t* mask, int64_t maskoffset, int64_t length, bool bitmask, bool lsb_order);
+
 }
 
 #endif // AWKWARDCPU_GETITEM_H_
@@ -0,0 +1,66 @@
+// BSD 3-Clause License; see https://github.com/jpivarski/awkward-1.0/blob/master/LICENSE
+
+#ifndef AWKWARDCPU_PARALLEL_H_
+#define AWKWARDCPU_PARALLEL_H_
+
+#include <algorithm>
+#include <functional>
+#include <vector>
+
+#include "awkward/cpu-kernels/util.h"
+
+extern "C" {
+  EXPORT_SYMBOL void awkward_set_num_threads(int64_t numthreads);
+  EXPORT_SYMBOL int64_t awkward_get_num_threads();
+}
+
+// Loops shorter than this stay serial: splitting them costs more than it saves.
+const int64_t kParallelThreshold = 65536;
+
+// Calls task(0), ..., task(numtasks - 1) on the thread pool (the calling thread
+// takes tasks, too) and returns when they have all finished. If the pool is in use
+// by another thread's kernel, the tasks run serially instead.
+void awkward_parallel_run(int64_t numtasks, const std::function<void(int64_t)>& task);
+
+// Number of chunks that a loop over length items is split into (1 means serial).
+inline int64_t awkward_parallel_numchunks(int64_t length) {
+  int64_t numthreads = awkward_get_num_threads();
+  if (numthreads <= 1  ||  length < kParallelThreshold) {
+    return 1;
+  }
+  return std::min(numthreads, length / (kParallelThreshold / 4));
+}
+
+// Splits [0, length) into numchunks contiguous chunks (from awkward_parallel_numchunks)
+// and calls body(chunk, start, stop) on each; body returns success() or a failure.
+// Chunks are in order, so the first failing chunk has the same failure that a
+// serial loop would have stopped at.
+template <typename F>
+ERROR awkward_parallel_chunks(int64_t length, int64_t numchunks, const F& body) {
+  if (numchunks == 1) {
+    return body(0, 0, length);
+  }
+  int64_t chunksize = (length + numchunks - 1) / numchunks;
+  std::vector<struct Error> errors((size_t)numchunks, success());
+  awkward_parallel_run(numchunks, [&](int64_t chunk) -> void {
+    int64_t start = std::min(chunk*chunksize, length);
+    int64_t stop = std::min(start + chunksize, length);
+    errors[(size_t)chunk] = body(chunk, start, stop);
+  });
+  for (auto err : errors) {
+    if (err.str != nullptr) {
+      return err;
+    }
+  }
+  return success();
+}
+
+// The same, for loops whose items are independent: body(start, stop).
+template <typename F>
+ERROR awkward_parallel_for(int64_t length, const F& body) {
+  return awkward_parallel_chunks(length, awkward_parallel_numchunks(length), [&](int64_t chunk, int64_t start, int64_t stop) -> ERROR {
+    return body(start, stop);
+  });
+}
+
+#endif // AWKWARDCPU_PARALLEL_H_
@@ -5,6 +5,7 @@
 
 #include <cstdio>
 #include <string>
+#include <functional>
 
 #include "awkward/builder/ArrayBuilderOptions.h"
 #include "awkward/cpu-kernels/util.h"
@@ -12,9 +13,30 @@
 
 namespace awkward {
   class Content;
+  class Type;
 
   EXPORT_SYMBOL const std::shared_ptr<Content> FromJsonString(const char* source, const ArrayBuilderOptions& options);
+  EXPORT_SYMBOL const std::shared_ptr<Content> FromJsonString(const char* source, const std::shared_ptr<Type>& type, const ArrayBuilderOptions& options);
   EXPORT_SYMBOL const std::shared_ptr<Content> FromJsonFile(FILE* source, const ArrayBuilderOptions& options, int64_t buffersize);
+  EXPORT_SYMBOL const std::shared_ptr<Content> FromJsonFile(FILE* source, const std::shared_ptr<Type>& type, const ArrayBuilderOptions& options, int64_t buffersize);
+
+  EXPORT_SYMBOL bool SimdjsonEnabled();
+  EXPORT_SYMBOL const std::shared_ptr<Content> FromJsonStringSimdjson(const char* source, int64_t length, const ArrayBuilderOptions& options, bool lines);
+  EXPORT_SYMBOL const std::shared_ptr<Content> FromJsonFileSimdjson(const std::string& filename, const ArrayBuilderOptions& options, bool lines);
+
+  EXPORT_SYMBOL const std::shared_ptr<Content> FromJsonLinesParallel(const char* data, int64_t length, const std::shared_ptr<Type>& type, const ArrayBuilderOptions& options, int64_t numthreads);
+
+  class EXPORT_SYMBOL FromJsonLines {
+  public:
+    FromJsonLines(const char* source, const std::shared_ptr<Type>& type, const ArrayBuilderOptions& options);
+    FromJsonLines(FILE* source, const std::shared_ptr<Type>& type, const ArrayBuilderOptions& options, int64_t buffersize);
+    ~FromJsonLines();
+    int64_t numlines() const;
+    const std::shared_ptr<Content> next(int64_t chunksize);
+  private:
+    class Impl;
+    Impl* impl_;
+  };
 
   class EXPORT_SYMBOL ToJson {
   public:
@@ -107,6 +129,27 @@ namespace awkward {
     class Impl;
     Impl* impl_;
   };
+
+  class EXPORT_SYMBOL ToJsonStream: public ToJson {
+  public:
+    ToJsonStream(const std::function<void(const char*, int64_t)>& destination, int64_t maxdecimals, int64_t buffersize);
+    ~ToJsonStream();
+    void null() override;
+    void boolean(bool x) override;
+    void integer(int64_t x) override;
+    void real(double x) override;
+    void string(const char* x, int64_t length) override;
+    void beginlist() override;
+    void endlist() override;
+    void beginrecord() override;
+    void field(const char* x) override;
+    void endrecord() override;
+    void newline();
+    void flush();
+  private:
+    class Impl;
+    Impl* impl_;
+  };
 }
 
 #endif // AWKWARD_IO_JSON_H_
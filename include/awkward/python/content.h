@@ -22,6 +22,9 @@
 #include "awkward/array/RecordArray.h"
 #include "awkward/array/RegularArray.h"
 #include "awkward/array/UnionArray.h"
+#include "awkward/array/VirtualArray.h"
+#include "awkward/virtual/ArrayGenerator.h"
+#include "awkward/virtual/ArrayCache.h"
 
 namespace py = pybind11;
 namespace ak = awkward;
@@ -72,4 +75,44 @@ py::class_<ak::RegularArray, std::shared_ptr<ak::RegularArray>, ak::Content> mak
 template <typename T, typename I>
 py::class_<ak::UnionArrayOf<T, I>, std::shared_ptr<ak::UnionArrayOf<T, I>>, ak::Content> make_UnionArrayOf(const py::handle& m, const std::string& name);
 
+class PyArrayGenerator: public ak::ArrayGenerator {
+public:
+  PyArrayGenerator(const std::shared_ptr<ak::Type>& type, int64_t length, const py::object& callable, const py::tuple& args, const py::dict& kwargs);
+  const py::object callable() const;
+  const py::tuple args() const;
+  const py::dict kwargs() const;
+
+  const std::shared_ptr<ak::Content> generate() const override;
+  const std::string tostring_part(const std::string& indent, const std::string& pre, const std::string& post) const override;
+  const std::shared_ptr<ak::ArrayGenerator> shallow_copy() const override;
+
+private:
+  const py::object callable_;
+  const py::tuple args_;
+  const py::dict kwargs_;
+};
+
+py::class_<PyArrayGenerator, std::shared_ptr<PyArrayGenerator>> make_PyArrayGenerator(const py::handle& m, const std::string& name);
+
+py::class_<ak::SliceGenerator, std::shared_ptr<ak::SliceGenerator>> make_SliceGenerator(const py::handle& m, const std::string& name);
+
+class PyArrayCache: public ak::ArrayCache {
+public:
+  PyArrayCache(const py::object& mutablemapping);
+  const py::object mutablemapping() const;
+
+  const std::shared_ptr<ak::Content> get(const std::string& key) override;
+  void set(const std::string& key, const std::shared_ptr<ak::Content>& value) override;
+  const std::string tostring_part(const std::string& indent, const std::string& pre, const std::string& post) const override;
+
+private:
+  const py::object mutablemapping_;
+};
+
+py::class_<PyArrayCache, std::shared_ptr<PyArrayCache>> make_PyArrayCache(const py::handle& m, const std::string& name);
+
+py::class_<ak::LRUCache, std::shared_ptr<ak::LRUCache>> make_LRUCache(const py::handle& m, const std::string& name);
+
+py::class_<ak::VirtualArray, std::shared_ptr<ak::VirtualArray>, ak::Content> make_VirtualArray(const py::handle& m, const std::string& name);
+
 #endif // AWKWARDPY_CONTENT_H_
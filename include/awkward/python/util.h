@@ -26,6 +26,8 @@ public:
     Py_INCREF(pyobj_);
   }
   void operator()(T const *p) {
+    // the last reference may be dropped while the GIL is released
+    py::gil_scoped_acquire acquire;
     Py_DECREF(pyobj_);
   }
 private:
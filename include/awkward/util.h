@@ -89,6 +89,8 @@ namespace awkward {
     template <typename T>
     ERROR awkward_listarray_getitem_carry_64(T* tostarts, T* tostops, const T* fromstarts, const T* fromstops, const int64_t* fromcarry, int64_t startsoffset, int64_t stopsoffset, int64_t lenstarts, int64_t lencarry);
     template <typename T>
+    ERROR awkward_listoffsetarray_getitem_slicemask(T* tostarts, T* tostops, const T* fromoffsets, int64_t offsetsoffset, int64_t lenarray, const uint8_t* mask, int64_t maskoffset, int64_t length, bool bitmask, bool lsb_order);
+    template <typename T>
     ERROR awkward_listarray_num_64(int64_t* tonum, const T* fromstarts, int64_t startsoffset, const T* fromstops, int64_t stopsoffset, int64_t length);
     template <typename T>
     ERROR awkward_listoffsetarray_flatten_offsets_64(int64_t* tooffsets, const T* outeroffsets, int64_t outeroffsetsoffset, int64_t outeroffsetslen, const int64_t* inneroffsets, int64_t inneroffsetsoffset, int64_t inneroffsetslen);
@@ -0,0 +1,54 @@
+// BSD 3-Clause License; see https://github.com/jpivarski/awkward-1.0/blob/master/LICENSE
+
+#ifndef AWKWARD_ARRAYCACHE_H_
+#define AWKWARD_ARRAYCACHE_H_
+
+#include <string>
+#include <memory>
+#include <list>
+#include <unordered_map>
+#include <vector>
+#include <mutex>
+
+#include "awkward/cpu-kernels/util.h"
+#include "awkward/Content.h"
+
+namespace awkward {
+  class EXPORT_SYMBOL ArrayCache {
+  public:
+    virtual ~ArrayCache();
+
+    virtual const std::shared_ptr<Content> get(const std::string& key) = 0;
+    virtual void set(const std::string& key, const std::shared_ptr<Content>& value) = 0;
+    virtual const std::string tostring_part(const std::string& indent, const std::string& pre, const std::string& post) const = 0;
+  };
+
+  class EXPORT_SYMBOL LRUCache: public ArrayCache {
+  public:
+    LRUCache(int64_t maxbytes);
+
+    int64_t maxbytes() const;
+    int64_t nbytes() const;
+    int64_t length() const;
+    bool has(const std::string& key) const;
+    const std::vector<std::string> keys() const;
+    void clear();
+
+    const std::shared_ptr<Content> get(const std::string& key) override;
+    void set(const std::string& key, const std::shared_ptr<Content>& value) override;
+    const std::string tostring_part(const std::string& indent, const std::string& pre, const std::string& post) const override;
+
+  private:
+    typedef std::pair<std::string, std::pair<std::shared_ptr<Content>, int64_t>> Entry;
+
+    void evict();
+
+    const int64_t maxbytes_;
+    int64_t nbytes_;
+    std::list<Entry> entries_;
+    std::unordered_map<std::string, std::list<Entry>::iterator> lookup_;
+    mutable std::mutex mutex_;
+  };
+}
+
+#endif // AWKWARD_ARRAYCACHE_H_
@@ -0,0 +1,53 @@
+// BSD 3-Clause License; see https://github.com/jpivarski/awkward-1.0/blob/master/LICENSE
+
+#ifndef AWKWARD_ARRAYGENERATOR_H_
+#define AWKWARD_ARRAYGENERATOR_H_
+
+#include <string>
+#include <memory>
+
+#include "awkward/cpu-kernels/util.h"
+#include "awkward/Content.h"
+#include "awkward/type/Type.h"
+
+namespace awkward {
+  class EXPORT_SYMBOL ArrayGenerator {
+  public:
+    ArrayGenerator(const std::shared_ptr<Type>& type, int64_t length);
+    virtual ~ArrayGenerator();
+
+    const std::shared_ptr<Type> type() const;
+    int64_t length() const;
+
+    virtual const std::shared_ptr<Content> generate() const = 0;
+    virtual const std::string tostring_part(const std::string& indent, const std::string& pre, const std::string& post) const = 0;
+    virtual const std::shared_ptr<ArrayGenerator> shallow_copy() const = 0;
+
+    const std::shared_ptr<Content> generate_and_check() const;
+    const std::string tostring() const;
+
+  protected:
+    const std::shared_ptr<Type> type_;
+    const int64_t length_;
+  };
+
+  class EXPORT_SYMBOL SliceGenerator: public ArrayGenerator {
+  public:
+    SliceGenerator(const std::shared_ptr<Type>& type, int64_t length, const std::shared_ptr<Content>& content, int64_t start, int64_t stop);
+
+    const std::shared_ptr<Content> content() const;
+    int64_t start() const;
+    int64_t stop() const;
+
+    const std::shared_ptr<Content> generate() const override;
+    const std::string tostring_part(const std::string& indent, const std::string& pre, const std::string& post) const override;
+    const std::shared_ptr<ArrayGenerator> shallow_copy() const override;
+
+  private:
+    const std::shared_ptr<Content> content_;
+    const int64_t start_;
+    const int64_t stop_;
+  };
+}
+
+#endif // AWKWARD_ARRAYGENERATOR_H_
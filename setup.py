@@ -144,7 +144,8 @@ setup(name = "awkward1",
           ("include/awkward/array",       glob.glob("include/awkward/array/*.h")),
           ("include/awkward/builder",     glob.glob("include/awkward/builder/*.h")),
           ("include/awkward/io",          glob.glob("include/awkward/io/*.h")),
-          ("include/awkward/type",        glob.glob("include/awkward/type/*.h"))],
+          ("include/awkward/type",        glob.glob("include/awkward/type/*.h")),
+          ("include/awkward/virtual",     glob.glob("include/awkward/virtual/*.h"))],
       version = open("VERSION_INFO").read().strip(),
       author = "Jim Pivarski",
       author_email = "pivarski@princeton.edu",
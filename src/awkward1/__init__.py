@@ -15,6 +15,10 @@ if distutils.version.LooseVersion(numpy.__version__) < distutils.version.LooseVe
 import awkward1.layout
 import awkward1.types
 
+# kernel thread pool
+from awkward1._util import set_num_threads
+from awkward1._util import get_num_threads
+
 # high-level interface
 behavior = {}
 from awkward1.highlevel import Array
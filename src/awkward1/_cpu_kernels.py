@@ -19,3 +19,17 @@ else:
 libpath = pkg_resources.resource_filename("awkward1", name)
 
 lib = ctypes.cdll.LoadLibrary(libpath)
+
+# void awkward_set_num_threads(int64_t numthreads);
+set_num_threads = lib.awkward_set_num_threads
+set_num_threads.argtypes = [ctypes.c_int64]
+set_num_threads.restype  = None
+
+# int64_t awkward_get_num_threads();
+get_num_threads = lib.awkward_get_num_threads
+get_num_threads.argtypes = []
+get_num_threads.restype  = ctypes.c_int64
+
+# this copy of the kernels starts with the same thread pool size as the others
+import awkward1.layout
+set_num_threads(awkward1.layout._get_num_threads())
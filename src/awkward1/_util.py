@@ -15,6 +15,7 @@ except ImportError:
 import numpy
 
 import awkward1.layout
+import awkward1._io
 
 py27 = (sys.version_info[0] < 3)
 win  = (os.name == "nt")
@@ -31,6 +32,19 @@ listtypes = (awkward1.layout.RegularArray, awkward1.layout.ListArray32, awkward1
 
 recordtypes = (awkward1.layout.RecordArray,)
 
+virtualtypes = (awkward1.layout.VirtualArray,)
+
+def set_num_threads(n):
+    # each compiled module has its own copy of the cpu-kernels (and its pool)
+    n = int(n)
+    awkward1.layout._set_num_threads(n)
+    awkward1._io._set_num_threads(n)
+    if "awkward1._cpu_kernels" in sys.modules:
+        sys.modules["awkward1._cpu_kernels"].set_num_threads(n)
+
+def get_num_threads():
+    return awkward1.layout._get_num_threads()
+
 class Behavior(Mapping):
     def __init__(self, defaults, overrides):
         self.defaults = defaults
@@ -289,6 +303,16 @@ def key2index(keys, key):
 
 key2index._pattern = re.compile(r"^[1-9][0-9]*$")
 
+def packbits_lsb(bits):
+    # like numpy.packbits(bits, bitorder="little"), which needs NumPy 1.17
+    padded = numpy.zeros(-(-len(bits) // 8) * 8, dtype=numpy.bool_)
+    padded[:len(bits)] = bits
+    return numpy.packbits(padded.reshape(-1, 8)[:, ::-1])
+
+def unpackbits_lsb(bytes, length, offset=0):
+    bits = numpy.unpackbits(numpy.asarray(bytes, dtype=numpy.uint8).reshape(-1, 1), axis=1)[:, ::-1]
+    return bits.reshape(-1)[offset : offset + length].astype(numpy.bool_)
+
 def completely_flatten(array):
     if isinstance(array, unknowntypes):
         return (numpy.array([], dtype=numpy.bool_),)
@@ -328,6 +352,10 @@ def broadcast_and_apply(inputs, getfunction):
                 raise ValueError("cannot broadcast {0} of length {1} with {2} of length {3}".format(type(inputs[0]).__name__, length, type(x).__name__, len(x)))
 
     def apply(inputs, depth):
+        # materialize any VirtualArrays; broadcasting needs their buffers
+        if any(isinstance(x, virtualtypes) for x in inputs):
+            return apply([x if not isinstance(x, virtualtypes) else x.array for x in inputs], depth)
+
         # handle implicit right-broadcasting (i.e. NumPy-like)
         if any(isinstance(x, listtypes) for x in inputs):
             maxdepth = max(x.purelist_depth for x in inputs if isinstance(x, awkward1.layout.Content))
@@ -612,6 +640,9 @@ def recursively_apply(layout, getfunction, args=(), depth=1):
     elif isinstance(layout, awkward1.layout.UnionArray8_64):
         return awkward1.layout.UnionArray8_64(layout.tags, layout.index, [recursively_apply(x, getfunction, args, depth) for x in layout.contents], layout.identities, layout.parameters)
 
+    elif isinstance(layout, awkward1.layout.VirtualArray):
+        return recursively_apply(layout.array, getfunction, args, depth)
+
     else:
         raise AssertionError("unrecognized Content type: {0}".format(type(layout)))
 
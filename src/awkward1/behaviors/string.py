@@ -57,7 +57,23 @@ awkward1.behavior["__typestr__", "bytestring"] = "bytes"
 awkward1.behavior["string"] = StringBehavior
 awkward1.behavior["__typestr__", "string"] = "string"
 
+def _dictionary(layout):
+    # categorical strings (from ArrayBuilder(categorical=True)) are an
+    # IndexedArray marked iscategorical over unique strings; returns the
+    # buffers that identify it
+    if isinstance(layout, (awkward1.layout.IndexedArray32, awkward1.layout.IndexedArrayU32, awkward1.layout.IndexedArray64)) and layout.iscategorical and isinstance(layout.content, (awkward1.layout.ListOffsetArray32, awkward1.layout.ListOffsetArrayU32, awkward1.layout.ListOffsetArray64)):
+        offsets = numpy.asarray(layout.content.offsets)
+        content = numpy.asarray(layout.content.content)
+        return (offsets.ctypes.data, len(offsets), content.ctypes.data, len(content))
+    else:
+        return None
+
 def string_equal(one, two):
+    # with the same dictionary of unique strings, equal strings have equal indexes
+    dictionary = _dictionary(one)
+    if dictionary is not None and dictionary == _dictionary(two):
+        return awkward1.layout.NumpyArray(numpy.asarray(one.index) == numpy.asarray(two.index))
+
     # first condition: string lengths must be the same
     counts1 = numpy.asarray(one.count(axis=-1))
     counts2 = numpy.asarray(two.count(axis=-1))
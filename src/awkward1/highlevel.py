@@ -147,6 +147,12 @@ class Array(awkward1._connect._numpy.NDArrayOperatorsMixin, awkward1._connect._p
 
         return "<Array {0} type={1}>".format(value, type)
 
+    def __getstate__(self):
+        return (self._layout, self._behavior)
+
+    def __setstate__(self, state):
+        self.layout, self.behavior = state
+
     def __array__(self, *args, **kwargs):
         if awkward1._util.called_by_module("pandas"):
             try:
@@ -294,6 +300,12 @@ class Record(awkward1._connect._numpy.NDArrayOperatorsMixin):
 
         return "<Record {0} type={1}>".format(value, type)
 
+    def __getstate__(self):
+        return (self._layout, self._behavior)
+
+    def __setstate__(self, state):
+        self.layout, self.behavior = state
+
     def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
         return awkward1._connect._numpy.array_ufunc(ufunc, method, inputs, kwargs, self._behavior)
 
@@ -315,10 +327,21 @@ class ArrayBuilder(Sequence):
         out.behavior = behavior
         return out
 
-    def __init__(self, behavior=None):
-        self._layout = awkward1.layout.ArrayBuilder()
+    def __init__(self, behavior=None, type=None, narrow=False, categorical=False):
+        if isinstance(type, awkward1.types.ArrayType):
+            type = type.type
+        elif type is not None and not isinstance(type, awkward1.types.Type):
+            raise TypeError("type must be an awkward1.types.Type, not {0}".format(repr(type)))
+        self._layout = awkward1.layout.ArrayBuilder(type=type, narrow=narrow, categorical=categorical)
         self.behavior = behavior
 
+    @classmethod
+    def merge(cls, builders, behavior=None):
+        layout = awkward1.layout.ArrayBuilder.merge([x._layout for x in builders])
+        if behavior is None:
+            behavior = awkward1._util.behaviorof(*builders)
+        return awkward1._util.wrap(layout, behavior)
+
     @property
     def behavior(self):
         return self._behavior
@@ -377,8 +400,8 @@ class ArrayBuilder(Sequence):
         awkward1._connect._numba.register()
         return awkward1._connect._numba.builder.ArrayBuilderType(self._behavior)
 
-    def snapshot(self):
-        return awkward1._util.wrap(self._layout.snapshot(), self._behavior)
+    def snapshot(self, finalize=False):
+        return awkward1._util.wrap(self._layout.snapshot(finalize=finalize), self._behavior)
 
     def null(self):
         self._layout.null()
@@ -422,14 +445,14 @@ class ArrayBuilder(Sequence):
     def endrecord(self):
         self._layout.endrecord()
 
-    def append(self, obj, at=None):
+    def append(self, obj, at=None, releasegil=False):
         if at is None:
             if isinstance(obj, Record):
                 self._layout.append(obj.layout.array, obj.layout.at)
             elif isinstance(obj, Array):
                 self._layout.extend(obj.layout)
             else:
-                self._layout.fromiter(obj)
+                self._layout.fromiter(obj, releasegil=releasegil)
 
         else:
             if isinstance(obj, Array):
@@ -3,6 +3,8 @@
 from __future__ import absolute_import
 
 import sys
+import os
+import io
 import numbers
 import json
 import collections
@@ -60,14 +62,70 @@ def fromiter(iterable, highlevel=True, behavior=None, allowrecord=True, initial=
     out = awkward1.layout.ArrayBuilder(initial=initial, resize=resize)
     for x in iterable:
         out.fromiter(x)
-    layout = out.snapshot()
+    layout = out.snapshot(finalize=True)
     if highlevel:
         return awkward1._util.wrap(layout, behavior)
     else:
         return layout
 
-def fromjson(source, highlevel=True, behavior=None, initial=1024, resize=2.0, buffersize=65536):
-    layout = awkward1._io.fromjson(source, initial=initial, resize=resize, buffersize=buffersize)
+def fromjson(source, highlevel=True, behavior=None, initial=1024, resize=2.0, buffersize=65536, lines=False, chunksize=None, type=None, num_threads=None, engine="rapidjson", categorical=False):
+    if engine not in ("rapidjson", "simdjson"):
+        raise ValueError("engine must be \"rapidjson\" or \"simdjson\", not {0}".format(repr(engine)))
+    if engine == "simdjson" and (type is not None or chunksize is not None or num_threads is not None):
+        raise ValueError("engine=\"simdjson\" can't be used with type, chunksize, or num_threads")
+    if chunksize is not None and not lines:
+        raise ValueError("chunksize can only be used with lines=True")
+    if num_threads is not None and not lines:
+        raise ValueError("num_threads can only be used with lines=True")
+    if num_threads is not None and chunksize is not None:
+        raise ValueError("num_threads and chunksize can't be used together")
+    if categorical and (type is not None or num_threads is not None):
+        raise ValueError("categorical can't be used with type or num_threads")
+
+    if isinstance(type, awkward1.types.ArrayType):
+        type = type.type
+    elif type is not None and not isinstance(type, awkward1.types.Type):
+        raise TypeError("type must be an awkward1.types.Type, not {0}".format(repr(type)))
+
+    if engine == "simdjson":
+        if not awkward1._io.has_simdjson:
+            raise ValueError("awkward1 was compiled without simdjson")
+        layout = awkward1._io.fromjson_simdjson(source, lines=lines, initial=initial, resize=resize, categorical=categorical)
+
+    elif lines and num_threads is not None:
+        # each thread parses a range of whole lines into its own ArrayBuilder
+        if source.lstrip()[:1] in ("[", "{"):
+            data = numpy.frombuffer(source.encode("utf-8"), dtype=numpy.uint8)
+        elif os.path.getsize(source) == 0:
+            data = numpy.empty(0, dtype=numpy.uint8)
+        else:
+            data = numpy.memmap(source, dtype=numpy.uint8, mode="r")
+        layout = awkward1._io.fromjsonlines_parallel(data, num_threads, type=type, initial=initial, resize=resize)
+        if layout is None:
+            layout = awkward1.layout.EmptyArray()
+
+    elif lines:
+        reader = awkward1._io.FromJsonLines(source, type=type, initial=initial, resize=resize, buffersize=buffersize, categorical=categorical)
+        if chunksize is None:
+            layout = reader.next(-1)
+            if layout is None:
+                layout = awkward1.layout.EmptyArray()
+        else:
+            if chunksize <= 0:
+                raise ValueError("chunksize must be positive")
+            def generator():
+                while True:
+                    layout = reader.next(chunksize)
+                    if layout is None:
+                        break
+                    if highlevel:
+                        yield awkward1._util.wrap(layout, behavior)
+                    else:
+                        yield layout
+            return generator()
+    else:
+        layout = awkward1._io.fromjson(source, type=type, initial=initial, resize=resize, buffersize=buffersize, categorical=categorical)
+
     if highlevel:
         return awkward1._util.wrap(layout, behavior)
     else:
@@ -161,6 +219,9 @@ def tonumpy(array):
     elif isinstance(array, awkward1.layout.NumpyArray):
         return numpy.asarray(array)
 
+    elif isinstance(array, awkward1._util.virtualtypes):
+        return tonumpy(array.array)
+
     elif isinstance(array, awkward1.layout.Content):
         raise AssertionError("unrecognized Content type: {0}".format(type(array)))
 
@@ -227,7 +288,7 @@ def tolist(array):
     else:
         raise TypeError("unrecognized array type: {0}".format(repr(array)))
 
-def tojson(array, destination=None, pretty=False, maxdecimals=None, buffersize=65536):
+def tojson(array, destination=None, pretty=False, maxdecimals=None, buffersize=65536, lines=False):
     import awkward1.highlevel
 
     if array is None or isinstance(array, (bool, str, bytes, numbers.Number)):
@@ -263,11 +324,35 @@ def tojson(array, destination=None, pretty=False, maxdecimals=None, buffersize=6
     else:
         raise TypeError("unrecognized array type: {0}".format(repr(array)))
 
-    if destination is None:
+    if lines:
+        if pretty:
+            raise ValueError("JSON Lines can't be pretty-printed")
+        if destination is None:
+            stream = io.BytesIO()
+            out.tojson(stream, lines=True, maxdecimals=maxdecimals, buffersize=buffersize)
+            return stream.getvalue().decode("utf-8")
+        elif isinstance(destination, str):
+            with open(destination, "wb") as file:
+                out.tojson(file, lines=True, maxdecimals=maxdecimals, buffersize=buffersize)
+        else:
+            out.tojson(destination, lines=True, maxdecimals=maxdecimals, buffersize=buffersize)
+
+    elif destination is None:
         return out.tojson(pretty=pretty, maxdecimals=maxdecimals)
-    else:
+
+    elif isinstance(destination, str):
         return out.tojson(destination, pretty=pretty, maxdecimals=maxdecimals, buffersize=buffersize)
 
+    elif pretty:
+        text = out.tojson(pretty=True, maxdecimals=maxdecimals)
+        if isinstance(destination, io.TextIOBase):
+            destination.write(text)
+        else:
+            destination.write(text.encode("utf-8"))
+
+    else:
+        out.tojson(destination, lines=False, maxdecimals=maxdecimals, buffersize=buffersize)
+
 def tolayout(array, allowrecord=True, allowother=False, numpytype=(numpy.number,)):
     import awkward1.highlevel
 
@@ -656,10 +741,576 @@ def toawkward0(array, keeplayout=False):
             # content
             return recurse(layout.content)   # awkward0 didn't agressively track array types
 
+        elif isinstance(layout, awkward1.layout.VirtualArray):
+            # generator, cache, cache_key
+            return recurse(layout.array)
+
         else:
             raise AssertionError("missing converter for {0}".format(type(layout).__name__))
 
     layout = tolayout(array, allowrecord=True, allowother=False, numpytype=(numpy.generic,))
     return recurse(layout)
 
-__all__ = [x for x in list(globals()) if not x.startswith("_") and x not in ("numbers", "json", "Iterable", "numpy", "awkward1")]
+def tobuffers(array, keyformat="{form_key}-{role}"):
+    layout = tolayout(array, allowrecord=False, allowother=False)
+
+    buffers = {}
+    def index(form, role, x):
+        buffers[keyformat.format(form_key=form["form_key"], role=role)] = numpy.asarray(x)
+        return tobuffers.index2code[type(x)]
+
+    def recurse(layout):
+        if isinstance(layout, awkward1.layout.VirtualArray):
+            return recurse(layout.array)
+        if isinstance(layout, awkward1.layout.IndexedArray64) and layout.isdeferred:
+            return recurse(layout.project())
+
+        form = {"class": type(layout).__name__, "form_key": "node{0}".format(recurse.numnodes)}
+        recurse.numnodes += 1
+
+        if isinstance(layout, awkward1.layout.NumpyArray):
+            data = numpy.asarray(layout)
+            if not (data.flags["C_CONTIGUOUS"] or data.size == 0):
+                data = numpy.ascontiguousarray(data)
+            buffers[keyformat.format(form_key=form["form_key"], role="data")] = data.reshape(-1)
+            form["dtype"] = str(data.dtype)
+            form["inner_shape"] = list(data.shape[1:])
+
+        elif isinstance(layout, awkward1.layout.EmptyArray):
+            pass
+
+        elif isinstance(layout, awkward1.layout.RegularArray):
+            form["size"] = layout.size
+            form["content"] = recurse(layout.content)
+
+        elif isinstance(layout, (awkward1.layout.ListArray32, awkward1.layout.ListArrayU32, awkward1.layout.ListArray64)):
+            form["starts"] = index(form, "starts", layout.starts)
+            form["stops"] = index(form, "stops", layout.stops)
+            form["content_length"] = len(layout.content)
+            form["content"] = recurse(layout.content)
+
+        elif isinstance(layout, (awkward1.layout.ListOffsetArray32, awkward1.layout.ListOffsetArrayU32, awkward1.layout.ListOffsetArray64)):
+            form["offsets"] = index(form, "offsets", layout.offsets)
+            form["content"] = recurse(layout.content)
+
+        elif isinstance(layout, (awkward1.layout.IndexedArray32, awkward1.layout.IndexedArrayU32, awkward1.layout.IndexedArray64, awkward1.layout.IndexedOptionArray32, awkward1.layout.IndexedOptionArray64)):
+            form["index"] = index(form, "index", layout.index)
+            form["content_length"] = len(layout.content)
+            form["content"] = recurse(layout.content)
+
+        elif isinstance(layout, awkward1.layout.ByteMaskedArray):
+            form["mask"] = index(form, "mask", layout.mask)
+            form["valid_when"] = layout.validwhen
+            form["content"] = recurse(layout.content)
+
+        elif isinstance(layout, awkward1.layout.BitMaskedArray):
+            form["mask"] = index(form, "mask", layout.mask)
+            form["valid_when"] = layout.validwhen
+            form["lsb_order"] = layout.lsb_order
+            form["content"] = recurse(layout.content)
+
+        elif isinstance(layout, awkward1.layout.UnmaskedArray):
+            form["content"] = recurse(layout.content)
+
+        elif isinstance(layout, awkward1.layout.RecordArray):
+            form["keys"] = layout.recordlookup
+            form["contents"] = [recurse(x) for x in layout.contents]
+
+        elif isinstance(layout, (awkward1.layout.UnionArray8_32, awkward1.layout.UnionArray8_U32, awkward1.layout.UnionArray8_64)):
+            form["tags"] = index(form, "tags", layout.tags)
+            form["index"] = index(form, "index", layout.index)
+            form["content_lengths"] = [len(x) for x in layout.contents]
+            form["contents"] = [recurse(x) for x in layout.contents]
+
+        else:
+            raise AssertionError("unrecognized Content type: {0}".format(type(layout)))
+
+        form["parameters"] = layout.parameters
+        return form
+
+    recurse.numnodes = 0
+    form = recurse(layout)
+    return form, buffers, len(layout)
+
+tobuffers.index2code = {
+    awkward1.layout.Index8:   "i8",
+    awkward1.layout.IndexU8:  "u8",
+    awkward1.layout.Index32:  "i32",
+    awkward1.layout.IndexU32: "u32",
+    awkward1.layout.Index64:  "i64",
+}
+
+def frombuffers(form, buffers, length, keyformat="{form_key}-{role}", highlevel=True, behavior=None):
+    if isinstance(form, str) or (awkward1._util.py27 and isinstance(form, unicode)):
+        form = json.loads(form)
+
+    def index(form, role, length):
+        key = keyformat.format(form_key=form["form_key"], role=role)
+        array = numpy.frombuffer(buffers[key], dtype=frombuffers.code2dtype[form[role]])
+        if len(array) < length:
+            raise ValueError("buffer {0} has {1} items, fewer than the required {2}".format(repr(key), len(array), length))
+        array = array[:length]
+        return array, frombuffers.code2index[form[role]](array)
+
+    def recurse(form, length):
+        cls = getattr(awkward1.layout, form["class"])
+        parameters = form.get("parameters")
+
+        if cls is awkward1.layout.NumpyArray:
+            data = numpy.frombuffer(buffers[keyformat.format(form_key=form["form_key"], role="data")], dtype=form["dtype"])
+            data = data.reshape((-1,) + tuple(form["inner_shape"]))
+            return cls(data, parameters=parameters)
+
+        elif cls is awkward1.layout.EmptyArray:
+            return cls(parameters=parameters)
+
+        elif cls is awkward1.layout.RegularArray:
+            content = recurse(form["content"], length*form["size"])
+            return cls(content, form["size"], parameters=parameters)
+
+        elif cls in (awkward1.layout.ListArray32, awkward1.layout.ListArrayU32, awkward1.layout.ListArray64):
+            starts, startsindex = index(form, "starts", length)
+            stops, stopsindex = index(form, "stops", length)
+            # forms without "content_length" predate it: scan for it instead
+            if "content_length" in form:
+                contentlength = form["content_length"]
+            else:
+                contentlength = 0 if length == 0 else int(stops.max())
+            content = recurse(form["content"], contentlength)
+            return cls(startsindex, stopsindex, content, parameters=parameters)
+
+        elif cls in (awkward1.layout.ListOffsetArray32, awkward1.layout.ListOffsetArrayU32, awkward1.layout.ListOffsetArray64):
+            offsets, offsetsindex = index(form, "offsets", length + 1)
+            content = recurse(form["content"], int(offsets[-1]))
+            return cls(offsetsindex, content, parameters=parameters)
+
+        elif cls in (awkward1.layout.IndexedArray32, awkward1.layout.IndexedArrayU32, awkward1.layout.IndexedArray64, awkward1.layout.IndexedOptionArray32, awkward1.layout.IndexedOptionArray64):
+            index_, indexindex = index(form, "index", length)
+            if "content_length" in form:
+                contentlength = form["content_length"]
+            else:
+                contentlength = 0 if length == 0 else max(int(index_.max()) + 1, 0)
+            content = recurse(form["content"], contentlength)
+            return cls(indexindex, content, parameters=parameters)
+
+        elif cls is awkward1.layout.ByteMaskedArray:
+            mask, maskindex = index(form, "mask", length)
+            content = recurse(form["content"], length)
+            return cls(maskindex, content, form["valid_when"], parameters=parameters)
+
+        elif cls is awkward1.layout.BitMaskedArray:
+            mask, maskindex = index(form, "mask", int(numpy.ceil(length / 8.0)))
+            content = recurse(form["content"], length)
+            return cls(maskindex, content, form["valid_when"], length, form["lsb_order"], parameters=parameters)
+
+        elif cls is awkward1.layout.UnmaskedArray:
+            content = recurse(form["content"], length)
+            return cls(content, parameters=parameters)
+
+        elif cls is awkward1.layout.RecordArray:
+            contents = [recurse(x, length) for x in form["contents"]]
+            return cls(contents, form["keys"], length, parameters=parameters)
+
+        elif cls in (awkward1.layout.UnionArray8_32, awkward1.layout.UnionArray8_U32, awkward1.layout.UnionArray8_64):
+            tags, tagsindex = index(form, "tags", length)
+            index_, indexindex = index(form, "index", length)
+            contents = []
+            for tag, x in enumerate(form["contents"]):
+                if "content_lengths" in form:
+                    contentlength = form["content_lengths"][tag]
+                else:
+                    selected = index_[tags == tag]
+                    contentlength = 0 if len(selected) == 0 else int(selected.max()) + 1
+                contents.append(recurse(x, contentlength))
+            return cls(tagsindex, indexindex, contents, parameters=parameters)
+
+        else:
+            raise ValueError("unrecognized Content class in form: {0}".format(repr(form["class"])))
+
+    out = recurse(form, length)
+    if highlevel:
+        return awkward1._util.wrap(out, behavior)
+    else:
+        return out
+
+frombuffers.code2dtype = {
+    "i8":  numpy.dtype(numpy.int8),
+    "u8":  numpy.dtype(numpy.uint8),
+    "i32": numpy.dtype(numpy.int32),
+    "u32": numpy.dtype(numpy.uint32),
+    "i64": numpy.dtype(numpy.int64),
+}
+
+frombuffers.code2index = {
+    "i8":  awkward1.layout.Index8,
+    "u8":  awkward1.layout.IndexU8,
+    "i32": awkward1.layout.Index32,
+    "u32": awkward1.layout.IndexU32,
+    "i64": awkward1.layout.Index64,
+}
+
+def save(destination, array, keyformat="{form_key}-{role}"):
+    form, buffers, length = tobuffers(array, keyformat=keyformat)
+
+    alignment = save.alignment
+    def padding(position):
+        return (-position) % alignment
+
+    # lay out the buffers first: their positions are relative to the data section
+    table = {}
+    position = 0
+    for key, buffer in buffers.items():
+        position += padding(position)
+        table[key] = [position, buffer.nbytes]
+        position += buffer.nbytes
+
+    header = json.dumps({"form": form,
+                         "length": length,
+                         "keyformat": keyformat,
+                         "alignment": alignment,
+                         "buffers": table}).encode("utf-8")
+    prefix = save.magic + numpy.array([len(header)], dtype="<u8").tobytes() + header
+    start = len(prefix) + padding(len(prefix))
+
+    with open(destination, "wb") as file:
+        file.write(prefix)
+        file.write(b"\x00" * (start - len(prefix)))
+        for key, buffer in buffers.items():
+            file.seek(start + table[key][0])
+            file.write(numpy.ascontiguousarray(buffer).view(numpy.uint8).data)
+        file.truncate(start + position)
+
+save.magic = b"awkward1"
+save.alignment = 64
+
+def load(source, mmap=True, highlevel=True, behavior=None):
+    with open(source, "rb") as file:
+        if file.read(len(save.magic)) != save.magic:
+            raise ValueError("{0} is not an awkward1 file (missing magic bytes)".format(repr(source)))
+        headersize = int(numpy.frombuffer(file.read(8), dtype="<u8")[0])
+        header = json.loads(file.read(headersize).decode("utf-8"))
+
+    prefix = len(save.magic) + 8 + headersize
+    start = prefix + ((-prefix) % header["alignment"])
+
+    if mmap:
+        # pages are only read when a kernel touches them
+        data = numpy.memmap(source, dtype=numpy.uint8, mode="r")
+    else:
+        data = numpy.fromfile(source, dtype=numpy.uint8)
+
+    buffers = {}
+    for key, (position, nbytes) in header["buffers"].items():
+        buffers[key] = data[start + position : start + position + nbytes]
+
+    return frombuffers(header["form"], buffers, header["length"], keyformat=header["keyformat"], highlevel=highlevel, behavior=behavior)
+
+def toarrow(array):
+    import pyarrow
+
+    layout = tolayout(array, allowrecord=False, allowother=False)
+
+    def option(valid, content, mask):
+        if mask is not None:
+            valid = valid & awkward1._util.unpackbits_lsb(numpy.frombuffer(mask, dtype=numpy.uint8), len(valid))
+        return recurse(content, pyarrow.py_buffer(awkward1._util.packbits_lsb(valid)))
+
+    def recurse(layout, mask=None):
+        if isinstance(layout, awkward1.layout.NumpyArray):
+            data = numpy.asarray(layout)
+            if len(data.shape) > 1:
+                return recurse(layout.toRegularArray(), mask)
+            elif issubclass(data.dtype.type, numpy.bool_):
+                # Arrow booleans are bit-packed
+                return pyarrow.Array.from_buffers(pyarrow.bool_(), len(data), [mask, pyarrow.py_buffer(awkward1._util.packbits_lsb(data))])
+            else:
+                data = numpy.ascontiguousarray(data)
+                return pyarrow.Array.from_buffers(pyarrow.from_numpy_dtype(data.dtype), len(data), [mask, pyarrow.py_buffer(data)])
+
+        elif isinstance(layout, awkward1.layout.EmptyArray):
+            return pyarrow.Array.from_buffers(pyarrow.null(), 0, [None])
+
+        elif isinstance(layout, (awkward1.layout.ListOffsetArray32, awkward1.layout.ListOffsetArray64)):
+            offsets = numpy.asarray(layout.offsets)
+            large = isinstance(layout, awkward1.layout.ListOffsetArray64)
+            if layout.parameter("__array__") in ("string", "bytestring"):
+                if layout.parameter("__array__") == "string":
+                    arrowtype = pyarrow.large_utf8() if large else pyarrow.utf8()
+                else:
+                    arrowtype = pyarrow.large_binary() if large else pyarrow.binary()
+                data = numpy.ascontiguousarray(numpy.asarray(layout.content))
+                return pyarrow.Array.from_buffers(arrowtype, len(layout), [mask, pyarrow.py_buffer(offsets), pyarrow.py_buffer(data)])
+            else:
+                content = recurse(layout.content)
+                arrowtype = pyarrow.large_list(content.type) if large else pyarrow.list_(content.type)
+                return pyarrow.Array.from_buffers(arrowtype, len(layout), [mask, pyarrow.py_buffer(offsets)], children=[content])
+
+        elif isinstance(layout, awkward1.layout.ListOffsetArrayU32):
+            offsets = awkward1.layout.Index64(numpy.asarray(layout.offsets).astype(numpy.int64))
+            return recurse(awkward1.layout.ListOffsetArray64(offsets, layout.content, layout.identities, layout.parameters), mask)
+
+        elif isinstance(layout, (awkward1.layout.ListArray32, awkward1.layout.ListArrayU32, awkward1.layout.ListArray64)):
+            return recurse(layout.broadcast_tooffsets64(layout.compact_offsets64(True)), mask)
+
+        elif isinstance(layout, awkward1.layout.RegularArray):
+            content = recurse(layout.content[:len(layout)*layout.size])
+            return pyarrow.Array.from_buffers(pyarrow.list_(content.type, layout.size), len(layout), [mask], children=[content])
+
+        elif isinstance(layout, awkward1._util.indexedtypes):
+            return recurse(layout.project(), mask)
+
+        elif isinstance(layout, awkward1.layout.BitMaskedArray) and layout.validwhen and layout.lsb_order and mask is None:
+            # same bit order and meaning as an Arrow validity bitmap
+            return recurse(layout.content[:len(layout)], pyarrow.py_buffer(numpy.asarray(layout.mask)))
+
+        elif isinstance(layout, (awkward1.layout.ByteMaskedArray, awkward1.layout.BitMaskedArray)):
+            return option(numpy.asarray(layout.bytemask()) == 0, layout.content[:len(layout)], mask)
+
+        elif isinstance(layout, (awkward1.layout.IndexedOptionArray32, awkward1.layout.IndexedOptionArray64)):
+            index = numpy.asarray(layout.index)
+            valid = (index >= 0)
+            if len(layout.content) == 0:
+                content = recurse(layout.content)
+                return pyarrow.nulls(len(layout), type=content.type)
+            return option(valid, layout.content[numpy.where(valid, index, 0)], mask)
+
+        elif isinstance(layout, awkward1.layout.UnmaskedArray):
+            return recurse(layout.content, mask)
+
+        elif isinstance(layout, awkward1.layout.RecordArray):
+            values = [recurse(x[:len(layout)]) for x in layout.contents]
+            arrowtype = pyarrow.struct([pyarrow.field(key, x.type) for key, x in zip(layout.keys(), values)])
+            return pyarrow.Array.from_buffers(arrowtype, len(layout), [mask], children=values)
+
+        elif isinstance(layout, awkward1._util.uniontypes):
+            if mask is not None:
+                raise ValueError("Arrow unions cannot have a validity bitmap; cannot convert option-type union")
+            tags = numpy.asarray(layout.tags)
+            index = numpy.asarray(layout.index)
+            if not issubclass(index.dtype.type, numpy.int32):
+                if len(index) > 0 and index.max() > numpy.iinfo(numpy.int32).max:
+                    raise ValueError("UnionArray index does not fit in an Arrow dense union's 32-bit offsets")
+                index = index.astype(numpy.int32)
+            values = [recurse(x) for x in layout.contents]
+            arrowtype = pyarrow.union([pyarrow.field(str(i), x.type) for i, x in enumerate(values)], "dense", list(range(len(values))))
+            return pyarrow.Array.from_buffers(arrowtype, len(layout), [None, pyarrow.py_buffer(tags), pyarrow.py_buffer(index)], children=values)
+
+        elif isinstance(layout, awkward1._util.virtualtypes):
+            return recurse(layout.array, mask)
+
+        else:
+            raise AssertionError("unrecognized Content type: {0}".format(type(layout)))
+
+    return recurse(layout)
+
+def fromarrow(array, highlevel=True, behavior=None):
+    import pyarrow
+
+    def popmask(array, content):
+        if array.null_count == 0:
+            return content
+        bytes = numpy.frombuffer(array.buffers()[0], dtype=numpy.uint8)
+        if array.offset % 8 == 0:
+            mask = bytes[array.offset // 8 : array.offset // 8 + -(-len(array) // 8)]
+        else:
+            mask = awkward1._util.packbits_lsb(awkward1._util.unpackbits_lsb(bytes, len(array), array.offset))
+        return awkward1.layout.BitMaskedArray(awkward1.layout.IndexU8(mask), content, True, len(array), True)
+
+    def recurse(array):
+        if isinstance(array, pyarrow.ChunkedArray):
+            if array.num_chunks == 0:
+                return recurse(pyarrow.array([], type=array.type))
+            chunks = [recurse(x) for x in array.chunks]
+            if len(chunks) == 1:
+                return chunks[0]
+            return awkward1.operations.structure.concatenate(chunks, highlevel=False)
+
+        arrowtype = array.type
+        buffers = array.buffers()
+        start, stop = array.offset, array.offset + len(array)
+
+        if pyarrow.types.is_null(arrowtype):
+            index = awkward1.layout.Index64(numpy.full(len(array), -1, dtype=numpy.int64))
+            return awkward1.layout.IndexedOptionArray64(index, awkward1.layout.EmptyArray())
+
+        elif pyarrow.types.is_boolean(arrowtype):
+            data = awkward1._util.unpackbits_lsb(numpy.frombuffer(buffers[1], dtype=numpy.uint8), len(array), start)
+            return popmask(array, awkward1.layout.NumpyArray(data))
+
+        elif pyarrow.types.is_integer(arrowtype) or pyarrow.types.is_floating(arrowtype):
+            data = numpy.frombuffer(buffers[1], dtype=arrowtype.to_pandas_dtype())[start:stop]
+            return popmask(array, awkward1.layout.NumpyArray(data))
+
+        elif pyarrow.types.is_string(arrowtype) or pyarrow.types.is_large_string(arrowtype) or pyarrow.types.is_binary(arrowtype) or pyarrow.types.is_large_binary(arrowtype):
+            large = pyarrow.types.is_large_string(arrowtype) or pyarrow.types.is_large_binary(arrowtype)
+            offsets = numpy.frombuffer(buffers[1], dtype=numpy.int64 if large else numpy.int32)[start : stop + 1]
+            if buffers[2] is None:
+                data = numpy.empty(0, dtype=numpy.uint8)
+            else:
+                data = numpy.frombuffer(buffers[2], dtype=numpy.uint8)
+            if pyarrow.types.is_string(arrowtype) or pyarrow.types.is_large_string(arrowtype):
+                listparams, contentparams = {"__array__": "string"}, {"__array__": "char"}
+            else:
+                listparams, contentparams = {"__array__": "bytestring"}, {"__array__": "byte"}
+            content = awkward1.layout.NumpyArray(data, parameters=contentparams)
+            if large:
+                out = awkward1.layout.ListOffsetArray64(awkward1.layout.Index64(offsets), content, parameters=listparams)
+            else:
+                out = awkward1.layout.ListOffsetArray32(awkward1.layout.Index32(offsets), content, parameters=listparams)
+            return popmask(array, out)
+
+        elif pyarrow.types.is_list(arrowtype):
+            offsets = numpy.frombuffer(buffers[1], dtype=numpy.int32)[start : stop + 1]
+            return popmask(array, awkward1.layout.ListOffsetArray32(awkward1.layout.Index32(offsets), recurse(array.values)))
+
+        elif pyarrow.types.is_large_list(arrowtype):
+            offsets = numpy.frombuffer(buffers[1], dtype=numpy.int64)[start : stop + 1]
+            return popmask(array, awkward1.layout.ListOffsetArray64(awkward1.layout.Index64(offsets), recurse(array.values)))
+
+        elif pyarrow.types.is_fixed_size_list(arrowtype):
+            size = arrowtype.list_size
+            content = recurse(array.values.slice(start*size, len(array)*size))
+            return popmask(array, awkward1.layout.RegularArray(content, size))
+
+        elif pyarrow.types.is_struct(arrowtype):
+            keys = [arrowtype[i].name for i in range(arrowtype.num_fields)]
+            contents = [recurse(array.field(i)) for i in range(arrowtype.num_fields)]
+            if keys == [str(i) for i in range(len(keys))]:
+                keys = None
+            return popmask(array, awkward1.layout.RecordArray(contents, keys, len(array)))
+
+        elif pyarrow.types.is_union(arrowtype):
+            tags = numpy.frombuffer(buffers[1], dtype=numpy.int8)[start:stop]
+            if list(arrowtype.type_codes) != list(range(arrowtype.num_fields)):
+                lookup = numpy.zeros(max(arrowtype.type_codes) + 1, dtype=numpy.int8)
+                lookup[list(arrowtype.type_codes)] = numpy.arange(arrowtype.num_fields, dtype=numpy.int8)
+                tags = lookup[tags]
+            contents = [recurse(array.field(i)) for i in range(arrowtype.num_fields)]
+            if arrowtype.mode == "dense":
+                index = numpy.frombuffer(buffers[2], dtype=numpy.int32)[start:stop]
+                return awkward1.layout.UnionArray8_32(awkward1.layout.Index8(tags), awkward1.layout.Index32(index), contents)
+            else:
+                index = numpy.arange(len(array), dtype=numpy.int64)
+                return awkward1.layout.UnionArray8_64(awkward1.layout.Index8(tags), awkward1.layout.Index64(index), contents)
+
+        elif pyarrow.types.is_dictionary(arrowtype):
+            indices = array.indices
+            content = recurse(array.dictionary)
+            index = numpy.frombuffer(indices.buffers()[1], dtype=indices.type.to_pandas_dtype())[indices.offset : indices.offset + len(indices)]
+            if indices.null_count != 0:
+                index = numpy.where(numpy.asarray(indices.is_valid()), index, -1).astype(numpy.int64)
+                return awkward1.layout.IndexedOptionArray64(awkward1.layout.Index64(index), content)
+            elif issubclass(index.dtype.type, numpy.int32):
+                return awkward1.layout.IndexedArray32(awkward1.layout.Index32(index), content)
+            else:
+                return awkward1.layout.IndexedArray64(awkward1.layout.Index64(index.astype(numpy.int64)), content)
+
+        else:
+            raise ValueError("cannot convert Arrow type {0} into an Awkward Array".format(arrowtype))
+
+    if isinstance(array, pyarrow.Table):
+        schema = array.schema
+        array = array.to_batches()
+        if len(array) == 0:
+            array = [pyarrow.RecordBatch.from_arrays([pyarrow.array([], type=x.type) for x in schema], schema=schema)]
+    elif isinstance(array, pyarrow.RecordBatch):
+        array = [array]
+
+    if isinstance(array, list):
+        batches = [awkward1.layout.RecordArray([recurse(x) for x in batch.columns], batch.schema.names, batch.num_rows) for batch in array]
+        if len(batches) == 1:
+            out = batches[0]
+        else:
+            out = awkward1.operations.structure.concatenate(batches, highlevel=False)
+    else:
+        out = recurse(array)
+
+    if highlevel:
+        return awkward1._util.wrap(out, behavior)
+    else:
+        return out
+
+def toparquet(array, where, **options):
+    import pyarrow
+    import pyarrow.parquet
+
+    layout = tolayout(array, allowrecord=False, allowother=False)
+    arrow = toarrow(layout)
+    if isinstance(arrow, pyarrow.StructArray) and arrow.null_count == 0 and not (isinstance(layout, awkward1.layout.RecordArray) and layout.istuple):
+        # top-level record fields become Parquet columns
+        table = pyarrow.Table.from_arrays([arrow.field(i) for i in range(arrow.type.num_fields)], [x.name for x in arrow.type])
+    else:
+        table = pyarrow.Table.from_arrays([arrow], [toparquet.noname])
+
+    pyarrow.parquet.write_table(table, where, **options)
+
+toparquet.noname = ""
+
+def fromparquet(source, columns=None, row_groups=None, iterate=False, highlevel=True, behavior=None):
+    import pyarrow
+    import pyarrow.parquet
+
+    file = pyarrow.parquet.ParquetFile(source)
+
+    if columns is not None:
+        if isinstance(columns, str) or (sys.version_info[0] < 3 and isinstance(columns, unicode)):
+            columns = [columns]
+
+        # Parquet leaf paths include the list/item levels; Awkward paths are record fields only
+        def leaves(arrowtype, path):
+            if isinstance(arrowtype, pyarrow.StructType):
+                for field in arrowtype:
+                    for x in leaves(field.type, path + (field.name,)):
+                        yield x
+            elif isinstance(arrowtype, (pyarrow.ListType, pyarrow.LargeListType, pyarrow.FixedSizeListType)):
+                for x in leaves(arrowtype.value_type, path):
+                    yield x
+            elif isinstance(arrowtype, pyarrow.MapType):
+                for x in leaves(arrowtype.key_type, path + ("key",)):
+                    yield x
+                for x in leaves(arrowtype.item_type, path + ("value",)):
+                    yield x
+            else:
+                yield path
+
+        awkwardpaths = []
+        for field in file.schema_arrow:
+            awkwardpaths.extend(leaves(field.type, (field.name,)))
+        parquetpaths = [file.schema.column(i).path for i in range(len(file.schema))]
+        assert len(awkwardpaths) == len(parquetpaths)
+
+        selected = []
+        for column in columns:
+            path = tuple(column.split("."))
+            matches = [p for a, p in zip(awkwardpaths, parquetpaths) if a[:len(path)] == path]
+            if len(matches) == 0:
+                raise ValueError("no column {0} in Parquet file {1}".format(repr(column), repr(source)))
+            selected.extend(x for x in matches if x not in selected)
+        columns = selected
+
+    if row_groups is None:
+        row_groups = range(file.num_row_groups)
+    elif isinstance(row_groups, (numbers.Integral, numpy.integer)):
+        row_groups = [row_groups]
+    else:
+        row_groups = list(row_groups)
+
+    def convert(table):
+        if table.schema.names == [toparquet.noname]:
+            out = fromarrow(table.column(0), highlevel=False)
+        else:
+            out = fromarrow(table, highlevel=False)
+        if highlevel:
+            return awkward1._util.wrap(out, behavior)
+        else:
+            return out
+
+    if iterate:
+        def generator():
+            for i in row_groups:
+                yield convert(file.read_row_group(i, columns=columns))
+        return generator()
+    else:
+        return convert(file.read_row_groups(row_groups, columns=columns))
+
+__all__ = [x for x in list(globals()) if not x.startswith("_") and x not in ("os", "io", "numbers", "json", "Iterable", "numpy", "awkward1")]
@@ -115,6 +115,8 @@ def size(array, axis=None):
                 sizes.extend(numpy.asarray(layout).shape[1:])
             else:
                 sizes.extend(numpy.asarray(layout).shape[1:axis + 2])
+        elif isinstance(layout, awkward1._util.virtualtypes):
+            recurse(layout.array, axis, sizes)
         else:
             raise AssertionError("unrecognized Content type")
 
@@ -455,4 +457,19 @@ def tomask(array, mask, validwhen=True, highlevel=True):
     else:
         return out[0]
 
+def selectionview(array, highlevel=True):
+    # an IndexedArray64 without parameters composes its index under integer,
+    # boolean, and range selections, so chained selections never carry the
+    # content; it's projected when a buffer is needed
+    layout = awkward1.operations.convert.tolayout(array, allowrecord=False, allowother=False)
+    if isinstance(layout, awkward1.layout.IndexedArray64) and layout.identities is None and len(layout.parameters) == 0:
+        out = layout
+    else:
+        index = awkward1.layout.Index64(numpy.arange(len(layout), dtype=numpy.int64))
+        out = awkward1.layout.IndexedArray64(index, layout)
+    if highlevel:
+        return awkward1._util.wrap(out, behavior=awkward1._util.behaviorof(array))
+    else:
+        return out
+
 __all__ = [x for x in list(globals()) if not x.startswith("_") and x not in ("numpy", "awkward1")]
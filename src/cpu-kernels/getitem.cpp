@@ -3,6 +3,7 @@
 #include <cstring>
 #include <vector>
 
+#include "awkward/cpu-kernels/parallel.h"
 #include "awkward/cpu-kernels/getitem.h"
 
 void awkward_regularize_rangeslice(int64_t* start, int64_t* stop, bool posstep, bool hasstart, bool hasstop, int64_t length) {
@@ -77,14 +78,16 @@ ERROR awkward_indexU32_to_index64(int64_t* toptr, const uint32_t* fromptr, int64
 
 template <typename C, typename T>
 ERROR awkward_index_carry(C* toindex, const C* fromindex, const T* carry, int64_t fromindexoffset, int64_t lenfromindex, int64_t length) {
-  for (int64_t i = 0;  i < length;  i++) {
-    T j = carry[i];
-    if (j > lenfromindex) {
-      return failure("index out of range", kSliceNone, j);
+  return awkward_parallel_for(length, [&](int64_t begin, int64_t end) -> ERROR {
+    for (int64_t i = begin;  i < end;  i++) {
+      T j = carry[i];
+      if (j > lenfromindex) {
+        return failure("index out of range", kSliceNone, j);
+      }
+      toindex[i] = fromindex[(size_t)(fromindexoffset + j)];
     }
-    toindex[i] = fromindex[(size_t)(fromindexoffset + j)];
-  }
-  return success();
+    return success();
+  });
 }
 ERROR awkward_index8_carry_64(int8_t* toindex, const int8_t* fromindex, const int64_t* carry, int64_t fromindexoffset, int64_t lenfromindex, int64_t length) {
   return awkward_index_carry<int8_t, int64_t>(toindex, fromindex, carry, fromindexoffset, lenfromindex, length);
@@ -104,10 +107,12 @@ ERROR awkward_index64_carry_64(int64_t* toindex, const int64_t* fromindex, const
 
 template <typename C, typename T>
 ERROR awkward_index_carry_nocheck(C* toindex, const C* fromindex, const T* carry, int64_t fromindexoffset, int64_t length) {
-  for (int64_t i = 0;  i < length;  i++) {
-    toindex[i] = fromindex[(size_t)(fromindexoffset + carry[i])];
-  }
-  return success();
+  return awkward_parallel_for(length, [&](int64_t begin, int64_t end) -> ERROR {
+    for (int64_t i = begin;  i < end;  i++) {
+      toindex[i] = fromindex[(size_t)(fromindexoffset + carry[i])];
+    }
+    return success();
+  });
 }
 ERROR awkward_index8_carry_nocheck_64(int8_t* toindex, const int8_t* fromindex, const int64_t* carry, int64_t fromindexoffset, int64_t length) {
   return awkward_index_carry_nocheck<int8_t, int64_t>(toindex, fromindex, carry, fromindexoffset, length);
@@ -161,10 +166,12 @@ ERROR awkward_slicemissing_check_same(bool* same, const int8_t* bytemask, int64_
 
 template <typename T>
 ERROR awkward_carry_arange(T* toptr, int64_t length) {
-  for (int64_t i = 0;  i < length;  i++) {
-    toptr[i] = i;
-  }
-  return success();
+  return awkward_parallel_for(length, [&](int64_t begin, int64_t end) -> ERROR {
+    for (int64_t i = begin;  i < end;  i++) {
+      toptr[i] = i;
+    }
+    return success();
+  });
 }
 ERROR awkward_carry_arange_64(int64_t* toptr, int64_t length) {
   return awkward_carry_arange<int64_t>(toptr, length);
@@ -172,15 +179,17 @@ ERROR awkward_carry_arange_64(int64_t* toptr, int64_t length) {
 
 template <typename ID, typename T>
 ERROR awkward_identities_getitem_carry(ID* newidentitiesptr, const ID* identitiesptr, const T* carryptr, int64_t lencarry, int64_t offset, int64_t width, int64_t length) {
-  for (int64_t i = 0;  i < lencarry;  i++) {
-    if (carryptr[i] >= length) {
-      return failure("index out of range", kSliceNone, carryptr[i]);
-    }
-    for (int64_t j = 0;  j < width;  j++) {
-      newidentitiesptr[width*i + j] = identitiesptr[offset + width*carryptr[i] + j];
+  return awkward_parallel_for(lencarry, [&](int64_t begin, int64_t end) -> ERROR {
+    for (int64_t i = begin;  i < end;  i++) {
+      if (carryptr[i] >= length) {
+        return failure("index out of range", kSliceNone, carryptr[i]);
+      }
+      for (int64_t j = 0;  j < width;  j++) {
+        newidentitiesptr[width*i + j] = identitiesptr[offset + width*carryptr[i] + j];
+      }
     }
-  }
-  return success();
+    return success();
+  });
 }
 ERROR awkward_identities32_getitem_carry_64(int32_t* newidentitiesptr, const int32_t* identitiesptr, const int64_t* carryptr, int64_t lencarry, int64_t offset, int64_t width, int64_t length) {
   return awkward_identities_getitem_carry<int32_t, int64_t>(newidentitiesptr, identitiesptr, carryptr, lencarry, offset, width, length);
@@ -202,10 +211,12 @@ ERROR awkward_numpyarray_contiguous_init_64(int64_t* toptr, int64_t skip, int64_
 
 template <typename T>
 ERROR awkward_numpyarray_contiguous_copy(uint8_t* toptr, const uint8_t* fromptr, int64_t len, int64_t stride, int64_t offset, const T* pos) {
-  for (int64_t i = 0;  i < len;  i++) {
-    memcpy(&toptr[i*stride], &fromptr[offset + (int64_t)pos[i]], (size_t)stride);
-  }
-  return success();
+  return awkward_parallel_for(len, [&](int64_t begin, int64_t end) -> ERROR {
+    for (int64_t i = begin;  i < end;  i++) {
+      memcpy(&toptr[i*stride], &fromptr[offset + (int64_t)pos[i]], (size_t)stride);
+    }
+    return success();
+  });
 }
 ERROR awkward_numpyarray_contiguous_copy_64(uint8_t* toptr, const uint8_t* fromptr, int64_t len, int64_t stride, int64_t offset, const int64_t* pos) {
   return awkward_numpyarray_contiguous_copy<int64_t>(toptr, fromptr, len, stride, offset, pos);
@@ -213,12 +224,14 @@ ERROR awkward_numpyarray_contiguous_copy_64(uint8_t* toptr, const uint8_t* fromp
 
 template <typename T>
 ERROR awkward_numpyarray_contiguous_next(T* topos, const T* frompos, int64_t len, int64_t skip, int64_t stride) {
-  for (int64_t i = 0;  i < len;  i++) {
-    for (int64_t j = 0;  j < skip;  j++) {
-      topos[i*skip + j] = frompos[i] + j*stride;
+  return awkward_parallel_for(len, [&](int64_t begin, int64_t end) -> ERROR {
+    for (int64_t i = begin;  i < end;  i++) {
+      for (int64_t j = 0;  j < skip;  j++) {
+        topos[i*skip + j] = frompos[i] + j*stride;
+      }
     }
-  }
-  return success();
+    return success();
+  });
 }
 ERROR awkward_numpyarray_contiguous_next_64(int64_t* topos, const int64_t* frompos, int64_t len, int64_t skip, int64_t stride) {
   return awkward_numpyarray_contiguous_next<int64_t>(topos, frompos, len, skip, stride);
@@ -226,10 +239,12 @@ ERROR awkward_numpyarray_contiguous_next_64(int64_t* topos, const int64_t* fromp
 
 template <typename T>
 ERROR awkward_numpyarray_getitem_next_null(uint8_t* toptr, const uint8_t* fromptr, int64_t len, int64_t stride, int64_t offset, const T* pos) {
-  for (int64_t i = 0;  i < len;  i++) {
-    std::memcpy(&toptr[i*stride], &fromptr[offset + pos[i]*stride], (size_t)stride);
-  }
-  return success();
+  return awkward_parallel_for(len, [&](int64_t begin, int64_t end) -> ERROR {
+    for (int64_t i = begin;  i < end;  i++) {
+      std::memcpy(&toptr[i*stride], &fromptr[offset + pos[i]*stride], (size_t)stride);
+    }
+    return success();
+  });
 }
 ERROR awkward_numpyarray_getitem_next_null_64(uint8_t* toptr, const uint8_t* fromptr, int64_t len, int64_t stride, int64_t offset, const int64_t* pos) {
   return awkward_numpyarray_getitem_next_null(toptr, fromptr, len, stride, offset, pos);
@@ -237,10 +252,12 @@ ERROR awkward_numpyarray_getitem_next_null_64(uint8_t* toptr, const uint8_t* fro
 
 template <typename T>
 ERROR awkward_numpyarray_getitem_next_at(T* nextcarryptr, const T* carryptr, int64_t lencarry, int64_t skip, int64_t at) {
-  for (int64_t i = 0;  i < lencarry;  i++) {
-    nextcarryptr[i] = skip*carryptr[i] + at;
-  }
-  return success();
+  return awkward_parallel_for(lencarry, [&](int64_t begin, int64_t end) -> ERROR {
+    for (int64_t i = begin;  i < end;  i++) {
+      nextcarryptr[i] = skip*carryptr[i] + at;
+    }
+    return success();
+  });
 }
 ERROR awkward_numpyarray_getitem_next_at_64(int64_t* nextcarryptr, const int64_t* carryptr, int64_t lencarry, int64_t skip, int64_t at) {
   return awkward_numpyarray_getitem_next_at(nextcarryptr, carryptr, lencarry, skip, at);
@@ -248,12 +265,14 @@ ERROR awkward_numpyarray_getitem_next_at_64(int64_t* nextcarryptr, const int64_t
 
 template <typename T>
 ERROR awkward_numpyarray_getitem_next_range(T* nextcarryptr, const T* carryptr, int64_t lencarry, int64_t lenhead, int64_t skip, int64_t start, int64_t step) {
-  for (int64_t i = 0;  i < lencarry;  i++) {
-    for (int64_t j = 0;  j < lenhead;  j++) {
-      nextcarryptr[i*lenhead + j] = skip*carryptr[i] + start + j*step;
+  return awkward_parallel_for(lencarry, [&](int64_t begin, int64_t end) -> ERROR {
+    for (int64_t i = begin;  i < end;  i++) {
+      for (int64_t j = 0;  j < lenhead;  j++) {
+        nextcarryptr[i*lenhead + j] = skip*carryptr[i] + start + j*step;
+      }
     }
-  }
-  return success();
+    return success();
+  });
 }
 ERROR awkward_numpyarray_getitem_next_range_64(int64_t* nextcarryptr, const int64_t* carryptr, int64_t lencarry, int64_t lenhead, int64_t skip, int64_t start, int64_t step) {
   return awkward_numpyarray_getitem_next_range(nextcarryptr, carryptr, lencarry, lenhead, skip, start, step);
@@ -261,13 +280,15 @@ ERROR awkward_numpyarray_getitem_next_range_64(int64_t* nextcarryptr, const int6
 
 template <typename T>
 ERROR awkward_numpyarray_getitem_next_range_advanced(T* nextcarryptr, T* nextadvancedptr, const T* carryptr, const T* advancedptr, int64_t lencarry, int64_t lenhead, int64_t skip, int64_t start, int64_t step) {
-  for (int64_t i = 0;  i < lencarry;  i++) {
-    for (int64_t j = 0;  j < lenhead;  j++) {
-      nextcarryptr[i*lenhead + j] = skip*carryptr[i] + start + j*step;
-      nextadvancedptr[i*lenhead + j] = advancedptr[i];
+  return awkward_parallel_for(lencarry, [&](int64_t begin, int64_t end) -> ERROR {
+    for (int64_t i = begin;  i < end;  i++) {
+      for (int64_t j = 0;  j < lenhead;  j++) {
+        nextcarryptr[i*lenhead + j] = skip*carryptr[i] + start + j*step;
+        nextadvancedptr[i*lenhead + j] = advancedptr[i];
+      }
     }
-  }
-  return success();
+    return success();
+  });
 }
 ERROR awkward_numpyarray_getitem_next_range_advanced_64(int64_t* nextcarryptr, int64_t* nextadvancedptr, const int64_t* carryptr, const int64_t* advancedptr, int64_t lencarry, int64_t lenhead, int64_t skip, int64_t start, int64_t step) {
   return awkward_numpyarray_getitem_next_range_advanced(nextcarryptr, nextadvancedptr, carryptr, advancedptr, lencarry, lenhead, skip, start, step);
@@ -275,13 +296,15 @@ ERROR awkward_numpyarray_getitem_next_range_advanced_64(int64_t* nextcarryptr, i
 
 template <typename T>
 ERROR awkward_numpyarray_getitem_next_array(T* nextcarryptr, T* nextadvancedptr, const T* carryptr, const T* flatheadptr, int64_t lencarry, int64_t lenflathead, int64_t skip) {
-  for (int64_t i = 0;  i < lencarry;  i++) {
-    for (int64_t j = 0;  j < lenflathead;  j++) {
-      nextcarryptr[i*lenflathead + j] = skip*carryptr[i] + flatheadptr[j];
-      nextadvancedptr[i*lenflathead + j] = j;
+  return awkward_parallel_for(lencarry, [&](int64_t begin, int64_t end) -> ERROR {
+    for (int64_t i = begin;  i < end;  i++) {
+      for (int64_t j = 0;  j < lenflathead;  j++) {
+        nextcarryptr[i*lenflathead + j] = skip*carryptr[i] + flatheadptr[j];
+        nextadvancedptr[i*lenflathead + j] = j;
+      }
     }
-  }
-  return success();
+    return success();
+  });
 }
 ERROR awkward_numpyarray_getitem_next_array_64(int64_t* nextcarryptr, int64_t* nextadvancedptr, const int64_t* carryptr, const int64_t* flatheadptr, int64_t lencarry, int64_t lenflathead, int64_t skip) {
   return awkward_numpyarray_getitem_next_array(nextcarryptr, nextadvancedptr, carryptr, flatheadptr, lencarry, lenflathead, skip);
@@ -289,10 +312,12 @@ ERROR awkward_numpyarray_getitem_next_array_64(int64_t* nextcarryptr, int64_t* n
 
 template <typename T>
 ERROR awkward_numpyarray_getitem_next_array_advanced(T* nextcarryptr, const T* carryptr, const T* advancedptr, const T* flatheadptr, int64_t lencarry, int64_t skip) {
-  for (int64_t i = 0;  i < lencarry;  i++) {
-    nextcarryptr[i] = skip*carryptr[i] + flatheadptr[advancedptr[i]];
-  }
-  return success();
+  return awkward_parallel_for(lencarry, [&](int64_t begin, int64_t end) -> ERROR {
+    for (int64_t i = begin;  i < end;  i++) {
+      nextcarryptr[i] = skip*carryptr[i] + flatheadptr[advancedptr[i]];
+    }
+    return success();
+  });
 }
 ERROR awkward_numpyarray_getitem_next_array_advanced_64(int64_t* nextcarryptr, const int64_t* carryptr, const int64_t* advancedptr, const int64_t* flatheadptr, int64_t lencarry, int64_t skip) {
   return awkward_numpyarray_getitem_next_array_advanced(nextcarryptr, carryptr, advancedptr, flatheadptr, lencarry, skip);
@@ -526,14 +551,16 @@ ERROR awkward_listarray64_getitem_next_array_advanced_64(int64_t* tocarry, int64
 
 template <typename C, typename T>
 ERROR awkward_listarray_getitem_carry(C* tostarts, C* tostops, const C* fromstarts, const C* fromstops, const T* fromcarry, int64_t startsoffset, int64_t stopsoffset, int64_t lenstarts, int64_t lencarry) {
-  for (int64_t i = 0;  i < lencarry;  i++) {
-    if (fromcarry[i] >= lenstarts) {
-      return failure("index out of range", i, fromcarry[i]);
+  return awkward_parallel_for(lencarry, [&](int64_t begin, int64_t end) -> ERROR {
+    for (int64_t i = begin;  i < end;  i++) {
+      if (fromcarry[i] >= lenstarts) {
+        return failure("index out of range", i, fromcarry[i]);
+      }
+      tostarts[i] = (C)(fromstarts[startsoffset + fromcarry[i]]);
+      tostops[i] = (C)(fromstops[stopsoffset + fromcarry[i]]);
     }
-    tostarts[i] = (C)(fromstarts[startsoffset + fromcarry[i]]);
-    tostops[i] = (C)(fromstops[stopsoffset + fromcarry[i]]);
-  }
-  return success();
+    return success();
+  });
 }
 ERROR awkward_listarray32_getitem_carry_64(int32_t* tostarts, int32_t* tostops, const int32_t* fromstarts, const int32_t* fromstops, const int64_t* fromcarry, int64_t startsoffset, int64_t stopsoffset, int64_t lenstarts, int64_t lencarry) {
   return awkward_listarray_getitem_carry<int32_t, int64_t>(tostarts, tostops, fromstarts, fromstops, fromcarry, startsoffset, stopsoffset, lenstarts, lencarry);
@@ -608,13 +635,15 @@ ERROR awkward_regulararray_getitem_next_array_regularize_64(int64_t* toarray, co
 
 template <typename T>
 ERROR awkward_regulararray_getitem_next_array(T* tocarry, T* toadvanced, const T* fromarray, int64_t len, int64_t lenarray, int64_t size) {
-  for (int64_t i = 0;  i < len;  i++) {
-    for (int64_t j = 0;  j < lenarray;  j++) {
-      tocarry[i*lenarray + j] = i*size + fromarray[j];
-      toadvanced[i*lenarray + j] = j;
+  return awkward_parallel_for(len, [&](int64_t begin, int64_t end) -> ERROR {
+    for (int64_t i = begin;  i < end;  i++) {
+      for (int64_t j = 0;  j < lenarray;  j++) {
+        tocarry[i*lenarray + j] = i*size + fromarray[j];
+        toadvanced[i*lenarray + j] = j;
+      }
     }
-  }
-  return success();
+    return success();
+  });
 }
 ERROR awkward_regulararray_getitem_next_array_64(int64_t* tocarry, int64_t* toadvanced, const int64_t* fromarray, int64_t len, int64_t lenarray, int64_t size) {
   return awkward_regulararray_getitem_next_array<int64_t>(tocarry, toadvanced, fromarray, len, lenarray, size);
@@ -622,11 +651,13 @@ ERROR awkward_regulararray_getitem_next_array_64(int64_t* tocarry, int64_t* toad
 
 template <typename T>
 ERROR awkward_regulararray_getitem_next_array_advanced(T* tocarry, T* toadvanced, const T* fromadvanced, const T* fromarray, int64_t len, int64_t lenarray, int64_t size) {
-  for (int64_t i = 0;  i < len;  i++) {
-    tocarry[i] = i*size + fromarray[fromadvanced[i]];
-    toadvanced[i] = i;
-  }
-  return success();
+  return awkward_parallel_for(len, [&](int64_t begin, int64_t end) -> ERROR {
+    for (int64_t i = begin;  i < end;  i++) {
+      tocarry[i] = i*size + fromarray[fromadvanced[i]];
+      toadvanced[i] = i;
+    }
+    return success();
+  });
 }
 ERROR awkward_regulararray_getitem_next_array_advanced_64(int64_t* tocarry, int64_t* toadvanced, const int64_t* fromadvanced, const int64_t* fromarray, int64_t len, int64_t lenarray, int64_t size) {
   return awkward_regulararray_getitem_next_array_advanced<int64_t>(tocarry, toadvanced, fromadvanced, fromarray, len, lenarray, size);
@@ -634,12 +665,14 @@ ERROR awkward_regulararray_getitem_next_array_advanced_64(int64_t* tocarry, int6
 
 template <typename T>
 ERROR awkward_regulararray_getitem_carry(T* tocarry, const T* fromcarry, int64_t lencarry, int64_t size) {
-  for (int64_t i = 0;  i < lencarry;  i++) {
-    for (int64_t j = 0;  j < size;  j++) {
-      tocarry[i*size + j] = fromcarry[i]*size + j;
+  return awkward_parallel_for(lencarry, [&](int64_t begin, int64_t end) -> ERROR {
+    for (int64_t i = begin;  i < end;  i++) {
+      for (int64_t j = 0;  j < size;  j++) {
+        tocarry[i*size + j] = fromcarry[i]*size + j;
+      }
     }
-  }
-  return success();
+    return success();
+  });
 }
 ERROR awkward_regulararray_getitem_carry_64(int64_t* tocarry, const int64_t* fromcarry, int64_t lencarry, int64_t size) {
   return awkward_regulararray_getitem_carry<int64_t>(tocarry, fromcarry, lencarry, size);
@@ -802,18 +835,17 @@ ERROR awkward_indexedarray_getitem_adjust_outindex_64(int8_t* tomask, int64_t* t
 
 template <typename C, typename T>
 ERROR awkward_indexedarray_getitem_nextcarry(T* tocarry, const C* fromindex, int64_t indexoffset, int64_t lenindex, int64_t lencontent) {
-  int64_t k = 0;
-  for (int64_t i = 0;  i < lenindex;  i++) {
-    C j = fromindex[indexoffset + i];
-    if (j < 0  ||  j >= lencontent) {
-      return failure("index out of range", i, j);
-    }
-    else {
-      tocarry[k] = j;
-      k++;
+  // no missing values are allowed, so every i fills tocarry[i]
+  return awkward_parallel_for(lenindex, [&](int64_t begin, int64_t end) -> ERROR {
+    for (int64_t i = begin;  i < end;  i++) {
+      C j = fromindex[indexoffset + i];
+      if (j < 0  ||  j >= lencontent) {
+        return failure("index out of range", i, j);
+      }
+      tocarry[i] = j;
     }
-  }
-  return success();
+    return success();
+  });
 }
 ERROR awkward_indexedarray32_getitem_nextcarry_64(int64_t* tocarry, const int32_t* fromindex, int64_t indexoffset, int64_t lenindex, int64_t lencontent) {
   return awkward_indexedarray_getitem_nextcarry<int32_t, int64_t>(tocarry, fromindex, indexoffset, lenindex, lencontent);
@@ -827,13 +859,15 @@ ERROR awkward_indexedarray64_getitem_nextcarry_64(int64_t* tocarry, const int64_
 
 template <typename C, typename T>
 ERROR awkward_indexedarray_getitem_carry(C* toindex, const C* fromindex, const T* fromcarry, int64_t indexoffset, int64_t lenindex, int64_t lencarry) {
-  for (int64_t i = 0;  i < lencarry;  i++) {
-    if (fromcarry[i] >= lenindex) {
-      return failure("index out of range", i, fromcarry[i]);
+  return awkward_parallel_for(lencarry, [&](int64_t begin, int64_t end) -> ERROR {
+    for (int64_t i = begin;  i < end;  i++) {
+      if (fromcarry[i] >= lenindex) {
+        return failure("index out of range", i, fromcarry[i]);
+      }
+      toindex[i] = (C)(fromindex[indexoffset + fromcarry[i]]);
     }
-    toindex[i] = (C)(fromindex[indexoffset + fromcarry[i]]);
-  }
-  return success();
+    return success();
+  });
 }
 ERROR awkward_indexedarray32_getitem_carry_64(int32_t* toindex, const int32_t* fromindex, const int64_t* fromcarry, int64_t indexoffset, int64_t lenindex, int64_t lencarry) {
   return awkward_indexedarray_getitem_carry<int32_t, int64_t>(toindex, fromindex, fromcarry, indexoffset, lenindex, lencarry);
@@ -1098,13 +1132,15 @@ ERROR awkward_listarray64_getitem_jagged_descend_64(int64_t* tooffsets, const in
 
 template <typename T>
 ERROR awkward_bytemaskedarray_getitem_carry(int8_t* tomask, const int8_t* frommask, int64_t frommaskoffset, int64_t lenmask, const T* fromcarry, int64_t lencarry) {
-  for (int64_t i = 0;  i < lencarry;  i++) {
-    if (fromcarry[i] >= lenmask) {
-      return failure("index out of range", i, fromcarry[i]);
+  return awkward_parallel_for(lencarry, [&](int64_t begin, int64_t end) -> ERROR {
+    for (int64_t i = begin;  i < end;  i++) {
+      if (fromcarry[i] >= lenmask) {
+        return failure("index out of range", i, fromcarry[i]);
+      }
+      tomask[i] = frommask[frommaskoffset + fromcarry[i]];
     }
-    tomask[i] = frommask[frommaskoffset + fromcarry[i]];
-  }
-  return success();
+    return success();
+  });
 }
 ERROR awkward_bytemaskedarray_getitem_carry_64(int8_t* tomask, const int8_t* frommask, int64_t frommaskoffset, int64_t lenmask, const int64_t* fromcarry, int64_t lencarry) {
   return awkward_bytemaskedarray_getitem_carry(tomask, frommask, frommaskoffset, lenmask, fromcarry, lencarry);
@@ -1164,3 +1200,163 @@ ERROR awkward_bytemaskedarray_toindexedarray(T* toindex, const int8_t* mask, int
 ERROR awkward_bytemaskedarray_toindexedarray_64(int64_t* toindex, const int8_t* mask, int64_t maskoffset, int64_t length, bool validwhen) {
   return awkward_bytemaskedarray_toindexedarray<int64_t>(toindex, mask, maskoffset, length, validwhen);
 }
+
+// A SliceMask is either one byte per item (nonzero is true) or one bit per item.
+// get(i) reads one item; count(begin, end) is a popcount over a range, eight
+// bytes (or 64 bits) at a time.
+inline int64_t awkward_popcount64(uint64_t x) {
+  x = x - ((x >> 1) & 0x5555555555555555ULL);
+  x = (x & 0x3333333333333333ULL) + ((x >> 2) & 0x3333333333333333ULL);
+  x = (x + (x >> 4)) & 0x0f0f0f0f0f0f0f0fULL;
+  return (int64_t)((x * 0x0101010101010101ULL) >> 56);
+}
+
+struct SliceMaskBytes {
+  const uint8_t* mask;
+
+  bool get(int64_t i) const {
+    return mask[i] != 0;
+  }
+
+  int64_t count(int64_t begin, int64_t end) const {
+    int64_t out = 0;
+    int64_t i = begin;
+    for (;  i + 8 <= end;  i += 8) {
+      uint64_t word;
+      std::memcpy(&word, &mask[i], 8);
+      // fold each byte onto its lowest bit, so that bytes other than 0 and 1 count once
+      word |= (word >> 4);
+      word |= (word >> 2);
+      word |= (word >> 1);
+      out += awkward_popcount64(word & 0x0101010101010101ULL);
+    }
+    for (;  i < end;  i++) {
+      out += (mask[i] != 0);
+    }
+    return out;
+  }
+};
+
+struct SliceMaskBits {
+  const uint8_t* mask;
+  bool lsb_order;
+
+  bool get(int64_t i) const {
+    int64_t bit = (lsb_order ? (i & 7) : (7 - (i & 7)));
+    return ((mask[i >> 3] >> bit) & 1) != 0;
+  }
+
+  int64_t count(int64_t begin, int64_t end) const {
+    int64_t out = 0;
+    int64_t i = begin;
+    for (;  i < end  &&  (i & 7) != 0;  i++) {
+      out += get(i);
+    }
+    for (;  i + 64 <= end;  i += 64) {
+      uint64_t word;
+      std::memcpy(&word, &mask[i >> 3], 8);
+      out += awkward_popcount64(word);
+    }
+    for (;  i + 8 <= end;  i += 8) {
+      out += awkward_popcount64((uint64_t)mask[i >> 3]);
+    }
+    for (;  i < end;  i++) {
+      out += get(i);
+    }
+    return out;
+  }
+};
+
+template <typename M>
+ERROR awkward_slicemask_count(int64_t* numtrue, const M& mask, int64_t length) {
+  int64_t numchunks = awkward_parallel_numchunks(length);
+  std::vector<int64_t> counts((size_t)numchunks, 0);
+  struct Error err = awkward_parallel_chunks(length, numchunks, [&](int64_t chunk, int64_t begin, int64_t end) -> ERROR {
+    counts[(size_t)chunk] = mask.count(begin, end);
+    return success();
+  });
+  *numtrue = 0;
+  for (auto x : counts) {
+    *numtrue += x;
+  }
+  return err;
+}
+ERROR awkward_slicemask_numtrue(int64_t* numtrue, const uint8_t* mask, int64_t maskoffset, int64_t length, bool bitmask, bool lsb_order) {
+  if (bitmask) {
+    return awkward_slicemask_count(numtrue, SliceMaskBits{ &mask[maskoffset], lsb_order }, length);
+  }
+  else {
+    return awkward_slicemask_count(numtrue, SliceMaskBytes{ &mask[maskoffset] }, length);
+  }
+}
+
+// Calls fill(k, i) for the kth true item i, in one pass over the mask. When the
+// pass is split into chunks, a popcount of each chunk gives it its first k.
+template <typename M, typename F>
+ERROR awkward_slicemask_apply(const M& mask, int64_t length, int64_t lenarray, const F& fill) {
+  int64_t numchunks = awkward_parallel_numchunks(length);
+  std::vector<int64_t> bases((size_t)numchunks, 0);
+  if (numchunks > 1) {
+    awkward_parallel_chunks(length, numchunks, [&](int64_t chunk, int64_t begin, int64_t end) -> ERROR {
+      bases[(size_t)chunk] = mask.count(begin, end);
+      return success();
+    });
+    int64_t base = 0;
+    for (int64_t chunk = 0;  chunk < numchunks;  chunk++) {
+      int64_t count = bases[(size_t)chunk];
+      bases[(size_t)chunk] = base;
+      base += count;
+    }
+  }
+  return awkward_parallel_chunks(length, numchunks, [&](int64_t chunk, int64_t begin, int64_t end) -> ERROR {
+    int64_t k = bases[(size_t)chunk];
+    for (int64_t i = begin;  i < end;  i++) {
+      if (mask.get(i)) {
+        if (i >= lenarray) {
+          return failure("index out of range", kSliceNone, i);
+        }
+        fill(k, i);
+        k++;
+      }
+    }
+    return success();
+  });
+}
+template <typename F>
+ERROR awkward_slicemask_apply(const uint8_t* mask, int64_t maskoffset, int64_t length, bool bitmask, bool lsb_order, int64_t lenarray, const F& fill) {
+  if (bitmask) {
+    return awkward_slicemask_apply(SliceMaskBits{ &mask[maskoffset], lsb_order }, length, lenarray, fill);
+  }
+  else {
+    return awkward_slicemask_apply(SliceMaskBytes{ &mask[maskoffset] }, length, lenarray, fill);
+  }
+}
+
+ERROR awkward_slicemask_nonzero_64(int64_t* tocarry, const uint8_t* mask, int64_t maskoffset, int64_t length, bool bitmask, bool lsb_order, int64_t lenarray) {
+  return awkward_slicemask_apply(mask, maskoffset, length, bitmask, lsb_order, lenarray, [&](int64_t k, int64_t i) -> void {
+    tocarry[k] = i;
+  });
+}
+
+ERROR awkward_numpyarray_getitem_slicemask(uint8_t* toptr, const uint8_t* fromptr, int64_t byteoffset, int64_t stride, int64_t lenarray, const uint8_t* mask, int64_t maskoffset, int64_t length, bool bitmask, bool lsb_order) {
+  return awkward_slicemask_apply(mask, maskoffset, length, bitmask, lsb_order, lenarray, [&](int64_t k, int64_t i) -> void {
+    std::memcpy(&toptr[k*stride], &fromptr[byteoffset + i*stride], (size_t)stride);
+  });
+}
+
+template <typename C>
+ERROR awkward_listoffsetarray_getitem_slicemask(C* tostarts, C* tostops, const C* fromoffsets, int64_t offsetsoffset, int64_t lenarray, const uint8_t* mask, int64_t maskoffset, int64_t length, bool bitmask, bool lsb_order) {
+  return awkward_slicemask_apply(mask, maskoffset, length, bitmask, lsb_order, lenarray, [&](int64_t k, int64_t i) -> void {
+    tostarts[k] = fromoffsets[offsetsoffset + i];
+    tostops[k] = fromoffsets[offsetsoffset + i + 1];
+  });
+}
+ERROR awkward_listoffsetarray32_getitem_slicemask(int32_t* tostarts, int32_t* tostops, const int32_t* fromoffsets, int64_t offsetsoffset, int64_t lenarray, const uint8_t* mask, int64_t maskoffset, int64_t length, bool bitmask, bool lsb_order) {
+  return awkward_listoffsetarray_getitem_slicemask<int32_t>(tostarts, tostops, fromoffsets, offsetsoffset, lenarray, mask, maskoffset, length, bitmask, lsb_order);
+}
+ERROR awkward_listoffsetarrayU32_getitem_slicemask(uint32_t* tostarts, uint32_t* tostops, const uint32_t* fromoffsets, int64_t offsetsoffset, int64_t lenarray, const uint8_t* mask, int64_t maskoffset, int64_t length, bool bitmask, bool lsb_order) {
+  return awkward_listoffsetarray_getitem_slicemask<uint32_t>(tostarts, tostops, fromoffsets, offsetsoffset, lenarray, mask, maskoffset, length, bitmask, lsb_order);
+}
+ERROR awkward_listoffsetarray64_getitem_slicemask(int64_t* tostarts, int64_t* tostops, const int64_t* fromoffsets, int64_t offsetsoffset, int64_t lenarray, const uint8_t* mask, int64_t maskoffset, int64_t length, bool bitmask, bool lsb_order) {
+  return awkward_listoffsetarray_getitem_slicemask<int64_t>(tostarts, tostops, fromoffsets, offsetsoffset, lenarray, mask, maskoffset, length, bitmask, lsb_order);
+}
@@ -2,16 +2,19 @@
 
 #include <cstring>
 
+#include "awkward/cpu-kernels/parallel.h"
 #include "awkward/cpu-kernels/operations.h"
 
 template <typename T, typename C>
 ERROR awkward_listarray_num(T* tonum, const C* fromstarts, int64_t startsoffset, const C* fromstops, int64_t stopsoffset, int64_t length) {
-  for (int64_t i = 0;  i < length;  i++) {
-    C start = fromstarts[startsoffset + i];
-    C stop = fromstops[stopsoffset + i];
-    tonum[i] = (T)(stop - start);
-  }
-  return success();
+  return awkward_parallel_for(length, [&](int64_t begin, int64_t end) -> ERROR {
+    for (int64_t i = begin;  i < end;  i++) {
+      C start = fromstarts[startsoffset + i];
+      C stop = fromstops[stopsoffset + i];
+      tonum[i] = (T)(stop - start);
+    }
+    return success();
+  });
 }
 ERROR awkward_listarray32_num_64(int64_t* tonum, const int32_t* fromstarts, int64_t startsoffset, const int32_t* fromstops, int64_t stopsoffset, int64_t length) {
   return awkward_listarray_num<int64_t, int32_t>(tonum, fromstarts, startsoffset, fromstops, stopsoffset, length);
@@ -159,11 +162,13 @@ ERROR awkward_indexedarray64_flatten_nextcarry_64(int64_t* tocarry, const int64_
 
 template <typename C, typename M, typename TO>
 ERROR awkward_indexedarray_overlay_mask(TO* toindex, const M* mask, int64_t maskoffset, const C* fromindex, int64_t indexoffset, int64_t length) {
-  for (int64_t i = 0;  i < length;  i++) {
-    M m = mask[maskoffset + i];
-    toindex[i] = (m ? -1 : fromindex[indexoffset + i]);
-  }
-  return success();
+  return awkward_parallel_for(length, [&](int64_t begin, int64_t end) -> ERROR {
+    for (int64_t i = begin;  i < end;  i++) {
+      M m = mask[maskoffset + i];
+      toindex[i] = (m ? -1 : fromindex[indexoffset + i]);
+    }
+    return success();
+  });
 }
 ERROR awkward_indexedarray32_overlay_mask8_to64(int64_t* toindex, const int8_t* mask, int64_t maskoffset, const int32_t* fromindex, int64_t indexoffset, int64_t length) {
   return awkward_indexedarray_overlay_mask<int32_t, int8_t, int64_t>(toindex, mask, maskoffset, fromindex, indexoffset, length);
@@ -177,10 +182,12 @@ ERROR awkward_indexedarray64_overlay_mask8_to64(int64_t* toindex, const int8_t*
 
 template <typename C, typename M>
 ERROR awkward_indexedarray_mask(M* tomask, const C* fromindex, int64_t indexoffset, int64_t length) {
-  for (int64_t i = 0;  i < length;  i++) {
-    tomask[i] = (fromindex[indexoffset + i] < 0);
-  }
-  return success();
+  return awkward_parallel_for(length, [&](int64_t begin, int64_t end) -> ERROR {
+    for (int64_t i = begin;  i < end;  i++) {
+      tomask[i] = (fromindex[indexoffset + i] < 0);
+    }
+    return success();
+  });
 }
 ERROR awkward_indexedarray32_mask8(int8_t* tomask, const int32_t* fromindex, int64_t indexoffset, int64_t length) {
   return awkward_indexedarray_mask<int32_t, int8_t>(tomask, fromindex, indexoffset, length);
@@ -194,10 +201,12 @@ ERROR awkward_indexedarray64_mask8(int8_t* tomask, const int64_t* fromindex, int
 
 template <typename M>
 ERROR awkward_bytemaskedarray_mask(M* tomask, const M* frommask, int64_t maskoffset, int64_t length, bool validwhen) {
-  for (int64_t i = 0;  i < length;  i++) {
-    tomask[i] = ((frommask[maskoffset + i] != 0) != validwhen);
-  }
-  return success();
+  return awkward_parallel_for(length, [&](int64_t begin, int64_t end) -> ERROR {
+    for (int64_t i = begin;  i < end;  i++) {
+      tomask[i] = ((frommask[maskoffset + i] != 0) != validwhen);
+    }
+    return success();
+  });
 }
 ERROR awkward_bytemaskedarray_mask8(int8_t* tomask, const int8_t* frommask, int64_t maskoffset, int64_t length, bool validwhen) {
   return awkward_bytemaskedarray_mask(tomask, frommask, maskoffset, length, validwhen);
@@ -205,10 +214,12 @@ ERROR awkward_bytemaskedarray_mask8(int8_t* tomask, const int8_t* frommask, int6
 
 template <typename M>
 ERROR awkward_zero_mask(M* tomask, int64_t length) {
-  for (int64_t i = 0;  i < length;  i++) {
-    tomask[i] = 0;
-  }
-  return success();
+  return awkward_parallel_for(length, [&](int64_t begin, int64_t end) -> ERROR {
+    for (int64_t i = begin;  i < end;  i++) {
+      tomask[i] = 0;
+    }
+    return success();
+  });
 }
 ERROR awkward_zero_mask8(int8_t* tomask, int64_t length) {
   return awkward_zero_mask<int8_t>(tomask, length);
@@ -216,19 +227,21 @@ ERROR awkward_zero_mask8(int8_t* tomask, int64_t length) {
 
 template <typename OUT, typename IN, typename TO>
 ERROR awkward_indexedarray_simplify(TO* toindex, const OUT* outerindex, int64_t outeroffset, int64_t outerlength, const IN* innerindex, int64_t inneroffset, int64_t innerlength) {
-  for (int64_t i = 0;  i < outerlength;  i++) {
-    OUT j = outerindex[outeroffset + i];
-    if (j < 0) {
-      toindex[i] = -1;
-    }
-    else if (j >= innerlength) {
-      return failure("index out of range", i, j);
-    }
-    else {
-      toindex[i] = innerindex[inneroffset + j];
+  return awkward_parallel_for(outerlength, [&](int64_t begin, int64_t end) -> ERROR {
+    for (int64_t i = begin;  i < end;  i++) {
+      OUT j = outerindex[outeroffset + i];
+      if (j < 0) {
+        toindex[i] = -1;
+      }
+      else if (j >= innerlength) {
+        return failure("index out of range", i, j);
+      }
+      else {
+        toindex[i] = innerindex[inneroffset + j];
+      }
     }
-  }
-  return success();
+    return success();
+  });
 }
 ERROR awkward_indexedarray32_simplify32_to64(int64_t* toindex, const int32_t* outerindex, int64_t outeroffset, int64_t outerlength, const int32_t* innerindex, int64_t inneroffset, int64_t innerlength) {
   return awkward_indexedarray_simplify<int32_t, int32_t, int64_t>(toindex, outerindex, outeroffset, outerlength, innerindex, inneroffset, innerlength);
@@ -261,10 +274,12 @@ ERROR awkward_indexedarray64_simplify64_to64(int64_t* toindex, const int64_t* ou
 template <typename T>
 ERROR awkward_regulararray_compact_offsets(T* tooffsets, int64_t length, int64_t size) {
   tooffsets[0] = 0;
-  for (int64_t i = 0;  i < length;  i++) {
-    tooffsets[i + 1] = (i + 1)*size;
-  }
-  return success();
+  return awkward_parallel_for(length, [&](int64_t begin, int64_t end) -> ERROR {
+    for (int64_t i = begin;  i < end;  i++) {
+      tooffsets[i + 1] = (i + 1)*size;
+    }
+    return success();
+  });
 }
 ERROR awkward_regulararray_compact_offsets64(int64_t* tooffsets, int64_t length, int64_t size) {
   return awkward_regulararray_compact_offsets<int64_t>(tooffsets, length, size);
@@ -273,15 +288,46 @@ ERROR awkward_regulararray_compact_offsets64(int64_t* tooffsets, int64_t length,
 template <typename C, typename T>
 ERROR awkward_listarray_compact_offsets(T* tooffsets, const C* fromstarts, const C* fromstops, int64_t startsoffset, int64_t stopsoffset, int64_t length) {
   tooffsets[0] = 0;
-  for (int64_t i = 0;  i < length;  i++) {
-    C start = fromstarts[startsoffset + i];
-    C stop = fromstops[stopsoffset + i];
-    if (stop < start) {
-      return failure("stops[i] < starts[i]", i, kSliceNone);
+  // prefix sum in two passes: each chunk's total, then each chunk's offsets from its base
+  int64_t numchunks = awkward_parallel_numchunks(length);
+  std::vector<T> bases((size_t)numchunks, 0);
+  if (numchunks > 1) {
+    struct Error err = awkward_parallel_chunks(length, numchunks, [&](int64_t chunk, int64_t begin, int64_t end) -> ERROR {
+      T total = 0;
+      for (int64_t i = begin;  i < end;  i++) {
+        C start = fromstarts[startsoffset + i];
+        C stop = fromstops[stopsoffset + i];
+        if (stop < start) {
+          return failure("stops[i] < starts[i]", i, kSliceNone);
+        }
+        total += (stop - start);
+      }
+      bases[(size_t)chunk] = total;
+      return success();
+    });
+    if (err.str != nullptr) {
+      return err;
+    }
+    T base = 0;
+    for (int64_t chunk = 0;  chunk < numchunks;  chunk++) {
+      T total = bases[(size_t)chunk];
+      bases[(size_t)chunk] = base;
+      base += total;
     }
-    tooffsets[i + 1] = tooffsets[i] + (stop - start);
   }
-  return success();
+  return awkward_parallel_chunks(length, numchunks, [&](int64_t chunk, int64_t begin, int64_t end) -> ERROR {
+    T offset = bases[(size_t)chunk];
+    for (int64_t i = begin;  i < end;  i++) {
+      C start = fromstarts[startsoffset + i];
+      C stop = fromstops[stopsoffset + i];
+      if (stop < start) {
+        return failure("stops[i] < starts[i]", i, kSliceNone);
+      }
+      offset += (stop - start);
+      tooffsets[i + 1] = offset;
+    }
+    return success();
+  });
 }
 ERROR awkward_listarray32_compact_offsets64(int64_t* tooffsets, const int32_t* fromstarts, const int32_t* fromstops, int64_t startsoffset, int64_t stopsoffset, int64_t length) {
   return awkward_listarray_compact_offsets<int32_t, int64_t>(tooffsets, fromstarts, fromstops, startsoffset, stopsoffset, length);
@@ -297,10 +343,12 @@ template <typename C, typename T>
 ERROR awkward_listoffsetarray_compact_offsets(T* tooffsets, const C* fromoffsets, int64_t offsetsoffset, int64_t length) {
   int64_t diff = (int64_t)fromoffsets[offsetsoffset + 0];
   tooffsets[0] = 0;
-  for (int64_t i = 0;  i < length;  i++) {
-    tooffsets[i + 1] = fromoffsets[offsetsoffset + i + 1] - diff;
-  }
-  return success();
+  return awkward_parallel_for(length, [&](int64_t begin, int64_t end) -> ERROR {
+    for (int64_t i = begin;  i < end;  i++) {
+      tooffsets[i + 1] = fromoffsets[offsetsoffset + i + 1] - diff;
+    }
+    return success();
+  });
 }
 ERROR awkward_listoffsetarray32_compact_offsets64(int64_t* tooffsets, const int32_t* fromoffsets, int64_t offsetsoffset, int64_t length) {
   return awkward_listoffsetarray_compact_offsets<int32_t, int64_t>(tooffsets, fromoffsets, offsetsoffset, length);
@@ -500,11 +548,13 @@ ERROR awkward_numpyarray_fill_tobool_frombool(bool* toptr, int64_t tooffset, con
 
 template <typename FROM, typename TO>
 ERROR awkward_listarray_fill(TO* tostarts, int64_t tostartsoffset, TO* tostops, int64_t tostopsoffset, const FROM* fromstarts, int64_t fromstartsoffset, const FROM* fromstops, int64_t fromstopsoffset, int64_t length, int64_t base) {
-  for (int64_t i = 0;  i < length;  i++) {
-    tostarts[tostartsoffset + i] = (TO)(fromstarts[fromstartsoffset + i] + base);
-    tostops[tostopsoffset + i] = (TO)(fromstops[fromstopsoffset + i] + base);
-  }
-  return success();
+  return awkward_parallel_for(length, [&](int64_t begin, int64_t end) -> ERROR {
+    for (int64_t i = begin;  i < end;  i++) {
+      tostarts[tostartsoffset + i] = (TO)(fromstarts[fromstartsoffset + i] + base);
+      tostops[tostopsoffset + i] = (TO)(fromstops[fromstopsoffset + i] + base);
+    }
+    return success();
+  });
 }
 ERROR awkward_listarray_fill_to64_from32(int64_t* tostarts, int64_t tostartsoffset, int64_t* tostops, int64_t tostopsoffset, const int32_t* fromstarts, int64_t fromstartsoffset, const int32_t* fromstops, int64_t fromstopsoffset, int64_t length, int64_t base) {
   return awkward_listarray_fill<int32_t, int64_t>(tostarts, tostartsoffset, tostops, tostopsoffset, fromstarts, fromstartsoffset, fromstops, fromstopsoffset, length, base);
@@ -518,11 +568,13 @@ ERROR awkward_listarray_fill_to64_from64(int64_t* tostarts, int64_t tostartsoffs
 
 template <typename FROM, typename TO>
 ERROR awkward_indexedarray_fill(TO* toindex, int64_t toindexoffset, const FROM* fromindex, int64_t fromindexoffset, int64_t length, int64_t base) {
-  for (int64_t i = 0;  i < length;  i++) {
-    FROM from = fromindex[fromindexoffset + i];
-    toindex[toindexoffset + i] = from < 0 ? -1 : (TO)(from + base);
-  }
-  return success();
+  return awkward_parallel_for(length, [&](int64_t begin, int64_t end) -> ERROR {
+    for (int64_t i = begin;  i < end;  i++) {
+      FROM from = fromindex[fromindexoffset + i];
+      toindex[toindexoffset + i] = from < 0 ? -1 : (TO)(from + base);
+    }
+    return success();
+  });
 }
 ERROR awkward_indexedarray_fill_to64_from32(int64_t* toindex, int64_t toindexoffset, const int32_t* fromindex, int64_t fromindexoffset, int64_t length, int64_t base) {
   return awkward_indexedarray_fill<int32_t, int64_t>(toindex, toindexoffset, fromindex, fromindexoffset, length, base);
@@ -536,10 +588,12 @@ ERROR awkward_indexedarray_fill_to64_from64(int64_t* toindex, int64_t toindexoff
 
 template <typename TO>
 ERROR awkward_indexedarray_fill_count(TO* toindex, int64_t toindexoffset, int64_t length, int64_t base) {
-  for (int64_t i = 0;  i < length;  i++) {
-    toindex[toindexoffset + i] = i + base;
-  }
-  return success();
+  return awkward_parallel_for(length, [&](int64_t begin, int64_t end) -> ERROR {
+    for (int64_t i = begin;  i < end;  i++) {
+      toindex[toindexoffset + i] = i + base;
+    }
+    return success();
+  });
 }
 ERROR awkward_indexedarray_fill_to64_count(int64_t* toindex, int64_t toindexoffset, int64_t length, int64_t base) {
   return awkward_indexedarray_fill_count(toindex, toindexoffset, length, base);
@@ -547,10 +601,12 @@ ERROR awkward_indexedarray_fill_to64_count(int64_t* toindex, int64_t toindexoffs
 
 template <typename FROM, typename TO>
 ERROR awkward_unionarray_filltags(TO* totags, int64_t totagsoffset, const FROM* fromtags, int64_t fromtagsoffset, int64_t length, int64_t base) {
-  for (int64_t i = 0;  i < length;  i++) {
-    totags[totagsoffset + i] = (TO)(fromtags[fromtagsoffset + i] + base);
-  }
-  return success();
+  return awkward_parallel_for(length, [&](int64_t begin, int64_t end) -> ERROR {
+    for (int64_t i = begin;  i < end;  i++) {
+      totags[totagsoffset + i] = (TO)(fromtags[fromtagsoffset + i] + base);
+    }
+    return success();
+  });
 }
 ERROR awkward_unionarray_filltags_to8_from8(int8_t* totags, int64_t totagsoffset, const int8_t* fromtags, int64_t fromtagsoffset, int64_t length, int64_t base) {
   return awkward_unionarray_filltags<int8_t, int8_t>(totags, totagsoffset, fromtags, fromtagsoffset, length, base);
@@ -558,10 +614,12 @@ ERROR awkward_unionarray_filltags_to8_from8(int8_t* totags, int64_t totagsoffset
 
 template <typename FROM, typename TO>
 ERROR awkward_unionarray_fillindex(TO* toindex, int64_t toindexoffset, const FROM* fromindex, int64_t fromindexoffset, int64_t length) {
-  for (int64_t i = 0;  i < length;  i++) {
-    toindex[toindexoffset + i] = (TO)fromindex[fromindexoffset + i];
-  }
-  return success();
+  return awkward_parallel_for(length, [&](int64_t begin, int64_t end) -> ERROR {
+    for (int64_t i = begin;  i < end;  i++) {
+      toindex[toindexoffset + i] = (TO)fromindex[fromindexoffset + i];
+    }
+    return success();
+  });
 }
 ERROR awkward_unionarray_fillindex_to64_from32(int64_t* toindex, int64_t toindexoffset, const int32_t* fromindex, int64_t fromindexoffset, int64_t length) {
   return awkward_unionarray_fillindex<int32_t, int64_t>(toindex, toindexoffset, fromindex, fromindexoffset, length);
@@ -575,10 +633,12 @@ ERROR awkward_unionarray_fillindex_to64_from64(int64_t* toindex, int64_t toindex
 
 template <typename TO>
 ERROR awkward_unionarray_filltags_const(TO* totags, int64_t totagsoffset, int64_t length, int64_t base) {
-  for (int64_t i = 0;  i < length;  i++) {
-    totags[totagsoffset + i] = (TO)base;
-  }
-  return success();
+  return awkward_parallel_for(length, [&](int64_t begin, int64_t end) -> ERROR {
+    for (int64_t i = begin;  i < end;  i++) {
+      totags[totagsoffset + i] = (TO)base;
+    }
+    return success();
+  });
 }
 ERROR awkward_unionarray_filltags_to8_const(int8_t* totags, int64_t totagsoffset, int64_t length, int64_t base) {
   return awkward_unionarray_filltags_const<int8_t>(totags, totagsoffset, length, base);
@@ -586,10 +646,12 @@ ERROR awkward_unionarray_filltags_to8_const(int8_t* totags, int64_t totagsoffset
 
 template <typename TO>
 ERROR awkward_unionarray_fillindex_count(TO* toindex, int64_t toindexoffset, int64_t length) {
-  for (int64_t i = 0;  i < length;  i++) {
-    toindex[toindexoffset + i] = (TO)i;
-  }
-  return success();
+  return awkward_parallel_for(length, [&](int64_t begin, int64_t end) -> ERROR {
+    for (int64_t i = begin;  i < end;  i++) {
+      toindex[toindexoffset + i] = (TO)i;
+    }
+    return success();
+  });
 }
 ERROR awkward_unionarray_fillindex_to64_count(int64_t* toindex, int64_t toindexoffset, int64_t length) {
   return awkward_unionarray_fillindex_count<int64_t>(toindex, toindexoffset, length);
@@ -1132,12 +1194,14 @@ ERROR awkward_regulararray_choose_64(int64_t** tocarry, int64_t n, bool diagonal
 
 template <typename M>
 ERROR awkward_bytemaskedarray_overlay_mask(M* tomask, const M* theirmask, int64_t theirmaskoffset, const M* mymask, int64_t mymaskoffset, int64_t length, bool validwhen) {
-  for (int64_t i = 0;  i < length;  i++) {
-    bool theirs = theirmask[theirmaskoffset + i];
-    bool mine = ((mymask[mymaskoffset + i] != 0) != validwhen);
-    tomask[i] = (theirs | mine ? 1 : 0);
-  }
-  return success();
+  return awkward_parallel_for(length, [&](int64_t begin, int64_t end) -> ERROR {
+    for (int64_t i = begin;  i < end;  i++) {
+      bool theirs = theirmask[theirmaskoffset + i];
+      bool mine = ((mymask[mymaskoffset + i] != 0) != validwhen);
+      tomask[i] = (theirs | mine ? 1 : 0);
+    }
+    return success();
+  });
 }
 ERROR awkward_bytemaskedarray_overlay_mask8(int8_t* tomask, const int8_t* theirmask, int64_t theirmaskoffset, const int8_t* mymask, int64_t mymaskoffset, int64_t length, bool validwhen) {
   return awkward_bytemaskedarray_overlay_mask<int8_t>(tomask, theirmask, theirmaskoffset, mymask, mymaskoffset, length, validwhen);
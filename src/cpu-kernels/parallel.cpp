@@ -0,0 +1,141 @@
+// BSD 3-Clause License; see https://github.com/jpivarski/awkward-1.0/blob/master/LICENSE
+
+#include <atomic>
+#include <condition_variable>
+#include <mutex>
+#include <thread>
+
+#include "awkward/cpu-kernels/parallel.h"
+
+namespace {
+  class ThreadPool {
+  public:
+    ThreadPool()
+        : numthreads_(1)
+        , task_(nullptr)
+        , numtasks_(0)
+        , next_(0)
+        , running_(0)
+        , generation_(0)
+        , stopping_(false) { }
+
+    int64_t numthreads() const {
+      return numthreads_.load();
+    }
+
+    void resize(int64_t numthreads) {
+      if (numthreads <= 0) {
+        numthreads = (int64_t)std::thread::hardware_concurrency();
+        if (numthreads <= 0) {
+          numthreads = 1;
+        }
+      }
+      std::lock_guard<std::mutex> busy(busy_);
+      stop_workers();
+      numthreads_.store(numthreads);
+    }
+
+    void run(int64_t numtasks, const std::function<void(int64_t)>& task) {
+      std::unique_lock<std::mutex> busy(busy_, std::try_to_lock);
+      if (!busy.owns_lock()) {
+        for (int64_t i = 0;  i < numtasks;  i++) {
+          task(i);
+        }
+        return;
+      }
+      // workers are started lazily, so that importing the library starts no threads
+      if ((int64_t)workers_.size() + 1 < numthreads_.load()) {
+        start_workers();
+      }
+      {
+        std::lock_guard<std::mutex> lock(mutex_);
+        task_ = &task;
+        numtasks_ = numtasks;
+        next_.store(0);
+        running_ = (int64_t)workers_.size();
+        generation_++;
+      }
+      wakeup_.notify_all();
+      work();
+      std::unique_lock<std::mutex> lock(mutex_);
+      done_.wait(lock, [this]() -> bool { return running_ == 0; });
+      task_ = nullptr;
+    }
+
+  private:
+    std::atomic<int64_t> numthreads_;
+    std::mutex busy_;
+    std::mutex mutex_;
+    std::condition_variable wakeup_;
+    std::condition_variable done_;
+    std::vector<std::thread> workers_;
+    const std::function<void(int64_t)>* task_;
+    int64_t numtasks_;
+    std::atomic<int64_t> next_;
+    int64_t running_;
+    uint64_t generation_;
+    bool stopping_;
+
+    void work() {
+      for (int64_t i = next_++;  i < numtasks_;  i = next_++) {
+        (*task_)(i);
+      }
+    }
+
+    void worker(uint64_t seen) {
+      std::unique_lock<std::mutex> lock(mutex_);
+      while (true) {
+        wakeup_.wait(lock, [&]() -> bool { return stopping_  ||  generation_ != seen; });
+        if (stopping_) {
+          return;
+        }
+        seen = generation_;
+        lock.unlock();
+        work();
+        lock.lock();
+        running_--;
+        if (running_ == 0) {
+          done_.notify_one();
+        }
+      }
+    }
+
+    void start_workers() {
+      std::lock_guard<std::mutex> lock(mutex_);
+      while ((int64_t)workers_.size() + 1 < numthreads_.load()) {
+        workers_.push_back(std::thread(&ThreadPool::worker, this, generation_));
+      }
+    }
+
+    void stop_workers() {
+      {
+        std::lock_guard<std::mutex> lock(mutex_);
+        stopping_ = true;
+      }
+      wakeup_.notify_all();
+      for (auto& thread : workers_) {
+        thread.join();
+      }
+      workers_.clear();
+      stopping_ = false;
+    }
+  };
+
+  // Never deleted: joining threads while the library is being unloaded can deadlock.
+  ThreadPool* pool() {
+    static ThreadPool* out = new ThreadPool();
+    return out;
+  }
+}
+
+void awkward_set_num_threads(int64_t numthreads) {
+  pool()->resize(numthreads);
+}
+
+int64_t awkward_get_num_threads() {
+  return pool()->numthreads();
+}
+
+void awkward_parallel_run(int64_t numtasks, const std::function<void(int64_t)>& task) {
+  pool()->run(numtasks, task);
+}
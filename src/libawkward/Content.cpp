@@ -64,6 +64,25 @@ namespace awkward {
     }
   }
 
+  void Content::tojson(const std::function<void(const char*, int64_t)>& destination, bool lines, int64_t maxdecimals, int64_t buffersize) const {
+    ToJsonStream builder(destination, maxdecimals, buffersize);
+    if (lines  &&  length() >= 0) {
+      int64_t len = length();
+      check_for_iteration();
+      for (int64_t i = 0;  i < len;  i++) {
+        getitem_at_nowrap(i).get()->tojson_part(builder);
+        builder.newline();
+      }
+    }
+    else {
+      tojson_part(builder);
+      if (lines) {
+        builder.newline();
+      }
+    }
+    builder.flush();
+  }
+
   int64_t Content::nbytes() const {
     // FIXME: this is only accurate if all subintervals of allocated arrays are nested
     // (which is likely, but not guaranteed). In general, it's <= the correct nbytes.
@@ -242,6 +261,10 @@ namespace awkward {
   }
 
   const std::shared_ptr<Content> Content::getitem(const Slice& where) const {
+    if (SliceMask* mask = dynamic_cast<SliceMask*>(where.head().get())) {
+      return getitem_first_mask(*mask, where.tail());
+    }
+
     std::shared_ptr<Content> next = std::make_shared<RegularArray>(Identities::none(), util::Parameters(), shallow_copy(), length());
 
     std::shared_ptr<SliceItem> nexthead = where.head();
@@ -288,6 +311,9 @@ namespace awkward {
     else if (SliceJagged64* jagged = dynamic_cast<SliceJagged64*>(head.get())) {
       return getitem_next(*jagged, tail, advanced);
     }
+    else if (SliceMask* mask = dynamic_cast<SliceMask*>(head.get())) {
+      return getitem_next(*mask->toarray(), tail, advanced);
+    }
     else {
       throw std::runtime_error("unrecognized slice type");
     }
@@ -428,6 +454,21 @@ namespace awkward {
     return that;
   }
 
+  const std::shared_ptr<Content> Content::getitem_mask(const SliceMask& mask) const {
+    return carry(mask.tocarry(length()));
+  }
+
+  const std::shared_ptr<Content> Content::getitem_first_mask(const SliceMask& mask, const Slice& tail) const {
+    std::shared_ptr<Content> out = getitem_mask(mask);
+    if (tail.length() == 0) {
+      return out;
+    }
+    std::vector<std::shared_ptr<SliceItem>> items = { std::make_shared<SliceRange>(Slice::none(), Slice::none(), 1) };
+    std::vector<std::shared_ptr<SliceItem>> tailitems = tail.items();
+    items.insert(items.end(), tailitems.begin(), tailitems.end());
+    return out.get()->getitem(Slice(items, true));
+  }
+
   const std::shared_ptr<Content> Content::getitem_next(const SliceMissing64& missing, const Slice& tail, const Index64& advanced) const {
     if (advanced.length() != 0) {
       throw std::invalid_argument("cannot mix missing values in slice with NumPy-style advanced indexing");
@@ -270,6 +270,81 @@ namespace awkward {
 
   template class SliceArrayOf<int64_t>;
 
+  /////////////////////////////////////////////////////// SliceMask
+
+  SliceMask::SliceMask(const IndexU8& mask, int64_t length, bool bitmask, bool lsb_order)
+      : mask_(mask)
+      , length_(length)
+      , bitmask_(bitmask)
+      , lsb_order_(lsb_order) {
+    if (mask_.length() < (bitmask_ ? (length_ + 7) / 8 : length_)) {
+      throw std::invalid_argument("mask is shorter than its length");
+    }
+  }
+
+  const IndexU8 SliceMask::mask() const {
+    return mask_;
+  }
+
+  int64_t SliceMask::length() const {
+    return length_;
+  }
+
+  bool SliceMask::bitmask() const {
+    return bitmask_;
+  }
+
+  bool SliceMask::lsb_order() const {
+    return lsb_order_;
+  }
+
+  int64_t SliceMask::numtrue() const {
+    int64_t numtrue;
+    struct Error err = awkward_slicemask_numtrue(
+      &numtrue,
+      mask_.ptr().get(),
+      mask_.offset(),
+      length_,
+      bitmask_,
+      lsb_order_);
+    util::handle_error(err, "SliceMask", nullptr);
+    return numtrue;
+  }
+
+  const Index64 SliceMask::tocarry(int64_t lenarray) const {
+    Index64 carry(numtrue());
+    struct Error err = awkward_slicemask_nonzero_64(
+      carry.ptr().get(),
+      mask_.ptr().get(),
+      mask_.offset(),
+      length_,
+      bitmask_,
+      lsb_order_,
+      lenarray);
+    util::handle_error(err, "SliceMask", nullptr);
+    return carry;
+  }
+
+  const std::shared_ptr<SliceArray64> SliceMask::toarray() const {
+    Index64 carry = tocarry(length_);
+    std::vector<int64_t> shape = { carry.length() };
+    std::vector<int64_t> strides = { 1 };
+    return std::make_shared<SliceArray64>(carry, shape, strides, true);
+  }
+
+  const std::shared_ptr<SliceItem> SliceMask::shallow_copy() const {
+    return std::make_shared<SliceMask>(mask_, length_, bitmask_, lsb_order_);
+  }
+
+  const std::string SliceMask::tostring() const {
+    // the same as the integer array that it stands for
+    return toarray().get()->tostring();
+  }
+
+  bool SliceMask::preserves_type(const Index64& advanced) const {
+    return advanced.length() == 0;
+  }
+
   /////////////////////////////////////////////////////// SliceField
 
   SliceField::SliceField(const std::string& key)
@@ -509,6 +584,9 @@ namespace awkward {
       else if (dynamic_cast<SliceArray64*>(x.get()) != nullptr) {
         out += 1;
       }
+      else if (dynamic_cast<SliceMask*>(x.get()) != nullptr) {
+        out += 1;
+      }
     }
     return out;
   }
@@ -576,6 +654,26 @@ namespace awkward {
       throw std::runtime_error("Slice::become_sealed when sealed_ == true");
     }
 
+    // A mask is applied directly only as the first item of a slice without other
+    // advanced indexes; anywhere else, it becomes the integer array it stands for.
+    bool keepmask = true;
+    for (size_t i = 1;  i < items_.size();  i++) {
+      if (dynamic_cast<SliceAt*>(items_[i].get()) != nullptr  ||
+          dynamic_cast<SliceArray64*>(items_[i].get()) != nullptr  ||
+          dynamic_cast<SliceMask*>(items_[i].get()) != nullptr  ||
+          dynamic_cast<SliceMissing64*>(items_[i].get()) != nullptr  ||
+          dynamic_cast<SliceJagged64*>(items_[i].get()) != nullptr) {
+        keepmask = false;
+      }
+    }
+    for (size_t i = 0;  i < items_.size();  i++) {
+      if (SliceMask* mask = dynamic_cast<SliceMask*>(items_[i].get())) {
+        if (i != 0  ||  !keepmask) {
+          items_[i] = mask->toarray();
+        }
+      }
+    }
+
     std::vector<int64_t> shape;
     for (size_t i = 0;  i < items_.size();  i++) {
       if (SliceArray64* array = dynamic_cast<SliceArray64*>(items_[i].get())) {
@@ -681,7 +779,8 @@ namespace awkward {
       throw std::runtime_error("Slice::isadvanced when sealed_ == false");
     }
     for (size_t i = 0;  i < items_.size();  i++) {
-      if (dynamic_cast<SliceArray64*>(items_[i].get()) != nullptr) {
+      if (dynamic_cast<SliceArray64*>(items_[i].get()) != nullptr  ||
+          dynamic_cast<SliceMask*>(items_[i].get()) != nullptr) {
         return true;
       }
     }
@@ -98,7 +98,7 @@ namespace awkward {
       validwhen_,
       lsb_order_);
     util::handle_error(err, classname(), identities_.get());
-    return std::make_shared<ByteMaskedArray>(identities_, parameters_, bytemask.getitem_range_nowrap(0, length_), content_, validwhen_);
+    return std::make_shared<ByteMaskedArray>(identities_, parameters_, bytemask.getitem_range_nowrap(0, length_), content_, false);
   }
 
   const std::shared_ptr<IndexedOptionArray64> BitMaskedArray::toIndexedOptionArray64() const {
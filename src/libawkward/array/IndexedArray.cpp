@@ -23,9 +23,19 @@
 namespace awkward {
   template <typename T, bool ISOPTION>
   IndexedArrayOf<T, ISOPTION>::IndexedArrayOf(const std::shared_ptr<Identities>& identities, const util::Parameters& parameters, const IndexOf<T>& index, const std::shared_ptr<Content>& content)
+      : IndexedArrayOf<T, ISOPTION>(identities, parameters, index, content, false) { }
+
+  template <typename T, bool ISOPTION>
+  IndexedArrayOf<T, ISOPTION>::IndexedArrayOf(const std::shared_ptr<Identities>& identities, const util::Parameters& parameters, const IndexOf<T>& index, const std::shared_ptr<Content>& content, bool isdeferred)
+      : IndexedArrayOf<T, ISOPTION>(identities, parameters, index, content, isdeferred, false) { }
+
+  template <typename T, bool ISOPTION>
+  IndexedArrayOf<T, ISOPTION>::IndexedArrayOf(const std::shared_ptr<Identities>& identities, const util::Parameters& parameters, const IndexOf<T>& index, const std::shared_ptr<Content>& content, bool isdeferred, bool iscategorical)
       : Content(identities, parameters)
       , index_(index)
-      , content_(content) { }
+      , content_(content)
+      , isdeferred_(isdeferred)
+      , iscategorical_(iscategorical) { }
 
   template <typename T, bool ISOPTION>
   const IndexOf<T> IndexedArrayOf<T, ISOPTION>::index() const {
@@ -42,6 +52,16 @@ namespace awkward {
     return ISOPTION;
   }
 
+  template <typename T, bool ISOPTION>
+  bool IndexedArrayOf<T, ISOPTION>::isdeferred() const {
+    return isdeferred_;
+  }
+
+  template <typename T, bool ISOPTION>
+  bool IndexedArrayOf<T, ISOPTION>::iscategorical() const {
+    return iscategorical_;
+  }
+
   template <typename T, bool ISOPTION>
   const std::shared_ptr<Content> IndexedArrayOf<T, ISOPTION>::project() const {
     if (ISOPTION) {
@@ -536,7 +556,7 @@ namespace awkward {
 
   template <typename T, bool ISOPTION>
   const std::shared_ptr<Content> IndexedArrayOf<T, ISOPTION>::shallow_copy() const {
-    return std::make_shared<IndexedArrayOf<T, ISOPTION>>(identities_, parameters_, index_, content_);
+    return std::make_shared<IndexedArrayOf<T, ISOPTION>>(identities_, parameters_, index_, content_, isdeferred_, iscategorical_);
   }
 
   template <typename T, bool ISOPTION>
@@ -547,7 +567,7 @@ namespace awkward {
     if (copyidentities  &&  identities_.get() != nullptr) {
       identities = identities_.get()->deep_copy();
     }
-    return std::make_shared<IndexedArrayOf<T, ISOPTION>>(identities, parameters_, index, content);
+    return std::make_shared<IndexedArrayOf<T, ISOPTION>>(identities, parameters_, index, content, isdeferred_, iscategorical_);
   }
 
   template <typename T, bool ISOPTION>
@@ -609,7 +629,7 @@ namespace awkward {
     if (identities_.get() != nullptr) {
       identities = identities_.get()->getitem_range_nowrap(start, stop);
     }
-    return std::make_shared<IndexedArrayOf<T, ISOPTION>>(identities, parameters_, index_.getitem_range_nowrap(start, stop), content_);
+    return std::make_shared<IndexedArrayOf<T, ISOPTION>>(identities, parameters_, index_.getitem_range_nowrap(start, stop), content_, isdeferred_, iscategorical_);
   }
 
   template <typename T, bool ISOPTION>
@@ -688,7 +708,7 @@ namespace awkward {
     if (identities_.get() != nullptr) {
       identities = identities_.get()->getitem_carry_64(carry);
     }
-    return std::make_shared<IndexedArrayOf<T, ISOPTION>>(identities, parameters_, nextindex, content_);
+    return std::make_shared<IndexedArrayOf<T, ISOPTION>>(identities, parameters_, nextindex, content_, isdeferred_, iscategorical_);
   }
 
   template <typename T, bool ISOPTION>
@@ -375,6 +375,29 @@ namespace awkward {
     return listarray.get()->getitem_next_jagged(slicestarts, slicestops, slicecontent, tail);
   }
 
+  template <typename T>
+  const std::shared_ptr<Content> ListOffsetArrayOf<T>::getitem_mask(const SliceMask& mask) const {
+    if (identities_.get() != nullptr) {
+      return Content::getitem_mask(mask);
+    }
+    int64_t numtrue = mask.numtrue();
+    IndexOf<T> nextstarts(numtrue);
+    IndexOf<T> nextstops(numtrue);
+    struct Error err = util::awkward_listoffsetarray_getitem_slicemask<T>(
+      nextstarts.ptr().get(),
+      nextstops.ptr().get(),
+      offsets_.ptr().get(),
+      offsets_.offset(),
+      length(),
+      mask.mask().ptr().get(),
+      mask.mask().offset(),
+      mask.length(),
+      mask.bitmask(),
+      mask.lsb_order());
+    util::handle_error(err, classname(), identities_.get());
+    return std::make_shared<ListArrayOf<T>>(identities_, parameters_, nextstarts, nextstops, content_);
+  }
+
   template <typename T>
   const std::shared_ptr<Content> ListOffsetArrayOf<T>::carry(const Index64& carry) const {
     IndexOf<T> starts = util::make_starts(offsets_);
@@ -634,7 +634,11 @@ namespace awkward {
       throw std::runtime_error("cannot get-item on a scalar");
     }
 
-    if (getitem_too_general(where.head(), where.tail())) {
+    if (SliceMask* mask = dynamic_cast<SliceMask*>(where.head().get())) {
+      return getitem_first_mask(*mask, where.tail());
+    }
+
+    else if (getitem_too_general(where.head(), where.tail())) {
       if (ndim() == 1) {
         return Content::getitem(where);
       }
@@ -688,6 +692,34 @@ namespace awkward {
     return getitem_next(head, tail, carry, advanced, shape_[0], strides_[0], false).shallow_copy();
   }
 
+  const std::shared_ptr<Content> NumpyArray::getitem_mask(const SliceMask& mask) const {
+    if (!iscontiguous()) {
+      return contiguous().getitem_mask(mask);
+    }
+    if (identities_.get() != nullptr) {
+      return Content::getitem_mask(mask);
+    }
+
+    int64_t numtrue = mask.numtrue();
+    std::shared_ptr<void> ptr(new uint8_t[(size_t)(numtrue*strides_[0])], util::array_deleter<uint8_t>());
+    struct Error err = awkward_numpyarray_getitem_slicemask(
+      reinterpret_cast<uint8_t*>(ptr.get()),
+      reinterpret_cast<uint8_t*>(ptr_.get()),
+      byteoffset_,
+      strides_[0],
+      shape_[0],
+      mask.mask().ptr().get(),
+      mask.mask().offset(),
+      mask.length(),
+      mask.bitmask(),
+      mask.lsb_order());
+    util::handle_error(err, classname(), identities_.get());
+
+    std::vector<ssize_t> shape = { (ssize_t)numtrue };
+    shape.insert(shape.end(), shape_.begin() + 1, shape_.end());
+    return std::make_shared<NumpyArray>(Identities::none(), parameters_, ptr, shape, strides_, 0, itemsize_, format_);
+  }
+
   const std::shared_ptr<Content> NumpyArray::carry(const Index64& carry) const {
     std::shared_ptr<void> ptr(new uint8_t[(size_t)(carry.length()*strides_[0])], util::array_deleter<uint8_t>());
     struct Error err = awkward_numpyarray_getitem_next_null_64(
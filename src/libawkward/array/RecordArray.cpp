@@ -20,6 +20,16 @@
 #include "awkward/array/RecordArray.h"
 
 namespace awkward {
+  // A field marked isdeferred is a carry that hasn't been applied: further
+  // carries only compose its index and getitem_field projects it.
+  IndexedArray64* lazy_carried(const std::shared_ptr<Content>& content) {
+    IndexedArray64* indexed = dynamic_cast<IndexedArray64*>(content.get());
+    if (indexed != nullptr  &&  indexed->isdeferred()) {
+      return indexed;
+    }
+    return nullptr;
+  }
+
   RecordArray::RecordArray(const std::shared_ptr<Identities>& identities, const util::Parameters& parameters, const std::vector<std::shared_ptr<Content>>& contents, const std::shared_ptr<util::RecordLookup>& recordlookup, int64_t length)
       : Content(identities, parameters)
       , contents_(contents)
@@ -304,7 +314,11 @@ namespace awkward {
   }
 
   const std::shared_ptr<Content> RecordArray::getitem_field(const std::string& key) const {
-    return field(key).get()->getitem_range_nowrap(0, length());
+    std::shared_ptr<Content> out = field(key).get()->getitem_range_nowrap(0, length());
+    if (IndexedArray64* indexed = lazy_carried(out)) {
+      return indexed->project();
+    }
+    return out;
   }
 
   const std::shared_ptr<Content> RecordArray::getitem_fields(const std::vector<std::string>& keys) const {
@@ -323,9 +337,24 @@ namespace awkward {
   }
 
   const std::shared_ptr<Content> RecordArray::carry(const Index64& carry) const {
+    // fields that share an index (all of them, after the first carry) share
+    // the composed index, too
+    IndexedArray64* previous = nullptr;
+    std::shared_ptr<Content> composed(nullptr);
     std::vector<std::shared_ptr<Content>> contents;
     for (auto content : contents_) {
-      contents.push_back(content.get()->carry(carry));
+      if (IndexedArray64* indexed = lazy_carried(content)) {
+        Index64 index = indexed->index();
+        if (previous == nullptr  ||  index.ptr() != previous->index().ptr()  ||  index.offset() != previous->index().offset()  ||  index.length() != previous->index().length()) {
+          previous = indexed;
+          composed = indexed->carry(carry);
+        }
+        Index64 nextindex = dynamic_cast<IndexedArray64*>(composed.get())->index();
+        contents.push_back(std::make_shared<IndexedArray64>(Identities::none(), util::Parameters(), nextindex, indexed->content(), true));
+      }
+      else {
+        contents.push_back(std::make_shared<IndexedArray64>(Identities::none(), util::Parameters(), carry, content, true));
+      }
     }
     std::shared_ptr<Identities> identities(nullptr);
     if (identities_.get() != nullptr) {
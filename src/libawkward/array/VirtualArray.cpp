@@ -0,0 +1,337 @@
+// BSD 3-Clause License; see https://github.com/jpivarski/awkward-1.0/blob/master/LICENSE
+
+#include <sstream>
+#include <atomic>
+
+#include "awkward/cpu-kernels/getitem.h"
+#include "awkward/type/ListType.h"
+#include "awkward/type/RegularType.h"
+#include "awkward/type/OptionType.h"
+#include "awkward/array/NumpyArray.h"
+
+#include "awkward/array/VirtualArray.h"
+
+namespace awkward {
+  std::atomic<int64_t> numkeys{0};
+
+  const std::string VirtualArray::newkey() {
+    return std::string("ak") + std::to_string(numkeys++);
+  }
+
+  VirtualArray::VirtualArray(const std::shared_ptr<Identities>& identities, const util::Parameters& parameters, const std::shared_ptr<ArrayGenerator>& generator, const std::shared_ptr<ArrayCache>& cache, const std::string& cache_key)
+      : Content(identities, parameters)
+      , generator_(generator)
+      , cache_(cache)
+      , cache_key_(cache_key) {
+    if (identities_.get() != nullptr) {
+      throw std::invalid_argument("VirtualArray cannot have identities; materialize it with 'array' first");
+    }
+  }
+
+  VirtualArray::VirtualArray(const std::shared_ptr<Identities>& identities, const util::Parameters& parameters, const std::shared_ptr<ArrayGenerator>& generator, const std::shared_ptr<ArrayCache>& cache)
+      : VirtualArray(identities, parameters, generator, cache, newkey()) { }
+
+  const std::shared_ptr<ArrayGenerator> VirtualArray::generator() const {
+    return generator_;
+  }
+
+  const std::shared_ptr<ArrayCache> VirtualArray::cache() const {
+    return cache_;
+  }
+
+  const std::string VirtualArray::cache_key() const {
+    return cache_key_;
+  }
+
+  const std::shared_ptr<Content> VirtualArray::peek_array() const {
+    if (cache_.get() != nullptr) {
+      return cache_.get()->get(cache_key_);
+    }
+    return std::shared_ptr<Content>(nullptr);
+  }
+
+  const std::shared_ptr<Content> VirtualArray::array() const {
+    std::shared_ptr<Content> out = peek_array();
+    if (out.get() == nullptr) {
+      out = generator_.get()->generate_and_check();
+      if (cache_.get() != nullptr) {
+        cache_.get()->set(cache_key_, out);
+      }
+    }
+    return out;
+  }
+
+  const std::string VirtualArray::classname() const {
+    return "VirtualArray";
+  }
+
+  void VirtualArray::setidentities(const std::shared_ptr<Identities>& identities) {
+    if (identities.get() != nullptr) {
+      throw std::invalid_argument("VirtualArray cannot have identities; materialize it with 'array' first");
+    }
+  }
+
+  void VirtualArray::setidentities() {
+    throw std::invalid_argument("VirtualArray cannot have identities; materialize it with 'array' first");
+  }
+
+  const std::shared_ptr<Type> VirtualArray::type(const std::map<std::string, std::string>& typestrs) const {
+    if (generator_.get()->type().get() != nullptr) {
+      return generator_.get()->type();
+    }
+    return array().get()->type(typestrs);
+  }
+
+  const std::string VirtualArray::tostring_part(const std::string& indent, const std::string& pre, const std::string& post) const {
+    std::stringstream out;
+    out << indent << pre << "<" << classname() << " cache_key=\"" << cache_key_ << "\">\n";
+    if (!parameters_.empty()) {
+      out << parameters_tostring(indent + std::string("    "), "", "\n");
+    }
+    out << generator_.get()->tostring_part(indent + std::string("    "), "", "\n");
+    if (cache_.get() != nullptr) {
+      out << cache_.get()->tostring_part(indent + std::string("    "), "", "\n");
+    }
+    out << indent << "</" << classname() << ">" << post;
+    return out.str();
+  }
+
+  void VirtualArray::tojson_part(ToJson& builder) const {
+    array().get()->tojson_part(builder);
+  }
+
+  void VirtualArray::nbytes_part(std::map<size_t, int64_t>& largest) const {
+    std::shared_ptr<Content> peek = peek_array();
+    if (peek.get() != nullptr) {
+      peek.get()->nbytes_part(largest);
+    }
+  }
+
+  int64_t VirtualArray::length() const {
+    if (generator_.get()->length() >= 0) {
+      return generator_.get()->length();
+    }
+    return array().get()->length();
+  }
+
+  const std::shared_ptr<Content> VirtualArray::shallow_copy() const {
+    return std::make_shared<VirtualArray>(identities_, parameters_, generator_, cache_, cache_key_);
+  }
+
+  const std::shared_ptr<Content> VirtualArray::deep_copy(bool copyarrays, bool copyindexes, bool copyidentities) const {
+    return array().get()->deep_copy(copyarrays, copyindexes, copyidentities);
+  }
+
+  void VirtualArray::check_for_iteration() const {
+    array().get()->check_for_iteration();
+  }
+
+  const std::shared_ptr<Content> VirtualArray::getitem_nothing() const {
+    return getitem_range_nowrap(0, 0);
+  }
+
+  const std::shared_ptr<Content> VirtualArray::getitem_at(int64_t at) const {
+    return array().get()->getitem_at(at);
+  }
+
+  const std::shared_ptr<Content> VirtualArray::getitem_at_nowrap(int64_t at) const {
+    return array().get()->getitem_at_nowrap(at);
+  }
+
+  const std::shared_ptr<Content> VirtualArray::getitem_range(int64_t start, int64_t stop) const {
+    int64_t regular_start = start;
+    int64_t regular_stop = stop;
+    awkward_regularize_rangeslice(&regular_start, &regular_stop, true, start != Slice::none(), stop != Slice::none(), length());
+    return getitem_range_nowrap(regular_start, regular_stop);
+  }
+
+  const std::shared_ptr<Content> VirtualArray::getitem_range_nowrap(int64_t start, int64_t stop) const {
+    std::shared_ptr<Content> peek = peek_array();
+    if (peek.get() != nullptr) {
+      return peek.get()->getitem_range_nowrap(start, stop);
+    }
+    std::shared_ptr<ArrayGenerator> generator = std::make_shared<SliceGenerator>(generator_.get()->type(), stop - start, shallow_copy(), start, stop);
+    return std::make_shared<VirtualArray>(Identities::none(), parameters_, generator, std::shared_ptr<ArrayCache>(nullptr), cache_key_ + std::string("[") + std::to_string(start) + std::string(":") + std::to_string(stop) + std::string("]"));
+  }
+
+  const std::shared_ptr<Content> VirtualArray::getitem_field(const std::string& key) const {
+    return array().get()->getitem_field(key);
+  }
+
+  const std::shared_ptr<Content> VirtualArray::getitem_fields(const std::vector<std::string>& keys) const {
+    return array().get()->getitem_fields(keys);
+  }
+
+  const std::shared_ptr<Content> VirtualArray::getitem(const Slice& where) const {
+    return array().get()->getitem(where);
+  }
+
+  const std::shared_ptr<Content> VirtualArray::getitem_next(const std::shared_ptr<SliceItem>& head, const Slice& tail, const Index64& advanced) const {
+    return array().get()->getitem_next(head, tail, advanced);
+  }
+
+  const std::shared_ptr<Content> VirtualArray::carry(const Index64& carry) const {
+    return array().get()->carry(carry);
+  }
+
+  const std::string type_purelist_parameter(const std::shared_ptr<Type>& type, const std::string& key) {
+    std::string out = type.get()->parameter(key);
+    if (out == std::string("null")) {
+      if (ListType* raw = dynamic_cast<ListType*>(type.get())) {
+        return type_purelist_parameter(raw->type(), key);
+      }
+      else if (RegularType* raw = dynamic_cast<RegularType*>(type.get())) {
+        return type_purelist_parameter(raw->type(), key);
+      }
+      else if (OptionType* raw = dynamic_cast<OptionType*>(type.get())) {
+        return type_purelist_parameter(raw->type(), key);
+      }
+    }
+    return out;
+  }
+
+  const std::string VirtualArray::purelist_parameter(const std::string& key) const {
+    std::string out = parameter(key);
+    if (out == std::string("null")) {
+      if (generator_.get()->type().get() != nullptr) {
+        return type_purelist_parameter(generator_.get()->type(), key);
+      }
+      return array().get()->purelist_parameter(key);
+    }
+    return out;
+  }
+
+  bool VirtualArray::purelist_isregular() const {
+    return array().get()->purelist_isregular();
+  }
+
+  int64_t VirtualArray::purelist_depth() const {
+    return array().get()->purelist_depth();
+  }
+
+  const std::pair<int64_t, int64_t> VirtualArray::minmax_depth() const {
+    return array().get()->minmax_depth();
+  }
+
+  const std::pair<bool, int64_t> VirtualArray::branch_depth() const {
+    return array().get()->branch_depth();
+  }
+
+  int64_t VirtualArray::numfields() const {
+    if (generator_.get()->type().get() != nullptr) {
+      return generator_.get()->type().get()->numfields();
+    }
+    return array().get()->numfields();
+  }
+
+  int64_t VirtualArray::fieldindex(const std::string& key) const {
+    if (generator_.get()->type().get() != nullptr) {
+      return generator_.get()->type().get()->fieldindex(key);
+    }
+    return array().get()->fieldindex(key);
+  }
+
+  const std::string VirtualArray::key(int64_t fieldindex) const {
+    if (generator_.get()->type().get() != nullptr) {
+      return generator_.get()->type().get()->key(fieldindex);
+    }
+    return array().get()->key(fieldindex);
+  }
+
+  bool VirtualArray::haskey(const std::string& key) const {
+    if (generator_.get()->type().get() != nullptr) {
+      return generator_.get()->type().get()->haskey(key);
+    }
+    return array().get()->haskey(key);
+  }
+
+  const std::vector<std::string> VirtualArray::keys() const {
+    if (generator_.get()->type().get() != nullptr) {
+      return generator_.get()->type().get()->keys();
+    }
+    return array().get()->keys();
+  }
+
+  const std::string VirtualArray::validityerror(const std::string& path) const {
+    return array().get()->validityerror(path + std::string(".array"));
+  }
+
+  const std::shared_ptr<Content> VirtualArray::shallow_simplify() const {
+    return shallow_copy();
+  }
+
+  const std::shared_ptr<Content> VirtualArray::num(int64_t axis, int64_t depth) const {
+    int64_t toaxis = axis_wrap_if_negative(axis);
+    if (toaxis == depth) {
+      Index64 out(1);
+      out.ptr().get()[0] = length();
+      return NumpyArray(out).getitem_at_nowrap(0);
+    }
+    return array().get()->num(axis, depth);
+  }
+
+  const std::pair<Index64, std::shared_ptr<Content>> VirtualArray::offsets_and_flattened(int64_t axis, int64_t depth) const {
+    return array().get()->offsets_and_flattened(axis, depth);
+  }
+
+  bool VirtualArray::mergeable(const std::shared_ptr<Content>& other, bool mergebool) const {
+    return array().get()->mergeable(other, mergebool);
+  }
+
+  const std::shared_ptr<Content> VirtualArray::merge(const std::shared_ptr<Content>& other) const {
+    return array().get()->merge(other);
+  }
+
+  const std::shared_ptr<SliceItem> VirtualArray::asslice() const {
+    return array().get()->asslice();
+  }
+
+  const std::shared_ptr<Content> VirtualArray::rpad(int64_t target, int64_t axis, int64_t depth) const {
+    return array().get()->rpad(target, axis, depth);
+  }
+
+  const std::shared_ptr<Content> VirtualArray::rpad_and_clip(int64_t target, int64_t axis, int64_t depth) const {
+    return array().get()->rpad_and_clip(target, axis, depth);
+  }
+
+  const std::shared_ptr<Content> VirtualArray::reduce_next(const Reducer& reducer, int64_t negaxis, const Index64& parents, int64_t outlength, bool mask, bool keepdims) const {
+    return array().get()->reduce_next(reducer, negaxis, parents, outlength, mask, keepdims);
+  }
+
+  const std::shared_ptr<Content> VirtualArray::localindex(int64_t axis, int64_t depth) const {
+    return array().get()->localindex(axis, depth);
+  }
+
+  const std::shared_ptr<Content> VirtualArray::choose(int64_t n, bool diagonal, const std::shared_ptr<util::RecordLookup>& recordlookup, const util::Parameters& parameters, int64_t axis, int64_t depth) const {
+    return array().get()->choose(n, diagonal, recordlookup, parameters, axis, depth);
+  }
+
+  const std::shared_ptr<Content> VirtualArray::getitem_next(const SliceAt& at, const Slice& tail, const Index64& advanced) const {
+    return array().get()->getitem_next(at, tail, advanced);
+  }
+
+  const std::shared_ptr<Content> VirtualArray::getitem_next(const SliceRange& range, const Slice& tail, const Index64& advanced) const {
+    return array().get()->getitem_next(range, tail, advanced);
+  }
+
+  const std::shared_ptr<Content> VirtualArray::getitem_next(const SliceArray64& array, const Slice& tail, const Index64& advanced) const {
+    return this->array().get()->getitem_next(array, tail, advanced);
+  }
+
+  const std::shared_ptr<Content> VirtualArray::getitem_next(const SliceJagged64& jagged, const Slice& tail, const Index64& advanced) const {
+    return array().get()->getitem_next(jagged, tail, advanced);
+  }
+
+  const std::shared_ptr<Content> VirtualArray::getitem_next_jagged(const Index64& slicestarts, const Index64& slicestops, const SliceArray64& slicecontent, const Slice& tail) const {
+    return array().get()->getitem_next_jagged(slicestarts, slicestops, slicecontent, tail);
+  }
+
+  const std::shared_ptr<Content> VirtualArray::getitem_next_jagged(const Index64& slicestarts, const Index64& slicestops, const SliceMissing64& slicecontent, const Slice& tail) const {
+    return array().get()->getitem_next_jagged(slicestarts, slicestops, slicecontent, tail);
+  }
+
+  const std::shared_ptr<Content> VirtualArray::getitem_next_jagged(const Index64& slicestarts, const Index64& slicestops, const SliceJagged64& slicecontent, const Slice& tail) const {
+    return array().get()->getitem_next_jagged(slicestarts, slicestops, slicecontent, tail);
+  }
+
+}
@@ -1,12 +1,425 @@
 // BSD 3-Clause License; see https://github.com/jpivarski/awkward-1.0/blob/master/LICENSE
 
 #include <sstream>
+#include <cstring>
+#include <algorithm>
+
+#include "awkward/array/EmptyArray.h"
+#include "awkward/array/NumpyArray.h"
+#include "awkward/array/ListOffsetArray.h"
+#include "awkward/array/IndexedArray.h"
+#include "awkward/array/ByteMaskedArray.h"
+#include "awkward/array/BitMaskedArray.h"
+#include "awkward/array/UnmaskedArray.h"
+#include "awkward/array/RecordArray.h"
+#include "awkward/array/UnionArray.h"
+#include "awkward/builder/TypedBuilder.h"
 
 #include "awkward/builder/ArrayBuilder.h"
 
 namespace awkward {
+  const std::shared_ptr<Content> ArrayBuilder::merge(const std::vector<const ArrayBuilder*>& builders) {
+    std::vector<std::shared_ptr<Content>> snapshots;
+    for (auto builder : builders) {
+      snapshots.push_back(builder->snapshot());
+    }
+    return merge_snapshots(snapshots);
+  }
+
+  // what Content::merge does two at a time, for layouts that aren't handled below
+  const std::shared_ptr<Content> merge_pairwise(const std::vector<std::shared_ptr<Content>>& parts) {
+    std::shared_ptr<Content> out = parts[0];
+    for (size_t i = 1;  i < parts.size();  i++) {
+      if (out.get()->mergeable(parts[i], false)) {
+        out = out.get()->merge(parts[i]);
+      }
+      else {
+        out = out.get()->merge_as_union(parts[i]);
+      }
+      if (UnionArray8_32* raw = dynamic_cast<UnionArray8_32*>(out.get())) {
+        out = raw->simplify_uniontype(false);
+      }
+      else if (UnionArray8_U32* raw = dynamic_cast<UnionArray8_U32*>(out.get())) {
+        out = raw->simplify_uniontype(false);
+      }
+      else if (UnionArray8_64* raw = dynamic_cast<UnionArray8_64*>(out.get())) {
+        out = raw->simplify_uniontype(false);
+      }
+    }
+    return out;
+  }
+
+  bool is_flat(const NumpyArray* array) {
+    return array != nullptr  &&  array->ndim() == 1  &&  array->strides()[0] == array->itemsize();
+  }
+
+  bool is_int64(const NumpyArray* array) {
+    return array->itemsize() == 8  &&  (array->format() == "l"  ||  array->format() == "q");
+  }
+
+  const std::shared_ptr<Content> merge_numpy(const std::vector<std::shared_ptr<Content>>& parts, int64_t length) {
+    const NumpyArray* first = dynamic_cast<NumpyArray*>(parts[0].get());
+    bool same = true;
+    bool numbers = true;
+    for (auto part : parts) {
+      const NumpyArray* raw = dynamic_cast<NumpyArray*>(part.get());
+      same = same  &&  raw->format() == first->format()  &&  raw->itemsize() == first->itemsize();
+      numbers = numbers  &&  (is_int64(raw)  ||  raw->format() == "d");
+    }
+    if (same) {
+      ssize_t itemsize = first->itemsize();
+      std::shared_ptr<uint8_t> ptr(new uint8_t[(size_t)(length*itemsize)], util::array_deleter<uint8_t>());
+      int64_t at = 0;
+      for (auto part : parts) {
+        const NumpyArray* raw = dynamic_cast<NumpyArray*>(part.get());
+        std::memcpy(ptr.get() + at*itemsize, raw->byteptr(), (size_t)(raw->length()*itemsize));
+        at += raw->length();
+      }
+      std::vector<ssize_t> shape = { (ssize_t)length };
+      std::vector<ssize_t> strides = { itemsize };
+      return std::make_shared<NumpyArray>(Identities::none(), first->parameters(), ptr, shape, strides, 0, itemsize, first->format());
+    }
+    else if (numbers) {
+      // int64 and float64, as Int64Builder would have been promoted
+      std::shared_ptr<double> ptr(new double[(size_t)length], util::array_deleter<double>());
+      int64_t at = 0;
+      for (auto part : parts) {
+        const NumpyArray* raw = dynamic_cast<NumpyArray*>(part.get());
+        if (is_int64(raw)) {
+          const int64_t* from = reinterpret_cast<const int64_t*>(raw->byteptr());
+          for (int64_t i = 0;  i < raw->length();  i++) {
+            ptr.get()[at + i] = (double)from[i];
+          }
+        }
+        else {
+          std::memcpy(ptr.get() + at, raw->byteptr(), (size_t)(raw->length()*sizeof(double)));
+        }
+        at += raw->length();
+      }
+      std::vector<ssize_t> shape = { (ssize_t)length };
+      std::vector<ssize_t> strides = { (ssize_t)sizeof(double) };
+      return std::make_shared<NumpyArray>(Identities::none(), first->parameters(), ptr, shape, strides, 0, sizeof(double), "d");
+    }
+    return merge_pairwise(parts);
+  }
+
+  // Which builder would have made a part: "bool", "int", "float", "list",
+  // "string:<__array__>", "tuple:<numfields>" or "record:<__record__>", and
+  // "" for layouts that ArrayBuilder doesn't make.
+  const std::string builder_kind(const std::shared_ptr<Content>& part) {
+    if (NumpyArray* raw = dynamic_cast<NumpyArray*>(part.get())) {
+      if (is_flat(raw)  &&  raw->parameters().empty()) {
+        if (raw->format() == "?") {
+          return "bool";
+        }
+        else if (is_int64(raw)) {
+          return "int";
+        }
+        else if (raw->format() == "d") {
+          return "float";
+        }
+      }
+    }
+    else if (ListOffsetArray64* raw = dynamic_cast<ListOffsetArray64*>(part.get())) {
+      if (raw->parameters().empty()) {
+        return "list";
+      }
+      std::string array = raw->parameter("__array__");
+      if (raw->parameters().size() == 1  &&  (array == "\"string\""  ||  array == "\"bytestring\"")  &&  is_flat(dynamic_cast<NumpyArray*>(raw->content().get()))) {
+        return std::string("string:") + array;
+      }
+    }
+    else if (RecordArray* raw = dynamic_cast<RecordArray*>(part.get())) {
+      if (raw->istuple()  &&  raw->parameters().empty()) {
+        return std::string("tuple:") + std::to_string(raw->numfields());
+      }
+      else if (!raw->istuple()  &&  raw->parameters().size() == (raw->parameters().count("__record__") ? 1 : 0)) {
+        return std::string("record:") + raw->parameter("__record__");
+      }
+    }
+    return std::string("");
+  }
+
+  // Which of the kinds filled so far a builder would put a value of this kind
+  // into, or -1 if it would add a union branch. A single Int64Builder or
+  // Float64Builder takes the other's values as float64, and a single
+  // StringBuilder takes either encoding; a UnionBuilder sends integers only
+  // to an Int64Builder (but reals promote one) and strings only to a
+  // StringBuilder of the same encoding.
+  int64_t builder_slot(std::vector<std::string>& kinds, const std::string& kind) {
+    if (kinds.size() == 1) {
+      if (kinds[0] == kind) {
+        return 0;
+      }
+      else if ((kinds[0] == "int"  &&  kind == "float")  ||  (kinds[0] == "float"  &&  kind == "int")) {
+        kinds[0] = "float";
+        return 0;
+      }
+      else if (kinds[0].compare(0, 7, "string:") == 0  &&  kind.compare(0, 7, "string:") == 0) {
+        return 0;
+      }
+      return -1;
+    }
+    for (size_t i = 0;  i < kinds.size();  i++) {
+      if (kinds[i] == kind) {
+        return (int64_t)i;
+      }
+    }
+    if (kind == "float") {
+      for (size_t i = 0;  i < kinds.size();  i++) {
+        if (kinds[i] == "int") {
+          kinds[i] = "float";
+          return (int64_t)i;
+        }
+      }
+    }
+    return -1;
+  }
+
+  const std::shared_ptr<Content> merge_lists(const std::vector<std::shared_ptr<Content>>& parts, int64_t length) {
+    Index64 offsets(length + 1);
+    int64_t* rawoffsets = offsets.ptr().get();
+    rawoffsets[0] = 0;
+    std::vector<std::shared_ptr<Content>> contents;
+    int64_t at = 0;
+    for (auto part : parts) {
+      ListOffsetArray64* list = dynamic_cast<ListOffsetArray64*>(part.get());
+      Index64 partoffsets = list->offsets();
+      int64_t start = partoffsets.getitem_at_nowrap(0);
+      int64_t stop = partoffsets.getitem_at_nowrap(partoffsets.length() - 1);
+      int64_t shift = rawoffsets[at] - start;
+      for (int64_t i = 1;  i < partoffsets.length();  i++) {
+        rawoffsets[at + i] = partoffsets.getitem_at_nowrap(i) + shift;
+      }
+      contents.push_back(list->content().get()->getitem_range_nowrap(start, stop));
+      at += list->length();
+    }
+    std::shared_ptr<Content> content;
+    if (parts[0].get()->parameters().empty()) {
+      content = ArrayBuilder::merge_snapshots(contents);
+    }
+    else {
+      // a string's characters are bytes with the same parameters
+      content = merge_numpy(contents, rawoffsets[length]);
+    }
+    return std::make_shared<ListOffsetArray64>(Identities::none(), parts[0].get()->parameters(), offsets, content);
+  }
+
+  // fields are merged over the union of the keys, in the order they were
+  // first seen; a part without a field gets None, as RecordBuilder would do
+  const std::shared_ptr<Content> merge_records(const std::vector<std::shared_ptr<Content>>& parts, int64_t length) {
+    RecordArray* first = dynamic_cast<RecordArray*>(parts[0].get());
+    std::vector<std::string> keys;
+    for (auto part : parts) {
+      for (auto key : part.get()->keys()) {
+        if (std::find(keys.begin(), keys.end(), key) == keys.end()) {
+          keys.push_back(key);
+        }
+      }
+    }
+    std::vector<std::shared_ptr<Content>> contents;
+    for (auto key : keys) {
+      std::vector<std::shared_ptr<Content>> fields;
+      for (auto part : parts) {
+        if (part.get()->haskey(key)) {
+          fields.push_back(part.get()->getitem_field(key));
+        }
+        else {
+          Index64 index(part.get()->length());
+          int64_t* rawindex = index.ptr().get();
+          for (int64_t i = 0;  i < index.length();  i++) {
+            rawindex[i] = -1;
+          }
+          fields.push_back(std::make_shared<IndexedOptionArray64>(Identities::none(), util::Parameters(), index, std::make_shared<EmptyArray>(Identities::none(), util::Parameters())));
+        }
+      }
+      contents.push_back(ArrayBuilder::merge_snapshots(fields));
+    }
+    std::shared_ptr<util::RecordLookup> recordlookup(nullptr);
+    if (!first->istuple()) {
+      recordlookup = std::make_shared<util::RecordLookup>(keys);
+    }
+    return std::make_shared<RecordArray>(Identities::none(), first->parameters(), contents, recordlookup, length);
+  }
+
+  const std::shared_ptr<Content> merge_kind(const std::string& kind, const std::vector<std::shared_ptr<Content>>& parts, int64_t length) {
+    if (kind == "bool"  ||  kind == "int"  ||  kind == "float") {
+      return merge_numpy(parts, length);
+    }
+    else if (kind == "list"  ||  kind.compare(0, 7, "string:") == 0) {
+      return merge_lists(parts, length);
+    }
+    else {
+      return merge_records(parts, length);
+    }
+  }
+
+  // The result is what one ArrayBuilder would have made from the parts'
+  // values in order: the same promotions, options, union branches and record
+  // fields. Layouts that ArrayBuilder doesn't make are merged pairwise.
+  const std::shared_ptr<Content> ArrayBuilder::merge_snapshots(const std::vector<std::shared_ptr<Content>>& snapshots) {
+    // empty parts don't affect the merged type
+    std::vector<std::shared_ptr<Content>> parts;
+    int64_t length = 0;
+    for (auto x : snapshots) {
+      if (x.get()->length() != 0) {
+        parts.push_back(x);
+        length += x.get()->length();
+      }
+    }
+    if (parts.empty()) {
+      return snapshots.empty() ? std::make_shared<EmptyArray>(Identities::none(), util::Parameters()) : snapshots[0];
+    }
+    if (parts.size() == 1) {
+      return parts[0];
+    }
+
+    bool anyoption = false;
+    bool otheroption = false;
+    for (auto part : parts) {
+      anyoption = anyoption  ||  dynamic_cast<IndexedOptionArray64*>(part.get()) != nullptr;
+      otheroption = otheroption  ||  dynamic_cast<IndexedOptionArray32*>(part.get()) != nullptr  ||  dynamic_cast<ByteMaskedArray*>(part.get()) != nullptr  ||  dynamic_cast<BitMaskedArray*>(part.get()) != nullptr  ||  dynamic_cast<UnmaskedArray*>(part.get()) != nullptr;
+    }
+
+    if (anyoption  &&  !otheroption) {
+      // one index over all of the (merged) non-missing values
+      Index64 index(length);
+      int64_t* rawindex = index.ptr().get();
+      std::vector<std::shared_ptr<Content>> contents;
+      int64_t at = 0;
+      int64_t shift = 0;
+      for (auto part : parts) {
+        if (IndexedOptionArray64* option = dynamic_cast<IndexedOptionArray64*>(part.get())) {
+          Index64 partindex = option->index();
+          for (int64_t i = 0;  i < partindex.length();  i++) {
+            int64_t x = partindex.getitem_at_nowrap(i);
+            rawindex[at + i] = (x < 0 ? -1 : x + shift);
+          }
+          contents.push_back(option->content());
+          shift += option->content().get()->length();
+        }
+        else {
+          for (int64_t i = 0;  i < part.get()->length();  i++) {
+            rawindex[at + i] = shift + i;
+          }
+          contents.push_back(part);
+          shift += part.get()->length();
+        }
+        at += part.get()->length();
+      }
+      return std::make_shared<IndexedOptionArray64>(Identities::none(), util::Parameters(), index, merge_snapshots(contents));
+    }
+    else if (otheroption) {
+      return merge_pairwise(parts);
+    }
+
+    // each part, or each branch of a union part, goes to the slot that a
+    // builder filled with the earlier parts would have put it in
+    std::vector<std::string> kinds;
+    std::vector<std::vector<int64_t>> slots(parts.size());
+    bool anyunion = false;
+    for (size_t j = 0;  j < parts.size();  j++) {
+      std::vector<std::shared_ptr<Content>> branches;
+      if (UnionArray8_64* raw = dynamic_cast<UnionArray8_64*>(parts[j].get())) {
+        branches = raw->contents();
+        anyunion = true;
+      }
+      else {
+        branches.push_back(parts[j]);
+      }
+      for (auto branch : branches) {
+        std::string kind = builder_kind(branch);
+        if (kind.empty()) {
+          return merge_pairwise(parts);
+        }
+        int64_t slot = builder_slot(kinds, kind);
+        if (slot == -1) {
+          slot = (int64_t)kinds.size();
+          kinds.push_back(kind);
+        }
+        slots[j].push_back(slot);
+      }
+    }
+
+    // a union part's branches, in the order the union refers to them
+    std::vector<std::vector<std::shared_ptr<Content>>> contents(kinds.size());
+    std::vector<int64_t> lengths(kinds.size(), 0);
+    std::vector<std::vector<int64_t>> starts(parts.size());
+    for (size_t j = 0;  j < parts.size();  j++) {
+      std::vector<std::shared_ptr<Content>> branches;
+      if (UnionArray8_64* raw = dynamic_cast<UnionArray8_64*>(parts[j].get())) {
+        Index8 tags = raw->tags();
+        Index64 index = raw->index();
+        for (int64_t k = 0;  k < raw->numcontents();  k++) {
+          std::vector<int64_t> carry;
+          bool inorder = true;
+          for (int64_t i = 0;  i < raw->length();  i++) {
+            if (tags.getitem_at_nowrap(i) == k) {
+              inorder = inorder  &&  index.getitem_at_nowrap(i) == (int64_t)carry.size();
+              carry.push_back(index.getitem_at_nowrap(i));
+            }
+          }
+          std::shared_ptr<Content> content = raw->content(k);
+          if (!inorder  ||  (int64_t)carry.size() != content.get()->length()) {
+            Index64 nextcarry((int64_t)carry.size());
+            std::copy(carry.begin(), carry.end(), nextcarry.ptr().get());
+            content = content.get()->carry(nextcarry);
+          }
+          branches.push_back(content);
+        }
+      }
+      else {
+        branches.push_back(parts[j]);
+      }
+      for (size_t k = 0;  k < branches.size();  k++) {
+        int64_t slot = slots[j][k];
+        starts[j].push_back(lengths[(size_t)slot]);
+        contents[(size_t)slot].push_back(branches[k]);
+        lengths[(size_t)slot] += branches[k].get()->length();
+      }
+    }
+
+    std::vector<std::shared_ptr<Content>> merged;
+    for (size_t slot = 0;  slot < kinds.size();  slot++) {
+      merged.push_back(merge_kind(kinds[slot], contents[slot], lengths[slot]));
+    }
+    if (merged.size() == 1  &&  !anyunion) {
+      return merged[0];
+    }
+
+    Index8 tags(length);
+    Index64 index(length);
+    int8_t* rawtags = tags.ptr().get();
+    int64_t* rawindex = index.ptr().get();
+    int64_t at = 0;
+    for (size_t j = 0;  j < parts.size();  j++) {
+      if (UnionArray8_64* raw = dynamic_cast<UnionArray8_64*>(parts[j].get())) {
+        Index8 parttags = raw->tags();
+        std::vector<int64_t> next = starts[j];
+        for (int64_t i = 0;  i < raw->length();  i++) {
+          size_t k = (size_t)parttags.getitem_at_nowrap(i);
+          rawtags[at + i] = (int8_t)slots[j][k];
+          rawindex[at + i] = next[k]++;
+        }
+      }
+      else {
+        for (int64_t i = 0;  i < parts[j].get()->length();  i++) {
+          rawtags[at + i] = (int8_t)slots[j][0];
+          rawindex[at + i] = starts[j][0] + i;
+        }
+      }
+      at += parts[j].get()->length();
+    }
+    return std::make_shared<UnionArray8_64>(Identities::none(), util::Parameters(), tags, index, merged);
+  }
+
   ArrayBuilder::ArrayBuilder(const ArrayBuilderOptions& options)
-      : builder_(UnknownBuilder::fromempty(options)) { }
+      : options_(options)
+      , builder_(UnknownBuilder::fromempty(options)) { }
+
+  ArrayBuilder::ArrayBuilder(const std::shared_ptr<Type>& type, const ArrayBuilderOptions& options)
+      : options_(options)
+      , builder_(type.get() == nullptr ? UnknownBuilder::fromempty(options) : TypedBuilder::fromtype(type, options)) { }
 
   const std::string ArrayBuilder::tostring() const {
     std::map<std::string, std::string> typestrs;
@@ -22,7 +435,13 @@ namespace awkward {
   }
 
   void ArrayBuilder::clear() {
-    builder_.get()->clear();
+    // a typed builder keeps its type; an untyped one forgets what it inferred
+    if (dynamic_cast<TypedBuilder*>(builder_.get()) != nullptr) {
+      builder_.get()->clear();
+    }
+    else {
+      builder_ = UnknownBuilder::fromempty(options_);
+    }
   }
 
   const std::shared_ptr<Type> ArrayBuilder::type(const std::map<std::string, std::string>& typestrs) const {
@@ -33,6 +452,14 @@ namespace awkward {
     return builder_.get()->snapshot();
   }
 
+  const std::shared_ptr<Content> ArrayBuilder::finalize() {
+    // trimmed buffers go to the snapshot; clear gives the builder new ones
+    builder_.get()->shrink_to_fit();
+    std::shared_ptr<Content> out = builder_.get()->snapshot();
+    clear();
+    return out;
+  }
+
   const std::shared_ptr<Content> ArrayBuilder::getitem_at(int64_t at) const {
     return snapshot().get()->getitem_at(at);
   }
@@ -69,6 +496,18 @@ namespace awkward {
     maybeupdate(builder_.get()->real(x));
   }
 
+  void ArrayBuilder::booleans(const bool* x, int64_t length) {
+    maybeupdate(builder_.get()->booleans(x, length));
+  }
+
+  void ArrayBuilder::integers(const int64_t* x, int64_t length) {
+    maybeupdate(builder_.get()->integers(x, length));
+  }
+
+  void ArrayBuilder::reals(const double* x, int64_t length) {
+    maybeupdate(builder_.get()->reals(x, length));
+  }
+
   void ArrayBuilder::bytestring(const char* x) {
     maybeupdate(builder_.get()->string(x, -1, no_encoding));
   }
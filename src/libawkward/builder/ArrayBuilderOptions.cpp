@@ -5,7 +5,15 @@
 namespace awkward {
   ArrayBuilderOptions::ArrayBuilderOptions(int64_t initial, double resize)
       : initial_(initial)
-      , resize_(resize) { }
+      , resize_(resize)
+      , narrow_(false)
+      , categorical_(false) { }
+
+  ArrayBuilderOptions::ArrayBuilderOptions(int64_t initial, double resize, bool narrow, bool categorical)
+      : initial_(initial)
+      , resize_(resize)
+      , narrow_(narrow)
+      , categorical_(categorical) { }
 
   int64_t ArrayBuilderOptions::initial() const {
     return initial_;
@@ -14,4 +22,12 @@ namespace awkward {
   double ArrayBuilderOptions::resize() const {
     return resize_;
   }
+
+  bool ArrayBuilderOptions::narrow() const {
+    return narrow_;
+  }
+
+  bool ArrayBuilderOptions::categorical() const {
+    return categorical_;
+  }
 }
@@ -31,6 +31,10 @@ namespace awkward {
     buffer_.clear();
   }
 
+  void BoolBuilder::shrink_to_fit() {
+    buffer_.shrink_to_fit();
+  }
+
   const std::shared_ptr<Content> BoolBuilder::snapshot() const {
     std::vector<ssize_t> shape = { (ssize_t)buffer_.length() };
     std::vector<ssize_t> strides = { (ssize_t)sizeof(bool) };
@@ -108,6 +112,13 @@ namespace awkward {
     throw std::invalid_argument("called 'endrecord' without 'beginrecord' at the same level before it");
   }
 
+  const std::shared_ptr<Builder> BoolBuilder::booleans(const bool* x, int64_t length) {
+    for (int64_t i = 0;  i < length;  i++) {
+      buffer_.append(x[i]);
+    }
+    return that_;
+  }
+
   const std::shared_ptr<Builder> BoolBuilder::append(const std::shared_ptr<Content>& array, int64_t at) {
     std::shared_ptr<Builder> out = UnionBuilder::fromsingle(options_, that_);
     out.get()->append(array, at);
@@ -5,6 +5,30 @@
 namespace awkward {
   Builder::~Builder() { }
 
+  const std::shared_ptr<Builder> Builder::booleans(const bool* x, int64_t length) {
+    std::shared_ptr<Builder> out = that_;
+    for (int64_t i = 0;  i < length;  i++) {
+      out = out.get()->boolean(x[i]);
+    }
+    return out;
+  }
+
+  const std::shared_ptr<Builder> Builder::integers(const int64_t* x, int64_t length) {
+    std::shared_ptr<Builder> out = that_;
+    for (int64_t i = 0;  i < length;  i++) {
+      out = out.get()->integer(x[i]);
+    }
+    return out;
+  }
+
+  const std::shared_ptr<Builder> Builder::reals(const double* x, int64_t length) {
+    std::shared_ptr<Builder> out = that_;
+    for (int64_t i = 0;  i < length;  i++) {
+      out = out.get()->real(x[i]);
+    }
+    return out;
+  }
+
   void Builder::setthat(const std::shared_ptr<Builder>& that) {
     that_ = that;
   }
@@ -44,6 +44,10 @@ namespace awkward {
     buffer_.clear();
   }
 
+  void Float64Builder::shrink_to_fit() {
+    buffer_.shrink_to_fit();
+  }
+
   const std::shared_ptr<Content> Float64Builder::snapshot() const {
     std::vector<ssize_t> shape = { (ssize_t)buffer_.length() };
     std::vector<ssize_t> strides = { (ssize_t)sizeof(double) };
@@ -120,6 +124,18 @@ namespace awkward {
     throw std::invalid_argument("called 'endrecord' without 'beginrecord' at the same level before it");
   }
 
+  const std::shared_ptr<Builder> Float64Builder::integers(const int64_t* x, int64_t length) {
+    for (int64_t i = 0;  i < length;  i++) {
+      buffer_.append((double)x[i]);
+    }
+    return that_;
+  }
+
+  const std::shared_ptr<Builder> Float64Builder::reals(const double* x, int64_t length) {
+    buffer_.extend(x, length);
+    return that_;
+  }
+
   const std::shared_ptr<Builder> Float64Builder::append(const std::shared_ptr<Content>& array, int64_t at) {
     std::shared_ptr<Builder> out = UnionBuilder::fromsingle(options_, that_);
     out.get()->append(array, at);
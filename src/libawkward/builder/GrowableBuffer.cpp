@@ -1,5 +1,7 @@
 // BSD 3-Clause License; see https://github.com/jpivarski/awkward-1.0/blob/master/LICENSE
 
+#include <algorithm>
+
 #include "awkward/builder/GrowableBuffer.h"
 
 namespace awkward {
@@ -46,6 +48,7 @@ namespace awkward {
   GrowableBuffer<T>::GrowableBuffer(const ArrayBuilderOptions& options, std::shared_ptr<T> ptr, int64_t length, int64_t reserved)
       : options_(options)
       , ptr_(ptr)
+      , ptrstart_(0)
       , length_(length)
       , reserved_(reserved) { }
 
@@ -53,8 +56,14 @@ namespace awkward {
   GrowableBuffer<T>::GrowableBuffer(const ArrayBuilderOptions& options)
       : GrowableBuffer(options, std::shared_ptr<T>(new T[(size_t)options.initial()], util::array_deleter<T>()), 0, options.initial()) { }
 
+  // Not thread-safe: joining the chunks changes the mutable members, so
+  // callers must not share a buffer between threads without a lock (in
+  // Python, the GIL).
   template <typename T>
   const std::shared_ptr<T> GrowableBuffer<T>::ptr() const {
+    if (!chunks_.empty()) {
+      flatten(reserved_);
+    }
     return ptr_;
   }
 
@@ -65,6 +74,9 @@ namespace awkward {
 
   template <typename T>
   void GrowableBuffer<T>::set_length(int64_t newlength) {
+    if (newlength < ptrstart_) {
+      flatten(reserved_);
+    }
     if (newlength > reserved_) {
       set_reserved(newlength);
     }
@@ -80,14 +92,30 @@ namespace awkward {
   void GrowableBuffer<T>::set_reserved(int64_t minreserved) {
     if (minreserved > reserved_) {
       std::shared_ptr<T> ptr(new T[(size_t)minreserved], util::array_deleter<T>());
-      memcpy(ptr.get(), ptr_.get(), (size_t)(length_ * sizeof(T)));
+      memcpy(ptr.get(), GrowableBuffer<T>::ptr().get(), (size_t)(length_ * sizeof(T)));
       ptr_ = ptr;
       reserved_ = minreserved;
     }
   }
 
+  template <typename T>
+  void GrowableBuffer<T>::shrink_to_fit() {
+    if (!chunks_.empty()) {
+      flatten(length_);
+    }
+    else if (length_ < reserved_) {
+      std::shared_ptr<T> ptr(new T[(size_t)length_], util::array_deleter<T>());
+      memcpy(ptr.get(), ptr_.get(), (size_t)(length_ * sizeof(T)));
+      ptr_ = ptr;
+      reserved_ = length_;
+    }
+  }
+
   template <typename T>
   void GrowableBuffer<T>::clear() {
+    chunks_.clear();
+    chunkstarts_.clear();
+    ptrstart_ = 0;
     length_ = 0;
     reserved_ = options_.initial();
     ptr_ = std::shared_ptr<T>(new T[(size_t)options_.initial()], util::array_deleter<T>());
@@ -96,19 +124,78 @@ namespace awkward {
   template <typename T>
   void GrowableBuffer<T>::append(T datum) {
     if (length_ == reserved_) {
-      set_reserved((int64_t)ceil(reserved_ * options_.resize()));
+      addchunk(1);
     }
-    ptr_.get()[length_] = datum;
+    ptr_.get()[length_ - ptrstart_] = datum;
     length_++;
   }
 
+  template <typename T>
+  void GrowableBuffer<T>::extend(const T* ptr, int64_t length) {
+    int64_t fits = reserved_ - length_;
+    if (length > fits) {
+      memcpy(ptr_.get() + (length_ - ptrstart_), ptr, (size_t)(fits * sizeof(T)));
+      length_ += fits;
+      ptr += fits;
+      length -= fits;
+      addchunk(length);
+    }
+    memcpy(ptr_.get() + (length_ - ptrstart_), ptr, (size_t)(length * sizeof(T)));
+    length_ += length;
+  }
+
   template <typename T>
   T GrowableBuffer<T>::getitem_at_nowrap(int64_t at) const {
-    return ptr_.get()[at];
+    if (at >= ptrstart_) {
+      return ptr_.get()[at - ptrstart_];
+    }
+    size_t i = (size_t)(std::upper_bound(chunkstarts_.begin(), chunkstarts_.end(), at) - chunkstarts_.begin()) - 1;
+    return chunks_[i].get()[at - chunkstarts_[i]];
+  }
+
+  // Instead of reallocating and copying everything, a full buffer starts a
+  // new chunk as large as the total would have grown by.
+  template <typename T>
+  void GrowableBuffer<T>::addchunk(int64_t minreserve) {
+    int64_t reserve = (int64_t)ceil(reserved_ * options_.resize()) - reserved_;
+    if (reserve < minreserve) {
+      reserve = minreserve;
+    }
+    chunks_.push_back(ptr_);
+    chunkstarts_.push_back(ptrstart_);
+    ptr_ = std::shared_ptr<T>(new T[(size_t)reserve], util::array_deleter<T>());
+    ptrstart_ = length_;
+    reserved_ += reserve;
+  }
+
+  // Copies the chunks into one buffer just once, when a contiguous pointer
+  // is needed, e.g. by snapshot. The joined buffer keeps the total
+  // reservation, so later appends fill it and later snapshots don't copy.
+  template <typename T>
+  void GrowableBuffer<T>::flatten(int64_t reserved) const {
+    std::shared_ptr<T> ptr(new T[(size_t)reserved], util::array_deleter<T>());
+    T* raw = ptr.get();
+    for (size_t i = 0;  i < chunks_.size();  i++) {
+      int64_t stop = (i + 1 < chunks_.size() ? chunkstarts_[i + 1] : ptrstart_);
+      memcpy(raw + chunkstarts_[i], chunks_[i].get(), (size_t)((stop - chunkstarts_[i]) * sizeof(T)));
+      chunks_[i] = std::shared_ptr<T>(nullptr);
+    }
+    memcpy(raw + ptrstart_, ptr_.get(), (size_t)((length_ - ptrstart_) * sizeof(T)));
+    chunks_.clear();
+    chunkstarts_.clear();
+    ptr_ = ptr;
+    ptrstart_ = 0;
+    reserved_ = reserved;
   }
 
   template class GrowableBuffer<int8_t>;
   template class GrowableBuffer<uint8_t>;
+  template class GrowableBuffer<int16_t>;
+  template class GrowableBuffer<uint16_t>;
+  template class GrowableBuffer<int32_t>;
+  template class GrowableBuffer<uint32_t>;
   template class GrowableBuffer<int64_t>;
+  template class GrowableBuffer<uint64_t>;
+  template class GrowableBuffer<float>;
   template class GrowableBuffer<double>;
 }
@@ -33,6 +33,11 @@ namespace awkward {
     index_.clear();
   }
 
+  template <typename T>
+  void IndexedBuilder<T>::shrink_to_fit() {
+    index_.shrink_to_fit();
+  }
+
   template <typename T>
   bool IndexedBuilder<T>::active() const {
     return false;
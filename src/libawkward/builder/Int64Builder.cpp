@@ -1,5 +1,7 @@
 // BSD 3-Clause License; see https://github.com/jpivarski/awkward-1.0/blob/master/LICENSE
 
+#include <algorithm>
+
 #include "awkward/Identities.h"
 #include "awkward/array/NumpyArray.h"
 #include "awkward/type/PrimitiveType.h"
@@ -36,7 +38,46 @@ namespace awkward {
     buffer_.clear();
   }
 
+  void Int64Builder::shrink_to_fit() {
+    buffer_.shrink_to_fit();
+  }
+
+  template <typename T>
+  const std::shared_ptr<Content> narrowed(const GrowableBuffer<int64_t>& buffer, const std::string& format) {
+    std::vector<ssize_t> shape = { (ssize_t)buffer.length() };
+    std::vector<ssize_t> strides = { (ssize_t)sizeof(T) };
+    return std::make_shared<NumpyArray>(Identities::none(), util::Parameters(), buffer.copy_as<T>(), shape, strides, 0, sizeof(T), format);
+  }
+
   const std::shared_ptr<Content> Int64Builder::snapshot() const {
+    if (options_.narrow()) {
+      // smallest type that holds all values, preferring signed at each width
+      const int64_t* raw = buffer_.ptr().get();
+      int64_t min = 0;
+      int64_t max = 0;
+      for (int64_t i = 0;  i < buffer_.length();  i++) {
+        min = std::min(min, raw[i]);
+        max = std::max(max, raw[i]);
+      }
+      if (min >= INT8_MIN  &&  max <= INT8_MAX) {
+        return narrowed<int8_t>(buffer_, "b");
+      }
+      else if (min >= 0  &&  max <= UINT8_MAX) {
+        return narrowed<uint8_t>(buffer_, "B");
+      }
+      else if (min >= INT16_MIN  &&  max <= INT16_MAX) {
+        return narrowed<int16_t>(buffer_, "h");
+      }
+      else if (min >= 0  &&  max <= UINT16_MAX) {
+        return narrowed<uint16_t>(buffer_, "H");
+      }
+      else if (min >= INT32_MIN  &&  max <= INT32_MAX) {
+        return narrowed<int32_t>(buffer_, "i");
+      }
+      else if (min >= 0  &&  max <= UINT32_MAX) {
+        return narrowed<uint32_t>(buffer_, "I");
+      }
+    }
     std::vector<ssize_t> shape = { (ssize_t)buffer_.length() };
     std::vector<ssize_t> strides = { (ssize_t)sizeof(int64_t) };
 #if defined _MSC_VER || defined __i386__
@@ -117,6 +158,11 @@ namespace awkward {
     throw std::invalid_argument("called 'endrecord' without 'beginrecord' at the same level before it");
   }
 
+  const std::shared_ptr<Builder> Int64Builder::integers(const int64_t* x, int64_t length) {
+    buffer_.extend(x, length);
+    return that_;
+  }
+
   const std::shared_ptr<Builder> Int64Builder::append(const std::shared_ptr<Content>& array, int64_t at) {
     std::shared_ptr<Builder> out = UnionBuilder::fromsingle(options_, that_);
     out.get()->append(array, at);
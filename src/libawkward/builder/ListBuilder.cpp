@@ -40,7 +40,16 @@ namespace awkward {
     content_.get()->clear();
   }
 
+  void ListBuilder::shrink_to_fit() {
+    offsets_.shrink_to_fit();
+    content_.get()->shrink_to_fit();
+  }
+
   const std::shared_ptr<Content> ListBuilder::snapshot() const {
+    if (options_.narrow()  &&  offsets_.getitem_at_nowrap(offsets_.length() - 1) <= INT32_MAX) {
+      Index32 offsets(offsets_.copy_as<int32_t>(), 0, offsets_.length());
+      return std::make_shared<ListOffsetArray32>(Identities::none(), util::Parameters(), offsets, content_.get()->snapshot());
+    }
     Index64 offsets(offsets_.ptr(), 0, offsets_.length());
     return std::make_shared<ListOffsetArray64>(Identities::none(), util::Parameters(), offsets, content_.get()->snapshot());
   }
@@ -197,6 +206,36 @@ namespace awkward {
     }
   }
 
+  const std::shared_ptr<Builder> ListBuilder::booleans(const bool* x, int64_t length) {
+    if (!begun_) {
+      return Builder::booleans(x, length);
+    }
+    else {
+      maybeupdate(content_.get()->booleans(x, length));
+      return that_;
+    }
+  }
+
+  const std::shared_ptr<Builder> ListBuilder::integers(const int64_t* x, int64_t length) {
+    if (!begun_) {
+      return Builder::integers(x, length);
+    }
+    else {
+      maybeupdate(content_.get()->integers(x, length));
+      return that_;
+    }
+  }
+
+  const std::shared_ptr<Builder> ListBuilder::reals(const double* x, int64_t length) {
+    if (!begun_) {
+      return Builder::reals(x, length);
+    }
+    else {
+      maybeupdate(content_.get()->reals(x, length));
+      return that_;
+    }
+  }
+
   const std::shared_ptr<Builder> ListBuilder::append(const std::shared_ptr<Content>& array, int64_t at) {
     if (!begun_) {
       std::shared_ptr<Builder> out = UnionBuilder::fromsingle(options_, that_);
@@ -5,6 +5,8 @@
 #include "awkward/Identities.h"
 #include "awkward/Index.h"
 #include "awkward/array/IndexedArray.h"
+#include "awkward/array/BitMaskedArray.h"
+#include "awkward/array/NumpyArray.h"
 #include "awkward/type/OptionType.h"
 
 #include "awkward/builder/OptionBuilder.h"
@@ -42,9 +44,41 @@ namespace awkward {
     content_.get()->clear();
   }
 
+  void OptionBuilder::shrink_to_fit() {
+    offsets_.shrink_to_fit();
+    content_.get()->shrink_to_fit();
+  }
+
   const std::shared_ptr<Content> OptionBuilder::snapshot() const {
+    std::shared_ptr<Content> content = content_.get()->snapshot();
+    if (options_.narrow()) {
+      // numbers are cheaper to spread out under a bitmask than to index
+      if (dynamic_cast<NumpyArray*>(content.get())  &&  content.get()->length() != 0) {
+        int64_t length = offsets_.length();
+        const int64_t* raw = offsets_.ptr().get();
+        Index64 carry(length);
+        IndexU8 mask((length + 7) / 8);
+        int64_t* rawcarry = carry.ptr().get();
+        uint8_t* rawmask = mask.ptr().get();
+        std::memset(rawmask, 0, (size_t)mask.length());
+        for (int64_t i = 0;  i < length;  i++) {
+          if (raw[i] >= 0) {
+            rawcarry[i] = raw[i];
+            rawmask[i / 8] |= (uint8_t)(1 << (i % 8));
+          }
+          else {
+            rawcarry[i] = 0;
+          }
+        }
+        return std::make_shared<BitMaskedArray>(Identities::none(), util::Parameters(), mask, content.get()->carry(carry), true, length, true);
+      }
+      else if (content.get()->length() <= INT32_MAX) {
+        Index32 index(offsets_.copy_as<int32_t>(), 0, offsets_.length());
+        return std::make_shared<IndexedOptionArray32>(Identities::none(), util::Parameters(), index, content);
+      }
+    }
     Index64 index(offsets_.ptr(), 0, offsets_.length());
-    return std::make_shared<IndexedOptionArray64>(Identities::none(), util::Parameters(), index, content_.get()->snapshot());
+    return std::make_shared<IndexedOptionArray64>(Identities::none(), util::Parameters(), index, content);
   }
 
   bool OptionBuilder::active() const {
@@ -201,6 +235,48 @@ namespace awkward {
     return that_;
   }
 
+  const std::shared_ptr<Builder> OptionBuilder::booleans(const bool* x, int64_t length) {
+    if (!content_.get()->active()) {
+      int64_t start = content_.get()->length();
+      maybeupdate(content_.get()->booleans(x, length));
+      for (int64_t i = 0;  i < length;  i++) {
+        offsets_.append(start + i);
+      }
+    }
+    else {
+      content_.get()->booleans(x, length);
+    }
+    return that_;
+  }
+
+  const std::shared_ptr<Builder> OptionBuilder::integers(const int64_t* x, int64_t length) {
+    if (!content_.get()->active()) {
+      int64_t start = content_.get()->length();
+      maybeupdate(content_.get()->integers(x, length));
+      for (int64_t i = 0;  i < length;  i++) {
+        offsets_.append(start + i);
+      }
+    }
+    else {
+      content_.get()->integers(x, length);
+    }
+    return that_;
+  }
+
+  const std::shared_ptr<Builder> OptionBuilder::reals(const double* x, int64_t length) {
+    if (!content_.get()->active()) {
+      int64_t start = content_.get()->length();
+      maybeupdate(content_.get()->reals(x, length));
+      for (int64_t i = 0;  i < length;  i++) {
+        offsets_.append(start + i);
+      }
+    }
+    else {
+      content_.get()->reals(x, length);
+    }
+    return that_;
+  }
+
   const std::shared_ptr<Builder> OptionBuilder::append(const std::shared_ptr<Content>& array, int64_t at) {
     if (!content_.get()->active()) {
       int64_t length = content_.get()->length();
@@ -33,7 +33,14 @@ namespace awkward {
       , length_(length)
       , begun_(begun)
       , nextindex_(nextindex)
-      , nexttotry_(nexttotry) { }
+      , nexttotry_(nexttotry) {
+    for (size_t i = 0;  i < keys_.size();  i++) {
+      keyslots_.emplace(keys_[i], (int64_t)i);
+      if (pointers_[i] != nullptr) {
+        pointerslots_.emplace(pointers_[i], (int64_t)i);
+      }
+    }
+  }
 
   const std::string RecordBuilder::name() const {
     return name_;
@@ -52,11 +59,11 @@ namespace awkward {
   }
 
   void RecordBuilder::clear() {
-    for (auto x : contents_) {
-      x.get()->clear();
-    }
+    contents_.clear();
     keys_.clear();
     pointers_.clear();
+    keyslots_.clear();
+    pointerslots_.clear();
     name_ = "";
     nameptr_ = nullptr;
     length_ = -1;
@@ -65,6 +72,12 @@ namespace awkward {
     nexttotry_ = 0;
   }
 
+  void RecordBuilder::shrink_to_fit() {
+    for (auto x : contents_) {
+      x.get()->shrink_to_fit();
+    }
+  }
+
   const std::shared_ptr<Content> RecordBuilder::snapshot() const {
     if (length_ == -1) {
       return std::make_shared<EmptyArray>(Identities::none(), util::Parameters());
@@ -299,33 +312,20 @@ namespace awkward {
       throw std::invalid_argument("called 'field' without 'beginrecord' at the same level before it");
     }
     else if (nextindex_ == -1  ||  !contents_[(size_t)nextindex_].get()->active()) {
-      int64_t wrap_around = (int64_t)pointers_.size();
-      int64_t i = nexttotry_;
-      do {
-        if (i >= wrap_around) {
-          i = 0;
-          if (i == nexttotry_) {
-            break;
-          }
-        }
-        if (pointers_[(size_t)i] == key) {
-          nextindex_ = i;
-          nexttotry_ = i + 1;
-          return that_;
-        }
-        i++;
-      } while (i != nexttotry_);
-      nextindex_ = wrap_around;
-      nexttotry_ = 0;
-      if (length_ == 0) {
-        contents_.push_back(UnknownBuilder::fromempty(options_));
+      // fields usually come in the same order as in the last record
+      int64_t i = (nexttotry_ < (int64_t)pointers_.size() ? nexttotry_ : 0);
+      if (i < (int64_t)pointers_.size()  &&  pointers_[(size_t)i] == key) {
+        nextindex_ = i;
+        nexttotry_ = i + 1;
+        return that_;
       }
-      else {
-        contents_.push_back(OptionBuilder::fromnulls(options_, length_, UnknownBuilder::fromempty(options_)));
+      auto slot = pointerslots_.find(key);
+      if (slot != pointerslots_.end()) {
+        nextindex_ = slot->second;
+        nexttotry_ = slot->second + 1;
+        return that_;
       }
-      keys_.push_back(std::string(key));
-      pointers_.push_back(key);
-      return that_;
+      return newfield(key, key);
     }
     else {
       contents_[(size_t)nextindex_].get()->field(key, false);
@@ -338,33 +338,20 @@ namespace awkward {
       throw std::invalid_argument("called 'field' without 'beginrecord' at the same level before it");
     }
     else if (nextindex_ == -1  ||  !contents_[(size_t)nextindex_].get()->active()) {
-      int64_t wrap_around = (int64_t)keys_.size();
-      int64_t i = nexttotry_;
-      do {
-        if (i >= wrap_around) {
-          i = 0;
-          if (i == nexttotry_) {
-            break;
-          }
-        }
-        if (keys_[(size_t)i].compare(key) == 0) {
-          nextindex_ = i;
-          nexttotry_ = i + 1;
-          return that_;
-        }
-        i++;
-      } while (i != nexttotry_);
-      nextindex_ = wrap_around;
-      nexttotry_ = 0;
-      if (length_ == 0) {
-        contents_.push_back(UnknownBuilder::fromempty(options_));
+      // fields usually come in the same order as in the last record
+      int64_t i = (nexttotry_ < (int64_t)keys_.size() ? nexttotry_ : 0);
+      if (i < (int64_t)keys_.size()  &&  keys_[(size_t)i].compare(key) == 0) {
+        nextindex_ = i;
+        nexttotry_ = i + 1;
+        return that_;
       }
-      else {
-        contents_.push_back(OptionBuilder::fromnulls(options_, length_, UnknownBuilder::fromempty(options_)));
+      auto slot = keyslots_.find(std::string(key));
+      if (slot != keyslots_.end()) {
+        nextindex_ = slot->second;
+        nexttotry_ = slot->second + 1;
+        return that_;
       }
-      keys_.push_back(std::string(key));
-      pointers_.push_back(nullptr);
-      return that_;
+      return newfield(key, nullptr);
     }
     else {
       contents_[(size_t)nextindex_].get()->field(key, true);
@@ -372,6 +359,24 @@ namespace awkward {
     }
   }
 
+  const std::shared_ptr<Builder> RecordBuilder::newfield(const char* key, const char* pointer) {
+    nextindex_ = (int64_t)keys_.size();
+    nexttotry_ = 0;
+    if (length_ == 0) {
+      contents_.push_back(UnknownBuilder::fromempty(options_));
+    }
+    else {
+      contents_.push_back(OptionBuilder::fromnulls(options_, length_, UnknownBuilder::fromempty(options_)));
+    }
+    keys_.push_back(std::string(key));
+    pointers_.push_back(pointer);
+    keyslots_.emplace(keys_.back(), nextindex_);
+    if (pointer != nullptr) {
+      pointerslots_.emplace(pointer, nextindex_);
+    }
+    return that_;
+  }
+
   const std::shared_ptr<Builder> RecordBuilder::endrecord() {
     if (!begun_) {
       throw std::invalid_argument("called 'endrecord' without 'beginrecord' at the same level before it");
@@ -394,6 +399,45 @@ namespace awkward {
     return that_;
   }
 
+  const std::shared_ptr<Builder> RecordBuilder::booleans(const bool* x, int64_t length) {
+    if (!begun_  ||  nextindex_ == -1) {
+      return Builder::booleans(x, length);
+    }
+    else if (!contents_[(size_t)nextindex_].get()->active()) {
+      maybeupdate(nextindex_, contents_[(size_t)nextindex_].get()->booleans(x, length));
+    }
+    else {
+      contents_[(size_t)nextindex_].get()->booleans(x, length);
+    }
+    return that_;
+  }
+
+  const std::shared_ptr<Builder> RecordBuilder::integers(const int64_t* x, int64_t length) {
+    if (!begun_  ||  nextindex_ == -1) {
+      return Builder::integers(x, length);
+    }
+    else if (!contents_[(size_t)nextindex_].get()->active()) {
+      maybeupdate(nextindex_, contents_[(size_t)nextindex_].get()->integers(x, length));
+    }
+    else {
+      contents_[(size_t)nextindex_].get()->integers(x, length);
+    }
+    return that_;
+  }
+
+  const std::shared_ptr<Builder> RecordBuilder::reals(const double* x, int64_t length) {
+    if (!begun_  ||  nextindex_ == -1) {
+      return Builder::reals(x, length);
+    }
+    else if (!contents_[(size_t)nextindex_].get()->active()) {
+      maybeupdate(nextindex_, contents_[(size_t)nextindex_].get()->reals(x, length));
+    }
+    else {
+      contents_[(size_t)nextindex_].get()->reals(x, length);
+    }
+    return that_;
+  }
+
   const std::shared_ptr<Builder> RecordBuilder::append(const std::shared_ptr<Content>& array, int64_t at) {
     if (!begun_) {
       std::shared_ptr<Builder> out = UnionBuilder::fromsingle(options_, that_);
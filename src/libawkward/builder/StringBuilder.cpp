@@ -1,8 +1,12 @@
 // BSD 3-Clause License; see https://github.com/jpivarski/awkward-1.0/blob/master/LICENSE
 
+#include <cstring>
+#include <stdexcept>
+
 #include "awkward/Identities.h"
 #include "awkward/array/NumpyArray.h"
 #include "awkward/array/ListOffsetArray.h"
+#include "awkward/array/IndexedArray.h"
 #include "awkward/type/PrimitiveType.h"
 #include "awkward/type/ListType.h"
 #include "awkward/builder/OptionBuilder.h"
@@ -24,7 +28,8 @@ namespace awkward {
       : options_(options)
       , offsets_(offsets)
       , content_(content)
-      , encoding_(encoding) { }
+      , encoding_(encoding)
+      , index_(GrowableBuffer<int32_t>::empty(options, 0)) { }
 
   const std::string StringBuilder::classname() const {
     return "StringBuilder";
@@ -35,6 +40,9 @@ namespace awkward {
   }
 
   int64_t StringBuilder::length() const {
+    if (options_.categorical()) {
+      return index_.length();
+    }
     return offsets_.length() - 1;
   }
 
@@ -42,6 +50,16 @@ namespace awkward {
     offsets_.clear();
     offsets_.append(0);
     content_.clear();
+    if (options_.categorical()) {
+      index_.clear();
+      dictionary_.clear();
+    }
+  }
+
+  void StringBuilder::shrink_to_fit() {
+    offsets_.shrink_to_fit();
+    content_.shrink_to_fit();
+    index_.shrink_to_fit();
   }
 
   const std::shared_ptr<Content> StringBuilder::snapshot() const {
@@ -60,12 +78,25 @@ namespace awkward {
       throw std::invalid_argument(std::string("unsupported encoding: ") + util::quote(encoding_, false));
     }
 
-    Index64 offsets(offsets_.ptr(), 0, offsets_.length());
     std::vector<ssize_t> shape = { (ssize_t)content_.length() };
     std::vector<ssize_t> strides = { (ssize_t)sizeof(uint8_t) };
     std::shared_ptr<Content> content;
     content = std::make_shared<NumpyArray>(Identities::none(), char_parameters, content_.ptr(), shape, strides, 0, sizeof(uint8_t), "B");
-    return std::make_shared<ListOffsetArray64>(Identities::none(), string_parameters, offsets, content);
+    std::shared_ptr<Content> out;
+    if (options_.narrow()  &&  content_.length() <= INT32_MAX) {
+      Index32 offsets(offsets_.copy_as<int32_t>(), 0, offsets_.length());
+      out = std::make_shared<ListOffsetArray32>(Identities::none(), string_parameters, offsets, content);
+    }
+    else {
+      Index64 offsets(offsets_.ptr(), 0, offsets_.length());
+      out = std::make_shared<ListOffsetArray64>(Identities::none(), string_parameters, offsets, content);
+    }
+    if (options_.categorical()) {
+      // same parameters as the strings, so it still dispatches as a string
+      Index32 index(index_.ptr(), 0, index_.length());
+      out = std::make_shared<IndexedArray32>(Identities::none(), string_parameters, index, out, false, true);
+    }
+    return out;
   }
 
   bool StringBuilder::active() const {
@@ -97,6 +128,23 @@ namespace awkward {
   }
 
   const std::shared_ptr<Builder> StringBuilder::string(const char* x, int64_t length, const char* encoding) {
+    if (options_.categorical()) {
+      if (length < 0) {
+        length = (int64_t)strlen(x);
+      }
+      key_.assign(x, (size_t)length);
+      auto it = dictionary_.find(key_);
+      if (it != dictionary_.end()) {
+        index_.append(it->second);
+        return that_;
+      }
+      if (dictionary_.size() == (size_t)INT32_MAX) {
+        throw std::invalid_argument("too many distinct strings for a categorical StringBuilder");
+      }
+      int32_t slot = (int32_t)dictionary_.size();
+      dictionary_[key_] = slot;
+      index_.append(slot);
+    }
     if (length < 0) {
       for (int64_t i = 0;  x[i] != 0;  i++) {
         content_.append((uint8_t)x[i]);
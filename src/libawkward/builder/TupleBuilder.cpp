@@ -40,14 +40,18 @@ namespace awkward {
   }
 
   void TupleBuilder::clear() {
-    for (auto x : contents_) {
-      x.get()->clear();
-    }
+    contents_.clear();
     length_ = -1;
     begun_ = false;
     nextindex_ = -1;
   }
 
+  void TupleBuilder::shrink_to_fit() {
+    for (auto x : contents_) {
+      x.get()->shrink_to_fit();
+    }
+  }
+
   const std::shared_ptr<Content> TupleBuilder::snapshot() const {
     if (length_ == -1) {
       return std::make_shared<EmptyArray>(Identities::none(), util::Parameters());
@@ -292,6 +296,45 @@ namespace awkward {
     return that_;
   }
 
+  const std::shared_ptr<Builder> TupleBuilder::booleans(const bool* x, int64_t length) {
+    if (!begun_  ||  nextindex_ == -1) {
+      return Builder::booleans(x, length);
+    }
+    else if (!contents_[(size_t)nextindex_].get()->active()) {
+      maybeupdate(nextindex_, contents_[(size_t)nextindex_].get()->booleans(x, length));
+    }
+    else {
+      contents_[(size_t)nextindex_].get()->booleans(x, length);
+    }
+    return that_;
+  }
+
+  const std::shared_ptr<Builder> TupleBuilder::integers(const int64_t* x, int64_t length) {
+    if (!begun_  ||  nextindex_ == -1) {
+      return Builder::integers(x, length);
+    }
+    else if (!contents_[(size_t)nextindex_].get()->active()) {
+      maybeupdate(nextindex_, contents_[(size_t)nextindex_].get()->integers(x, length));
+    }
+    else {
+      contents_[(size_t)nextindex_].get()->integers(x, length);
+    }
+    return that_;
+  }
+
+  const std::shared_ptr<Builder> TupleBuilder::reals(const double* x, int64_t length) {
+    if (!begun_  ||  nextindex_ == -1) {
+      return Builder::reals(x, length);
+    }
+    else if (!contents_[(size_t)nextindex_].get()->active()) {
+      maybeupdate(nextindex_, contents_[(size_t)nextindex_].get()->reals(x, length));
+    }
+    else {
+      contents_[(size_t)nextindex_].get()->reals(x, length);
+    }
+    return that_;
+  }
+
   const std::shared_ptr<Builder> TupleBuilder::append(const std::shared_ptr<Content>& array, int64_t at) {
     if (!begun_) {
       std::shared_ptr<Builder> out = UnionBuilder::fromsingle(options_, that_);
@@ -0,0 +1,881 @@
+// BSD 3-Clause License; see https://github.com/jpivarski/awkward-1.0/blob/master/LICENSE
+
+#include <cstring>
+#include <algorithm>
+#include <limits>
+#include <stdexcept>
+#include <type_traits>
+
+#include "awkward/Identities.h"
+#include "awkward/Index.h"
+#include "awkward/array/NumpyArray.h"
+#include "awkward/array/ListOffsetArray.h"
+#include "awkward/array/RegularArray.h"
+#include "awkward/array/IndexedArray.h"
+#include "awkward/array/RecordArray.h"
+#include "awkward/type/ArrayType.h"
+#include "awkward/type/ListType.h"
+#include "awkward/type/OptionType.h"
+#include "awkward/type/PrimitiveType.h"
+#include "awkward/type/RecordType.h"
+#include "awkward/type/RegularType.h"
+#include "awkward/util.h"
+#include "awkward/builder/GrowableBuffer.h"
+
+#include "awkward/builder/TypedBuilder.h"
+
+namespace awkward {
+  // A Filler is a fixed node of a tree compiled from a Type: it appends
+  // straight into GrowableBuffers and refuses values that don't fit, so no
+  // type discovery or promotion happens while filling.
+  class Filler {
+  public:
+    Filler(const std::shared_ptr<Type>& type)
+        : type_(type)
+        , isoption_(dynamic_cast<OptionType*>(type.get()) != nullptr) { }
+    virtual ~Filler() { }
+    virtual int64_t length() const = 0;
+    virtual void clear() = 0;
+    virtual void shrink_to_fit() = 0;
+    virtual const std::shared_ptr<Content> snapshot() const = 0;
+    // snapshot of this and other fillers of the same tree, end to end
+    virtual const std::shared_ptr<Content> concatenate(const std::vector<const Filler*>& parts) const = 0;
+    // mark remembers the current lengths and rollback truncates back to them,
+    // so that a value that fails halfway can be taken out again
+    virtual void mark() = 0;
+    virtual void rollback() = 0;
+
+    virtual bool null() { return false; }
+    virtual bool boolean(bool x) { return false; }
+    virtual bool integer(int64_t x) { return false; }
+    // integers beyond int64 (from JSON, for instance)
+    virtual bool uinteger(uint64_t x) { return false; }
+    virtual bool real(double x) { return false; }
+    virtual bool string(const char* x, int64_t length) { return false; }
+    virtual Filler* beginlist() { return nullptr; }
+    virtual bool endlist() { return false; }
+    virtual Filler* beginrecord() { return nullptr; }
+    virtual bool field(const char* key) { return false; }
+    virtual bool endrecord() { return false; }
+    virtual Filler* begintuple(int64_t numfields) { return nullptr; }
+    virtual bool index(int64_t i) { return false; }
+    virtual bool endtuple() { return false; }
+    virtual Filler* next() { return nullptr; }
+
+    bool isoption() const {
+      return isoption_;
+    }
+    const std::string tostring() const {
+      return type_.get()->tostring();
+    }
+
+  protected:
+    const std::shared_ptr<Type> type_;
+    const bool isoption_;
+  };
+
+  std::shared_ptr<Filler> compile_filler(const std::shared_ptr<Type>& type, const ArrayBuilderOptions& options);
+
+  template <typename T>
+  const std::shared_ptr<T> concatenate_buffers(const std::vector<const GrowableBuffer<T>*>& buffers, int64_t& length) {
+    length = 0;
+    for (auto x : buffers) {
+      length += x->length();
+    }
+    std::shared_ptr<T> out(new T[(size_t)std::max(length, (int64_t)1)], util::array_deleter<T>());
+    int64_t at = 0;
+    for (auto x : buffers) {
+      memcpy(out.get() + at, x->ptr().get(), (size_t)x->length()*sizeof(T));
+      at += x->length();
+    }
+    return out;
+  }
+
+  // offsets start at zero in each part; shifts[i] is added to part i's offsets
+  const Index64 concatenate_offsets(const std::vector<const GrowableBuffer<int64_t>*>& offsets, const std::vector<int64_t>& shifts) {
+    int64_t length = 1;
+    for (auto x : offsets) {
+      length += x->length() - 1;
+    }
+    Index64 out(length);
+    int64_t* raw = out.ptr().get();
+    raw[0] = 0;
+    int64_t at = 1;
+    for (size_t i = 0;  i < offsets.size();  i++) {
+      const int64_t* part = offsets[i]->ptr().get();
+      for (int64_t j = 1;  j < offsets[i]->length();  j++) {
+        raw[at] = part[j] + shifts[i];
+        at++;
+      }
+    }
+    return out;
+  }
+
+  class BoolFiller: public Filler {
+  public:
+    BoolFiller(const std::shared_ptr<Type>& type, const ArrayBuilderOptions& options)
+        : Filler(type)
+        , buffer_(options)
+        , marked_(0) { }
+    int64_t length() const override { return buffer_.length(); }
+    void clear() override { buffer_.clear(); }
+    void shrink_to_fit() override { buffer_.shrink_to_fit(); }
+    const std::shared_ptr<Content> snapshot() const override {
+      std::vector<ssize_t> shape = { (ssize_t)buffer_.length() };
+      std::vector<ssize_t> strides = { (ssize_t)sizeof(bool) };
+      return std::make_shared<NumpyArray>(Identities::none(), type_.get()->parameters(), buffer_.ptr(), shape, strides, 0, sizeof(bool), "?");
+    }
+    const std::shared_ptr<Content> concatenate(const std::vector<const Filler*>& parts) const override {
+      std::vector<const GrowableBuffer<uint8_t>*> buffers;
+      for (auto x : parts) {
+        buffers.push_back(&dynamic_cast<const BoolFiller*>(x)->buffer_);
+      }
+      int64_t length;
+      std::shared_ptr<uint8_t> ptr = concatenate_buffers(buffers, length);
+      std::vector<ssize_t> shape = { (ssize_t)length };
+      std::vector<ssize_t> strides = { (ssize_t)sizeof(bool) };
+      return std::make_shared<NumpyArray>(Identities::none(), type_.get()->parameters(), ptr, shape, strides, 0, sizeof(bool), "?");
+    }
+    void mark() override { marked_ = buffer_.length(); }
+    void rollback() override { buffer_.set_length(marked_); }
+    bool boolean(bool x) override {
+      buffer_.append((uint8_t)x);
+      return true;
+    }
+  private:
+    GrowableBuffer<uint8_t> buffer_;
+    int64_t marked_;
+  };
+
+  template <typename T>
+  class NumberFiller: public Filler {
+  public:
+    NumberFiller(const std::shared_ptr<Type>& type, const ArrayBuilderOptions& options)
+        : Filler(type)
+        , buffer_(options)
+        , format_(std::dynamic_pointer_cast<NumpyArray>(type.get()->empty()).get()->format())
+        , marked_(0) { }
+    int64_t length() const override { return buffer_.length(); }
+    void clear() override { buffer_.clear(); }
+    void shrink_to_fit() override { buffer_.shrink_to_fit(); }
+    const std::shared_ptr<Content> snapshot() const override {
+      std::vector<ssize_t> shape = { (ssize_t)buffer_.length() };
+      std::vector<ssize_t> strides = { (ssize_t)sizeof(T) };
+      return std::make_shared<NumpyArray>(Identities::none(), type_.get()->parameters(), buffer_.ptr(), shape, strides, 0, sizeof(T), format_);
+    }
+    const std::shared_ptr<Content> concatenate(const std::vector<const Filler*>& parts) const override {
+      std::vector<const GrowableBuffer<T>*> buffers;
+      for (auto x : parts) {
+        buffers.push_back(&dynamic_cast<const NumberFiller<T>*>(x)->buffer_);
+      }
+      int64_t length;
+      std::shared_ptr<T> ptr = concatenate_buffers(buffers, length);
+      std::vector<ssize_t> shape = { (ssize_t)length };
+      std::vector<ssize_t> strides = { (ssize_t)sizeof(T) };
+      return std::make_shared<NumpyArray>(Identities::none(), type_.get()->parameters(), ptr, shape, strides, 0, sizeof(T), format_);
+    }
+    void mark() override { marked_ = buffer_.length(); }
+    void rollback() override { buffer_.set_length(marked_); }
+    bool integer(int64_t x) override {
+      if (!std::is_floating_point<T>::value) {
+        if ((std::is_unsigned<T>::value  &&  x < 0)  ||  (int64_t)((T)x) != x) {
+          return false;
+        }
+      }
+      buffer_.append((T)x);
+      return true;
+    }
+    bool uinteger(uint64_t x) override {
+      if (!std::is_floating_point<T>::value  &&  x > (uint64_t)std::numeric_limits<T>::max()) {
+        return false;
+      }
+      buffer_.append((T)x);
+      return true;
+    }
+    bool real(double x) override {
+      if (!std::is_floating_point<T>::value) {
+        return false;
+      }
+      buffer_.append((T)x);
+      return true;
+    }
+  private:
+    GrowableBuffer<T> buffer_;
+    const std::string format_;
+    int64_t marked_;
+  };
+
+  class StringFiller: public Filler {
+  public:
+    StringFiller(const std::shared_ptr<Type>& type, const ArrayBuilderOptions& options)
+        : Filler(type)
+        , offsets_(options)
+        , content_(options)
+        , markedoffsets_(1)
+        , markedcontent_(0) {
+      offsets_.append(0);
+    }
+    int64_t length() const override { return offsets_.length() - 1; }
+    void clear() override {
+      offsets_.clear();
+      offsets_.append(0);
+      content_.clear();
+    }
+    void shrink_to_fit() override {
+      offsets_.shrink_to_fit();
+      content_.shrink_to_fit();
+    }
+    const std::shared_ptr<Content> snapshot() const override {
+      ListType* listtype = dynamic_cast<ListType*>(type_.get());
+      std::vector<ssize_t> shape = { (ssize_t)content_.length() };
+      std::vector<ssize_t> strides = { (ssize_t)sizeof(uint8_t) };
+      std::shared_ptr<Content> content = std::make_shared<NumpyArray>(Identities::none(), listtype->type().get()->parameters(), content_.ptr(), shape, strides, 0, sizeof(uint8_t), "B");
+      Index64 offsets(offsets_.ptr(), 0, offsets_.length());
+      return std::make_shared<ListOffsetArray64>(Identities::none(), type_.get()->parameters(), offsets, content);
+    }
+    const std::shared_ptr<Content> concatenate(const std::vector<const Filler*>& parts) const override {
+      std::vector<const GrowableBuffer<int64_t>*> offsets;
+      std::vector<const GrowableBuffer<uint8_t>*> contents;
+      std::vector<int64_t> shifts;
+      int64_t shift = 0;
+      for (auto x : parts) {
+        const StringFiller* raw = dynamic_cast<const StringFiller*>(x);
+        offsets.push_back(&raw->offsets_);
+        contents.push_back(&raw->content_);
+        shifts.push_back(shift);
+        shift += raw->content_.length();
+      }
+      int64_t length;
+      std::shared_ptr<uint8_t> ptr = concatenate_buffers(contents, length);
+      ListType* listtype = dynamic_cast<ListType*>(type_.get());
+      std::vector<ssize_t> shape = { (ssize_t)length };
+      std::vector<ssize_t> strides = { (ssize_t)sizeof(uint8_t) };
+      std::shared_ptr<Content> content = std::make_shared<NumpyArray>(Identities::none(), listtype->type().get()->parameters(), ptr, shape, strides, 0, sizeof(uint8_t), "B");
+      return std::make_shared<ListOffsetArray64>(Identities::none(), type_.get()->parameters(), concatenate_offsets(offsets, shifts), content);
+    }
+    void mark() override {
+      markedoffsets_ = offsets_.length();
+      markedcontent_ = content_.length();
+    }
+    void rollback() override {
+      offsets_.set_length(markedoffsets_);
+      content_.set_length(markedcontent_);
+    }
+    bool string(const char* x, int64_t length) override {
+      for (int64_t i = 0;  i < length;  i++) {
+        content_.append((uint8_t)x[i]);
+      }
+      offsets_.append(content_.length());
+      return true;
+    }
+  private:
+    GrowableBuffer<int64_t> offsets_;
+    GrowableBuffer<uint8_t> content_;
+    int64_t markedoffsets_;
+    int64_t markedcontent_;
+  };
+
+  class ListFiller: public Filler {
+  public:
+    ListFiller(const std::shared_ptr<Type>& type, const ArrayBuilderOptions& options)
+        : Filler(type)
+        , offsets_(options)
+        , content_(compile_filler(dynamic_cast<ListType*>(type.get())->type(), options))
+        , marked_(1) {
+      offsets_.append(0);
+    }
+    int64_t length() const override { return offsets_.length() - 1; }
+    void clear() override {
+      offsets_.clear();
+      offsets_.append(0);
+      content_.get()->clear();
+    }
+    void shrink_to_fit() override {
+      offsets_.shrink_to_fit();
+      content_.get()->shrink_to_fit();
+    }
+    const std::shared_ptr<Content> snapshot() const override {
+      Index64 offsets(offsets_.ptr(), 0, offsets_.length());
+      return std::make_shared<ListOffsetArray64>(Identities::none(), type_.get()->parameters(), offsets, content_.get()->snapshot());
+    }
+    const std::shared_ptr<Content> concatenate(const std::vector<const Filler*>& parts) const override {
+      std::vector<const GrowableBuffer<int64_t>*> offsets;
+      std::vector<const Filler*> contents;
+      std::vector<int64_t> shifts;
+      int64_t shift = 0;
+      for (auto x : parts) {
+        const ListFiller* raw = dynamic_cast<const ListFiller*>(x);
+        offsets.push_back(&raw->offsets_);
+        contents.push_back(raw->content_.get());
+        shifts.push_back(shift);
+        shift += raw->content_.get()->length();
+      }
+      return std::make_shared<ListOffsetArray64>(Identities::none(), type_.get()->parameters(), concatenate_offsets(offsets, shifts), content_.get()->concatenate(contents));
+    }
+    void mark() override {
+      marked_ = offsets_.length();
+      content_.get()->mark();
+    }
+    void rollback() override {
+      offsets_.set_length(marked_);
+      content_.get()->rollback();
+    }
+    Filler* beginlist() override { return this; }
+    bool endlist() override {
+      offsets_.append(content_.get()->length());
+      return true;
+    }
+    Filler* next() override { return content_.get(); }
+  private:
+    GrowableBuffer<int64_t> offsets_;
+    std::shared_ptr<Filler> content_;
+    int64_t marked_;
+  };
+
+  class RegularFiller: public Filler {
+  public:
+    RegularFiller(const std::shared_ptr<Type>& type, const ArrayBuilderOptions& options)
+        : Filler(type)
+        , size_(dynamic_cast<RegularType*>(type.get())->size())
+        , length_(0)
+        , start_(0)
+        , content_(compile_filler(dynamic_cast<RegularType*>(type.get())->type(), options))
+        , marked_(0) { }
+    int64_t length() const override { return length_; }
+    void clear() override {
+      length_ = 0;
+      content_.get()->clear();
+    }
+    void shrink_to_fit() override {
+      content_.get()->shrink_to_fit();
+    }
+    const std::shared_ptr<Content> snapshot() const override {
+      return std::make_shared<RegularArray>(Identities::none(), type_.get()->parameters(), content_.get()->snapshot(), size_);
+    }
+    const std::shared_ptr<Content> concatenate(const std::vector<const Filler*>& parts) const override {
+      std::vector<const Filler*> contents;
+      for (auto x : parts) {
+        contents.push_back(dynamic_cast<const RegularFiller*>(x)->content_.get());
+      }
+      return std::make_shared<RegularArray>(Identities::none(), type_.get()->parameters(), content_.get()->concatenate(contents), size_);
+    }
+    void mark() override {
+      marked_ = length_;
+      content_.get()->mark();
+    }
+    void rollback() override {
+      length_ = marked_;
+      content_.get()->rollback();
+    }
+    Filler* beginlist() override {
+      start_ = content_.get()->length();
+      return this;
+    }
+    bool endlist() override {
+      if (content_.get()->length() - start_ != size_) {
+        return false;
+      }
+      length_++;
+      return true;
+    }
+    Filler* next() override { return content_.get(); }
+  private:
+    const int64_t size_;
+    int64_t length_;
+    int64_t start_;
+    std::shared_ptr<Filler> content_;
+    int64_t marked_;
+  };
+
+  class OptionFiller: public Filler {
+  public:
+    OptionFiller(const std::shared_ptr<Type>& type, const ArrayBuilderOptions& options)
+        : Filler(type)
+        , index_(options)
+        , content_(compile_filler(dynamic_cast<OptionType*>(type.get())->type(), options))
+        , marked_(0) { }
+    int64_t length() const override { return index_.length(); }
+    void clear() override {
+      index_.clear();
+      content_.get()->clear();
+    }
+    void shrink_to_fit() override {
+      index_.shrink_to_fit();
+      content_.get()->shrink_to_fit();
+    }
+    const std::shared_ptr<Content> snapshot() const override {
+      Index64 index(index_.ptr(), 0, index_.length());
+      return std::make_shared<IndexedOptionArray64>(Identities::none(), type_.get()->parameters(), index, content_.get()->snapshot());
+    }
+    const std::shared_ptr<Content> concatenate(const std::vector<const Filler*>& parts) const override {
+      int64_t length = 0;
+      for (auto x : parts) {
+        length += x->length();
+      }
+      Index64 index(length);
+      int64_t* raw = index.ptr().get();
+      std::vector<const Filler*> contents;
+      int64_t at = 0;
+      int64_t shift = 0;
+      for (auto x : parts) {
+        const OptionFiller* part = dynamic_cast<const OptionFiller*>(x);
+        const int64_t* partindex = part->index_.ptr().get();
+        for (int64_t j = 0;  j < part->index_.length();  j++) {
+          raw[at] = (partindex[j] < 0 ? -1 : partindex[j] + shift);
+          at++;
+        }
+        contents.push_back(part->content_.get());
+        shift += part->content_.get()->length();
+      }
+      return std::make_shared<IndexedOptionArray64>(Identities::none(), type_.get()->parameters(), index, content_.get()->concatenate(contents));
+    }
+    void mark() override {
+      marked_ = index_.length();
+      content_.get()->mark();
+    }
+    void rollback() override {
+      index_.set_length(marked_);
+      content_.get()->rollback();
+    }
+    bool null() override {
+      index_.append(-1);
+      return true;
+    }
+    bool boolean(bool x) override {
+      int64_t length = content_.get()->length();
+      return content_.get()->boolean(x)  &&  valid(length);
+    }
+    bool integer(int64_t x) override {
+      int64_t length = content_.get()->length();
+      return content_.get()->integer(x)  &&  valid(length);
+    }
+    bool uinteger(uint64_t x) override {
+      int64_t length = content_.get()->length();
+      return content_.get()->uinteger(x)  &&  valid(length);
+    }
+    bool real(double x) override {
+      int64_t length = content_.get()->length();
+      return content_.get()->real(x)  &&  valid(length);
+    }
+    bool string(const char* x, int64_t length) override {
+      int64_t len = content_.get()->length();
+      return content_.get()->string(x, length)  &&  valid(len);
+    }
+    Filler* beginlist() override {
+      int64_t length = content_.get()->length();
+      Filler* out = content_.get()->beginlist();
+      return (out != nullptr  &&  valid(length)) ? out : nullptr;
+    }
+    Filler* beginrecord() override {
+      int64_t length = content_.get()->length();
+      Filler* out = content_.get()->beginrecord();
+      return (out != nullptr  &&  valid(length)) ? out : nullptr;
+    }
+    Filler* begintuple(int64_t numfields) override {
+      int64_t length = content_.get()->length();
+      Filler* out = content_.get()->begintuple(numfields);
+      return (out != nullptr  &&  valid(length)) ? out : nullptr;
+    }
+  private:
+    // index entries are only added for values the content accepted
+    bool valid(int64_t length) {
+      index_.append(length);
+      return true;
+    }
+
+    GrowableBuffer<int64_t> index_;
+    std::shared_ptr<Filler> content_;
+    int64_t marked_;
+  };
+
+  class RecordFiller: public Filler {
+  public:
+    RecordFiller(const std::shared_ptr<Type>& type, const ArrayBuilderOptions& options)
+        : Filler(type)
+        , keys_(type.get()->keys())
+        , istuple_(dynamic_cast<RecordType*>(type.get())->istuple())
+        , length_(0)
+        , current_(-1)
+        , nexttotry_(0)
+        , marked_(0) {
+      for (auto x : dynamic_cast<RecordType*>(type.get())->types()) {
+        contents_.push_back(compile_filler(x, options));
+      }
+    }
+    int64_t length() const override { return length_; }
+    void clear() override {
+      length_ = 0;
+      for (auto x : contents_) {
+        x.get()->clear();
+      }
+    }
+    void shrink_to_fit() override {
+      for (auto x : contents_) {
+        x.get()->shrink_to_fit();
+      }
+    }
+    const std::shared_ptr<Content> snapshot() const override {
+      std::vector<std::shared_ptr<Content>> contents;
+      for (auto x : contents_) {
+        contents.push_back(x.get()->snapshot());
+      }
+      return std::make_shared<RecordArray>(Identities::none(), type_.get()->parameters(), contents, dynamic_cast<RecordType*>(type_.get())->recordlookup(), length_);
+    }
+    const std::shared_ptr<Content> concatenate(const std::vector<const Filler*>& parts) const override {
+      int64_t length = 0;
+      for (auto x : parts) {
+        length += x->length();
+      }
+      std::vector<std::shared_ptr<Content>> contents;
+      for (size_t i = 0;  i < contents_.size();  i++) {
+        std::vector<const Filler*> fields;
+        for (auto x : parts) {
+          fields.push_back(dynamic_cast<const RecordFiller*>(x)->contents_[i].get());
+        }
+        contents.push_back(contents_[i].get()->concatenate(fields));
+      }
+      return std::make_shared<RecordArray>(Identities::none(), type_.get()->parameters(), contents, dynamic_cast<RecordType*>(type_.get())->recordlookup(), length);
+    }
+    void mark() override {
+      marked_ = length_;
+      for (auto x : contents_) {
+        x.get()->mark();
+      }
+    }
+    void rollback() override {
+      length_ = marked_;
+      current_ = -1;
+      for (auto x : contents_) {
+        x.get()->rollback();
+      }
+    }
+    Filler* beginrecord() override {
+      if (istuple_) {
+        return nullptr;
+      }
+      current_ = -1;
+      return this;
+    }
+    bool field(const char* key) override {
+      if (istuple_) {
+        return false;
+      }
+      // fields usually arrive in the same order as the type's keys
+      int64_t numfields = (int64_t)keys_.size();
+      for (int64_t j = 0;  j < numfields;  j++) {
+        int64_t i = (nexttotry_ + j) % numfields;
+        if (keys_[(size_t)i].compare(key) == 0) {
+          current_ = i;
+          nexttotry_ = i + 1;
+          return true;
+        }
+      }
+      return false;
+    }
+    bool endrecord() override {
+      return !istuple_  &&  finish();
+    }
+    Filler* begintuple(int64_t numfields) override {
+      if (!istuple_  ||  numfields != (int64_t)contents_.size()) {
+        return nullptr;
+      }
+      current_ = -1;
+      return this;
+    }
+    bool index(int64_t i) override {
+      if (!istuple_  ||  i < 0  ||  i >= (int64_t)contents_.size()) {
+        return false;
+      }
+      current_ = i;
+      return true;
+    }
+    bool endtuple() override {
+      return istuple_  &&  finish();
+    }
+    Filler* next() override {
+      return current_ == -1 ? nullptr : contents_[(size_t)current_].get();
+    }
+  private:
+    bool finish() {
+      for (auto x : contents_) {
+        int64_t length = x.get()->length();
+        if (length == length_  &&  x.get()->isoption()) {
+          x.get()->null();
+        }
+        else if (length != length_ + 1) {
+          return false;
+        }
+      }
+      length_++;
+      return true;
+    }
+
+    const std::vector<std::string> keys_;
+    const bool istuple_;
+    std::vector<std::shared_ptr<Filler>> contents_;
+    int64_t length_;
+    int64_t current_;
+    int64_t nexttotry_;
+    int64_t marked_;
+  };
+
+  std::shared_ptr<Filler> compile_filler(const std::shared_ptr<Type>& type, const ArrayBuilderOptions& options) {
+    if (ArrayType* raw = dynamic_cast<ArrayType*>(type.get())) {
+      return compile_filler(raw->type(), options);
+    }
+    else if (PrimitiveType* raw = dynamic_cast<PrimitiveType*>(type.get())) {
+      switch (raw->dtype()) {
+        case PrimitiveType::boolean: return std::make_shared<BoolFiller>(type, options);
+        case PrimitiveType::int8:    return std::make_shared<NumberFiller<int8_t>>(type, options);
+        case PrimitiveType::int16:   return std::make_shared<NumberFiller<int16_t>>(type, options);
+        case PrimitiveType::int32:   return std::make_shared<NumberFiller<int32_t>>(type, options);
+        case PrimitiveType::int64:   return std::make_shared<NumberFiller<int64_t>>(type, options);
+        case PrimitiveType::uint8:   return std::make_shared<NumberFiller<uint8_t>>(type, options);
+        case PrimitiveType::uint16:  return std::make_shared<NumberFiller<uint16_t>>(type, options);
+        case PrimitiveType::uint32:  return std::make_shared<NumberFiller<uint32_t>>(type, options);
+        case PrimitiveType::uint64:  return std::make_shared<NumberFiller<uint64_t>>(type, options);
+        case PrimitiveType::float32: return std::make_shared<NumberFiller<float>>(type, options);
+        case PrimitiveType::float64: return std::make_shared<NumberFiller<double>>(type, options);
+        default: throw std::runtime_error(std::string("unexpected dtype: ") + std::to_string(raw->dtype()));
+      }
+    }
+    else if (ListType* raw = dynamic_cast<ListType*>(type.get())) {
+      if (raw->parameter_equals("__array__", "\"string\"")  ||  raw->parameter_equals("__array__", "\"bytestring\"")) {
+        return std::make_shared<StringFiller>(type, options);
+      }
+      return std::make_shared<ListFiller>(type, options);
+    }
+    else if (dynamic_cast<RegularType*>(type.get())) {
+      return std::make_shared<RegularFiller>(type, options);
+    }
+    else if (dynamic_cast<OptionType*>(type.get())) {
+      return std::make_shared<OptionFiller>(type, options);
+    }
+    else if (dynamic_cast<RecordType*>(type.get())) {
+      return std::make_shared<RecordFiller>(type, options);
+    }
+    else {
+      throw std::invalid_argument(std::string("cannot fill type ") + type.get()->tostring() + std::string(" with a fixed-type builder (unions and unknown types are not supported)"));
+    }
+  }
+
+
+  /////////////////////////////////////////////////////// TypedBuilder
+
+  class TypedBuilder::Impl {
+  public:
+    Impl(const std::shared_ptr<Type>& type, const ArrayBuilderOptions& options)
+        : root_(compile_filler(type, options)) { }
+
+    // the filler that the next value goes into; a value that starts at the
+    // top level marks the lengths to roll back to if it fails
+    Filler* target() {
+      if (stack_.empty()) {
+        root_.get()->mark();
+        return root_.get();
+      }
+      Filler* out = stack_.back()->next();
+      if (out == nullptr) {
+        error(std::string("a value in ") + stack_.back()->tostring() + std::string(" needs 'field' or 'index' before it"));
+      }
+      return out;
+    }
+
+    Filler* top(const char* method) {
+      if (stack_.empty()) {
+        throw std::invalid_argument(std::string("called '") + method + std::string("' without a 'beginlist', 'begintuple', or 'beginrecord' before it"));
+      }
+      return stack_.back();
+    }
+
+    void fail(const Filler* filler, const std::string& what) {
+      error(what + std::string(" does not match type ") + filler->tostring());
+    }
+
+    // takes out the partly filled top-level value, so that filling can go on
+    // with the next one and earlier values are untouched
+    void error(const std::string& message) {
+      root_.get()->rollback();
+      stack_.clear();
+      throw std::invalid_argument(message);
+    }
+
+    std::shared_ptr<Filler> root_;
+    std::vector<Filler*> stack_;
+  };
+
+  const std::shared_ptr<Builder> TypedBuilder::fromtype(const std::shared_ptr<Type>& type, const ArrayBuilderOptions& options) {
+    std::shared_ptr<Builder> out = std::make_shared<TypedBuilder>(type, options);
+    out.get()->setthat(out);
+    return out;
+  }
+
+  TypedBuilder::TypedBuilder(const std::shared_ptr<Type>& type, const ArrayBuilderOptions& options)
+      : type_(type)
+      , impl_(new Impl(type, options)) { }
+
+  // defined here, where Impl is complete, for the unique_ptr
+  TypedBuilder::~TypedBuilder() { }
+
+  const std::shared_ptr<Type> TypedBuilder::type() const {
+    return type_;
+  }
+
+  const std::shared_ptr<Content> TypedBuilder::concatenate(const std::vector<const TypedBuilder*>& parts) const {
+    std::vector<const Filler*> roots;
+    for (auto x : parts) {
+      roots.push_back(x->impl_->root_.get());
+    }
+    return impl_->root_.get()->concatenate(roots);
+  }
+
+  const std::string TypedBuilder::classname() const {
+    return "TypedBuilder";
+  }
+
+  int64_t TypedBuilder::length() const {
+    return impl_->root_.get()->length();
+  }
+
+  void TypedBuilder::clear() {
+    impl_->root_.get()->clear();
+    impl_->stack_.clear();
+  }
+
+  void TypedBuilder::shrink_to_fit() {
+    impl_->root_.get()->shrink_to_fit();
+  }
+
+  const std::shared_ptr<Content> TypedBuilder::snapshot() const {
+    return impl_->root_.get()->snapshot();
+  }
+
+  bool TypedBuilder::active() const {
+    return !impl_->stack_.empty();
+  }
+
+  const std::shared_ptr<Builder> TypedBuilder::null() {
+    Filler* filler = impl_->target();
+    if (!filler->null()) {
+      impl_->fail(filler, "null");
+    }
+    return that_;
+  }
+
+  const std::shared_ptr<Builder> TypedBuilder::boolean(bool x) {
+    Filler* filler = impl_->target();
+    if (!filler->boolean(x)) {
+      impl_->fail(filler, x ? "true" : "false");
+    }
+    return that_;
+  }
+
+  const std::shared_ptr<Builder> TypedBuilder::integer(int64_t x) {
+    Filler* filler = impl_->target();
+    if (!filler->integer(x)) {
+      impl_->fail(filler, std::to_string(x));
+    }
+    return that_;
+  }
+
+  const std::shared_ptr<Builder> TypedBuilder::uinteger(uint64_t x) {
+    Filler* filler = impl_->target();
+    if (!filler->uinteger(x)) {
+      impl_->fail(filler, std::to_string(x));
+    }
+    return that_;
+  }
+
+  const std::shared_ptr<Builder> TypedBuilder::real(double x) {
+    Filler* filler = impl_->target();
+    if (!filler->real(x)) {
+      impl_->fail(filler, std::to_string(x));
+    }
+    return that_;
+  }
+
+  const std::shared_ptr<Builder> TypedBuilder::string(const char* x, int64_t length, const char* encoding) {
+    Filler* filler = impl_->target();
+    if (!filler->string(x, length < 0 ? (int64_t)strlen(x) : length)) {
+      impl_->fail(filler, "string");
+    }
+    return that_;
+  }
+
+  const std::shared_ptr<Builder> TypedBuilder::beginlist() {
+    Filler* filler = impl_->target();
+    Filler* out = filler->beginlist();
+    if (out == nullptr) {
+      impl_->fail(filler, "list");
+    }
+    impl_->stack_.push_back(out);
+    return that_;
+  }
+
+  const std::shared_ptr<Builder> TypedBuilder::endlist() {
+    Filler* filler = impl_->top("endlist");
+    if (!filler->endlist()) {
+      impl_->fail(filler, "list");
+    }
+    impl_->stack_.pop_back();
+    return that_;
+  }
+
+  const std::shared_ptr<Builder> TypedBuilder::begintuple(int64_t numfields) {
+    Filler* filler = impl_->target();
+    Filler* out = filler->begintuple(numfields);
+    if (out == nullptr) {
+      impl_->fail(filler, std::string("tuple with ") + std::to_string(numfields) + std::string(" fields"));
+    }
+    impl_->stack_.push_back(out);
+    return that_;
+  }
+
+  const std::shared_ptr<Builder> TypedBuilder::index(int64_t index) {
+    Filler* filler = impl_->top("index");
+    if (!filler->index(index)) {
+      impl_->fail(filler, std::string("tuple index ") + std::to_string(index));
+    }
+    return that_;
+  }
+
+  const std::shared_ptr<Builder> TypedBuilder::endtuple() {
+    Filler* filler = impl_->top("endtuple");
+    if (!filler->endtuple()) {
+      impl_->fail(filler, "tuple with missing or duplicate fields");
+    }
+    impl_->stack_.pop_back();
+    return that_;
+  }
+
+  const std::shared_ptr<Builder> TypedBuilder::beginrecord(const char* name, bool check) {
+    Filler* filler = impl_->target();
+    Filler* out = filler->beginrecord();
+    if (out == nullptr) {
+      impl_->fail(filler, "record");
+    }
+    impl_->stack_.push_back(out);
+    return that_;
+  }
+
+  const std::shared_ptr<Builder> TypedBuilder::field(const char* key, bool check) {
+    Filler* filler = impl_->top("field");
+    if (!filler->field(key)) {
+      impl_->fail(filler, std::string("field ") + util::quote(key, true));
+    }
+    return that_;
+  }
+
+  const std::shared_ptr<Builder> TypedBuilder::endrecord() {
+    Filler* filler = impl_->top("endrecord");
+    if (!filler->endrecord()) {
+      impl_->fail(filler, "record with missing or duplicate fields");
+    }
+    impl_->stack_.pop_back();
+    return that_;
+  }
+
+  const std::shared_ptr<Builder> TypedBuilder::append(const std::shared_ptr<Content>& array, int64_t at) {
+    throw std::invalid_argument("'append' is not supported by an ArrayBuilder with a fixed type");
+  }
+}
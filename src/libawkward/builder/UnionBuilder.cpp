@@ -51,13 +51,27 @@ namespace awkward {
     }
   }
 
+  void UnionBuilder::shrink_to_fit() {
+    types_.shrink_to_fit();
+    offsets_.shrink_to_fit();
+    for (auto x : contents_) {
+      x.get()->shrink_to_fit();
+    }
+  }
+
   const std::shared_ptr<Content> UnionBuilder::snapshot() const {
     Index8 tags(types_.ptr(), 0, types_.length());
-    Index64 index(offsets_.ptr(), 0, offsets_.length());
     std::vector<std::shared_ptr<Content>> contents;
+    bool fits32 = true;
     for (auto content : contents_) {
       contents.push_back(content.get()->snapshot());
+      fits32 = fits32  &&  contents.back().get()->length() <= INT32_MAX;
+    }
+    if (options_.narrow()  &&  fits32) {
+      Index32 index(offsets_.copy_as<int32_t>(), 0, offsets_.length());
+      return std::make_shared<UnionArray8_32>(Identities::none(), util::Parameters(), tags, index, contents);
     }
+    Index64 index(offsets_.ptr(), 0, offsets_.length());
     return std::make_shared<UnionArray8_64>(Identities::none(), util::Parameters(), tags, index, contents);
   }
 
@@ -341,6 +355,36 @@ namespace awkward {
     return that_;
   }
 
+  const std::shared_ptr<Builder> UnionBuilder::booleans(const bool* x, int64_t length) {
+    if (current_ == -1) {
+      return Builder::booleans(x, length);
+    }
+    else {
+      contents_[(size_t)current_].get()->booleans(x, length);
+      return that_;
+    }
+  }
+
+  const std::shared_ptr<Builder> UnionBuilder::integers(const int64_t* x, int64_t length) {
+    if (current_ == -1) {
+      return Builder::integers(x, length);
+    }
+    else {
+      contents_[(size_t)current_].get()->integers(x, length);
+      return that_;
+    }
+  }
+
+  const std::shared_ptr<Builder> UnionBuilder::reals(const double* x, int64_t length) {
+    if (current_ == -1) {
+      return Builder::reals(x, length);
+    }
+    else {
+      contents_[(size_t)current_].get()->reals(x, length);
+      return that_;
+    }
+  }
+
   const std::shared_ptr<Builder> UnionBuilder::append(const std::shared_ptr<Content>& array, int64_t at) {
     if (current_ == -1) {
       std::shared_ptr<Builder> tofill(nullptr);
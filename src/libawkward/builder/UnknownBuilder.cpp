@@ -42,6 +42,8 @@ namespace awkward {
     nullcount_ = 0;
   }
 
+  void UnknownBuilder::shrink_to_fit() { }
+
   const std::shared_ptr<Content> UnknownBuilder::snapshot() const {
     if (nullcount_ == 0) {
       return std::make_shared<EmptyArray>(Identities::none(), util::Parameters());
@@ -149,6 +151,42 @@ namespace awkward {
     throw std::invalid_argument("called 'endrecord' without 'beginrecord' at the same level before it");
   }
 
+  const std::shared_ptr<Builder> UnknownBuilder::booleans(const bool* x, int64_t length) {
+    if (length == 0) {
+      return that_;
+    }
+    std::shared_ptr<Builder> out = BoolBuilder::fromempty(options_);
+    if (nullcount_ != 0) {
+      out = OptionBuilder::fromnulls(options_, nullcount_, out);
+    }
+    out.get()->booleans(x, length);
+    return out;
+  }
+
+  const std::shared_ptr<Builder> UnknownBuilder::integers(const int64_t* x, int64_t length) {
+    if (length == 0) {
+      return that_;
+    }
+    std::shared_ptr<Builder> out = Int64Builder::fromempty(options_);
+    if (nullcount_ != 0) {
+      out = OptionBuilder::fromnulls(options_, nullcount_, out);
+    }
+    out.get()->integers(x, length);
+    return out;
+  }
+
+  const std::shared_ptr<Builder> UnknownBuilder::reals(const double* x, int64_t length) {
+    if (length == 0) {
+      return that_;
+    }
+    std::shared_ptr<Builder> out = Float64Builder::fromempty(options_);
+    if (nullcount_ != 0) {
+      out = OptionBuilder::fromnulls(options_, nullcount_, out);
+    }
+    out.get()->reals(x, length);
+    return out;
+  }
+
   const std::shared_ptr<Builder> UnknownBuilder::append(const std::shared_ptr<Content>& array, int64_t at) {
     std::shared_ptr<Builder> out = IndexedGenericBuilder::fromnulls(options_, nullcount_, array);
     out.get()->append(array, at);
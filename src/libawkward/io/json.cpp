@@ -1,15 +1,38 @@
 // BSD 3-Clause License; see https://github.com/jpivarski/awkward-1.0/blob/master/LICENSE
 
+#include <memory>
+#include <cstring>
+#include <algorithm>
+#include <limits>
+#include <type_traits>
+#include <thread>
+#include <exception>
+
 #include "rapidjson/reader.h"
 #include "rapidjson/writer.h"
 #include "rapidjson/prettywriter.h"
 #include "rapidjson/stringbuffer.h"
 #include "rapidjson/filereadstream.h"
+#include "rapidjson/memorystream.h"
 #include "rapidjson/filewritestream.h"
 #include "rapidjson/error/en.h"
 
 #include "awkward/builder/ArrayBuilder.h"
+#include "awkward/builder/GrowableBuffer.h"
+#include "awkward/builder/TypedBuilder.h"
 #include "awkward/Content.h"
+#include "awkward/array/NumpyArray.h"
+#include "awkward/array/ListOffsetArray.h"
+#include "awkward/array/RegularArray.h"
+#include "awkward/array/IndexedArray.h"
+#include "awkward/array/RecordArray.h"
+#include "awkward/type/ArrayType.h"
+#include "awkward/type/ListType.h"
+#include "awkward/type/OptionType.h"
+#include "awkward/type/PrimitiveType.h"
+#include "awkward/type/RecordType.h"
+#include "awkward/type/RegularType.h"
+#include "awkward/type/UnionType.h"
 
 #include "awkward/io/json.h"
 
@@ -320,16 +343,146 @@ namespace awkward {
     impl_->endrecord();
   }
 
+  // A rapidjson output stream that hands fixed-size chunks to a callback.
+  class CallbackWriteStream {
+  public:
+    typedef char Ch;
+    CallbackWriteStream(const std::function<void(const char*, int64_t)>& destination, int64_t buffersize)
+        : destination_(destination)
+        , buffer_(new char[(size_t)buffersize], util::array_deleter<char>())
+        , buffersize_(buffersize)
+        , length_(0) { }
+    void Put(char c) {
+      if (length_ == buffersize_) {
+        drain();
+      }
+      buffer_.get()[length_] = c;
+      length_++;
+    }
+    // rapidjson flushes after every top-level value; only full buffers (and
+    // the last one, through drain) go to the destination
+    void Flush() { }
+    void drain() {
+      if (length_ != 0) {
+        destination_(buffer_.get(), length_);
+        length_ = 0;
+      }
+    }
+    char Peek() const { RAPIDJSON_ASSERT(false); return 0; }
+    char Take() { RAPIDJSON_ASSERT(false); return 0; }
+    size_t Tell() const { RAPIDJSON_ASSERT(false); return 0; }
+    char* PutBegin() { RAPIDJSON_ASSERT(false); return 0; }
+    size_t PutEnd(char*) { RAPIDJSON_ASSERT(false); return 0; }
+  private:
+    const std::function<void(const char*, int64_t)> destination_;
+    std::shared_ptr<char> buffer_;
+    int64_t buffersize_;
+    int64_t length_;
+  };
+
+  class ToJsonStream::Impl {
+  public:
+    Impl(const std::function<void(const char*, int64_t)>& destination, int64_t maxdecimals, int64_t buffersize)
+        : stream_(destination, buffersize)
+        , writer_(stream_) {
+      if (maxdecimals >= 0) {
+        writer_.SetMaxDecimalPlaces((int)maxdecimals);
+      }
+    }
+    void null() { writer_.Null(); }
+    void boolean(bool x) { writer_.Bool(x); }
+    void integer(int64_t x) { writer_.Int64(x); }
+    void real(double x) { writer_.Double(x); }
+    void string(const char* x, int64_t length) { writer_.String(x, (rj::SizeType)length); }
+    void beginlist() { writer_.StartArray(); }
+    void endlist() { writer_.EndArray(); }
+    void beginrecord() { writer_.StartObject(); }
+    void field(const char* x) { writer_.Key(x); }
+    void endrecord() { writer_.EndObject(); }
+    void newline() {
+      writer_.Reset(stream_);
+      stream_.Put('\n');
+    }
+    void flush() { stream_.drain(); }
+  private:
+    CallbackWriteStream stream_;
+    rj::Writer<CallbackWriteStream> writer_;
+  };
+
+  ToJsonStream::ToJsonStream(const std::function<void(const char*, int64_t)>& destination, int64_t maxdecimals, int64_t buffersize)
+      : impl_(new ToJsonStream::Impl(destination, maxdecimals, buffersize)) { }
+
+  ToJsonStream::~ToJsonStream() {
+    delete impl_;
+  }
+
+  void ToJsonStream::null() {
+    impl_->null();
+  }
+
+  void ToJsonStream::boolean(bool x) {
+    impl_->boolean(x);
+  }
+
+  void ToJsonStream::integer(int64_t x) {
+    impl_->integer(x);
+  }
+
+  void ToJsonStream::real(double x) {
+    impl_->real(x);
+  }
+
+  void ToJsonStream::string(const char* x, int64_t length) {
+    impl_->string(x, length);
+  }
+
+  void ToJsonStream::beginlist() {
+    impl_->beginlist();
+  }
+
+  void ToJsonStream::endlist() {
+    impl_->endlist();
+  }
+
+  void ToJsonStream::beginrecord() {
+    impl_->beginrecord();
+  }
+
+  void ToJsonStream::field(const char* x) {
+    impl_->field(x);
+  }
+
+  void ToJsonStream::endrecord() {
+    impl_->endrecord();
+  }
+
+  void ToJsonStream::newline() {
+    impl_->newline();
+  }
+
+  void ToJsonStream::flush() {
+    impl_->flush();
+  }
+
   /////////////////////////////////////////////////////// reading from JSON
 
   class Handler: public rj::BaseReaderHandler<rj::UTF8<>, Handler> {
   public:
-    Handler(const ArrayBuilderOptions& options): builder_(options), depth_(0) { }
+    Handler(const ArrayBuilderOptions& options, bool lines): builder_(options), depth_(0), lines_(lines) { }
 
     const std::shared_ptr<Content> snapshot() const {
       return builder_.snapshot();
     }
 
+    const std::shared_ptr<Content> finalize() {
+      return builder_.finalize();
+    }
+
+    void clear() {
+      builder_.clear();
+      depth_ = 0;
+    }
+
     bool Null()               { builder_.null();              return true; }
     bool Bool(bool x)         { builder_.boolean(x);          return true; }
     bool Int(int x)           { builder_.integer((int64_t)x); return true; }
@@ -344,7 +497,7 @@ namespace awkward {
     }
 
     bool StartArray() {
-      if (depth_ != 0) {
+      if (depth_ != 0  ||  lines_) {
         builder_.beginlist();
       }
       depth_++;
@@ -352,14 +505,14 @@ namespace awkward {
     }
     bool EndArray(rj::SizeType numfields) {
       depth_--;
-      if (depth_ != 0) {
+      if (depth_ != 0  ||  lines_) {
         builder_.endlist();
       }
       return true;
     }
 
     bool StartObject() {
-      if (depth_ == 0) {
+      if (depth_ == 0  &&  !lines_) {
         builder_.beginlist();
       }
       depth_++;
@@ -369,7 +522,7 @@ namespace awkward {
     bool EndObject(rj::SizeType numfields) {
       depth_--;
       builder_.endrecord();
-      if (depth_ == 0) {
+      if (depth_ == 0  &&  !lines_) {
         builder_.endlist();
       }
       return true;
@@ -382,31 +535,440 @@ namespace awkward {
   private:
     ArrayBuilder builder_;
     int64_t depth_;
+    bool lines_;
   };
 
-  const std::shared_ptr<Content> FromJsonString(const char* source, const ArrayBuilderOptions& options) {
-    Handler handler(options);
+  /////////////////////////////////////////////////////// reading JSON with a known type
+
+  // Feeds a TypedBuilder, which refuses values that don't fit the type; its
+  // error message is kept for json_error instead of propagating through rapidjson.
+  class TypedHandler: public rj::BaseReaderHandler<rj::UTF8<>, TypedHandler> {
+  public:
+    TypedHandler(const std::shared_ptr<Type>& type, const ArrayBuilderOptions& options, bool lines)
+        : builder_(type, options)
+        , depth_(0)
+        , lines_(lines) { }
+
+    const std::shared_ptr<Content> snapshot() const {
+      return builder_.snapshot();
+    }
+
+    const std::shared_ptr<Content> finalize() {
+      builder_.shrink_to_fit();
+      std::shared_ptr<Content> out = builder_.snapshot();
+      builder_.clear();
+      return out;
+    }
+
+    const TypedBuilder* root() const {
+      return &builder_;
+    }
+
+    void clear() {
+      builder_.clear();
+      depth_ = 0;
+      error_ = std::string("");
+    }
+
+    const std::string error() const {
+      return error_;
+    }
+
+    bool Null() {
+      try {
+        builder_.null();
+        return true;
+      }
+      catch (std::invalid_argument& err) {
+        return fail(err);
+      }
+    }
+    bool Bool(bool x) {
+      try {
+        builder_.boolean(x);
+        return true;
+      }
+      catch (std::invalid_argument& err) {
+        return fail(err);
+      }
+    }
+    bool Int(int x)           { return Int64((int64_t)x); }
+    bool Uint(unsigned int x) { return Int64((int64_t)x); }
+    bool Int64(int64_t x) {
+      try {
+        builder_.integer(x);
+        return true;
+      }
+      catch (std::invalid_argument& err) {
+        return fail(err);
+      }
+    }
+    bool Uint64(uint64_t x) {
+      try {
+        builder_.uinteger(x);
+        return true;
+      }
+      catch (std::invalid_argument& err) {
+        return fail(err);
+      }
+    }
+    bool Double(double x) {
+      try {
+        builder_.real(x);
+        return true;
+      }
+      catch (std::invalid_argument& err) {
+        return fail(err);
+      }
+    }
+
+    bool String(const char* str, rj::SizeType length, bool copy) {
+      try {
+        builder_.string(str, (int64_t)length, nullptr);
+        return true;
+      }
+      catch (std::invalid_argument& err) {
+        return fail(err);
+      }
+    }
+
+    bool StartArray() {
+      depth_++;
+      if (depth_ == 1  &&  !lines_) {
+        return true;
+      }
+      try {
+        builder_.beginlist();
+        return true;
+      }
+      catch (std::invalid_argument& err) {
+        return fail(err);
+      }
+    }
+    bool EndArray(rj::SizeType numfields) {
+      depth_--;
+      if (depth_ == 0  &&  !lines_) {
+        return true;
+      }
+      try {
+        builder_.endlist();
+        return true;
+      }
+      catch (std::invalid_argument& err) {
+        return fail(err);
+      }
+    }
+
+    bool StartObject() {
+      depth_++;
+      try {
+        builder_.beginrecord(nullptr, false);
+        return true;
+      }
+      catch (std::invalid_argument& err) {
+        return fail(err);
+      }
+    }
+    bool EndObject(rj::SizeType numfields) {
+      depth_--;
+      try {
+        builder_.endrecord();
+        return true;
+      }
+      catch (std::invalid_argument& err) {
+        return fail(err);
+      }
+    }
+    bool Key(const char* str, rj::SizeType length, bool copy) {
+      try {
+        builder_.field(str, true);
+        return true;
+      }
+      catch (std::invalid_argument& err) {
+        return fail(err);
+      }
+    }
+
+  private:
+    bool fail(const std::invalid_argument& err) {
+      error_ = std::string("JSON ") + err.what();
+      return false;
+    }
+
+    TypedBuilder builder_;
+    int64_t depth_;
+    bool lines_;
+    std::string error_;
+  };
+
+  template <typename HANDLER>
+  const std::string json_error(const rj::Reader& reader, const HANDLER& handler) {
+    return std::string(rj::GetParseError_En(reader.GetParseErrorCode()));
+  }
+
+  template <>
+  const std::string json_error(const rj::Reader& reader, const TypedHandler& handler) {
+    if (reader.GetParseErrorCode() == rj::kParseErrorTermination  &&  !handler.error().empty()) {
+      return handler.error();
+    }
+    return std::string(rj::GetParseError_En(reader.GetParseErrorCode()));
+  }
+
+  template <typename HANDLER, typename STREAM>
+  const std::shared_ptr<Content> parse_json(HANDLER& handler, STREAM& stream) {
     rj::Reader reader;
-    rj::StringStream stream(source);
     if (reader.Parse(stream, handler)) {
-      return handler.snapshot();
+      return handler.finalize();
     }
     else {
-      throw std::invalid_argument(std::string("JSON error at char ") + std::to_string(reader.GetErrorOffset()) + std::string(": ") + std::string(rj::GetParseError_En(reader.GetParseErrorCode())));
+      throw std::invalid_argument(std::string("JSON error at char ") + std::to_string(reader.GetErrorOffset()) + std::string(": ") + json_error(reader, handler));
     }
   }
 
+  const std::shared_ptr<Content> FromJsonString(const char* source, const ArrayBuilderOptions& options) {
+    Handler handler(options, false);
+    rj::StringStream stream(source);
+    return parse_json(handler, stream);
+  }
+
+  const std::shared_ptr<Content> FromJsonString(const char* source, const std::shared_ptr<Type>& type, const ArrayBuilderOptions& options) {
+    TypedHandler handler(type, options, false);
+    rj::StringStream stream(source);
+    return parse_json(handler, stream);
+  }
+
   const std::shared_ptr<Content> FromJsonFile(FILE* source, const ArrayBuilderOptions& options, int64_t buffersize) {
-    Handler handler(options);
-    rj::Reader reader;
+    Handler handler(options, false);
     std::shared_ptr<char> buffer(new char[(size_t)buffersize], util::array_deleter<char>());
     rj::FileReadStream stream(source, buffer.get(), ((size_t)buffersize)*sizeof(char));
-    if (reader.Parse(stream, handler)) {
-      return handler.snapshot();
+    return parse_json(handler, stream);
+  }
+
+  const std::shared_ptr<Content> FromJsonFile(FILE* source, const std::shared_ptr<Type>& type, const ArrayBuilderOptions& options, int64_t buffersize) {
+    TypedHandler handler(type, options, false);
+    std::shared_ptr<char> buffer(new char[(size_t)buffersize], util::array_deleter<char>());
+    rj::FileReadStream stream(source, buffer.get(), ((size_t)buffersize)*sizeof(char));
+    return parse_json(handler, stream);
+  }
+
+  // Each top-level JSON document in the stream is one item of the output;
+  // the reader, stream buffer, and ArrayBuilder (with its type) persist
+  // across chunks, so every call to next only parses the next chunksize lines.
+  class FromJsonLines::Impl {
+  public:
+    Impl(const char* source, const std::shared_ptr<Type>& type, const ArrayBuilderOptions& options)
+        : handler_(type.get() == nullptr ? new Handler(options, true) : nullptr)
+        , typedhandler_(type.get() == nullptr ? nullptr : new TypedHandler(type, options, true))
+        , reader_()
+        , buffer_(nullptr)
+        , stringstream_(new rj::StringStream(source))
+        , filestream_(nullptr)
+        , numlines_(0) { }
+    Impl(FILE* source, const std::shared_ptr<Type>& type, const ArrayBuilderOptions& options, int64_t buffersize)
+        : handler_(type.get() == nullptr ? new Handler(options, true) : nullptr)
+        , typedhandler_(type.get() == nullptr ? nullptr : new TypedHandler(type, options, true))
+        , reader_()
+        , buffer_(new char[(size_t)buffersize], util::array_deleter<char>())
+        , stringstream_(nullptr)
+        , filestream_(new rj::FileReadStream(source, buffer_.get(), ((size_t)buffersize)*sizeof(char)))
+        , numlines_(0) { }
+
+    int64_t numlines() const {
+      return numlines_;
     }
-    else {
-      throw std::invalid_argument(std::string("JSON error at char ") + std::to_string(reader.GetErrorOffset()) + std::string(": ") + std::string(rj::GetParseError_En(reader.GetParseErrorCode())));
+
+    const std::shared_ptr<Content> next(int64_t chunksize) {
+      if (stringstream_.get() != nullptr) {
+        if (typedhandler_.get() != nullptr) {
+          return fill(*typedhandler_.get(), *stringstream_.get(), chunksize);
+        }
+        else {
+          return fill(*handler_.get(), *stringstream_.get(), chunksize);
+        }
+      }
+      else {
+        if (typedhandler_.get() != nullptr) {
+          return fill(*typedhandler_.get(), *filestream_.get(), chunksize);
+        }
+        else {
+          return fill(*handler_.get(), *filestream_.get(), chunksize);
+        }
+      }
+    }
+
+  private:
+    template <typename HANDLER, typename STREAM>
+    const std::shared_ptr<Content> fill(HANDLER& handler, STREAM& stream, int64_t chunksize) {
+      handler.clear();
+      int64_t count = 0;
+      while (chunksize < 0  ||  count < chunksize) {
+        rj::SkipWhitespace(stream);
+        if (stream.Peek() == '\0') {
+          break;
+        }
+        if (!reader_.Parse<rj::kParseStopWhenDoneFlag>(stream, handler)) {
+          throw std::invalid_argument(std::string("JSON error in line ") + std::to_string(numlines_ + 1) + std::string(" at char ") + std::to_string(reader_.GetErrorOffset()) + std::string(": ") + json_error(reader_, handler));
+        }
+        count++;
+        numlines_++;
+      }
+      if (count == 0) {
+        return std::shared_ptr<Content>(nullptr);
+      }
+      return handler.finalize();
+    }
+
+    std::unique_ptr<Handler> handler_;
+    std::unique_ptr<TypedHandler> typedhandler_;
+    rj::Reader reader_;
+    std::shared_ptr<char> buffer_;
+    std::unique_ptr<rj::StringStream> stringstream_;
+    std::unique_ptr<rj::FileReadStream> filestream_;
+    int64_t numlines_;
+  };
+
+  FromJsonLines::FromJsonLines(const char* source, const std::shared_ptr<Type>& type, const ArrayBuilderOptions& options)
+      : impl_(new FromJsonLines::Impl(source, type, options)) { }
+
+  FromJsonLines::FromJsonLines(FILE* source, const std::shared_ptr<Type>& type, const ArrayBuilderOptions& options, int64_t buffersize)
+      : impl_(new FromJsonLines::Impl(source, type, options, buffersize)) { }
+
+  FromJsonLines::~FromJsonLines() {
+    delete impl_;
+  }
+
+  int64_t FromJsonLines::numlines() const {
+    return impl_->numlines();
+  }
+
+  const std::shared_ptr<Content> FromJsonLines::next(int64_t chunksize) {
+    return impl_->next(chunksize);
+  }
+
+  template <typename HANDLER>
+  void parse_lines_range(HANDLER& handler, const char* data, int64_t start, int64_t stop, bool takesnapshot, std::shared_ptr<Content>& out, std::exception_ptr& error) {
+    try {
+      rj::Reader reader;
+      rj::MemoryStream stream(data + start, (size_t)(stop - start));
+      while (true) {
+        rj::SkipWhitespace(stream);
+        if (stream.Peek() == '\0') {
+          break;
+        }
+        if (!reader.Parse<rj::kParseStopWhenDoneFlag>(stream, handler)) {
+          throw std::invalid_argument(std::string("JSON error at char ") + std::to_string(start + (int64_t)reader.GetErrorOffset()) + std::string(": ") + json_error(reader, handler));
+        }
+      }
+      if (takesnapshot) {
+        out = handler.snapshot();
+      }
+    }
+    catch (...) {
+      error = std::current_exception();
+    }
+  }
+
+  // A part's own builder folds integers into float64 once it sees a real;
+  // a single builder that had already become a union at that point would have
+  // kept them in an int64 branch, so such unions can't be trusted after a merge.
+  bool has_real_in_union(const std::shared_ptr<Type>& type, bool inunion) {
+    if (PrimitiveType* raw = dynamic_cast<PrimitiveType*>(type.get())) {
+      return inunion  &&  raw->dtype() == PrimitiveType::float64;
+    }
+    else if (OptionType* raw = dynamic_cast<OptionType*>(type.get())) {
+      return has_real_in_union(raw->type(), inunion);
+    }
+    else if (ListType* raw = dynamic_cast<ListType*>(type.get())) {
+      return has_real_in_union(raw->type(), false);
+    }
+    else if (RegularType* raw = dynamic_cast<RegularType*>(type.get())) {
+      return has_real_in_union(raw->type(), false);
+    }
+    else if (RecordType* raw = dynamic_cast<RecordType*>(type.get())) {
+      for (int64_t i = 0;  i < raw->numfields();  i++) {
+        if (has_real_in_union(raw->field(i), false)) {
+          return true;
+        }
+      }
+      return false;
+    }
+    else if (UnionType* raw = dynamic_cast<UnionType*>(type.get())) {
+      for (int64_t i = 0;  i < raw->numtypes();  i++) {
+        if (has_real_in_union(raw->type(i), true)) {
+          return true;
+        }
+      }
+      return false;
+    }
+    return false;
+  }
+
+  const std::shared_ptr<Content> FromJsonLinesParallel(const char* data, int64_t length, const std::shared_ptr<Type>& type, const ArrayBuilderOptions& options, int64_t numthreads) {
+    if (numthreads <= 0) {
+      numthreads = (int64_t)std::thread::hardware_concurrency();
+      if (numthreads <= 0) {
+        numthreads = 1;
+      }
+    }
+
+    // JSON strings can't contain raw newlines, so every newline ends a document
+    std::vector<int64_t> boundaries = { 0 };
+    for (int64_t i = 1;  i < numthreads;  i++) {
+      int64_t pos = std::max(boundaries.back(), (length * i) / numthreads);
+      while (pos < length  &&  pos > 0  &&  data[pos - 1] != '\n') {
+        pos++;
+      }
+      boundaries.push_back(pos);
+    }
+    boundaries.push_back(length);
+
+    size_t numranges = boundaries.size() - 1;
+    std::vector<std::shared_ptr<Content>> parts(numranges);
+    std::vector<std::exception_ptr> errors(numranges);
+    std::vector<std::thread> threads;
+    std::vector<std::unique_ptr<Handler>> handlers;
+    std::vector<std::unique_ptr<TypedHandler>> typedhandlers;
+    for (size_t i = 0;  i < numranges;  i++) {
+      if (type.get() == nullptr) {
+        handlers.push_back(std::unique_ptr<Handler>(new Handler(options, true)));
+        threads.push_back(std::thread(parse_lines_range<Handler>, std::ref(*handlers.back().get()), data, boundaries[i], boundaries[i + 1], true, std::ref(parts[i]), std::ref(errors[i])));
+      }
+      else {
+        typedhandlers.push_back(std::unique_ptr<TypedHandler>(new TypedHandler(type, options, true)));
+        threads.push_back(std::thread(parse_lines_range<TypedHandler>, std::ref(*typedhandlers.back().get()), data, boundaries[i], boundaries[i + 1], false, std::ref(parts[i]), std::ref(errors[i])));
+      }
+    }
+    for (auto& thread : threads) {
+      thread.join();
+    }
+    for (auto error : errors) {
+      if (error) {
+        std::rethrow_exception(error);
+      }
+    }
+
+    if (type.get() != nullptr) {
+      // all parts have the same builder tree: concatenate their buffers directly
+      // (typed parts take no snapshot of their own)
+      std::vector<const TypedBuilder*> roots;
+      for (auto& handler : typedhandlers) {
+        roots.push_back(handler.get()->root());
+      }
+      return roots[0]->concatenate(roots);
+    }
+
+    // without a type, each part may have discovered a different type
+    std::shared_ptr<Content> out = ArrayBuilder::merge_snapshots(parts);
+    if (numranges > 1  &&  has_real_in_union(out.get()->type(std::map<std::string, std::string>()), false)) {
+      // the result must not depend on the number of threads: parse it again
+      // as a single part (rare: only mixed data reach this)
+      Handler handler(options, true);
+      std::exception_ptr error;
+      parse_lines_range<Handler>(handler, data, 0, length, true, out, error);
+      if (error) {
+        std::rethrow_exception(error);
+      }
     }
-    return handler.snapshot();
+    return out;
   }
 }
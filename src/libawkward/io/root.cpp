@@ -1,6 +1,9 @@
 // BSD 3-Clause License; see https://github.com/jpivarski/awkward-1.0/blob/master/LICENSE
 
 #include <cstring>
+#include <thread>
+#include <exception>
+#include <algorithm>
 
 #include "awkward/Content.h"
 #include "awkward/Identities.h"
@@ -10,71 +13,288 @@
 #include "awkward/io/root.h"
 
 namespace awkward {
-  void FromROOT_nestedvector_fill(std::vector<GrowableBuffer<int64_t>>& levels, GrowableBuffer<int64_t>& bytepos_tocopy, int64_t& bytepos, const NumpyArray& rawdata, int64_t whichlevel, int64_t itemsize) {
-    if (whichlevel == levels.size()) {
-      bytepos_tocopy.append(bytepos);
-      bytepos += itemsize;
+  // ROOT writes lengths big-endian, whatever the native endianness
+  inline uint32_t FromROOT_bigendian32(const uint8_t* data) {
+    return ((uint32_t)data[0] << 24) | ((uint32_t)data[1] << 16) | ((uint32_t)data[2] << 8) | (uint32_t)data[3];
+  }
+
+  inline bool FromROOT_littleendian() {
+    uint16_t one = 1;
+    return *reinterpret_cast<uint8_t*>(&one) == 1;
+  }
+
+  template <typename T>
+  void FromROOT_byteswap(uint8_t* data, int64_t length) {
+    T* array = reinterpret_cast<T*>(data);
+    for (int64_t i = 0;  i < length;  i++) {
+      T x = array[i];
+      T out = 0;
+      for (size_t j = 0;  j < sizeof(T);  j++) {
+        out = (T)((out << 8) | ((x >> (8*j)) & 0xff));
+      }
+      array[i] = out;
+    }
+  }
+
+  void FromROOT_byteswap_run(uint8_t* data, int64_t length, int64_t itemsize) {
+    switch (itemsize) {
+      case 1:
+        break;
+      case 2:
+        FromROOT_byteswap<uint16_t>(data, length);
+        break;
+      case 4:
+        FromROOT_byteswap<uint32_t>(data, length);
+        break;
+      case 8:
+        FromROOT_byteswap<uint64_t>(data, length);
+        break;
+      default:
+        for (int64_t i = 0;  i < length;  i++) {
+          std::reverse(&data[i*itemsize], &data[(i + 1)*itemsize]);
+        }
+    }
+  }
+
+  // Everything one thread learns about its entries in the count pass: the
+  // length of every vector at every level and where each contiguous run of
+  // items (the contents of an innermost vector or the characters of a
+  // string) starts in rawdata.
+  class FromROOT_Range {
+  public:
+    FromROOT_Range(int64_t numlevels, const ArrayBuilderOptions& options)
+        : runstarts(options) {
+      for (int64_t i = 0;  i < numlevels;  i++) {
+        counts.push_back(GrowableBuffer<int64_t>(options));
+      }
+    }
+
+    int64_t start;
+    int64_t stop;
+    std::vector<GrowableBuffer<int64_t>> counts;
+    GrowableBuffer<int64_t> runstarts;
+    std::vector<int64_t> firstoffset;
+    int64_t firstitem;
+    std::exception_ptr error;
+  };
+
+  void FromROOT_nestedvector_count(FromROOT_Range& range, const uint8_t* data, int64_t datalength, int64_t& bytepos, int64_t whichlevel, int64_t depth, int64_t itemsize, bool strings) {
+    if (whichlevel == depth) {
+      // std::string: one byte of length, or 255 and four bytes of length
+      if (bytepos + 1 > datalength) {
+        throw std::runtime_error("FromROOT_nestedvector: rawdata ends in the middle of a string length");
+      }
+      int64_t length = (int64_t)data[bytepos];
+      bytepos += 1;
+      if (length == 255) {
+        if (bytepos + 4 > datalength) {
+          throw std::runtime_error("FromROOT_nestedvector: rawdata ends in the middle of a string length");
+        }
+        length = (int64_t)FromROOT_bigendian32(&data[bytepos]);
+        bytepos += 4;
+      }
+      range.counts[(size_t)whichlevel].append(length);
+      range.runstarts.append(bytepos);
+      bytepos += length;
     }
 
     else {
-      uint32_t bigendian = *reinterpret_cast<uint32_t*>(rawdata.byteptr((ssize_t)bytepos));
+      if (bytepos + 4 > datalength) {
+        throw std::runtime_error("FromROOT_nestedvector: rawdata ends in the middle of a vector length");
+      }
+      int64_t length = (int64_t)FromROOT_bigendian32(&data[bytepos]);
+      bytepos += 4;
+      range.counts[(size_t)whichlevel].append(length);
+      if (whichlevel == depth - 1  &&  !strings) {
+        // the innermost vector's items are contiguous: skip them in one step
+        range.runstarts.append(bytepos);
+        bytepos += length*itemsize;
+      }
+      else {
+        for (int64_t i = 0;  i < length;  i++) {
+          FromROOT_nestedvector_count(range, data, datalength, bytepos, whichlevel + 1, depth, itemsize, strings);
+        }
+      }
+    }
+    if (bytepos > datalength) {
+      throw std::runtime_error("FromROOT_nestedvector: rawdata ends in the middle of a vector");
+    }
+  }
+
+  void FromROOT_nestedvector_countrange(FromROOT_Range& range, const Index64& byteoffsets, const uint8_t* data, int64_t datalength, int64_t depth, int64_t itemsize, bool strings) {
+    try {
+      for (int64_t i = range.start;  i < range.stop;  i++) {
+        int64_t bytepos = byteoffsets.getitem_at_nowrap(i);
+        FromROOT_nestedvector_count(range, data, datalength, bytepos, 0, depth, itemsize, strings);
+      }
+    }
+    catch (...) {
+      range.error = std::current_exception();
+    }
+  }
 
-      // FIXME: check native endianness
-      uint32_t length = ((bigendian >> 24) & 0xff)     |  // move byte 3 to byte 0
-                        ((bigendian <<  8) & 0xff0000) |  // move byte 1 to byte 2
-                        ((bigendian >>  8) & 0xff00)   |  // move byte 2 to byte 1
-                        ((bigendian << 24) & 0xff000000); // byte 0 to byte 3
+  void FromROOT_nestedvector_fillrange(FromROOT_Range& range, std::vector<Index64>& offsets, const std::vector<int64_t>& firstvector, const uint8_t* data, uint8_t* toptr, int64_t itemsize, bool swap) {
+    for (size_t level = 0;  level < offsets.size();  level++) {
+      int64_t* tooffsets = offsets[level].ptr().get();
+      GrowableBuffer<int64_t>& counts = range.counts[level];
+      int64_t at = firstvector[level];
+      int64_t offset = range.firstoffset[level];
+      for (int64_t i = 0;  i < counts.length();  i++) {
+        offset += counts.getitem_at_nowrap(i);
+        tooffsets[at + i + 1] = offset;
+      }
+    }
 
-      bytepos += sizeof(int32_t);
-      for (uint32_t i = 0;  i < length;  i++) {
-        FromROOT_nestedvector_fill(levels, bytepos_tocopy, bytepos, rawdata, whichlevel + 1, itemsize);
+    GrowableBuffer<int64_t>& runlengths = range.counts.back();
+    int64_t item = range.firstitem;
+    for (int64_t i = 0;  i < runlengths.length();  i++) {
+      int64_t length = runlengths.getitem_at_nowrap(i);
+      uint8_t* to = &toptr[item*itemsize];
+      std::memcpy(to, &data[range.runstarts.getitem_at_nowrap(i)], (size_t)(length*itemsize));
+      if (swap) {
+        FromROOT_byteswap_run(to, length, itemsize);
       }
-      int64_t previous = levels[(unsigned int)whichlevel].getitem_at_nowrap(levels[(unsigned int)whichlevel].length() - 1);
-      levels[(unsigned int)whichlevel].append(previous + length);
+      item += length;
     }
   }
 
-  const std::shared_ptr<Content> FromROOT_nestedvector(const Index64& byteoffsets, const NumpyArray& rawdata, int64_t depth, int64_t itemsize, std::string format, const ArrayBuilderOptions& options) {
+  const std::shared_ptr<Content> FromROOT_nestedvector(const Index64& byteoffsets, const NumpyArray& rawdata, int64_t depth, int64_t itemsize, std::string format, const ArrayBuilderOptions& options, int64_t numthreads) {
     if (depth <= 0) {
       throw std::runtime_error("FromROOT_nestedvector: depth <= 0");
     }
     if (rawdata.ndim() != 1) {
       throw std::runtime_error("FromROOT_nestedvector: rawdata.ndim() != 1");
     }
+    if (byteoffsets.length() < 1) {
+      throw std::runtime_error("FromROOT_nestedvector: byteoffsets must have at least one item");
+    }
+    bool strings = (format == std::string("string"));
+    if (strings) {
+      itemsize = 1;
+      format = std::string("B");
+    }
+    else if (itemsize <= 0) {
+      throw std::runtime_error("FromROOT_nestedvector: itemsize <= 0");
+    }
+
+    // bytes are swapped (once, in bulk) if the format is non-native
+    bool swap = false;
+    if (format.length() > 1  &&  (format[0] == '>'  ||  format[0] == '!')  &&  FromROOT_littleendian()) {
+      swap = true;
+      format = format.substr(1);
+    }
+    else if (format.length() > 1  &&  format[0] == '<'  &&  !FromROOT_littleendian()) {
+      swap = true;
+      format = format.substr(1);
+    }
 
-    Index64 level0(byteoffsets.length());
-    level0.setitem_at_nowrap(0, 0);
+    const uint8_t* data = reinterpret_cast<const uint8_t*>(rawdata.byteptr());
+    int64_t datalength = (int64_t)(rawdata.length()*rawdata.itemsize());
+    int64_t numentries = byteoffsets.length() - 1;
+    int64_t numlevels = depth + (strings ? 1 : 0);
 
-    std::vector<GrowableBuffer<int64_t>> levels;
-    for (int64_t i = 0;  i < depth;  i++) {
-      levels.push_back(GrowableBuffer<int64_t>(options));
-      levels[(size_t)i].append(0);
+    if (numthreads <= 0) {
+      numthreads = (int64_t)std::thread::hardware_concurrency();
+      if (numthreads <= 0) {
+        numthreads = 1;
+      }
     }
+    numthreads = std::max((int64_t)1, std::min(numthreads, numentries));
 
-    GrowableBuffer<int64_t> bytepos_tocopy(options);
+    // split the entries into ranges of about the same number of bytes
+    std::vector<std::unique_ptr<FromROOT_Range>> ranges;
+    int64_t firstbyte = (numentries == 0 ? 0 : byteoffsets.getitem_at_nowrap(0));
+    int64_t lastbyte = byteoffsets.getitem_at_nowrap(numentries);
+    int64_t start = 0;
+    for (int64_t i = 1;  i <= numthreads;  i++) {
+      int64_t stop = numentries;
+      if (i < numthreads) {
+        int64_t target = firstbyte + ((lastbyte - firstbyte) * i) / numthreads;
+        stop = start;
+        while (stop < numentries  &&  byteoffsets.getitem_at_nowrap(stop) < target) {
+          stop++;
+        }
+      }
+      ranges.push_back(std::unique_ptr<FromROOT_Range>(new FromROOT_Range(numlevels, options)));
+      ranges.back().get()->start = start;
+      ranges.back().get()->stop = stop;
+      start = stop;
+    }
+
+    // count pass: the length of every vector, without touching the items
+    if (ranges.size() == 1) {
+      FromROOT_nestedvector_countrange(*ranges[0].get(), byteoffsets, data, datalength, depth, itemsize, strings);
+    }
+    else {
+      std::vector<std::thread> threads;
+      for (auto& range : ranges) {
+        threads.push_back(std::thread(FromROOT_nestedvector_countrange, std::ref(*range.get()), std::cref(byteoffsets), data, datalength, depth, itemsize, strings));
+      }
+      for (auto& thread : threads) {
+        thread.join();
+      }
+    }
+    for (auto& range : ranges) {
+      if (range.get()->error) {
+        std::rethrow_exception(range.get()->error);
+      }
+    }
 
-    for (int64_t i = 0;  i < byteoffsets.length() - 1;  i++) {
-      int64_t bytepos = byteoffsets.getitem_at_nowrap(i);
-      FromROOT_nestedvector_fill(levels, bytepos_tocopy, bytepos, rawdata, 0, itemsize);
-      level0.setitem_at_nowrap(i + 1, levels[0].length());
+    // where each range starts in every output array
+    std::vector<std::vector<int64_t>> firstvector(ranges.size(), std::vector<int64_t>((size_t)numlevels, 0));
+    std::vector<int64_t> numvectors((size_t)numlevels, 0);
+    std::vector<int64_t> total((size_t)numlevels, 0);
+    int64_t numitems = 0;
+    for (size_t r = 0;  r < ranges.size();  r++) {
+      FromROOT_Range* range = ranges[r].get();
+      range->firstoffset = total;
+      range->firstitem = numitems;
+      for (size_t level = 0;  level < (size_t)numlevels;  level++) {
+        GrowableBuffer<int64_t>& counts = range->counts[level];
+        firstvector[r][level] = numvectors[level];
+        numvectors[level] += counts.length();
+        for (int64_t i = 0;  i < counts.length();  i++) {
+          total[level] += counts.getitem_at_nowrap(i);
+        }
+      }
+      numitems = total.back();
     }
 
-    std::shared_ptr<void> ptr(new uint8_t[(size_t)(bytepos_tocopy.length()*itemsize)], util::array_deleter<uint8_t>());
-    ssize_t offset = rawdata.byteoffset();
+    std::vector<Index64> offsets;
+    for (size_t level = 0;  level < (size_t)numlevels;  level++) {
+      offsets.push_back(Index64(numvectors[level] + 1));
+      offsets.back().setitem_at_nowrap(0, 0);
+    }
+    std::shared_ptr<void> ptr(new uint8_t[(size_t)std::max((int64_t)1, numitems*itemsize)], util::array_deleter<uint8_t>());
     uint8_t* toptr = reinterpret_cast<uint8_t*>(ptr.get());
-    uint8_t* fromptr = reinterpret_cast<uint8_t*>(rawdata.ptr().get());
-    for (int64_t i = 0;  i < bytepos_tocopy.length();  i++) {
-      ssize_t bytepos = (ssize_t)bytepos_tocopy.getitem_at_nowrap(i);
-      std::memcpy(&toptr[(ssize_t)(i*itemsize)], &fromptr[offset + bytepos], (size_t)itemsize);
+
+    // fill pass: offsets from the counts and items copied one run at a time
+    if (ranges.size() == 1) {
+      FromROOT_nestedvector_fillrange(*ranges[0].get(), offsets, firstvector[0], data, toptr, itemsize, swap);
+    }
+    else {
+      std::vector<std::thread> threads;
+      for (size_t r = 0;  r < ranges.size();  r++) {
+        threads.push_back(std::thread(FromROOT_nestedvector_fillrange, std::ref(*ranges[r].get()), std::ref(offsets), std::cref(firstvector[r]), data, toptr, itemsize, swap));
+      }
+      for (auto& thread : threads) {
+        thread.join();
+      }
+    }
+
+    util::Parameters contentparameters;
+    util::Parameters stringparameters;
+    if (strings) {
+      contentparameters["__array__"] = std::string("\"char\"");
+      stringparameters["__array__"] = std::string("\"string\"");
     }
 
-    std::vector<ssize_t> shape = { (ssize_t)bytepos_tocopy.length() };
+    std::vector<ssize_t> shape = { (ssize_t)numitems };
     std::vector<ssize_t> strides = { (ssize_t)itemsize };
-    std::shared_ptr<Content> out = std::make_shared<NumpyArray>(Identities::none(), util::Parameters(), ptr, shape, strides, 0, (ssize_t)itemsize, format);
+    std::shared_ptr<Content> out = std::make_shared<NumpyArray>(Identities::none(), contentparameters, ptr, shape, strides, 0, (ssize_t)itemsize, format);
 
-    for (int64_t i = depth - 1;  i >= 0;  i--) {
-      Index64 index(levels[(size_t)i].ptr(), 0, levels[(size_t)i].length());
-      out = std::make_shared<ListOffsetArray64>(Identities::none(), util::Parameters(), index, out);
+    for (int64_t i = numlevels - 1;  i >= 0;  i--) {
+      out = std::make_shared<ListOffsetArray64>(Identities::none(), (strings  &&  i == depth ? stringparameters : util::Parameters()), offsets[(size_t)i], out);
     }
     return out;
   }
@@ -0,0 +1,145 @@
+// BSD 3-Clause License; see https://github.com/jpivarski/awkward-1.0/blob/master/LICENSE
+
+#include <string>
+#include <memory>
+#include <stdexcept>
+
+#ifdef AWKWARD_SIMDJSON
+#include "simdjson.h"
+#endif
+
+#include "awkward/builder/ArrayBuilder.h"
+#include "awkward/Content.h"
+
+#include "awkward/io/json.h"
+
+// simdjson needs C++17, so this file is only compiled with it (and
+// AWKWARD_SIMDJSON defined) if CMake finds simdjson; otherwise the same
+// functions exist but raise an error.
+
+namespace awkward {
+#ifdef AWKWARD_SIMDJSON
+  // Walks simdjson's tape (through the DOM API, which only wraps tape
+  // positions) and makes the same ArrayBuilder calls as the rapidjson Handler.
+  void fill_simdjson(ArrayBuilder& builder, const simdjson::dom::element& element) {
+    switch (element.type()) {
+      case simdjson::dom::element_type::ARRAY: {
+        simdjson::dom::array array = element.get_array().value_unsafe();
+        builder.beginlist();
+        for (simdjson::dom::element x : array) {
+          fill_simdjson(builder, x);
+        }
+        builder.endlist();
+        break;
+      }
+      case simdjson::dom::element_type::OBJECT: {
+        simdjson::dom::object object = element.get_object().value_unsafe();
+        builder.beginrecord();
+        for (simdjson::dom::object::iterator it = object.begin();  it != object.end();  ++it) {
+          builder.field_check(it.key_c_str());
+          fill_simdjson(builder, it.value());
+        }
+        builder.endrecord();
+        break;
+      }
+      case simdjson::dom::element_type::INT64:
+        builder.integer(element.get_int64().value_unsafe());
+        break;
+      case simdjson::dom::element_type::UINT64:
+        builder.integer((int64_t)element.get_uint64().value_unsafe());
+        break;
+      case simdjson::dom::element_type::DOUBLE:
+        builder.real(element.get_double().value_unsafe());
+        break;
+      case simdjson::dom::element_type::STRING: {
+        std::string_view x = element.get_string().value_unsafe();
+        builder.string(x.data(), (int64_t)x.size());
+        break;
+      }
+      case simdjson::dom::element_type::BOOL:
+        builder.boolean(element.get_bool().value_unsafe());
+        break;
+      case simdjson::dom::element_type::NULL_VALUE:
+        builder.null();
+        break;
+      default:
+        throw std::invalid_argument("unrecognized JSON value (simdjson)");
+    }
+  }
+
+  const std::shared_ptr<Content> fromjson_simdjson(const simdjson::padded_string& json, const ArrayBuilderOptions& options, bool lines) {
+    ArrayBuilder builder(options);
+    simdjson::dom::parser parser;
+    if (lines) {
+      simdjson::dom::document_stream stream;
+      simdjson::error_code error = parser.parse_many(json).get(stream);
+      if (error) {
+        throw std::invalid_argument(std::string("JSON error: ") + simdjson::error_message(error));
+      }
+      int64_t line = 1;
+      for (simdjson::dom::document_stream::iterator it = stream.begin();  it != stream.end();  ++it) {
+        simdjson::dom::element document;
+        error = (*it).get(document);
+        if (error) {
+          throw std::invalid_argument(std::string("JSON error in document ") + std::to_string(line) + std::string(" at char ") + std::to_string(it.current_index()) + std::string(": ") + simdjson::error_message(error));
+        }
+        fill_simdjson(builder, document);
+        line++;
+      }
+      // parse_many stops quietly at an incomplete last document
+      if (stream.truncated_bytes() != 0) {
+        throw std::invalid_argument(std::string("JSON error in document ") + std::to_string(line) + std::string(" at char ") + std::to_string(json.size() - stream.truncated_bytes()) + std::string(": incomplete document"));
+      }
+    }
+    else {
+      simdjson::dom::element document;
+      simdjson::error_code error = parser.parse(json).get(document);
+      if (error) {
+        throw std::invalid_argument(std::string("JSON error: ") + simdjson::error_message(error));
+      }
+      // same top-level rules as Handler: an array is the output, anything else is one item
+      if (document.type() == simdjson::dom::element_type::ARRAY) {
+        simdjson::dom::array array = document.get_array().value_unsafe();
+        for (simdjson::dom::element x : array) {
+          fill_simdjson(builder, x);
+        }
+      }
+      else {
+        fill_simdjson(builder, document);
+      }
+    }
+    return builder.finalize();
+  }
+
+  bool SimdjsonEnabled() {
+    return true;
+  }
+
+  const std::shared_ptr<Content> FromJsonStringSimdjson(const char* source, int64_t length, const ArrayBuilderOptions& options, bool lines) {
+    simdjson::padded_string json(source, (size_t)length);
+    return fromjson_simdjson(json, options, lines);
+  }
+
+  const std::shared_ptr<Content> FromJsonFileSimdjson(const std::string& filename, const ArrayBuilderOptions& options, bool lines) {
+    simdjson::padded_string json;
+    if (simdjson::padded_string::load(filename).get(json)) {
+      throw std::invalid_argument(std::string("file \"") + filename + std::string("\" could not be opened for reading"));
+    }
+    return fromjson_simdjson(json, options, lines);
+  }
+
+#else
+  bool SimdjsonEnabled() {
+    return false;
+  }
+
+  const std::shared_ptr<Content> FromJsonStringSimdjson(const char* source, int64_t length, const ArrayBuilderOptions& options, bool lines) {
+    throw std::invalid_argument("awkward1 was compiled without simdjson");
+  }
+
+  const std::shared_ptr<Content> FromJsonFileSimdjson(const std::string& filename, const ArrayBuilderOptions& options, bool lines) {
+    throw std::invalid_argument("awkward1 was compiled without simdjson");
+  }
+
+#endif
+}
@@ -444,6 +444,19 @@ namespace awkward {
       return awkward_listarray64_getitem_carry_64(tostarts, tostops, fromstarts, fromstops, fromcarry, startsoffset, stopsoffset, lenstarts, lencarry);
     }
 
+    template <>
+    Error awkward_listoffsetarray_getitem_slicemask<int32_t>(int32_t* tostarts, int32_t* tostops, const int32_t* fromoffsets, int64_t offsetsoffset, int64_t lenarray, const uint8_t* mask, int64_t maskoffset, int64_t length, bool bitmask, bool lsb_order) {
+      return awkward_listoffsetarray32_getitem_slicemask(tostarts, tostops, fromoffsets, offsetsoffset, lenarray, mask, maskoffset, length, bitmask, lsb_order);
+    }
+    template <>
+    Error awkward_listoffsetarray_getitem_slicemask<uint32_t>(uint32_t* tostarts, uint32_t* tostops, const uint32_t* fromoffsets, int64_t offsetsoffset, int64_t lenarray, const uint8_t* mask, int64_t maskoffset, int64_t length, bool bitmask, bool lsb_order) {
+      return awkward_listoffsetarrayU32_getitem_slicemask(tostarts, tostops, fromoffsets, offsetsoffset, lenarray, mask, maskoffset, length, bitmask, lsb_order);
+    }
+    template <>
+    Error awkward_listoffsetarray_getitem_slicemask<int64_t>(int64_t* tostarts, int64_t* tostops, const int64_t* fromoffsets, int64_t offsetsoffset, int64_t lenarray, const uint8_t* mask, int64_t maskoffset, int64_t length, bool bitmask, bool lsb_order) {
+      return awkward_listoffsetarray64_getitem_slicemask(tostarts, tostops, fromoffsets, offsetsoffset, lenarray, mask, maskoffset, length, bitmask, lsb_order);
+    }
+
     template <>
     Error awkward_listarray_num_64<int32_t>(int64_t* tonum, const int32_t* fromstarts, int64_t startsoffset, const int32_t* fromstops, int64_t stopsoffset, int64_t length) {
       return awkward_listarray32_num_64(tonum, fromstarts, startsoffset, fromstops, stopsoffset, length);
@@ -0,0 +1,96 @@
+// BSD 3-Clause License; see https://github.com/jpivarski/awkward-1.0/blob/master/LICENSE
+
+#include <sstream>
+
+#include "awkward/virtual/ArrayCache.h"
+
+namespace awkward {
+  ArrayCache::~ArrayCache() { }
+
+  LRUCache::LRUCache(int64_t maxbytes)
+      : maxbytes_(maxbytes)
+      , nbytes_(0) {
+    if (maxbytes < 0) {
+      throw std::invalid_argument("LRUCache maxbytes must be non-negative");
+    }
+  }
+
+  int64_t LRUCache::maxbytes() const {
+    return maxbytes_;
+  }
+
+  int64_t LRUCache::nbytes() const {
+    std::lock_guard<std::mutex> lock(mutex_);
+    return nbytes_;
+  }
+
+  int64_t LRUCache::length() const {
+    std::lock_guard<std::mutex> lock(mutex_);
+    return (int64_t)entries_.size();
+  }
+
+  bool LRUCache::has(const std::string& key) const {
+    std::lock_guard<std::mutex> lock(mutex_);
+    return lookup_.find(key) != lookup_.end();
+  }
+
+  const std::vector<std::string> LRUCache::keys() const {
+    std::lock_guard<std::mutex> lock(mutex_);
+    std::vector<std::string> out;
+    for (auto entry : entries_) {
+      out.push_back(entry.first);
+    }
+    return out;
+  }
+
+  void LRUCache::clear() {
+    std::lock_guard<std::mutex> lock(mutex_);
+    entries_.clear();
+    lookup_.clear();
+    nbytes_ = 0;
+  }
+
+  const std::shared_ptr<Content> LRUCache::get(const std::string& key) {
+    std::lock_guard<std::mutex> lock(mutex_);
+    auto found = lookup_.find(key);
+    if (found == lookup_.end()) {
+      return std::shared_ptr<Content>(nullptr);
+    }
+    // most recently used entries are at the front of the list
+    entries_.splice(entries_.begin(), entries_, found->second);
+    return found->second->second.first;
+  }
+
+  void LRUCache::set(const std::string& key, const std::shared_ptr<Content>& value) {
+    int64_t nbytes = value.get()->nbytes();
+    std::lock_guard<std::mutex> lock(mutex_);
+    auto found = lookup_.find(key);
+    if (found != lookup_.end()) {
+      nbytes_ -= found->second->second.second;
+      entries_.erase(found->second);
+      lookup_.erase(found);
+    }
+    if (nbytes > maxbytes_) {
+      return;
+    }
+    entries_.push_front(Entry(key, std::pair<std::shared_ptr<Content>, int64_t>(value, nbytes)));
+    lookup_[key] = entries_.begin();
+    nbytes_ += nbytes;
+    evict();
+  }
+
+  void LRUCache::evict() {
+    while (nbytes_ > maxbytes_  &&  !entries_.empty()) {
+      nbytes_ -= entries_.back().second.second;
+      lookup_.erase(entries_.back().first);
+      entries_.pop_back();
+    }
+  }
+
+  const std::string LRUCache::tostring_part(const std::string& indent, const std::string& pre, const std::string& post) const {
+    std::lock_guard<std::mutex> lock(mutex_);
+    std::stringstream out;
+    out << indent << pre << "<LRUCache maxbytes=\"" << maxbytes_ << "\" nbytes=\"" << nbytes_ << "\" length=\"" << entries_.size() << "\"/>" << post;
+    return out.str();
+  }
+}
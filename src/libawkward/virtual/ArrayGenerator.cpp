@@ -0,0 +1,79 @@
+// BSD 3-Clause License; see https://github.com/jpivarski/awkward-1.0/blob/master/LICENSE
+
+#include <sstream>
+
+#include "awkward/array/VirtualArray.h"
+
+#include "awkward/virtual/ArrayGenerator.h"
+
+namespace awkward {
+  ArrayGenerator::ArrayGenerator(const std::shared_ptr<Type>& type, int64_t length)
+      : type_(type)
+      , length_(length) { }
+
+  ArrayGenerator::~ArrayGenerator() { }
+
+  const std::shared_ptr<Type> ArrayGenerator::type() const {
+    return type_;
+  }
+
+  int64_t ArrayGenerator::length() const {
+    return length_;
+  }
+
+  const std::shared_ptr<Content> ArrayGenerator::generate_and_check() const {
+    std::shared_ptr<Content> out = generate();
+    if (length_ >= 0  &&  length_ != out.get()->length()) {
+      throw std::invalid_argument(std::string("generated array does not have the expected length: ") + std::to_string(out.get()->length()) + std::string(" versus ") + std::to_string(length_));
+    }
+    if (type_.get() != nullptr) {
+      std::shared_ptr<Type> generated = out.get()->type(std::map<std::string, std::string>());
+      if (!generated.get()->equal(type_, false)) {
+        throw std::invalid_argument(std::string("generated array does not conform to the expected type: ") + generated.get()->compare(type_));
+      }
+    }
+    return out;
+  }
+
+  const std::string ArrayGenerator::tostring() const {
+    return tostring_part("", "", "");
+  }
+
+  SliceGenerator::SliceGenerator(const std::shared_ptr<Type>& type, int64_t length, const std::shared_ptr<Content>& content, int64_t start, int64_t stop)
+      : ArrayGenerator(type, length)
+      , content_(content)
+      , start_(start)
+      , stop_(stop) { }
+
+  const std::shared_ptr<Content> SliceGenerator::content() const {
+    return content_;
+  }
+
+  int64_t SliceGenerator::start() const {
+    return start_;
+  }
+
+  int64_t SliceGenerator::stop() const {
+    return stop_;
+  }
+
+  const std::shared_ptr<Content> SliceGenerator::generate() const {
+    if (VirtualArray* raw = dynamic_cast<VirtualArray*>(content_.get())) {
+      // slicing an unmaterialized VirtualArray would only make another SliceGenerator
+      return raw->array().get()->getitem_range_nowrap(start_, stop_);
+    }
+    return content_.get()->getitem_range_nowrap(start_, stop_);
+  }
+
+  const std::string SliceGenerator::tostring_part(const std::string& indent, const std::string& pre, const std::string& post) const {
+    std::stringstream out;
+    out << indent << pre << "<SliceGenerator start=\"" << start_ << "\" stop=\"" << stop_ << "\">\n";
+    out << content_.get()->tostring_part(indent + std::string("    "), "<content>", "</content>\n");
+    out << indent << "</SliceGenerator>" << post;
+    return out.str();
+  }
+
+  const std::shared_ptr<ArrayGenerator> SliceGenerator::shallow_copy() const {
+    return std::make_shared<SliceGenerator>(type_, length_, content_, start_, stop_);
+  }
+}
@@ -1,6 +1,7 @@
 // BSD 3-Clause License; see https://github.com/jpivarski/awkward-1.0/blob/master/LICENSE
 
 #include <string>
+#include <memory>
 
 #include <pybind11/pybind11.h>
 
@@ -10,6 +11,9 @@
 #include "awkward/builder/ArrayBuilderOptions.h"
 #include "awkward/io/json.h"
 #include "awkward/io/root.h"
+#include "awkward/type/Type.h"
+
+#include "awkward/cpu-kernels/parallel.h"
 
 namespace py = pybind11;
 namespace ak = awkward;
@@ -17,7 +21,8 @@ namespace ak = awkward;
 /////////////////////////////////////////////////////////////// fromjson
 
 void make_fromjson(py::module& m, const std::string& name) {
-  m.def(name.c_str(), [](const std::string& source, int64_t initial, double resize, int64_t buffersize) -> std::shared_ptr<ak::Content> {
+  m.def(name.c_str(), [](const std::string& source, const std::shared_ptr<ak::Type>& type, int64_t initial, double resize, int64_t buffersize, bool categorical) -> std::shared_ptr<ak::Content> {
+    py::gil_scoped_release release;
     bool isarray = false;
     for (char const &x: source) {
       if (x != 9  &&  x != 10  &&  x != 13  &&  x != 32) {  // whitespace
@@ -28,7 +33,10 @@ void make_fromjson(py::module& m, const std::string& name) {
       }
     }
     if (isarray) {
-      return ak::FromJsonString(source.c_str(), ak::ArrayBuilderOptions(initial, resize));
+      if (type.get() != nullptr) {
+        return ak::FromJsonString(source.c_str(), type, ak::ArrayBuilderOptions(initial, resize));
+      }
+      return ak::FromJsonString(source.c_str(), ak::ArrayBuilderOptions(initial, resize, false, categorical));
     }
     else {
 #ifdef _MSC_VER
@@ -42,7 +50,12 @@ void make_fromjson(py::module& m, const std::string& name) {
       }
       std::shared_ptr<ak::Content> out(nullptr);
       try {
-        out = FromJsonFile(file, ak::ArrayBuilderOptions(initial, resize), buffersize);
+        if (type.get() != nullptr) {
+          out = FromJsonFile(file, type, ak::ArrayBuilderOptions(initial, resize), buffersize);
+        }
+        else {
+          out = FromJsonFile(file, ak::ArrayBuilderOptions(initial, resize, false, categorical), buffersize);
+        }
       }
       catch (...) {
         fclose(file);
@@ -51,15 +64,107 @@ void make_fromjson(py::module& m, const std::string& name) {
       fclose(file);
       return out;
     }
-  }, py::arg("source"), py::arg("initial") = 1024, py::arg("resize") = 2.0, py::arg("buffersize") = 65536);
+  }, py::arg("source"), py::arg("type") = py::none(), py::arg("initial") = 1024, py::arg("resize") = 2.0, py::arg("buffersize") = 65536, py::arg("categorical") = false);
+}
+
+class FromJsonLinesSource {
+public:
+  FromJsonLinesSource(const std::string& source, const std::shared_ptr<ak::Type>& type, int64_t initial, double resize, int64_t buffersize, bool categorical)
+      : source_(source)
+      , file_(nullptr)
+      , reader_(nullptr) {
+    bool istext = false;
+    for (char const &x: source_) {
+      if (x != 9  &&  x != 10  &&  x != 13  &&  x != 32) {  // whitespace
+        if (x == 91  ||  x == 123) {                        // opening square bracket or curly brace
+          istext = true;
+        }
+        break;
+      }
+    }
+    if (istext) {
+      reader_ = std::unique_ptr<ak::FromJsonLines>(new ak::FromJsonLines(source_.c_str(), type, ak::ArrayBuilderOptions(initial, resize, false, categorical)));
+    }
+    else {
+#ifdef _MSC_VER
+      if (fopen_s(&file_, source_.c_str(), "rb") != 0) {
+#else
+      file_ = fopen(source_.c_str(), "rb");
+      if (file_ == nullptr) {
+#endif
+        throw std::invalid_argument(std::string("file \"") + source_ + std::string("\" could not be opened for reading"));
+      }
+      reader_ = std::unique_ptr<ak::FromJsonLines>(new ak::FromJsonLines(file_, type, ak::ArrayBuilderOptions(initial, resize, false, categorical), buffersize));
+    }
+  }
+
+  ~FromJsonLinesSource() {
+    reader_.reset(nullptr);
+    if (file_ != nullptr) {
+      fclose(file_);
+    }
+  }
+
+  int64_t numlines() const {
+    return reader_.get()->numlines();
+  }
+
+  const std::shared_ptr<ak::Content> next(int64_t chunksize) {
+    return reader_.get()->next(chunksize);
+  }
+
+private:
+  const std::string source_;
+  FILE* file_;
+  std::unique_ptr<ak::FromJsonLines> reader_;
+};
+
+void make_fromjsonlines(py::module& m, const std::string& name) {
+  py::class_<FromJsonLinesSource>(m, name.c_str())
+      .def(py::init<const std::string&, const std::shared_ptr<ak::Type>&, int64_t, double, int64_t, bool>(), py::arg("source"), py::arg("type") = py::none(), py::arg("initial") = 1024, py::arg("resize") = 2.0, py::arg("buffersize") = 65536, py::arg("categorical") = false)
+      .def_property_readonly("numlines", &FromJsonLinesSource::numlines)
+      .def("next", &FromJsonLinesSource::next, py::arg("chunksize") = -1, py::call_guard<py::gil_scoped_release>())
+  ;
+}
+
+void make_fromjsonlines_parallel(py::module& m, const std::string& name) {
+  m.def(name.c_str(), [](const py::buffer& data, int64_t numthreads, const std::shared_ptr<ak::Type>& type, int64_t initial, double resize) -> std::shared_ptr<ak::Content> {
+    py::buffer_info info = data.request();
+    const char* ptr = reinterpret_cast<const char*>(info.ptr);
+    int64_t length = (int64_t)(info.size * info.itemsize);
+    py::gil_scoped_release release;
+    return ak::FromJsonLinesParallel(ptr, length, type, ak::ArrayBuilderOptions(initial, resize), numthreads);
+  }, py::arg("data"), py::arg("numthreads"), py::arg("type") = py::none(), py::arg("initial") = 1024, py::arg("resize") = 2.0);
+}
+
+void make_fromjson_simdjson(py::module& m, const std::string& name) {
+  m.def(name.c_str(), [](const std::string& source, bool lines, int64_t initial, double resize, bool categorical) -> std::shared_ptr<ak::Content> {
+    bool istext = false;
+    for (char const &x: source) {
+      if (x != 9  &&  x != 10  &&  x != 13  &&  x != 32) {  // whitespace
+        if (x == 91  ||  (lines  &&  x == 123)) {           // opening square bracket or curly brace
+          istext = true;
+        }
+        break;
+      }
+    }
+    py::gil_scoped_release release;
+    if (istext) {
+      return ak::FromJsonStringSimdjson(source.c_str(), (int64_t)source.length(), ak::ArrayBuilderOptions(initial, resize, false, categorical), lines);
+    }
+    else {
+      return ak::FromJsonFileSimdjson(source, ak::ArrayBuilderOptions(initial, resize, false, categorical), lines);
+    }
+  }, py::arg("source"), py::arg("lines") = false, py::arg("initial") = 1024, py::arg("resize") = 2.0, py::arg("categorical") = false);
 }
 
 /////////////////////////////////////////////////////////////// fromroot
 
 void make_fromroot_nestedvector(py::module& m, const std::string& name) {
-  m.def(name.c_str(), [](const ak::Index64& byteoffsets, const ak::NumpyArray& rawdata, int64_t depth, int64_t itemsize, const std::string& format, int64_t initial, double resize) -> std::shared_ptr<ak::Content> {
-      return FromROOT_nestedvector(byteoffsets, rawdata, depth, itemsize, format, ak::ArrayBuilderOptions(initial, resize));
-  }, py::arg("byteoffsets"), py::arg("rawdata"), py::arg("depth"), py::arg("itemsize"), py::arg("format"), py::arg("initial") = 1024, py::arg("resize") = 2.0);
+  m.def(name.c_str(), [](const ak::Index64& byteoffsets, const ak::NumpyArray& rawdata, int64_t depth, int64_t itemsize, const std::string& format, int64_t initial, double resize, int64_t numthreads) -> std::shared_ptr<ak::Content> {
+      py::gil_scoped_release release;
+      return FromROOT_nestedvector(byteoffsets, rawdata, depth, itemsize, format, ak::ArrayBuilderOptions(initial, resize), numthreads);
+  }, py::arg("byteoffsets"), py::arg("rawdata"), py::arg("depth"), py::arg("itemsize"), py::arg("format"), py::arg("initial") = 1024, py::arg("resize") = 2.0, py::arg("numthreads") = 1);
 }
 
 /////////////////////////////////////////////////////////////// module
@@ -73,5 +178,12 @@ PYBIND11_MODULE(_io, m) {
 #endif
 
   make_fromjson(m, "fromjson");
+  make_fromjsonlines(m, "FromJsonLines");
+  make_fromjsonlines_parallel(m, "fromjsonlines_parallel");
+  make_fromjson_simdjson(m, "fromjson_simdjson");
+  m.attr("has_simdjson") = py::bool_(ak::SimdjsonEnabled());
   make_fromroot_nestedvector(m, "fromroot_nestedvector");
+
+  m.def("_set_num_threads", &awkward_set_num_threads, py::call_guard<py::gil_scoped_release>());
+  m.def("_get_num_threads", &awkward_get_num_threads);
 }
@@ -6,6 +6,8 @@
 #include "awkward/python/identities.h"
 #include "awkward/python/content.h"
 
+#include "awkward/cpu-kernels/parallel.h"
+
 namespace py = pybind11;
 PYBIND11_MODULE(layout, m) {
 #ifdef VERSION_INFO
@@ -65,7 +67,16 @@ PYBIND11_MODULE(layout, m) {
   make_UnionArrayOf<int8_t, uint32_t>(m, "UnionArray8_U32");
   make_UnionArrayOf<int8_t, int64_t>(m,  "UnionArray8_64");
 
+  make_PyArrayGenerator(m, "ArrayGenerator");
+  make_SliceGenerator(m,   "SliceGenerator");
+  make_PyArrayCache(m,     "ArrayCache");
+  make_LRUCache(m,         "LRUCache");
+  make_VirtualArray(m,     "VirtualArray");
+
   m.def("_slice_tostring", [](py::object obj) -> std::string {
     return toslice(obj).tostring();
   });
+
+  m.def("_set_num_threads", &awkward_set_num_threads, py::call_guard<py::gil_scoped_release>());
+  m.def("_get_num_threads", &awkward_get_num_threads);
 }
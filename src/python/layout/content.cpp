@@ -1,7 +1,13 @@
 // BSD 3-Clause License; see https://github.com/jpivarski/awkward-1.0/blob/master/LICENSE
 
+#include <limits>
+#include <sstream>
+
 #include <pybind11/numpy.h>
 
+#include "awkward/cpu-kernels/getitem.h"
+#include "awkward/type/ArrayType.h"
+
 #include "awkward/python/identities.h"
 #include "awkward/python/util.h"
 
@@ -94,6 +100,9 @@ py::object box(const std::shared_ptr<ak::Content>& content) {
   else if (ak::UnionArray8_64* raw = dynamic_cast<ak::UnionArray8_64*>(content.get())) {
     return py::cast(*raw);
   }
+  else if (ak::VirtualArray* raw = dynamic_cast<ak::VirtualArray*>(content.get())) {
+    return py::cast(*raw);
+  }
   else {
     throw std::runtime_error("missing boxer for Content subtype");
   }
@@ -204,6 +213,10 @@ std::shared_ptr<ak::Content> unbox_content(const py::handle& obj) {
     return obj.cast<ak::UnionArray8_64*>()->shallow_copy();
   }
   catch (py::cast_error err) { }
+  try {
+    return obj.cast<ak::VirtualArray*>()->shallow_copy();
+  }
+  catch (py::cast_error err) { }
   throw std::invalid_argument("content argument must be a Content subtype");
 }
 
@@ -408,7 +421,15 @@ void toslice_part(ak::Slice& slice, py::object obj) {
         }
 
         py::buffer_info info = array.request();
-        if (info.format.compare("?") == 0) {
+        if (info.format.compare("?") == 0  &&  info.ndim == 1) {
+          py::object mask_object = py::module::import("numpy").attr("ascontiguousarray")(array);
+          py::array mask = mask_object.cast<py::array>();
+          py::buffer_info maskinfo = mask.request();
+          ak::IndexU8 index(std::shared_ptr<uint8_t>(reinterpret_cast<uint8_t*>(maskinfo.ptr), pyobject_deleter<uint8_t>(mask.ptr())), 0, (int64_t)maskinfo.shape[0]);
+          slice.append(std::make_shared<ak::SliceMask>(index, (int64_t)maskinfo.shape[0], false, false));
+        }
+
+        else if (info.format.compare("?") == 0) {
           py::object nonzero_tuple = py::module::import("numpy").attr("nonzero")(array);
           for (auto x : nonzero_tuple.cast<py::tuple>()) {
             py::object intarray_object = py::module::import("numpy").attr("asarray")(x.cast<py::object>(), py::module::import("numpy").attr("int64"));
@@ -483,6 +504,14 @@ ak::Slice toslice(py::object obj) {
   return out;
 }
 
+// Runs C++ work with the GIL released; the result is boxed after the GIL is
+// reacquired, so only the work itself may not touch Python objects.
+template <typename F>
+auto nogil(const F& f) -> decltype(f()) {
+  py::gil_scoped_release release;
+  return f();
+}
+
 template <typename T>
 py::object getitem(const T& self, const py::object& obj) {
   if (py::isinstance<py::int_>(obj)) {
@@ -506,7 +535,8 @@ py::object getitem(const T& self, const py::object& obj) {
     // NOTE: control flow can pass through here; don't make the last line an 'else'!
   }
   if (py::isinstance<py::str>(obj)) {
-    return box(self.getitem_field(obj.cast<std::string>()));
+    std::string key = obj.cast<std::string>();
+    return box(nogil([&]() { return self.getitem_field(key); }));
   }
   if (!py::isinstance<py::tuple>(obj)  &&  py::isinstance<py::iterable>(obj)) {
     std::vector<std::string> strings;
@@ -521,16 +551,125 @@ py::object getitem(const T& self, const py::object& obj) {
       }
     }
     if (all_strings  &&  !strings.empty()) {
-      return box(self.getitem_fields(strings));
+      return box(nogil([&]() { return self.getitem_fields(strings); }));
     }
     // NOTE: control flow can pass through here; don't make the last line an 'else'!
   }
-  return box(self.getitem(toslice(obj)));
+  ak::Slice slice = toslice(obj);
+  return box(nogil([&]() { return self.getitem(slice); }));
 }
 
 /////////////////////////////////////////////////////////////// ArrayBuilder
 
-void builder_fromiter(ak::ArrayBuilder& self, const py::handle& obj) {
+struct NumpyScalarTypes {
+  py::handle bool_;
+  py::handle integer;
+  py::handle floating;
+};
+
+const NumpyScalarTypes& numpy_scalar_types() {
+  // imported once and never released, so they outlive the module
+  static const NumpyScalarTypes out = {
+    py::object(py::module::import("numpy").attr("bool_")).release(),
+    py::object(py::module::import("numpy").attr("integer")).release(),
+    py::object(py::module::import("numpy").attr("floating")).release()
+  };
+  return out;
+}
+
+void builder_extend(ak::ArrayBuilder& self, const bool* x, int64_t length) {
+  self.booleans(x, length);
+}
+
+void builder_extend(ak::ArrayBuilder& self, const int64_t* x, int64_t length) {
+  self.integers(x, length);
+}
+
+void builder_extend(ak::ArrayBuilder& self, const double* x, int64_t length) {
+  self.reals(x, length);
+}
+
+const ssize_t kBuilderNoGilSize = 4096;
+
+template <typename T>
+const T* builder_fromiter_ndarray(ak::ArrayBuilder& self, const T* data, const std::vector<ssize_t>& shape, size_t dim) {
+  self.beginlist();
+  if (dim + 1 == shape.size()) {
+    builder_extend(self, data, (int64_t)shape[dim]);
+    data += shape[dim];
+  }
+  else {
+    for (ssize_t i = 0;  i < shape[dim];  i++) {
+      data = builder_fromiter_ndarray(self, data, shape, dim + 1);
+    }
+  }
+  self.endlist();
+  return data;
+}
+
+template <typename T>
+void builder_fromiter_ndarray(ak::ArrayBuilder& self, const py::array& obj, bool releasegil) {
+  // one contiguous copy (and dtype conversion) by NumPy, then the innermost
+  // dimension goes into the builder's GrowableBuffer as a single block
+  py::array_t<T, py::array::c_style | py::array::forcecast> array(obj);
+  std::vector<ssize_t> shape(array.shape(), array.shape() + array.ndim());
+  const T* data = array.data();
+  auto fill = [&]() -> void {
+    if (shape.empty()) {
+      builder_extend(self, data, 1);
+    }
+    else {
+      builder_fromiter_ndarray(self, data, shape, 0);
+    }
+  };
+  // only on request: without the GIL, nothing stops another thread from
+  // using the same builder, so the caller must not share it while it fills
+  if (releasegil  &&  array.size() >= kBuilderNoGilSize) {
+    nogil(fill);
+  }
+  else {
+    fill();
+  }
+}
+
+void builder_fromiter(ak::ArrayBuilder& self, const py::handle& obj, bool releasegil);
+
+bool builder_fits_int64(const py::array& array) {
+  // only uint64 can hold values that int64 can't; those go element by
+  // element, which raises OverflowError like any other too-large int
+  if (array.dtype().kind() != 'u'  ||  array.itemsize() < 8  ||  array.size() == 0) {
+    return true;
+  }
+  return array.attr("max")().cast<uint64_t>() <= (uint64_t)std::numeric_limits<int64_t>::max();
+}
+
+void builder_fromiter_array(ak::ArrayBuilder& self, const py::array& array, bool releasegil) {
+  char kind = array.dtype().kind();
+  if (kind == 'b') {
+    builder_fromiter_ndarray<bool>(self, array, releasegil);
+  }
+  else if ((kind == 'i'  ||  kind == 'u')  &&  builder_fits_int64(array)) {
+    builder_fromiter_ndarray<int64_t>(self, array, releasegil);
+  }
+  else if (kind == 'f') {
+    builder_fromiter_ndarray<double>(self, array, releasegil);
+  }
+  else {
+    py::object list = array.attr("tolist")();
+    if (py::isinstance<py::list>(list)) {
+      self.beginlist();
+      for (auto x : list) {
+        builder_fromiter(self, x, releasegil);
+      }
+      self.endlist();
+    }
+    else {
+      builder_fromiter(self, list, releasegil);
+    }
+  }
+}
+
+void builder_fromiter(ak::ArrayBuilder& self, const py::handle& obj, bool releasegil) {
   if (obj.is(py::none())) {
     self.null();
   }
@@ -549,12 +688,15 @@ void builder_fromiter(ak::ArrayBuilder& self, const py::handle& obj) {
   else if (py::isinstance<py::str>(obj)) {
     self.string(obj.cast<std::string>());
   }
+  else if (py::isinstance<py::array>(obj)) {
+    builder_fromiter_array(self, obj.cast<py::array>(), releasegil);
+  }
   else if (py::isinstance<py::tuple>(obj)) {
     py::tuple tup = obj.cast<py::tuple>();
     self.begintuple(tup.size());
     for (size_t i = 0;  i < tup.size();  i++) {
       self.index((int64_t)i);
-      builder_fromiter(self, tup[i]);
+      builder_fromiter(self, tup[i], releasegil);
     }
     self.endtuple();
   }
@@ -565,9 +707,19 @@ void builder_fromiter(ak::ArrayBuilder& self, const py::handle& obj) {
       if (!py::isinstance<py::str>(pair.first)) {
         throw std::invalid_argument("keys of dicts in 'fromiter' must all be strings");
       }
+#if PY_MAJOR_VERSION >= 3
+      // the UTF-8 form is cached on the str object (usually interned), so
+      // same-shaped dicts don't make a new copy of each key
+      const char* key = PyUnicode_AsUTF8(pair.first.ptr());
+      if (key == nullptr) {
+        throw py::error_already_set();
+      }
+      self.field_check(key);
+#else
       std::string key = pair.first.cast<std::string>();
       self.field_check(key.c_str());
-      builder_fromiter(self, pair.second);
+#endif
+      builder_fromiter(self, pair.second, releasegil);
     }
     self.endrecord();
   }
@@ -575,25 +727,17 @@ void builder_fromiter(ak::ArrayBuilder& self, const py::handle& obj) {
     py::iterable seq = obj.cast<py::iterable>();
     self.beginlist();
     for (auto x : seq) {
-      builder_fromiter(self, x);
-    }
-    self.endlist();
-  }
-  else if (py::isinstance<py::array>(obj)) {
-    py::iterable seq = obj.attr("tolist")().cast<py::iterable>();
-    self.beginlist();
-    for (auto x : seq) {
-      builder_fromiter(self, x);
+      builder_fromiter(self, x, releasegil);
     }
     self.endlist();
   }
-  else if (py::isinstance(obj, py::module::import("numpy").attr("bool_"))) {
+  else if (py::isinstance(obj, numpy_scalar_types().bool_)) {
     self.boolean(obj.cast<bool>());
   }
-  else if (py::isinstance(obj, py::module::import("numpy").attr("integer"))) {
+  else if (py::isinstance(obj, numpy_scalar_types().integer)) {
     self.integer(obj.cast<int64_t>());
   }
-  else if (py::isinstance(obj, py::module::import("numpy").attr("floating"))) {
+  else if (py::isinstance(obj, numpy_scalar_types().floating)) {
     self.real(obj.cast<double>());
   }
   else {
@@ -603,18 +747,34 @@ void builder_fromiter(ak::ArrayBuilder& self, const py::handle& obj) {
 
 py::class_<ak::ArrayBuilder> make_ArrayBuilder(const py::handle& m, const std::string& name) {
   return (py::class_<ak::ArrayBuilder>(m, name.c_str())
-      .def(py::init([](int64_t initial, double resize) -> ak::ArrayBuilder {
-        return ak::ArrayBuilder(ak::ArrayBuilderOptions(initial, resize));
-      }), py::arg("initial") = 1024, py::arg("resize") = 2.0)
+      .def(py::init([](int64_t initial, double resize, const std::shared_ptr<ak::Type>& type, bool narrow, bool categorical) -> ak::ArrayBuilder {
+        return ak::ArrayBuilder(type, ak::ArrayBuilderOptions(initial, resize, narrow, categorical));
+      }), py::arg("initial") = 1024, py::arg("resize") = 2.0, py::arg("type") = py::none(), py::arg("narrow") = false, py::arg("categorical") = false)
+      .def_static("merge", [](const std::vector<const ak::ArrayBuilder*>& builders) -> py::object {
+        // taking a snapshot can join a builder's chunks, so it needs the GIL;
+        // only merging the snapshots runs without it
+        std::vector<std::shared_ptr<ak::Content>> snapshots;
+        for (auto builder : builders) {
+          snapshots.push_back(builder->snapshot());
+        }
+        return box(nogil([&]() { return ak::ArrayBuilder::merge_snapshots(snapshots); }));
+      })
       .def_property_readonly("_ptr", [](const ak::ArrayBuilder* self) -> size_t { return reinterpret_cast<size_t>(self); })
       .def("__repr__", &ak::ArrayBuilder::tostring)
       .def("__len__", &ak::ArrayBuilder::length)
       .def("clear", &ak::ArrayBuilder::clear)
       .def("type", &ak::ArrayBuilder::type)
-      .def("snapshot", [](const ak::ArrayBuilder& self) -> py::object {
+      .def("snapshot", [](ak::ArrayBuilder& self, bool finalize) -> py::object {
+        if (finalize) {
+          return box(self.finalize());
+        }
         return box(self.snapshot());
+      }, py::arg("finalize") = false)
+      .def("__getitem__", [](const ak::ArrayBuilder& self, const py::object& obj) -> py::object {
+        // the snapshot is taken with the GIL held; only slicing it runs without
+        std::shared_ptr<ak::Content> snapshot = self.snapshot();
+        return getitem<ak::Content>(*snapshot.get(), obj);
       })
-      .def("__getitem__", &getitem<ak::ArrayBuilder>)
       .def("__iter__", [](const ak::ArrayBuilder& self) -> ak::Iterator {
         return ak::Iterator(self.snapshot());
       })
@@ -652,7 +812,7 @@ py::class_<ak::ArrayBuilder> make_ArrayBuilder(const py::handle& m, const std::s
       .def("extend", [](ak::ArrayBuilder& self, const std::shared_ptr<ak::Content>& array) {
         self.extend(array);
       })
-      .def("fromiter", &builder_fromiter)
+      .def("fromiter", &builder_fromiter, py::arg("obj"), py::arg("releasegil") = false)
   );
 }
 
@@ -755,6 +915,12 @@ ak::Iterator iter(const T& self) {
   return ak::Iterator(self.shallow_copy());
 }
 
+template <>
+ak::Iterator iter(const ak::VirtualArray& self) {
+  // materialize once, rather than once per item
+  return ak::Iterator(self.array());
+}
+
 ak::util::Parameters dict2parameters(const py::object& in) {
   ak::util::Parameters out;
   if (in.is(py::none())) {
@@ -829,7 +995,8 @@ int64_t check_maxdecimals(const py::object& maxdecimals) {
 
 template <typename T>
 std::string tojson_string(const T& self, bool pretty, const py::object& maxdecimals) {
-  return self.tojson(pretty, check_maxdecimals(maxdecimals));
+  int64_t decimals = check_maxdecimals(maxdecimals);
+  return nogil([&]() { return self.tojson(pretty, decimals); });
 }
 
 template <typename T>
@@ -844,7 +1011,9 @@ void tojson_file(const T& self, const std::string& destination, bool pretty, py:
     throw std::invalid_argument(std::string("file \"") + destination + std::string("\" could not be opened for writing"));
   }
   try {
-    self.tojson(file, pretty, check_maxdecimals(maxdecimals), buffersize);
+    int64_t decimals = check_maxdecimals(maxdecimals);
+    py::gil_scoped_release release;
+    self.tojson(file, pretty, decimals, buffersize);
   }
   catch (...) {
     fclose(file);
@@ -853,6 +1022,36 @@ void tojson_file(const T& self, const std::string& destination, bool pretty, py:
   fclose(file);
 }
 
+template <typename T>
+void tojson_stream(const T& self, const py::object& destination, bool lines, py::object maxdecimals, int64_t buffersize) {
+  py::object write;
+  if (py::hasattr(destination, "write")) {
+    write = destination.attr("write");
+  }
+  else if (py::hasattr(destination, "sendall")) {
+    write = destination.attr("sendall");
+  }
+  else {
+    throw std::invalid_argument("destination must be a filename or an object with a 'write' or 'sendall' method");
+  }
+  // text files get str; chunks can split a UTF-8 character, so decode incrementally
+  py::object decoder = py::none();
+  if (py::isinstance(destination, py::module::import("io").attr("TextIOBase"))) {
+    decoder = py::module::import("codecs").attr("getincrementaldecoder")("utf-8")();
+  }
+  int64_t decimals = check_maxdecimals(maxdecimals);
+  py::gil_scoped_release release;
+  self.tojson([&write, &decoder](const char* data, int64_t length) -> void {
+    py::gil_scoped_acquire acquire;
+    if (decoder.is_none()) {
+      write(py::bytes(data, (size_t)length));
+    }
+    else {
+      write(decoder.attr("decode")(py::bytes(data, (size_t)length)));
+    }
+  }, lines, decimals, buffersize);
+}
+
 template <typename T>
 py::class_<T, std::shared_ptr<T>, ak::Content> content_methods(py::class_<T, std::shared_ptr<T>, ak::Content>& x) {
   return x.def("__repr__", &repr<T>)
@@ -875,8 +1074,9 @@ py::class_<T, std::shared_ptr<T>, ak::Content> content_methods(py::class_<T, std
           .def("__iter__", &iter<T>)
           .def("tojson", &tojson_string<T>, py::arg("pretty") = false, py::arg("maxdecimals") = py::none())
           .def("tojson", &tojson_file<T>, py::arg("destination"), py::arg("pretty") = false, py::arg("maxdecimals") = py::none(), py::arg("buffersize") = 65536)
+          .def("tojson", &tojson_stream<T>, py::arg("destination"), py::arg("lines"), py::arg("maxdecimals") = py::none(), py::arg("buffersize") = 65536)
           .def_property_readonly("nbytes", &T::nbytes)
-          .def("deep_copy", &T::deep_copy, py::arg("copyarrays") = true, py::arg("copyindexes") = true, py::arg("copyidentities") = true)
+          .def("deep_copy", &T::deep_copy, py::arg("copyarrays") = true, py::arg("copyindexes") = true, py::arg("copyidentities") = true, py::call_guard<py::gil_scoped_release>())
           .def_property_readonly("identity", &identity<T>)
           .def_property_readonly("numfields", &T::numfields)
           .def("fieldindex", &T::fieldindex)
@@ -902,65 +1102,67 @@ py::class_<T, std::shared_ptr<T>, ak::Content> content_methods(py::class_<T, std
             }
           })
           .def("num", [](const T& self, int64_t axis) -> py::object {
-            return box(self.num(axis, 0));
+            return box(nogil([&]() { return self.num(axis, 0); }));
           }, py::arg("axis") = 1)
           .def("flatten", [](const T& self, int64_t axis) -> py::object {
-            std::pair<ak::Index64, std::shared_ptr<ak::Content>> pair = self.offsets_and_flattened(axis, 0);
+            std::pair<ak::Index64, std::shared_ptr<ak::Content>> pair = nogil([&]() { return self.offsets_and_flattened(axis, 0); });
             return box(pair.second);
           }, py::arg("axis") = 1)
           .def("offsets_and_flatten", [](const T& self, int64_t axis) -> py::object {
-            std::pair<ak::Index64, std::shared_ptr<ak::Content>> pair = self.offsets_and_flattened(axis, 0);
+            std::pair<ak::Index64, std::shared_ptr<ak::Content>> pair = nogil([&]() { return self.offsets_and_flattened(axis, 0); });
             return py::make_tuple(py::cast(pair.first), box(pair.second));
           }, py::arg("axis") = 1)
           .def("rpad", [](const T&self, int64_t length, int64_t axis) -> py::object {
-            return box(self.rpad(length, axis, 0));
+            return box(nogil([&]() { return self.rpad(length, axis, 0); }));
           })
           .def("rpad_and_clip", [](const T&self, int64_t length, int64_t axis) -> py::object {
-            return box(self.rpad_and_clip(length, axis, 0));
+            return box(nogil([&]() { return self.rpad_and_clip(length, axis, 0); }));
           })
           .def("mergeable", [](const T& self, const py::object& other, bool mergebool) -> bool {
             return self.mergeable(unbox_content(other), mergebool);
           }, py::arg("other"), py::arg("mergebool") = false)
           .def("merge", [](const T& self, const py::object& other) -> py::object {
-            return box(self.merge(unbox_content(other)));
+            std::shared_ptr<ak::Content> content = unbox_content(other);
+            return box(nogil([&]() { return self.merge(content); }));
           })
           .def("merge_as_union", [](const T& self, const py::object& other) -> py::object {
-            return box(self.merge_as_union(unbox_content(other)));
+            std::shared_ptr<ak::Content> content = unbox_content(other);
+            return box(nogil([&]() { return self.merge_as_union(content); }));
           })
           .def("count", [](const T& self, int64_t axis, bool mask, bool keepdims) -> py::object {
             ak::ReducerCount reducer;
-            return box(self.reduce(reducer, axis, mask, keepdims));
+            return box(nogil([&]() { return self.reduce(reducer, axis, mask, keepdims); }));
           }, py::arg("axis") = -1, py::arg("mask") = false, py::arg("keepdims") = false)
           .def("count_nonzero", [](const T& self, int64_t axis, bool mask, bool keepdims) -> py::object {
             ak::ReducerCountNonzero reducer;
-            return box(self.reduce(reducer, axis, mask, keepdims));
+            return box(nogil([&]() { return self.reduce(reducer, axis, mask, keepdims); }));
           }, py::arg("axis") = -1, py::arg("mask") = false, py::arg("keepdims") = false)
           .def("sum", [](const T& self, int64_t axis, bool mask, bool keepdims) -> py::object {
             ak::ReducerSum reducer;
-            return box(self.reduce(reducer, axis, mask, keepdims));
+            return box(nogil([&]() { return self.reduce(reducer, axis, mask, keepdims); }));
           }, py::arg("axis") = -1, py::arg("mask") = false, py::arg("keepdims") = false)
           .def("prod", [](const T& self, int64_t axis, bool mask, bool keepdims) -> py::object {
             ak::ReducerProd reducer;
-            return box(self.reduce(reducer, axis, mask, keepdims));
+            return box(nogil([&]() { return self.reduce(reducer, axis, mask, keepdims); }));
           }, py::arg("axis") = -1, py::arg("mask") = false, py::arg("keepdims") = false)
           .def("any", [](const T& self, int64_t axis, bool mask, bool keepdims) -> py::object {
             ak::ReducerAny reducer;
-            return box(self.reduce(reducer, axis, mask, keepdims));
+            return box(nogil([&]() { return self.reduce(reducer, axis, mask, keepdims); }));
           }, py::arg("axis") = -1, py::arg("mask") = false, py::arg("keepdims") = false)
           .def("all", [](const T& self, int64_t axis, bool mask, bool keepdims) -> py::object {
             ak::ReducerAll reducer;
-            return box(self.reduce(reducer, axis, mask, keepdims));
+            return box(nogil([&]() { return self.reduce(reducer, axis, mask, keepdims); }));
           }, py::arg("axis") = -1, py::arg("mask") = false, py::arg("keepdims") = false)
           .def("min", [](const T& self, int64_t axis, bool mask, bool keepdims) -> py::object {
             ak::ReducerMin reducer;
-            return box(self.reduce(reducer, axis, mask, keepdims));
+            return box(nogil([&]() { return self.reduce(reducer, axis, mask, keepdims); }));
           }, py::arg("axis") = -1, py::arg("mask") = true, py::arg("keepdims") = false)
           .def("max", [](const T& self, int64_t axis, bool mask, bool keepdims) -> py::object {
             ak::ReducerMax reducer;
-            return box(self.reduce(reducer, axis, mask, keepdims));
+            return box(nogil([&]() { return self.reduce(reducer, axis, mask, keepdims); }));
           }, py::arg("axis") = -1, py::arg("mask") = true, py::arg("keepdims") = false)
           .def("localindex", [](const T& self, int64_t axis) -> py::object {
-            return box(self.localindex(axis, 0));
+            return box(nogil([&]() { return self.localindex(axis, 0); }));
           }, py::arg("axis") = 1)
           .def("choose", [](const T& self, int64_t n, bool diagonal, py::object keys, py::object parameters, int64_t axis) -> py::object {
             std::shared_ptr<ak::util::RecordLookup> recordlookup(nullptr);
@@ -973,7 +1175,8 @@ py::class_<T, std::shared_ptr<T>, ak::Content> content_methods(py::class_<T, std
                 throw std::invalid_argument("if provided, the length of 'keys' must be 'n'");
               }
             }
-            return box(self.choose(n, diagonal, recordlookup, dict2parameters(parameters), axis, 0));
+            ak::util::Parameters params = dict2parameters(parameters);
+            return box(nogil([&]() { return self.choose(n, diagonal, recordlookup, params, axis, 0); }));
           }, py::arg("n"), py::arg("diagonal") = false, py::arg("keys") = py::none(), py::arg("parameters") = py::none(), py::arg("axis") = 1)
 
   ;
@@ -992,6 +1195,11 @@ py::class_<ak::EmptyArray, std::shared_ptr<ak::EmptyArray>, ak::Content> make_Em
       .def("simplify", [](const ak::EmptyArray& self) {
         return box(self.shallow_simplify());
       })
+      .def(py::pickle([](const ak::EmptyArray& self) {
+        return py::make_tuple(box(self.identities()), getparameters(self));
+      }, [](const py::tuple& state) {
+        return ak::EmptyArray(unbox_identities_none(state[0]), dict2parameters(state[1]));
+      }))
   );
 }
 
@@ -1007,6 +1215,8 @@ py::class_<ak::IndexedArrayOf<T, ISOPTION>, std::shared_ptr<ak::IndexedArrayOf<T
       .def_property_readonly("index", &ak::IndexedArrayOf<T, ISOPTION>::index)
       .def_property_readonly("content", &ak::IndexedArrayOf<T, ISOPTION>::content)
       .def_property_readonly("isoption", &ak::IndexedArrayOf<T, ISOPTION>::isoption)
+      .def_property_readonly("isdeferred", &ak::IndexedArrayOf<T, ISOPTION>::isdeferred)
+      .def_property_readonly("iscategorical", &ak::IndexedArrayOf<T, ISOPTION>::iscategorical)
       .def("project", [](const ak::IndexedArrayOf<T, ISOPTION>& self, const py::object& mask) {
         if (mask.is(py::none())) {
           return box(self.project());
@@ -1019,6 +1229,11 @@ py::class_<ak::IndexedArrayOf<T, ISOPTION>, std::shared_ptr<ak::IndexedArrayOf<T
       .def("simplify", [](const ak::IndexedArrayOf<T, ISOPTION>& self) {
         return box(self.simplify_optiontype());
       })
+      .def(py::pickle([](const ak::IndexedArrayOf<T, ISOPTION>& self) {
+        return py::make_tuple(py::cast(self.index()), box(self.content()), box(self.identities()), getparameters(self));
+      }, [](const py::tuple& state) {
+        return ak::IndexedArrayOf<T, ISOPTION>(unbox_identities_none(state[2]), dict2parameters(state[3]), state[0].cast<ak::IndexOf<T>>(), unbox_content(state[1]));
+      }))
   );
 }
 
@@ -1051,6 +1266,11 @@ py::class_<ak::ByteMaskedArray, std::shared_ptr<ak::ByteMaskedArray>, ak::Conten
       .def("simplify", [](const ak::ByteMaskedArray& self) {
         return box(self.simplify_optiontype());
       })
+      .def(py::pickle([](const ak::ByteMaskedArray& self) {
+        return py::make_tuple(py::cast(self.mask()), box(self.content()), py::cast(self.validwhen()), box(self.identities()), getparameters(self));
+      }, [](const py::tuple& state) {
+        return ak::ByteMaskedArray(unbox_identities_none(state[3]), dict2parameters(state[4]), state[0].cast<ak::Index8>(), unbox_content(state[1]), state[2].cast<bool>());
+      }))
   );
 }
 
@@ -1080,6 +1300,11 @@ py::class_<ak::BitMaskedArray, std::shared_ptr<ak::BitMaskedArray>, ak::Content>
       })
       .def("toByteMaskedArray", &ak::BitMaskedArray::toByteMaskedArray)
       .def("toIndexedOptionArray64", &ak::BitMaskedArray::toIndexedOptionArray64)
+      .def(py::pickle([](const ak::BitMaskedArray& self) {
+        return py::make_tuple(py::cast(self.mask()), box(self.content()), py::cast(self.validwhen()), py::cast(self.length()), py::cast(self.lsb_order()), box(self.identities()), getparameters(self));
+      }, [](const py::tuple& state) {
+        return ak::BitMaskedArray(unbox_identities_none(state[5]), dict2parameters(state[6]), state[0].cast<ak::IndexU8>(), unbox_content(state[1]), state[2].cast<bool>(), state[3].cast<int64_t>(), state[4].cast<bool>());
+      }))
   );
 }
 
@@ -1104,6 +1329,11 @@ py::class_<ak::UnmaskedArray, std::shared_ptr<ak::UnmaskedArray>, ak::Content> m
       .def("simplify", [](const ak::UnmaskedArray& self) {
         return box(self.simplify_optiontype());
       })
+      .def(py::pickle([](const ak::UnmaskedArray& self) {
+        return py::make_tuple(box(self.content()), box(self.identities()), getparameters(self));
+      }, [](const py::tuple& state) {
+        return ak::UnmaskedArray(unbox_identities_none(state[1]), dict2parameters(state[2]), unbox_content(state[0]));
+      }))
   );
 }
 
@@ -1125,6 +1355,11 @@ py::class_<ak::ListArrayOf<T>, std::shared_ptr<ak::ListArrayOf<T>>, ak::Content>
       .def("simplify", [](const ak::ListArrayOf<T>& self) {
         return box(self.shallow_simplify());
       })
+      .def(py::pickle([](const ak::ListArrayOf<T>& self) {
+        return py::make_tuple(py::cast(self.starts()), py::cast(self.stops()), box(self.content()), box(self.identities()), getparameters(self));
+      }, [](const py::tuple& state) {
+        return ak::ListArrayOf<T>(unbox_identities_none(state[3]), dict2parameters(state[4]), state[0].cast<ak::IndexOf<T>>(), state[1].cast<ak::IndexOf<T>>(), unbox_content(state[2]));
+      }))
   );
 }
 
@@ -1151,6 +1386,11 @@ py::class_<ak::ListOffsetArrayOf<T>, std::shared_ptr<ak::ListOffsetArrayOf<T>>,
       .def("simplify", [](const ak::ListOffsetArrayOf<T>& self) {
         return box(self.shallow_simplify());
       })
+      .def(py::pickle([](const ak::ListOffsetArrayOf<T>& self) {
+        return py::make_tuple(py::cast(self.offsets()), box(self.content()), box(self.identities()), getparameters(self));
+      }, [](const py::tuple& state) {
+        return ak::ListOffsetArrayOf<T>(unbox_identities_none(state[2]), dict2parameters(state[3]), state[0].cast<ak::IndexOf<T>>(), unbox_content(state[1]));
+      }))
   );
 }
 
@@ -1160,6 +1400,23 @@ template py::class_<ak::ListOffsetArray64, std::shared_ptr<ak::ListOffsetArray64
 
 /////////////////////////////////////////////////////////////// NumpyArray
 
+ak::NumpyArray array_to_NumpyArray(py::array& array, const py::object& identities, const py::object& parameters) {
+  py::buffer_info info = array.request();
+  if (info.ndim == 0) {
+    throw std::invalid_argument("NumpyArray must not be scalar; try array.reshape(1)");
+  }
+  if (info.shape.size() != info.ndim  ||  info.strides.size() != info.ndim) {
+    throw std::invalid_argument("NumpyArray len(shape) != ndim or len(strides) != ndim");
+  }
+  return ak::NumpyArray(unbox_identities_none(identities), dict2parameters(parameters), std::shared_ptr<void>(
+    reinterpret_cast<void*>(info.ptr), pyobject_deleter<void>(array.ptr())),
+    info.shape,
+    info.strides,
+    0,
+    info.itemsize,
+    info.format);
+}
+
 py::class_<ak::NumpyArray, std::shared_ptr<ak::NumpyArray>, ak::Content> make_NumpyArray(const py::handle& m, const std::string& name) {
   return content_methods(py::class_<ak::NumpyArray, std::shared_ptr<ak::NumpyArray>, ak::Content>(m, name.c_str(), py::buffer_protocol())
       .def_buffer([](const ak::NumpyArray& self) -> py::buffer_info {
@@ -1172,22 +1429,7 @@ py::class_<ak::NumpyArray, std::shared_ptr<ak::NumpyArray>, ak::Content> make_Nu
           self.strides());
       })
 
-      .def(py::init([](py::array& array, const py::object& identities, const py::object& parameters) -> ak::NumpyArray {
-        py::buffer_info info = array.request();
-        if (info.ndim == 0) {
-          throw std::invalid_argument("NumpyArray must not be scalar; try array.reshape(1)");
-        }
-        if (info.shape.size() != info.ndim  ||  info.strides.size() != info.ndim) {
-          throw std::invalid_argument("NumpyArray len(shape) != ndim or len(strides) != ndim");
-        }
-        return ak::NumpyArray(unbox_identities_none(identities), dict2parameters(parameters), std::shared_ptr<void>(
-          reinterpret_cast<void*>(info.ptr), pyobject_deleter<void>(array.ptr())),
-          info.shape,
-          info.strides,
-          0,
-          info.itemsize,
-          info.format);
-      }), py::arg("array"), py::arg("identities") = py::none(), py::arg("parameters") = py::none())
+      .def(py::init(&array_to_NumpyArray), py::arg("array"), py::arg("identities") = py::none(), py::arg("parameters") = py::none())
 
       .def_property_readonly("shape", &ak::NumpyArray::shape)
       .def_property_readonly("strides", &ak::NumpyArray::strides)
@@ -1203,6 +1445,13 @@ py::class_<ak::NumpyArray, std::shared_ptr<ak::NumpyArray>, ak::Content> make_Nu
       .def("simplify", [](const ak::NumpyArray& self) {
         return box(self.shallow_simplify());
       })
+      .def(py::pickle([](const ak::NumpyArray& self) {
+        // NumPy pickles the (possibly strided) view; contiguous views go out-of-band in protocol 5
+        return py::make_tuple(py::module::import("numpy").attr("asarray")(py::cast(self)), box(self.identities()), getparameters(self));
+      }, [](const py::tuple& state) {
+        py::array array = state[0].cast<py::array>();
+        return array_to_NumpyArray(array, state[1], state[2]);
+      }))
   );
 }
 
@@ -1225,6 +1474,7 @@ py::class_<ak::Record, std::shared_ptr<ak::Record>> make_Record(const py::handle
       .def("purelist_parameter", &purelist_parameter<ak::Record>)
       .def("tojson", &tojson_string<ak::Record>, py::arg("pretty") = false, py::arg("maxdecimals") = py::none())
       .def("tojson", &tojson_file<ak::Record>, py::arg("destination"), py::arg("pretty") = false, py::arg("maxdecimals") = py::none(), py::arg("buffersize") = 65536)
+      .def("tojson", &tojson_stream<ak::Record>, py::arg("destination"), py::arg("lines"), py::arg("maxdecimals") = py::none(), py::arg("buffersize") = 65536)
 
       .def_property_readonly("array", [](const ak::Record& self) -> std::shared_ptr<const ak::RecordArray> { return self.array(); })
       .def_property_readonly("at", &ak::Record::at)
@@ -1266,6 +1516,11 @@ py::class_<ak::Record, std::shared_ptr<ak::Record>> make_Record(const py::handle
      .def("simplify", [](const ak::Record& self) {
        return box(self.shallow_simplify());
      })
+     .def(py::pickle([](const ak::Record& self) {
+       return py::make_tuple(py::cast(self.array()), py::cast(self.at()));
+     }, [](const py::tuple& state) {
+       return ak::Record(state[0].cast<std::shared_ptr<ak::RecordArray>>(), state[1].cast<int64_t>());
+     }))
 
   ;
 }
@@ -1294,6 +1549,21 @@ ak::RecordArray iterable_to_RecordArray(const py::iterable& contents, const py::
   }
 }
 
+py::object recordlookup2list(const ak::RecordArray& self) {
+  std::shared_ptr<ak::util::RecordLookup> recordlookup = self.recordlookup();
+  if (recordlookup.get() == nullptr) {
+    return py::none();
+  }
+  else {
+    py::list out;
+    for (auto x : *recordlookup.get()) {
+      py::str pyvalue(PyUnicode_DecodeUTF8(x.data(), x.length(), "surrogateescape"));
+      out.append(pyvalue);
+    }
+    return out;
+  }
+}
+
 py::class_<ak::RecordArray, std::shared_ptr<ak::RecordArray>, ak::Content> make_RecordArray(const py::handle& m, const std::string& name) {
   return content_methods(py::class_<ak::RecordArray, std::shared_ptr<ak::RecordArray>, ak::Content>(m, name.c_str())
       .def(py::init([](const py::dict& contents, const py::object& length, const py::object& identities, const py::object& parameters) -> ak::RecordArray {
@@ -1314,20 +1584,7 @@ py::class_<ak::RecordArray, std::shared_ptr<ak::RecordArray>, ak::Content> make_
       }), py::arg("contents"), py::arg("length") = py::none(), py::arg("identities") = py::none(), py::arg("parameters") = py::none())
       .def(py::init(&iterable_to_RecordArray), py::arg("contents"), py::arg("keys") = py::none(), py::arg("length") = py::none(), py::arg("identities") = py::none(), py::arg("parameters") = py::none())
 
-      .def_property_readonly("recordlookup", [](const ak::RecordArray& self) -> py::object {
-        std::shared_ptr<ak::util::RecordLookup> recordlookup = self.recordlookup();
-        if (recordlookup.get() == nullptr) {
-          return py::none();
-        }
-        else {
-          py::list out;
-          for (auto x : *recordlookup.get()) {
-            py::str pyvalue(PyUnicode_DecodeUTF8(x.data(), x.length(), "surrogateescape"));
-            out.append(pyvalue);
-          }
-          return out;
-        }
-      })
+      .def_property_readonly("recordlookup", &recordlookup2list)
       .def_property_readonly("istuple", &ak::RecordArray::istuple)
       .def_property_readonly("contents", &ak::RecordArray::contents)
       .def("setitem_field", [](const ak::RecordArray& self, const py::object& where, const py::object& what) -> py::object {
@@ -1383,6 +1640,21 @@ py::class_<ak::RecordArray, std::shared_ptr<ak::RecordArray>, ak::Content> make_
       .def("simplify", [](const ak::RecordArray& self) {
         return box(self.shallow_simplify());
       })
+      .def(py::pickle([](const ak::RecordArray& self) {
+        py::list contents;
+        for (auto item : self.contents()) {
+          ak::IndexedArray64* indexed = dynamic_cast<ak::IndexedArray64*>(item.get());
+          if (indexed != nullptr  &&  indexed->isdeferred()) {
+            contents.append(box(indexed->project()));
+          }
+          else {
+            contents.append(box(item));
+          }
+        }
+        return py::make_tuple(contents, recordlookup2list(self), py::cast(self.length()), box(self.identities()), getparameters(self));
+      }, [](const py::tuple& state) {
+        return iterable_to_RecordArray(state[0].cast<py::iterable>(), state[1], state[2], state[3], state[4]);
+      }))
 
   );
 }
@@ -1402,6 +1674,11 @@ py::class_<ak::RegularArray, std::shared_ptr<ak::RegularArray>, ak::Content> mak
       .def("simplify", [](const ak::RegularArray& self) {
         return box(self.shallow_simplify());
       })
+      .def(py::pickle([](const ak::RegularArray& self) {
+        return py::make_tuple(box(self.content()), py::cast(self.size()), box(self.identities()), getparameters(self));
+      }, [](const py::tuple& state) {
+        return ak::RegularArray(unbox_identities_none(state[2]), dict2parameters(state[3]), unbox_content(state[0]), state[1].cast<int64_t>());
+      }))
   );
 }
 
@@ -1428,6 +1705,19 @@ py::class_<ak::UnionArrayOf<T, I>, std::shared_ptr<ak::UnionArrayOf<T, I>>, ak::
       .def("simplify", [](const ak::UnionArrayOf<T, I>& self, bool mergebool) -> py::object {
         return box(self.simplify_uniontype(mergebool));
       }, py::arg("mergebool") = false)
+      .def(py::pickle([](const ak::UnionArrayOf<T, I>& self) {
+        py::list contents;
+        for (auto item : self.contents()) {
+          contents.append(box(item));
+        }
+        return py::make_tuple(py::cast(self.tags()), py::cast(self.index()), contents, box(self.identities()), getparameters(self));
+      }, [](const py::tuple& state) {
+        std::vector<std::shared_ptr<ak::Content>> contents;
+        for (auto content : state[2].cast<py::iterable>()) {
+          contents.push_back(unbox_content(content));
+        }
+        return ak::UnionArrayOf<T, I>(unbox_identities_none(state[3]), dict2parameters(state[4]), state[0].cast<ak::IndexOf<T>>(), state[1].cast<ak::IndexOf<I>>(), contents);
+      }))
 
   );
 }
@@ -1435,3 +1725,309 @@ py::class_<ak::UnionArrayOf<T, I>, std::shared_ptr<ak::UnionArrayOf<T, I>>, ak::
 template py::class_<ak::UnionArray8_32, std::shared_ptr<ak::UnionArray8_32>, ak::Content> make_UnionArrayOf(const py::handle& m, const std::string& name);
 template py::class_<ak::UnionArray8_U32, std::shared_ptr<ak::UnionArray8_U32>, ak::Content> make_UnionArrayOf(const py::handle& m, const std::string& name);
 template py::class_<ak::UnionArray8_64, std::shared_ptr<ak::UnionArray8_64>, ak::Content> make_UnionArrayOf(const py::handle& m, const std::string& name);
+
+/////////////////////////////////////////////////////////////// VirtualArray
+
+PyArrayGenerator::PyArrayGenerator(const std::shared_ptr<ak::Type>& type, int64_t length, const py::object& callable, const py::tuple& args, const py::dict& kwargs)
+    : ak::ArrayGenerator(type, length)
+    , callable_(callable)
+    , args_(args)
+    , kwargs_(kwargs) { }
+
+const py::object PyArrayGenerator::callable() const {
+  return callable_;
+}
+
+const py::tuple PyArrayGenerator::args() const {
+  return args_;
+}
+
+const py::dict PyArrayGenerator::kwargs() const {
+  return kwargs_;
+}
+
+const std::shared_ptr<ak::Content> PyArrayGenerator::generate() const {
+  py::gil_scoped_acquire acquire;
+  py::object out = callable_(*args_, **kwargs_);
+  if (py::isinstance(out, py::module::import("awkward1").attr("Array"))) {
+    out = out.attr("layout");
+  }
+  return unbox_content(out);
+}
+
+const std::string PyArrayGenerator::tostring_part(const std::string& indent, const std::string& pre, const std::string& post) const {
+  py::gil_scoped_acquire acquire;
+  std::stringstream out;
+  out << indent << pre << "<ArrayGenerator f=" << ak::util::quote(py::repr(callable_).cast<std::string>(), true);
+  if (py::len(args_) != 0) {
+    out << " args=" << ak::util::quote(py::repr(args_).cast<std::string>(), true);
+  }
+  if (py::len(kwargs_) != 0) {
+    out << " kwargs=" << ak::util::quote(py::repr(kwargs_).cast<std::string>(), true);
+  }
+  if (length_ >= 0) {
+    out << " length=\"" << length_ << "\"";
+  }
+  if (type_.get() != nullptr) {
+    out << " type=" << ak::util::quote(type_.get()->tostring(), true);
+  }
+  out << "/>" << post;
+  return out.str();
+}
+
+const std::shared_ptr<ak::ArrayGenerator> PyArrayGenerator::shallow_copy() const {
+  return std::make_shared<PyArrayGenerator>(type_, length_, callable_, args_, kwargs_);
+}
+
+py::object box(const std::shared_ptr<ak::ArrayGenerator>& generator) {
+  if (std::shared_ptr<PyArrayGenerator> raw = std::dynamic_pointer_cast<PyArrayGenerator>(generator)) {
+    return py::cast(raw);
+  }
+  else if (std::shared_ptr<ak::SliceGenerator> raw = std::dynamic_pointer_cast<ak::SliceGenerator>(generator)) {
+    return py::cast(raw);
+  }
+  else {
+    throw std::runtime_error("missing boxer for ArrayGenerator subtype");
+  }
+}
+
+std::shared_ptr<ak::Type> unbox_type_none(const py::object& type) {
+  if (type.is(py::none())) {
+    return std::shared_ptr<ak::Type>(nullptr);
+  }
+  try {
+    return type.cast<ak::Type*>()->shallow_copy();
+  }
+  catch (py::cast_error err) {
+    throw std::invalid_argument("type must be an awkward1.types.Type or None");
+  }
+}
+
+std::shared_ptr<ak::ArrayGenerator> unbox_generator(const py::object& generator) {
+  try {
+    return generator.cast<std::shared_ptr<PyArrayGenerator>>();
+  }
+  catch (py::cast_error err) { }
+  try {
+    return generator.cast<std::shared_ptr<ak::SliceGenerator>>();
+  }
+  catch (py::cast_error err) { }
+  if (PyCallable_Check(generator.ptr())) {
+    return std::make_shared<PyArrayGenerator>(std::shared_ptr<ak::Type>(nullptr), -1, generator, py::tuple(0), py::dict());
+  }
+  throw std::invalid_argument("generator must be an ArrayGenerator or a callable");
+}
+
+template <typename T>
+py::object generator_type(const T& self) {
+  if (self.type().get() == nullptr) {
+    return py::none();
+  }
+  return py::cast(self.type());
+}
+
+template <typename T>
+py::object generator_length(const T& self) {
+  if (self.length() < 0) {
+    return py::none();
+  }
+  return py::cast(self.length());
+}
+
+py::class_<PyArrayGenerator, std::shared_ptr<PyArrayGenerator>> make_PyArrayGenerator(const py::handle& m, const std::string& name) {
+  return py::class_<PyArrayGenerator, std::shared_ptr<PyArrayGenerator>>(m, name.c_str())
+      .def(py::init([](const py::object& callable, const py::object& args, const py::object& kwargs, const py::object& type, const py::object& length) -> PyArrayGenerator {
+        if (!PyCallable_Check(callable.ptr())) {
+          throw std::invalid_argument("ArrayGenerator callable must be callable");
+        }
+        std::shared_ptr<ak::Type> t = unbox_type_none(type);
+        int64_t len = (length.is(py::none()) ? -1 : length.cast<int64_t>());
+        if (ak::ArrayType* raw = dynamic_cast<ak::ArrayType*>(t.get())) {
+          if (len < 0) {
+            len = raw->length();
+          }
+          else if (len != raw->length()) {
+            throw std::invalid_argument("ArrayGenerator length does not agree with the length of its ArrayType");
+          }
+          t = raw->type();
+        }
+        py::dict kw;
+        if (!kwargs.is(py::none())) {
+          kw = py::dict(kwargs);
+        }
+        return PyArrayGenerator(t, len, callable, py::tuple(args), kw);
+      }), py::arg("callable"), py::arg("args") = py::tuple(0), py::arg("kwargs") = py::none(), py::arg("type") = py::none(), py::arg("length") = py::none())
+      .def_property_readonly("callable", &PyArrayGenerator::callable)
+      .def_property_readonly("args", &PyArrayGenerator::args)
+      .def_property_readonly("kwargs", &PyArrayGenerator::kwargs)
+      .def_property_readonly("type", &generator_type<PyArrayGenerator>)
+      .def_property_readonly("length", &generator_length<PyArrayGenerator>)
+      .def("__call__", [](const PyArrayGenerator& self) -> py::object {
+        return box(self.generate_and_check());
+      })
+      .def("__repr__", &PyArrayGenerator::tostring);
+}
+
+py::class_<ak::SliceGenerator, std::shared_ptr<ak::SliceGenerator>> make_SliceGenerator(const py::handle& m, const std::string& name) {
+  return py::class_<ak::SliceGenerator, std::shared_ptr<ak::SliceGenerator>>(m, name.c_str())
+      .def(py::init([](const py::object& content, int64_t start, int64_t stop) -> ak::SliceGenerator {
+        std::shared_ptr<ak::Content> c = unbox_content(content);
+        int64_t regular_start = start;
+        int64_t regular_stop = stop;
+        awkward_regularize_rangeslice(&regular_start, &regular_stop, true, true, true, c.get()->length());
+        std::shared_ptr<ak::Type> t(nullptr);
+        if (ak::VirtualArray* raw = dynamic_cast<ak::VirtualArray*>(c.get())) {
+          t = raw->generator().get()->type();
+        }
+        return ak::SliceGenerator(t, regular_stop - regular_start, c, regular_start, regular_stop);
+      }), py::arg("content"), py::arg("start"), py::arg("stop"))
+      .def_property_readonly("content", [](const ak::SliceGenerator& self) -> py::object {
+        return box(self.content());
+      })
+      .def_property_readonly("start", &ak::SliceGenerator::start)
+      .def_property_readonly("stop", &ak::SliceGenerator::stop)
+      .def_property_readonly("type", &generator_type<ak::SliceGenerator>)
+      .def_property_readonly("length", &generator_length<ak::SliceGenerator>)
+      .def("__call__", [](const ak::SliceGenerator& self) -> py::object {
+        return box(self.generate_and_check());
+      })
+      .def("__repr__", &ak::SliceGenerator::tostring);
+}
+
+PyArrayCache::PyArrayCache(const py::object& mutablemapping)
+    : mutablemapping_(mutablemapping) { }
+
+const py::object PyArrayCache::mutablemapping() const {
+  return mutablemapping_;
+}
+
+const std::shared_ptr<ak::Content> PyArrayCache::get(const std::string& key) {
+  py::gil_scoped_acquire acquire;
+  try {
+    return unbox_content(mutablemapping_.attr("__getitem__")(py::str(key)));
+  }
+  catch (py::error_already_set err) {
+    if (err.matches(PyExc_KeyError)) {
+      return std::shared_ptr<ak::Content>(nullptr);
+    }
+    throw;
+  }
+}
+
+void PyArrayCache::set(const std::string& key, const std::shared_ptr<ak::Content>& value) {
+  py::gil_scoped_acquire acquire;
+  mutablemapping_.attr("__setitem__")(py::str(key), box(value));
+}
+
+const std::string PyArrayCache::tostring_part(const std::string& indent, const std::string& pre, const std::string& post) const {
+  py::gil_scoped_acquire acquire;
+  std::stringstream out;
+  out << indent << pre << "<ArrayCache mutablemapping=" << ak::util::quote(py::repr(mutablemapping_).cast<std::string>(), true) << "/>" << post;
+  return out.str();
+}
+
+py::object box(const std::shared_ptr<ak::ArrayCache>& cache) {
+  if (cache.get() == nullptr) {
+    return py::none();
+  }
+  else if (std::shared_ptr<ak::LRUCache> raw = std::dynamic_pointer_cast<ak::LRUCache>(cache)) {
+    return py::cast(raw);
+  }
+  else if (std::shared_ptr<PyArrayCache> raw = std::dynamic_pointer_cast<PyArrayCache>(cache)) {
+    return py::cast(raw);
+  }
+  else {
+    throw std::runtime_error("missing boxer for ArrayCache subtype");
+  }
+}
+
+std::shared_ptr<ak::ArrayCache> unbox_cache_none(const py::object& cache) {
+  if (cache.is(py::none())) {
+    return std::shared_ptr<ak::ArrayCache>(nullptr);
+  }
+  try {
+    return cache.cast<std::shared_ptr<ak::LRUCache>>();
+  }
+  catch (py::cast_error err) { }
+  try {
+    return cache.cast<std::shared_ptr<PyArrayCache>>();
+  }
+  catch (py::cast_error err) { }
+  // any other MutableMapping (dict, cachetools.LRUCache, etc.)
+  return std::make_shared<PyArrayCache>(cache);
+}
+
+py::class_<PyArrayCache, std::shared_ptr<PyArrayCache>> make_PyArrayCache(const py::handle& m, const std::string& name) {
+  return py::class_<PyArrayCache, std::shared_ptr<PyArrayCache>>(m, name.c_str())
+      .def(py::init([](const py::object& mutablemapping) -> std::shared_ptr<PyArrayCache> {
+        return std::make_shared<PyArrayCache>(mutablemapping);
+      }), py::arg("mutablemapping"))
+      .def_property_readonly("mutablemapping", &PyArrayCache::mutablemapping)
+      .def("__repr__", [](const PyArrayCache& self) -> std::string {
+        return self.tostring_part("", "", "");
+      });
+}
+
+py::class_<ak::LRUCache, std::shared_ptr<ak::LRUCache>> make_LRUCache(const py::handle& m, const std::string& name) {
+  return py::class_<ak::LRUCache, std::shared_ptr<ak::LRUCache>>(m, name.c_str())
+      .def(py::init([](int64_t maxbytes) -> std::shared_ptr<ak::LRUCache> {
+        return std::make_shared<ak::LRUCache>(maxbytes);
+      }), py::arg("maxbytes"))
+      .def_property_readonly("maxbytes", &ak::LRUCache::maxbytes)
+      .def_property_readonly("nbytes", &ak::LRUCache::nbytes)
+      .def("__len__", &ak::LRUCache::length)
+      .def("__contains__", &ak::LRUCache::has)
+      .def("keys", &ak::LRUCache::keys)
+      .def("clear", &ak::LRUCache::clear)
+      .def("__getitem__", [](ak::LRUCache& self, const std::string& key) -> py::object {
+        std::shared_ptr<ak::Content> out = self.get(key);
+        if (out.get() == nullptr) {
+          throw py::key_error(key);
+        }
+        return box(out);
+      })
+      .def("__setitem__", [](ak::LRUCache& self, const std::string& key, const py::object& value) -> void {
+        self.set(key, unbox_content(value));
+      })
+      .def("__repr__", [](const ak::LRUCache& self) -> std::string {
+        return self.tostring_part("", "", "");
+      });
+}
+
+py::class_<ak::VirtualArray, std::shared_ptr<ak::VirtualArray>, ak::Content> make_VirtualArray(const py::handle& m, const std::string& name) {
+  return content_methods(py::class_<ak::VirtualArray, std::shared_ptr<ak::VirtualArray>, ak::Content>(m, name.c_str())
+      .def(py::init([](const py::object& generator, const py::object& cache, const py::object& cache_key, const py::object& identities, const py::object& parameters) -> ak::VirtualArray {
+        std::shared_ptr<ak::ArrayGenerator> gen = unbox_generator(generator);
+        ak::util::Parameters params;
+        if (parameters.is(py::none())  &&  gen.get()->type().get() != nullptr) {
+          params = gen.get()->type().get()->parameters();
+        }
+        else {
+          params = dict2parameters(parameters);
+        }
+        if (cache_key.is(py::none())) {
+          return ak::VirtualArray(unbox_identities_none(identities), params, gen, unbox_cache_none(cache));
+        }
+        else {
+          return ak::VirtualArray(unbox_identities_none(identities), params, gen, unbox_cache_none(cache), cache_key.cast<std::string>());
+        }
+      }), py::arg("generator"), py::arg("cache") = py::none(), py::arg("cache_key") = py::none(), py::arg("identities") = py::none(), py::arg("parameters") = py::none())
+      .def_property_readonly("generator", [](const ak::VirtualArray& self) -> py::object {
+        return box(self.generator());
+      })
+      .def_property_readonly("cache", [](const ak::VirtualArray& self) -> py::object {
+        return box(self.cache());
+      })
+      .def_property_readonly("cache_key", &ak::VirtualArray::cache_key)
+      .def_property_readonly("peek_array", [](const ak::VirtualArray& self) -> py::object {
+        std::shared_ptr<ak::Content> out = self.peek_array();
+        if (out.get() == nullptr) {
+          return py::none();
+        }
+        return box(out);
+      })
+      .def_property_readonly("array", [](const ak::VirtualArray& self) -> py::object {
+        return box(self.array());
+      })
+  );
+}
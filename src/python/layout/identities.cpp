@@ -9,6 +9,18 @@
 
 template <typename T>
 py::class_<ak::IdentitiesOf<T>> make_IdentitiesOf(const py::handle& m, const std::string& name) {
+  auto fromarray = [name](ak::Identities::Ref ref, ak::Identities::FieldLoc fieldloc, py::array_t<T, py::array::c_style | py::array::forcecast> array) -> ak::IdentitiesOf<T> {
+    py::buffer_info info = array.request();
+    if (info.ndim != 2) {
+      throw std::invalid_argument(name + std::string(" must be built from a two-dimensional array"));
+    }
+    if (info.strides[0] != sizeof(T)*info.shape[1]  ||  info.strides[1] != sizeof(T)) {
+      throw std::invalid_argument(name + std::string(" must be built from a contiguous array (array.stries == (array.shape[1]*array.itemsize, array.itemsize)); try array.copy()"));
+    }
+    return ak::IdentitiesOf<T>(ref, fieldloc, 0, info.shape[1], info.shape[0],
+        std::shared_ptr<T>(reinterpret_cast<T*>(info.ptr), pyobject_deleter<T>(array.ptr())));
+  };
+
   return (py::class_<ak::IdentitiesOf<T>>(m, name.c_str(), py::buffer_protocol())
       .def_buffer([](const ak::IdentitiesOf<T>& self) -> py::buffer_info {
         return py::buffer_info(
@@ -26,17 +38,7 @@ py::class_<ak::IdentitiesOf<T>> make_IdentitiesOf(const py::handle& m, const std
         return ak::IdentitiesOf<T>(ref, fieldloc, width, length);
       }))
 
-      .def(py::init([name](ak::Identities::Ref ref, ak::Identities::FieldLoc fieldloc, py::array_t<T, py::array::c_style | py::array::forcecast> array) {
-        py::buffer_info info = array.request();
-        if (info.ndim != 2) {
-          throw std::invalid_argument(name + std::string(" must be built from a two-dimensional array"));
-        }
-        if (info.strides[0] != sizeof(T)*info.shape[1]  ||  info.strides[1] != sizeof(T)) {
-          throw std::invalid_argument(name + std::string(" must be built from a contiguous array (array.stries == (array.shape[1]*array.itemsize, array.itemsize)); try array.copy()"));
-        }
-        return ak::IdentitiesOf<T>(ref, fieldloc, 0, info.shape[1], info.shape[0],
-            std::shared_ptr<T>(reinterpret_cast<T*>(info.ptr), pyobject_deleter<T>(array.ptr())));
-      }))
+      .def(py::init(fromarray))
 
       .def("__repr__", &ak::IdentitiesOf<T>::tostring)
       .def("__len__", &ak::IdentitiesOf<T>::length)
@@ -68,6 +70,12 @@ py::class_<ak::IdentitiesOf<T>> make_IdentitiesOf(const py::handle& m, const std
         return out;
       })
 
+      .def(py::pickle([](const ak::IdentitiesOf<T>& self) {
+        return py::make_tuple(py::cast(self.ref()), py::cast(self.fieldloc()), py::module::import("numpy").attr("asarray")(py::cast(self)));
+      }, [fromarray](const py::tuple& state) {
+        return fromarray(state[0].cast<ak::Identities::Ref>(), state[1].cast<ak::Identities::FieldLoc>(), state[2].cast<py::array_t<T, py::array::c_style | py::array::forcecast>>());
+      }))
+
   );
 }
 
@@ -8,6 +8,20 @@
 
 template <typename T>
 py::class_<ak::IndexOf<T>> make_IndexOf(const py::handle& m, const std::string& name) {
+  auto fromarray = [name](py::array_t<T, py::array::c_style | py::array::forcecast> array) -> ak::IndexOf<T> {
+    py::buffer_info info = array.request();
+    if (info.ndim != 1) {
+      throw std::invalid_argument(name + std::string(" must be built from a one-dimensional array; try array.ravel()"));
+    }
+    if (info.strides[0] != sizeof(T)) {
+      throw std::invalid_argument(name + std::string(" must be built from a contiguous array (array.strides == (array.itemsize,)); try array.copy()"));
+    }
+    return ak::IndexOf<T>(
+      std::shared_ptr<T>(reinterpret_cast<T*>(info.ptr), pyobject_deleter<T>(array.ptr())),
+      0,
+      (int64_t)info.shape[0]);
+  };
+
   return (py::class_<ak::IndexOf<T>>(m, name.c_str(), py::buffer_protocol())
       .def_buffer([](const ak::IndexOf<T>& self) -> py::buffer_info {
         return py::buffer_info(
@@ -19,25 +33,21 @@ py::class_<ak::IndexOf<T>> make_IndexOf(const py::handle& m, const std::string&
           { (ssize_t)sizeof(T) });
         })
 
-      .def(py::init([name](py::array_t<T, py::array::c_style | py::array::forcecast> array) -> ak::IndexOf<T> {
-        py::buffer_info info = array.request();
-        if (info.ndim != 1) {
-          throw std::invalid_argument(name + std::string(" must be built from a one-dimensional array; try array.ravel()"));
-        }
-        if (info.strides[0] != sizeof(T)) {
-          throw std::invalid_argument(name + std::string(" must be built from a contiguous array (array.strides == (array.itemsize,)); try array.copy()"));
-        }
-        return ak::IndexOf<T>(
-          std::shared_ptr<T>(reinterpret_cast<T*>(info.ptr), pyobject_deleter<T>(array.ptr())),
-          0,
-          (int64_t)info.shape[0]);
-      }))
+      .def(py::init(fromarray))
 
       .def("__repr__", &ak::IndexOf<T>::tostring)
       .def("__len__", &ak::IndexOf<T>::length)
       .def("__getitem__", &ak::IndexOf<T>::getitem_at)
       .def("__getitem__", &ak::IndexOf<T>::getitem_range)
 
+      // the state is a NumPy view of the buffer: with pickle protocol 5,
+      // NumPy passes it out-of-band as a PickleBuffer, without a copy
+      .def(py::pickle([](const ak::IndexOf<T>& self) {
+        return py::make_tuple(py::module::import("numpy").attr("asarray")(py::cast(self)));
+      }, [fromarray](const py::tuple& state) {
+        return fromarray(state[0].cast<py::array_t<T, py::array::c_style | py::array::forcecast>>());
+      }))
+
   );
 }
 
@@ -0,0 +1,61 @@
+# Compares fromjson(engine="rapidjson") with fromjson(engine="simdjson") on
+# many copies of studies/small-example.json and on a jagged-3 numerical file
+# like the ones studies/chep-2019/make-numerical-json.py makes (but smaller).
+
+import os
+import time
+
+import numpy
+import awkward1
+
+if not awkward1._io.has_simdjson:
+    raise ImportError("awkward1 was compiled without simdjson")
+
+here = os.path.dirname(os.path.abspath(__file__))
+small = open(os.path.join(here, "small-example.json")).read().strip()
+
+numpy.random.seed(12345)
+content = numpy.random.normal(0, 1, 2**22).astype(numpy.float32)
+offsets1 = numpy.arange(0, len(content) + 8, 8, dtype=numpy.int64)
+offsets1[1:-1] += numpy.random.randint(0, 8, len(offsets1) - 2)
+offsets2 = numpy.arange(0, len(offsets1) - 1 + 8, 8, dtype=numpy.int64)
+offsets2[1:-1] += numpy.random.randint(0, 8, len(offsets2) - 2)
+offsets3 = numpy.arange(0, len(offsets2) - 1 + 8, 8, dtype=numpy.int64)
+offsets3[1:-1] += numpy.random.randint(0, 8, len(offsets3) - 2)
+jagged3 = awkward1.layout.ListOffsetArray64(
+              awkward1.layout.Index64(offsets3),
+              awkward1.layout.ListOffsetArray64(
+                  awkward1.layout.Index64(offsets2),
+                  awkward1.layout.ListOffsetArray64(
+                      awkward1.layout.Index64(offsets1),
+                      awkward1.layout.NumpyArray(content))))
+
+samples = {
+    "small-example x 100000": "[" + ", ".join([small[1:-1]] * 100000) + "]",
+    "small-example lines x 100000": "\n".join([small] * 100000) + "\n",
+    "jagged3 (4M float32)": jagged3.tojson(maxdecimals=5),
+    }
+
+for name, text in samples.items():
+    lines = "lines" in name
+    filename = os.path.join(here, "fromjson-engines.json")
+    with open(filename, "w") as file:
+        file.write(text)
+
+    results = {}
+    for engine in ("rapidjson", "simdjson"):
+        best = None
+        for repeat in range(5):
+            starttime = time.time()
+            out = awkward1.fromjson(filename, lines=lines, engine=engine)
+            runtime = time.time() - starttime
+            if best is None or runtime < best:
+                best = runtime
+        results[engine] = (best, out)
+
+    assert awkward1.tolist(results["rapidjson"][1][:10]) == awkward1.tolist(results["simdjson"][1][:10])
+    mb = len(text) / 1024.0**2
+    print("{0:30s} {1:8.1f} MB   rapidjson {2:7.1f} MB/s   simdjson {3:7.1f} MB/s   ({4:.2f}x)".format(
+        name, mb, mb / results["rapidjson"][0], mb / results["simdjson"][0], results["rapidjson"][0] / results["simdjson"][0]))
+
+os.remove(filename)
@@ -0,0 +1,100 @@
+# BSD 3-Clause License; see https://github.com/jpivarski/awkward-1.0/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import sys
+import pickle
+
+import pytest
+import numpy
+
+import awkward1
+
+if sys.version_info[0] < 3:
+    pytest.skip("pybind11 pickle only works in Python 3", allow_module_level=True)
+
+def test_index():
+    for cls, dtype in [(awkward1.layout.Index8, numpy.int8), (awkward1.layout.IndexU8, numpy.uint8), (awkward1.layout.Index32, numpy.int32), (awkward1.layout.IndexU32, numpy.uint32), (awkward1.layout.Index64, numpy.int64)]:
+        index = cls(numpy.array([1, 2, 3, 4, 5], dtype=dtype)[1:4])
+        out = pickle.loads(pickle.dumps(index))
+        assert isinstance(out, cls)
+        assert numpy.asarray(out).tolist() == [2, 3, 4]
+
+def test_identities():
+    layout = awkward1.Array([[1.1, 2.2, 3.3], [], [4.4, 5.5]]).layout
+    layout.setidentities()
+    out = pickle.loads(pickle.dumps(layout))
+    assert numpy.asarray(out.identities).tolist() == numpy.asarray(layout.identities).tolist()
+    assert out.identities.ref == layout.identities.ref
+
+def test_layouts():
+    content = awkward1.layout.NumpyArray(numpy.array([0.0, 1.1, 2.2, 3.3, 4.4, 5.5, 6.6, 7.7, 8.8, 9.9]))
+    offsets = awkward1.layout.Index64(numpy.array([0, 3, 3, 5, 6, 10]))
+    starts = awkward1.layout.Index32(numpy.array([0, 3, 3, 5, 6], dtype=numpy.int32))
+    stops = awkward1.layout.Index32(numpy.array([3, 3, 5, 6, 10], dtype=numpy.int32))
+    index = awkward1.layout.Index64(numpy.array([4, -1, 2, 0, -1]))
+    listoffsetarray = awkward1.layout.ListOffsetArray64(offsets, content, parameters={"hey": [1, 2, 3]})
+    records = awkward1.layout.RecordArray([listoffsetarray, awkward1.layout.NumpyArray(numpy.arange(5))], ["x", "y"])
+    tags = awkward1.layout.Index8(numpy.array([0, 1, 0, 1, 0], dtype=numpy.int8))
+    unionindex = awkward1.layout.Index32(numpy.array([0, 0, 1, 1, 2], dtype=numpy.int32))
+
+    layouts = [
+        content,
+        awkward1.layout.NumpyArray(numpy.arange(2*3*5).reshape(2, 3, 5)[:, ::2, 1:]),
+        awkward1.layout.EmptyArray(),
+        listoffsetarray,
+        awkward1.layout.ListArray32(starts, stops, content),
+        awkward1.layout.RegularArray(content, 3),
+        awkward1.layout.IndexedArray64(awkward1.layout.Index64(numpy.array([3, 2, 1])), listoffsetarray),
+        awkward1.layout.IndexedOptionArray64(index, listoffsetarray),
+        awkward1.layout.ByteMaskedArray(awkward1.layout.Index8(numpy.array([1, 0, 1, 0, 1], dtype=numpy.int8)), listoffsetarray, validwhen=True),
+        awkward1.layout.BitMaskedArray(awkward1.layout.IndexU8(numpy.array([21], dtype=numpy.uint8)), listoffsetarray, validwhen=True, length=5, lsb_order=True),
+        awkward1.layout.UnmaskedArray(listoffsetarray),
+        records,
+        awkward1.layout.RecordArray([listoffsetarray, content[:5]]),
+        awkward1.layout.RecordArray([], length=3),
+        awkward1.layout.UnionArray8_32(tags, unionindex, [content, listoffsetarray]),
+    ]
+    for layout in layouts:
+        out = pickle.loads(pickle.dumps(layout))
+        assert type(out) is type(layout)
+        assert out.parameters == layout.parameters
+        assert awkward1.tolist(out) == awkward1.tolist(layout)
+
+    out = pickle.loads(pickle.dumps(records[3]))
+    assert isinstance(out, awkward1.layout.Record)
+    assert awkward1.tolist(out) == {"x": [5.5], "y": 3}
+
+def test_highlevel():
+    array = awkward1.Array([{"x": 1, "y": [1.1, 2.2]}, {"x": 2, "y": []}, None, {"x": 3, "y": [3.3]}])
+    out = pickle.loads(pickle.dumps(array))
+    assert isinstance(out, awkward1.Array)
+    assert awkward1.tolist(out) == awkward1.tolist(array)
+    assert str(out.type) == str(array.type)
+
+    out = pickle.loads(pickle.dumps(array[1]))
+    assert isinstance(out, awkward1.Record)
+    assert awkward1.tolist(out) == {"x": 2, "y": []}
+
+    strings = awkward1.Array(["one", "two", "three"])
+    out = pickle.loads(pickle.dumps(strings))
+    assert awkward1.tolist(out) == ["one", "two", "three"]
+    assert type(out) is type(strings)
+
+@pytest.mark.skipif(sys.version_info < (3, 8), reason="pickle protocol 5 requires Python 3.8")
+def test_out_of_band():
+    array = awkward1.Array([[1.1, 2.2, 3.3], [], [4.4, 5.5]])
+    buffers = []
+    data = pickle.dumps(array, protocol=5, buffer_callback=buffers.append)
+    assert len(buffers) == 2
+    assert len(data) < 1024
+
+    # as if they had been received by another process
+    buffers = [bytearray(x) for x in buffers]
+    out = pickle.loads(data, buffers=buffers)
+    assert awkward1.tolist(out) == [[1.1, 2.2, 3.3], [], [4.4, 5.5]]
+
+    # the unpickled layout views the out-of-band buffers without copying them
+    pointers = [numpy.frombuffer(x, dtype=numpy.uint8).ctypes.data for x in buffers]
+    assert numpy.asarray(out.layout.offsets).ctypes.data in pointers
+    assert numpy.asarray(out.layout.content).ctypes.data in pointers
@@ -0,0 +1,130 @@
+# BSD 3-Clause License; see https://github.com/jpivarski/awkward-1.0/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import json
+
+import pytest
+import numpy
+
+import awkward1
+
+content = awkward1.layout.NumpyArray(numpy.array([0.0, 1.1, 2.2, 3.3, 4.4, 5.5, 6.6, 7.7, 8.8, 9.9]))
+offsets = awkward1.layout.Index32(numpy.array([0, 3, 3, 5, 6, 10], dtype=numpy.int32))
+listoffsetarray = awkward1.layout.ListOffsetArray32(offsets, content)
+
+def roundtrip(layout):
+    form, buffers, length = awkward1.tobuffers(layout)
+    form = json.loads(json.dumps(form))
+    buffers = dict((n, x.tobytes()) for n, x in buffers.items())
+    return awkward1.frombuffers(form, buffers, length, highlevel=False)
+
+def test_numpyarray():
+    assert awkward1.tolist(roundtrip(content)) == awkward1.tolist(content)
+    array = awkward1.layout.NumpyArray(numpy.arange(2*3*5, dtype=numpy.int16).reshape(2, 3, 5)[:, ::2, 1:])
+    out = roundtrip(array)
+    assert numpy.asarray(out).dtype == numpy.dtype(numpy.int16)
+    assert awkward1.tolist(out) == awkward1.tolist(array)
+    assert awkward1.tolist(roundtrip(awkward1.layout.EmptyArray())) == []
+
+def test_lists():
+    assert awkward1.tolist(roundtrip(listoffsetarray)) == [[0.0, 1.1, 2.2], [], [3.3, 4.4], [5.5], [6.6, 7.7, 8.8, 9.9]]
+    assert isinstance(roundtrip(listoffsetarray), awkward1.layout.ListOffsetArray32)
+    assert awkward1.tolist(roundtrip(listoffsetarray[1:4])) == [[], [3.3, 4.4], [5.5]]
+    starts = awkward1.layout.IndexU32(numpy.array([4, 100, 0], dtype=numpy.uint32))
+    stops = awkward1.layout.IndexU32(numpy.array([7, 100, 2], dtype=numpy.uint32))
+    listarray = awkward1.layout.ListArrayU32(starts, stops, content)
+    assert awkward1.tolist(roundtrip(listarray)) == [[4.4, 5.5, 6.6], [], [0.0, 1.1]]
+    regulararray = awkward1.layout.RegularArray(content, 3)
+    assert awkward1.tolist(roundtrip(regulararray)) == [[0.0, 1.1, 2.2], [3.3, 4.4, 5.5], [6.6, 7.7, 8.8]]
+
+def test_options_and_indexed():
+    index = awkward1.layout.Index64(numpy.array([4, -1, 2, 0, -1]))
+    for layout in [
+        awkward1.layout.IndexedOptionArray64(index, listoffsetarray),
+        awkward1.layout.IndexedArray32(awkward1.layout.Index32(numpy.array([3, 2, 1], dtype=numpy.int32)), listoffsetarray),
+        awkward1.layout.ByteMaskedArray(awkward1.layout.Index8(numpy.array([1, 0, 1, 0, 1], dtype=numpy.int8)), listoffsetarray, validwhen=True),
+        awkward1.layout.BitMaskedArray(awkward1.layout.IndexU8(numpy.array([21], dtype=numpy.uint8)), listoffsetarray, validwhen=False, length=5, lsb_order=False),
+        awkward1.layout.UnmaskedArray(listoffsetarray),
+    ]:
+        out = roundtrip(layout)
+        assert type(out) is type(layout)
+        assert awkward1.tolist(out) == awkward1.tolist(layout)
+
+def test_records_and_unions():
+    array = awkward1.Array([{"x": 1, "y": [1.1, 2.2]}, {"x": 2, "y": []}, None, {"x": 3, "y": [3.3]}])
+    assert awkward1.tolist(roundtrip(array.layout)) == awkward1.tolist(array)
+    array = awkward1.Array([(1, "one"), (2, "two"), (3, "three")])
+    out = roundtrip(array.layout)
+    assert out.istuple
+    assert awkward1.tolist(out) == [(1, "one"), (2, "two"), (3, "three")]
+    assert awkward1.tolist(roundtrip(awkward1.layout.RecordArray([], length=4))) == [(), (), (), ()]
+    array = awkward1.Array([1, [2, 3], "four", [], 5])
+    assert awkward1.tolist(roundtrip(array.layout)) == [1, [2, 3], "four", [], 5]
+
+def test_form():
+    array = awkward1.Array(["one", "two", "three"])
+    form, buffers, length = awkward1.tobuffers(array)
+    assert length == 3
+    assert form == {
+        "class": "ListOffsetArray64",
+        "form_key": "node0",
+        "offsets": "i64",
+        "content": {
+            "class": "NumpyArray",
+            "form_key": "node1",
+            "dtype": "uint8",
+            "inner_shape": [],
+            "parameters": {"__array__": "char"}},
+        "parameters": {"__array__": "string"}}
+    assert set(buffers) == set(["node0-offsets", "node1-data"])
+
+    out = awkward1.frombuffers(json.dumps(form), buffers, length)
+    assert isinstance(out, awkward1.Array)
+    assert awkward1.tolist(out) == ["one", "two", "three"]
+    assert type(out) is type(array)
+
+def test_no_copy():
+    form, buffers, length = awkward1.tobuffers(listoffsetarray)
+    assert buffers["node0-offsets"].ctypes.data == numpy.asarray(offsets).ctypes.data
+    assert buffers["node1-data"].ctypes.data == numpy.asarray(content).ctypes.data
+
+    out = awkward1.frombuffers(form, buffers, length, highlevel=False)
+    assert numpy.asarray(out.offsets).ctypes.data == numpy.asarray(offsets).ctypes.data
+    assert numpy.asarray(out.content).ctypes.data == numpy.asarray(content).ctypes.data
+
+def test_keyformat():
+    form, buffers, length = awkward1.tobuffers(listoffsetarray, keyformat="part0/{form_key}/{role}")
+    assert set(buffers) == set(["part0/node0/offsets", "part0/node1/data"])
+    assert awkward1.tolist(awkward1.frombuffers(form, buffers, length, keyformat="part0/{form_key}/{role}")) == awkward1.tolist(listoffsetarray)
+
+def test_short_buffer():
+    form, buffers, length = awkward1.tobuffers(listoffsetarray)
+    with pytest.raises(ValueError):
+        awkward1.frombuffers(form, buffers, length + 1)
+
+def test_content_lengths():
+    # child lengths come from the form, so opening an array never reads
+    # index, stops, or tags buffers
+    content = awkward1.layout.ListOffsetArray64(awkward1.layout.Index64(numpy.array([0, 1, 3])), awkward1.layout.NumpyArray(numpy.array([1.1, 2.2, 3.3])))
+    indexed = awkward1.layout.IndexedArray64(awkward1.layout.Index64(numpy.array([1, 0, 1])), content)
+    listarray = awkward1.layout.ListArray64(awkward1.layout.Index64(numpy.array([0, 2])), awkward1.layout.Index64(numpy.array([2, 3])), indexed)
+    form, buffers, length = awkward1.tobuffers(listarray)
+    assert form["content_length"] == 3
+    assert form["content"]["content_length"] == 2
+    assert awkward1.tolist(awkward1.frombuffers(form, buffers, length)) == [[[2.2, 3.3], [1.1]], [[2.2, 3.3]]]
+
+    buffers = dict(buffers)
+    buffers["node0-stops"] = numpy.array([2, 1000], dtype=numpy.int64)
+    buffers["node1-index"] = numpy.array([1, 0, 1000], dtype=numpy.int64)
+    out = awkward1.frombuffers(form, buffers, length, highlevel=False)
+    assert len(out.content) == 3
+    assert len(out.content.content) == 2
+
+    union = awkward1.Array([1, [2, 3], "four", [], 5]).layout
+    form, buffers, length = awkward1.tobuffers(union)
+    assert form["content_lengths"] == [len(x) for x in union.contents]
+
+    # forms written before content lengths were recorded still load
+    del form["content_lengths"]
+    assert awkward1.tolist(awkward1.frombuffers(form, buffers, length)) == [1, [2, 3], "four", [], 5]
@@ -0,0 +1,73 @@
+# BSD 3-Clause License; see https://github.com/jpivarski/awkward-1.0/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import os
+import json
+
+import pytest
+import numpy
+
+import awkward1
+
+def test_roundtrip(tmp_path):
+    array = awkward1.Array([{"x": 1, "y": [1.1, 2.2]}, {"x": 2, "y": []}, None, {"x": 3, "y": [3.3]}])
+    awkward1.save(os.path.join(str(tmp_path), "tmp1.awkd"), array)
+    for mmap in (True, False):
+        out = awkward1.load(os.path.join(str(tmp_path), "tmp1.awkd"), mmap=mmap)
+        assert isinstance(out, awkward1.Array)
+        assert awkward1.tolist(out) == awkward1.tolist(array)
+
+    strings = awkward1.Array(["one", "two", "three"])
+    awkward1.save(os.path.join(str(tmp_path), "tmp2.awkd"), strings)
+    out = awkward1.load(os.path.join(str(tmp_path), "tmp2.awkd"))
+    assert awkward1.tolist(out) == ["one", "two", "three"]
+    assert type(out) is type(strings)
+
+    awkward1.save(os.path.join(str(tmp_path), "tmp3.awkd"), awkward1.layout.EmptyArray())
+    assert awkward1.tolist(awkward1.load(os.path.join(str(tmp_path), "tmp3.awkd"))) == []
+
+def test_alignment(tmp_path):
+    array = awkward1.Array([[1, 2, 3], [], [4, 5]])
+    awkward1.save(os.path.join(str(tmp_path), "tmp1.awkd"), array)
+    with open(os.path.join(str(tmp_path), "tmp1.awkd"), "rb") as file:
+        assert file.read(8) == b"awkward1"
+        headersize = int(numpy.frombuffer(file.read(8), dtype="<u8")[0])
+        header = json.loads(file.read(headersize).decode("utf-8"))
+    start = 16 + headersize
+    start += (-start) % 64
+    assert start % 64 == 0
+    for position, nbytes in header["buffers"].values():
+        assert position % 64 == 0
+    assert header["length"] == 3
+    assert header["form"]["class"] == "ListOffsetArray64"
+
+def test_mmap(tmp_path):
+    array = awkward1.Array([{"x": 1.1, "y": [1, 2, 3]}, {"x": 2.2, "y": []}])
+    filename = os.path.join(str(tmp_path), "tmp1.awkd")
+    awkward1.save(filename, array)
+    mapped = awkward1.load(filename, mmap=True)
+    inmemory = awkward1.load(filename, mmap=False)
+
+    # overwrite the "x" column on disk: only the memory-mapped array sees it
+    with open(filename, "rb") as file:
+        file.read(8)
+        headersize = int(numpy.frombuffer(file.read(8), dtype="<u8")[0])
+        header = json.loads(file.read(headersize).decode("utf-8"))
+    key = header["form"]["contents"][0]["form_key"] + "-data"
+    position, nbytes = header["buffers"][key]
+    start = 16 + headersize
+    start += (-start) % 64
+    with open(filename, "r+b") as file:
+        file.seek(start + position)
+        file.write(numpy.array([9.9, 8.8]).tobytes())
+
+    assert awkward1.tolist(mapped.x) == [9.9, 8.8]
+    assert awkward1.tolist(inmemory.x) == [1.1, 2.2]
+    assert awkward1.tolist(mapped.y) == [[1, 2, 3], []]
+
+def test_not_awkward(tmp_path):
+    with open(os.path.join(str(tmp_path), "tmp1.awkd"), "wb") as file:
+        file.write(b"something else entirely")
+    with pytest.raises(ValueError):
+        awkward1.load(os.path.join(str(tmp_path), "tmp1.awkd"))
@@ -0,0 +1,170 @@
+# BSD 3-Clause License; see https://github.com/jpivarski/awkward-1.0/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import pytest
+import numpy
+
+import awkward1
+
+class Counter(object):
+    def __init__(self, array):
+        self.array = array
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.array
+
+def test_generator():
+    array = awkward1.Array([[1.1, 2.2, 3.3], [], [4.4, 5.5]])
+    generator = awkward1.layout.ArrayGenerator(Counter(array), type=array.type)
+    assert generator.length == 3
+    assert str(generator.type) == "var * float64"
+    assert awkward1.tolist(generator()) == [[1.1, 2.2, 3.3], [], [4.4, 5.5]]
+
+    generator = awkward1.layout.ArrayGenerator(lambda x, y: awkward1.Array([x, y]), (1,), {"y": 2})
+    assert generator.length is None
+    assert generator.type is None
+    assert awkward1.tolist(generator()) == [1, 2]
+
+    wronglength = awkward1.layout.ArrayGenerator(Counter(array), length=5)
+    with pytest.raises(ValueError):
+        wronglength()
+    wrongtype = awkward1.layout.ArrayGenerator(Counter(array), type=awkward1.Array([1, 2, 3]).type)
+    with pytest.raises(ValueError):
+        wrongtype()
+
+def test_no_materialization():
+    array = awkward1.Array([{"x": 1, "y": [1.1]}, {"x": 2, "y": []}, {"x": 3, "y": [2.2, 3.3]}])
+    counter = Counter(array)
+    virtual = awkward1.layout.VirtualArray(awkward1.layout.ArrayGenerator(counter, type=array.type))
+    assert len(virtual) == 3
+    assert str(virtual.type({})) == str(array.layout.type({}))
+    assert virtual.keys() == ["x", "y"]
+    assert virtual.haskey("y")
+    assert virtual.numfields == 2
+    sliced = virtual[1:]
+    assert isinstance(sliced, awkward1.layout.VirtualArray)
+    assert len(sliced) == 2
+    highlevel = awkward1.Array(virtual)
+    assert str(highlevel.type) == "3 * {\"x\": int64, \"y\": var * float64}"
+    assert counter.calls == 0
+
+    assert awkward1.tolist(sliced) == [{"x": 2, "y": []}, {"x": 3, "y": [2.2, 3.3]}]
+    assert awkward1.tolist(highlevel.y) == [[1.1], [], [2.2, 3.3]]
+    assert counter.calls > 0
+
+def test_no_cache():
+    counter = Counter(awkward1.Array([1, 2, 3]))
+    virtual = awkward1.layout.VirtualArray(counter)
+    assert virtual.cache is None
+    assert virtual.peek_array is None
+    assert awkward1.tolist(virtual) == [1, 2, 3]
+    assert awkward1.tolist(virtual) == [1, 2, 3]
+    assert counter.calls == 2
+
+def test_cache():
+    cache = awkward1.layout.LRUCache(1024)
+    counter = Counter(awkward1.Array([1, 2, 3]))
+    virtual = awkward1.layout.VirtualArray(awkward1.layout.ArrayGenerator(counter, length=3), cache, cache_key="one")
+    assert virtual.cache_key == "one"
+    assert "one" not in cache
+    assert virtual.peek_array is None
+    assert awkward1.tolist(virtual) == [1, 2, 3]
+    assert awkward1.tolist(virtual) == [1, 2, 3]
+    assert virtual[1] == 2
+    assert awkward1.tolist(virtual[numpy.array([2, 0])]) == [3, 1]
+    assert counter.calls == 1
+    assert "one" in cache
+    assert cache.keys() == ["one"]
+    assert cache.nbytes == 24
+    assert awkward1.tolist(virtual.peek_array) == [1, 2, 3]
+
+    # a VirtualArray with the same key shares the cached array
+    other = awkward1.layout.VirtualArray(Counter(awkward1.Array([999])), cache, cache_key="one")
+    assert awkward1.tolist(other) == [1, 2, 3]
+
+    # slices of a materialized VirtualArray are views, not new VirtualArrays
+    assert isinstance(virtual[1:], awkward1.layout.NumpyArray)
+
+    cache.clear()
+    assert len(cache) == 0
+    assert awkward1.tolist(virtual) == [1, 2, 3]
+    assert counter.calls == 2
+
+    # default keys are unique
+    one = awkward1.layout.VirtualArray(counter, cache)
+    two = awkward1.layout.VirtualArray(counter, cache)
+    assert one.cache_key != two.cache_key
+
+def test_lru_eviction():
+    cache = awkward1.layout.LRUCache(100)
+    counters = [Counter(awkward1.layout.NumpyArray(numpy.arange(5) + i)) for i in range(3)]
+    virtuals = [awkward1.layout.VirtualArray(counter, cache, cache_key=str(i)) for i, counter in enumerate(counters)]
+    virtuals[0].array
+    virtuals[1].array
+    assert cache.keys() == ["1", "0"]
+    virtuals[0].array
+    assert cache.keys() == ["0", "1"]
+    virtuals[2].array
+    assert cache.keys() == ["2", "0"]
+    assert cache.nbytes == 80
+    assert [counter.calls for counter in counters] == [1, 1, 1]
+
+    toobig = awkward1.layout.VirtualArray(Counter(awkward1.layout.NumpyArray(numpy.arange(100))), cache, cache_key="big")
+    assert len(toobig.array) == 100
+    assert "big" not in cache
+    assert cache.keys() == ["2", "0"]
+
+def test_mutablemapping_cache():
+    cache = {}
+    counter = Counter(awkward1.Array([[1, 2], [3]]))
+    virtual = awkward1.layout.VirtualArray(counter, cache, cache_key="key")
+    assert isinstance(virtual.cache, awkward1.layout.ArrayCache)
+    assert virtual.cache.mutablemapping is cache
+    assert awkward1.tolist(virtual) == [[1, 2], [3]]
+    assert awkward1.tolist(virtual) == [[1, 2], [3]]
+    assert counter.calls == 1
+    assert awkward1.tolist(cache["key"]) == [[1, 2], [3]]
+
+def test_lazy_fields():
+    cache = awkward1.layout.LRUCache(1 << 20)
+    pt = awkward1.Array([[1.1, 2.2], [], [3.3]])
+    eta = awkward1.Array([[0.1, 0.2], [], [0.3]])
+    pt_counter, eta_counter, jets_counter = Counter(pt), Counter(eta), Counter(awkward1.Array([1, 2, 3]))
+    muons = awkward1.layout.RecordArray([
+        awkward1.layout.VirtualArray(awkward1.layout.ArrayGenerator(pt_counter, type=pt.type), cache, cache_key="muons.pt"),
+        awkward1.layout.VirtualArray(awkward1.layout.ArrayGenerator(eta_counter, type=eta.type), cache, cache_key="muons.eta")], ["pt", "eta"])
+    events = awkward1.Array(awkward1.layout.RecordArray([
+        muons,
+        awkward1.layout.VirtualArray(awkward1.layout.ArrayGenerator(jets_counter, length=3), cache, cache_key="njets")], ["muons", "njets"]))
+
+    assert len(events) == 3
+    assert awkward1.keys(events.muons) == ["pt", "eta"]
+    assert awkward1.tolist(events.muons.pt) == [[1.1, 2.2], [], [3.3]]
+    assert awkward1.tolist(events[1:].muons.pt) == [[], [3.3]]
+    assert awkward1.tolist(awkward1.sum(events.muons.pt, axis=1)) == pytest.approx([3.3, 0.0, 3.3])
+    assert pt_counter.calls == 1
+    assert eta_counter.calls == 0
+    assert jets_counter.calls == 0
+    assert cache.keys() == ["muons.pt"]
+
+def test_operations():
+    array = awkward1.Array([[1, 2, 3], [], [4, 5]])
+    virtual = awkward1.Array(awkward1.layout.VirtualArray(Counter(array), awkward1.layout.LRUCache(1024)))
+    assert awkward1.tolist(virtual + 1) == [[2, 3, 4], [], [5, 6]]
+    assert awkward1.tolist(awkward1.num(virtual)) == [3, 0, 2]
+    assert awkward1.tolist(awkward1.flatten(virtual)) == [1, 2, 3, 4, 5]
+    assert awkward1.tolist(virtual[:, :1]) == [[1], [], [4]]
+    assert awkward1.tolist(virtual[[True, False, True]]) == [[1, 2, 3], [4, 5]]
+    assert awkward1.tojson(virtual) == "[[1,2,3],[],[4,5]]"
+    form, buffers, length = awkward1.tobuffers(virtual)
+    assert form["class"] == "ListOffsetArray64"
+    assert awkward1.tolist(awkward1.frombuffers(form, buffers, length)) == [[1, 2, 3], [], [4, 5]]
+
+def test_strings():
+    strings = awkward1.Array(["one", "two", "three"])
+    virtual = awkward1.Array(awkward1.layout.VirtualArray(awkward1.layout.ArrayGenerator(Counter(strings), type=strings.type)))
+    assert type(virtual) is type(strings)
+    assert awkward1.tolist(virtual) == ["one", "two", "three"]
@@ -0,0 +1,114 @@
+# BSD 3-Clause License; see https://github.com/jpivarski/awkward-1.0/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import pytest
+import numpy
+
+import awkward1
+
+pyarrow = pytest.importorskip("pyarrow")
+
+content = awkward1.layout.NumpyArray(numpy.array([0.0, 1.1, 2.2, 3.3, 4.4, 5.5, 6.6, 7.7, 8.8, 9.9]))
+offsets = awkward1.layout.Index32(numpy.array([0, 3, 3, 5, 6, 10], dtype=numpy.int32))
+listoffsetarray = awkward1.layout.ListOffsetArray32(offsets, content)
+
+def roundtrip(layout):
+    return awkward1.fromarrow(awkward1.toarrow(layout), highlevel=False)
+
+def test_numpyarray():
+    assert awkward1.toarrow(content).to_pylist() == awkward1.tolist(content)
+    assert awkward1.tolist(roundtrip(content)) == awkward1.tolist(content)
+    booleans = awkward1.layout.NumpyArray(numpy.array([True, False, True, True, False, False, True, False, True]))
+    assert awkward1.toarrow(booleans).to_pylist() == awkward1.tolist(booleans)
+    assert awkward1.tolist(roundtrip(booleans)) == awkward1.tolist(booleans)
+    array = awkward1.layout.NumpyArray(numpy.arange(2*3*5, dtype=numpy.int16).reshape(2, 3, 5))
+    assert awkward1.toarrow(array).to_pylist() == awkward1.tolist(array)
+    assert awkward1.tolist(roundtrip(array)) == awkward1.tolist(array)
+    assert awkward1.tolist(roundtrip(awkward1.layout.EmptyArray())) == []
+
+def test_lists():
+    assert awkward1.toarrow(listoffsetarray).to_pylist() == awkward1.tolist(listoffsetarray)
+    assert isinstance(roundtrip(listoffsetarray), awkward1.layout.ListOffsetArray32)
+    assert pyarrow.types.is_large_list(awkward1.toarrow(awkward1.Array([[1, 2], [3]])).type)
+    assert awkward1.tolist(roundtrip(listoffsetarray[1:4])) == [[], [3.3, 4.4], [5.5]]
+    starts = awkward1.layout.IndexU32(numpy.array([4, 100, 0], dtype=numpy.uint32))
+    stops = awkward1.layout.IndexU32(numpy.array([7, 100, 2], dtype=numpy.uint32))
+    listarray = awkward1.layout.ListArrayU32(starts, stops, content)
+    assert awkward1.toarrow(listarray).to_pylist() == [[4.4, 5.5, 6.6], [], [0.0, 1.1]]
+    regulararray = awkward1.layout.RegularArray(content, 3)
+    assert pyarrow.types.is_fixed_size_list(awkward1.toarrow(regulararray).type)
+    assert awkward1.tolist(roundtrip(regulararray)) == [[0.0, 1.1, 2.2], [3.3, 4.4, 5.5], [6.6, 7.7, 8.8]]
+
+def test_strings():
+    strings = awkward1.Array(["one", "two", "", "three"])
+    assert awkward1.toarrow(strings).type == pyarrow.large_utf8()
+    assert awkward1.toarrow(strings).to_pylist() == ["one", "two", "", "three"]
+    out = awkward1.fromarrow(awkward1.toarrow(strings))
+    assert type(out) is type(strings)
+    assert awkward1.tolist(out) == ["one", "two", "", "three"]
+
+    assert awkward1.tolist(awkward1.fromarrow(pyarrow.array(["one", None, "three"]))) == ["one", None, "three"]
+    assert awkward1.tolist(awkward1.fromarrow(pyarrow.array([b"one", b"two"]))) == [b"one", b"two"]
+
+def test_options():
+    index = awkward1.layout.Index64(numpy.array([4, -1, 2, 0, -1]))
+    expected = [[6.6, 7.7, 8.8, 9.9], None, [3.3, 4.4], [0.0, 1.1, 2.2], None]
+    for layout in [
+        awkward1.layout.IndexedOptionArray64(index, listoffsetarray),
+        awkward1.layout.ByteMaskedArray(awkward1.layout.Index8(numpy.array([1, 0, 1, 1, 0], dtype=numpy.int8)), listoffsetarray[[4, 0, 2, 0, 1]], validwhen=True),
+        awkward1.layout.BitMaskedArray(awkward1.layout.IndexU8(numpy.array([18], dtype=numpy.uint8)), listoffsetarray[[4, 0, 2, 0, 1]], validwhen=False, length=5, lsb_order=True),
+        awkward1.layout.BitMaskedArray(awkward1.layout.IndexU8(numpy.array([72], dtype=numpy.uint8)), listoffsetarray[[4, 0, 2, 0, 1]], validwhen=False, length=5, lsb_order=False),
+    ]:
+        assert awkward1.toarrow(layout).to_pylist() == expected
+        assert awkward1.tolist(roundtrip(layout)) == expected
+
+    assert awkward1.toarrow(awkward1.layout.UnmaskedArray(content)).to_pylist() == awkward1.tolist(content)
+    assert awkward1.toarrow(awkward1.Array([None, None])).to_pylist() == [None, None]
+    assert awkward1.tolist(awkward1.fromarrow(pyarrow.array([None, None]))) == [None, None]
+    assert awkward1.tolist(awkward1.fromarrow(pyarrow.array([1, 2, None, 4, 5, 6, 7, 8, None, 10])[1:])) == [2, None, 4, 5, 6, 7, 8, None, 10]
+
+def test_records_and_unions():
+    array = awkward1.Array([{"x": 1, "y": [1.1, 2.2]}, {"x": 2, "y": []}, None, {"x": 3, "y": [3.3]}])
+    assert awkward1.toarrow(array).to_pylist() == awkward1.tolist(array)
+    assert awkward1.tolist(roundtrip(array.layout)) == awkward1.tolist(array)
+    array = awkward1.Array([(1, "one"), (2, "two"), (3, "three")])
+    out = roundtrip(array.layout)
+    assert out.istuple
+    assert awkward1.tolist(out) == [(1, "one"), (2, "two"), (3, "three")]
+
+    array = awkward1.Array([1, [2, 3], "four", [], 5])
+    assert awkward1.toarrow(array).type.mode == "dense"
+    assert awkward1.toarrow(array).to_pylist() == [1, [2, 3], "four", [], 5]
+    assert awkward1.tolist(roundtrip(array.layout)) == [1, [2, 3], "four", [], 5]
+
+    with pytest.raises(ValueError):
+        awkward1.toarrow(awkward1.Array([1, [2, 3], None]))
+
+def test_tables():
+    table = pyarrow.Table.from_pydict({"x": [1, 2, 3], "y": [[1.1], [], [2.2, 3.3]]})
+    assert awkward1.tolist(awkward1.fromarrow(table)) == [{"x": 1, "y": [1.1]}, {"x": 2, "y": []}, {"x": 3, "y": [2.2, 3.3]}]
+    table = pyarrow.concat_tables([table, table])
+    assert len(awkward1.fromarrow(table)) == 6
+    chunked = pyarrow.chunked_array([pyarrow.array([1, 2]), pyarrow.array([3])])
+    assert awkward1.tolist(awkward1.fromarrow(chunked)) == [1, 2, 3]
+    empty = awkward1.fromarrow(pyarrow.chunked_array([], type=pyarrow.int64()))
+    assert awkward1.tolist(empty) == []
+    assert str(empty.type) == "0 * int64"
+    empty = awkward1.fromarrow(pyarrow.chunked_array([], type=pyarrow.list_(pyarrow.float64())))
+    assert str(empty.type) == "0 * var * float64"
+    dictionary = pyarrow.array(["a", "b", "a", "a"]).dictionary_encode()
+    assert awkward1.tolist(awkward1.fromarrow(dictionary)) == ["a", "b", "a", "a"]
+
+def test_no_copy():
+    arrow = awkward1.toarrow(listoffsetarray)
+    assert arrow.buffers()[1].address == numpy.asarray(offsets).ctypes.data
+    assert arrow.buffers()[3].address == numpy.asarray(content).ctypes.data
+
+    out = awkward1.fromarrow(arrow, highlevel=False)
+    assert numpy.asarray(out.offsets).ctypes.data == numpy.asarray(offsets).ctypes.data
+    assert numpy.asarray(out.content).ctypes.data == numpy.asarray(content).ctypes.data
+
+    mask = numpy.array([18], dtype=numpy.uint8)
+    bitmasked = awkward1.layout.BitMaskedArray(awkward1.layout.IndexU8(mask), content, validwhen=True, length=5, lsb_order=True)
+    assert awkward1.toarrow(bitmasked).buffers()[0].address == mask.ctypes.data
@@ -0,0 +1,71 @@
+# BSD 3-Clause License; see https://github.com/jpivarski/awkward-1.0/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import os
+
+import pytest
+import numpy
+
+import awkward1
+
+pyarrow = pytest.importorskip("pyarrow")
+pyarrow_parquet = pytest.importorskip("pyarrow.parquet")
+
+events = awkward1.Array([
+    {"run": 1, "muons": [{"pt": 1.1, "eta": 0.1}, {"pt": 2.2, "eta": 0.2}], "met": {"x": 0.5, "y": -0.5}},
+    {"run": 1, "muons": [], "met": {"x": 1.5, "y": -1.5}},
+    {"run": 2, "muons": [{"pt": 3.3, "eta": 0.3}], "met": {"x": 2.5, "y": -2.5}},
+    {"run": 2, "muons": [{"pt": 4.4, "eta": 0.4}], "met": {"x": 3.5, "y": -3.5}},
+    {"run": 3, "muons": [{"pt": 5.5, "eta": 0.5}, {"pt": 6.6, "eta": 0.6}], "met": {"x": 4.5, "y": -4.5}}])
+
+def test_roundtrip(tmp_path):
+    filename = os.path.join(str(tmp_path), "events.parquet")
+    awkward1.toparquet(events, filename)
+    assert pyarrow_parquet.ParquetFile(filename).schema_arrow.names == ["run", "muons", "met"]
+    out = awkward1.fromparquet(filename)
+    assert isinstance(out, awkward1.Array)
+    assert awkward1.tolist(out) == awkward1.tolist(events)
+
+    strings = awkward1.Array([["one", "two"], [], ["three"]])
+    awkward1.toparquet(strings, os.path.join(str(tmp_path), "strings.parquet"))
+    assert awkward1.tolist(awkward1.fromparquet(os.path.join(str(tmp_path), "strings.parquet"))) == [["one", "two"], [], ["three"]]
+
+    optional = awkward1.Array([{"x": 1}, None, {"x": 3}])
+    awkward1.toparquet(optional, os.path.join(str(tmp_path), "optional.parquet"))
+    assert awkward1.tolist(awkward1.fromparquet(os.path.join(str(tmp_path), "optional.parquet"))) == [{"x": 1}, None, {"x": 3}]
+
+def test_columns(tmp_path):
+    filename = os.path.join(str(tmp_path), "events.parquet")
+    awkward1.toparquet(events, filename)
+    out = awkward1.fromparquet(filename, columns=["muons.pt", "met.x"])
+    assert awkward1.keys(out) == ["muons", "met"]
+    assert awkward1.keys(out.muons) == ["pt"]
+    assert awkward1.keys(out.met) == ["x"]
+    assert awkward1.tolist(out.muons.pt) == [[1.1, 2.2], [], [3.3], [4.4], [5.5, 6.6]]
+    assert awkward1.tolist(awkward1.fromparquet(filename, columns="run")) == [{"run": 1}, {"run": 1}, {"run": 2}, {"run": 2}, {"run": 3}]
+    assert awkward1.keys(awkward1.fromparquet(filename, columns=["muons"]).muons) == ["pt", "eta"]
+    with pytest.raises(ValueError):
+        awkward1.fromparquet(filename, columns=["muons.phi"])
+
+def test_row_groups(tmp_path):
+    filename = os.path.join(str(tmp_path), "events.parquet")
+    awkward1.toparquet(events, filename, row_group_size=2)
+    assert pyarrow_parquet.ParquetFile(filename).num_row_groups == 3
+    assert awkward1.tolist(awkward1.fromparquet(filename, row_groups=1)) == awkward1.tolist(events[2:4])
+    assert awkward1.tolist(awkward1.fromparquet(filename, row_groups=[0, 2])) == awkward1.tolist(events[[0, 1, 4]])
+    assert len(awkward1.fromparquet(filename, row_groups=[])) == 0
+
+    chunks = awkward1.fromparquet(filename, columns=["muons.pt"], iterate=True)
+    assert not isinstance(chunks, awkward1.Array)
+    chunks = list(chunks)
+    assert [len(x) for x in chunks] == [2, 2, 1]
+    assert [awkward1.tolist(x.muons.pt) for x in chunks] == [[[1.1, 2.2], []], [[3.3], [4.4]], [[5.5, 6.6]]]
+
+def test_not_records(tmp_path):
+    filename = os.path.join(str(tmp_path), "lists.parquet")
+    array = awkward1.Array([[1.1, 2.2, 3.3], [], [4.4, 5.5]])
+    awkward1.toparquet(array, filename)
+    out = awkward1.fromparquet(filename)
+    assert awkward1.tolist(out) == [[1.1, 2.2, 3.3], [], [4.4, 5.5]]
+    assert str(out.type) == "3 * var * float64"
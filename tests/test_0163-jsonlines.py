@@ -0,0 +1,83 @@
+# BSD 3-Clause License; see https://github.com/jpivarski/awkward-1.0/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import os
+
+import pytest
+import numpy
+
+import awkward1
+
+def write(tmp_path, text):
+    filename = os.path.join(str(tmp_path), "tmp.jsonl")
+    with open(filename, "w") as file:
+        file.write(text)
+    return filename
+
+def test_lines(tmp_path):
+    text = "{\"x\": 1, \"y\": [1.1]}\n{\"x\": 2, \"y\": []}\n\n{\"x\": 3, \"y\": [2.2, 3.3]}\n"
+    expected = [{"x": 1, "y": [1.1]}, {"x": 2, "y": []}, {"x": 3, "y": [2.2, 3.3]}]
+    assert awkward1.tolist(awkward1.fromjson(write(tmp_path, text), lines=True)) == expected
+    assert awkward1.tolist(awkward1.fromjson(text, lines=True)) == expected
+    assert awkward1.tolist(awkward1.fromjson("[1, 2]\n[]\n[3]", lines=True)) == [[1, 2], [], [3]]
+    assert awkward1.tolist(awkward1.fromjson(write(tmp_path, "1\n2.2\nnull\n"), lines=True)) == [1, 2.2, None]
+    assert len(awkward1.fromjson(write(tmp_path, "\n"), lines=True)) == 0
+
+def test_chunks(tmp_path):
+    filename = write(tmp_path, "".join("{{\"x\": {0}, \"y\": [{1}]}}\n".format(i, ", ".join(["1.5"] * (i % 3))) for i in range(10)))
+    chunks = awkward1.fromjson(filename, lines=True, chunksize=4, buffersize=16)
+    assert not isinstance(chunks, awkward1.Array)
+    chunks = list(chunks)
+    assert [len(x) for x in chunks] == [4, 4, 2]
+    assert [awkward1.tolist(x.x) for x in chunks] == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+    assert awkward1.tolist(chunks[2].y) == [[1.5, 1.5], []]
+
+    # earlier chunks are not overwritten by later ones
+    assert awkward1.tolist(chunks[0]) == [{"x": 0, "y": []}, {"x": 1, "y": [1.5]}, {"x": 2, "y": [1.5, 1.5]}, {"x": 3, "y": []}]
+
+    # each chunk's type comes from its own lines only
+    chunks = list(awkward1.fromjson("{\"x\": 1.5}\n{\"x\": 2.5}\n{\"x\": 3}\n", lines=True, chunksize=2))
+    assert str(chunks[1].type) == "1 * {\"x\": int64}"
+    chunks = list(awkward1.fromjson("{\"a\": 1}\n{\"a\": 2}\n{\"b\": 3}\n{\"b\": 4}\n", lines=True, chunksize=2))
+    assert awkward1.tolist(chunks[1]) == [{"b": 3}, {"b": 4}]
+    assert str(chunks[1].type) == "2 * {\"b\": int64}"
+    chunks = list(awkward1.fromjson(write(tmp_path, "1\n2\n\"x\"\n\"y\"\n"), lines=True, chunksize=2))
+    assert str(chunks[1].type) == "2 * string"
+
+def test_errors(tmp_path):
+    chunks = awkward1.fromjson(write(tmp_path, "[1, 2]\n[3\n"), lines=True, chunksize=1)
+    assert awkward1.tolist(next(chunks)) == [[1, 2]]
+    with pytest.raises(ValueError) as err:
+        next(chunks)
+    assert "line 2" in str(err.value)
+    with pytest.raises(ValueError):
+        awkward1.fromjson("[1, 2]", chunksize=1)
+
+def test_builder_clear():
+    builder = awkward1.layout.ArrayBuilder()
+    builder.beginrecord()
+    builder.field("x")
+    builder.integer(1)
+    builder.endrecord()
+    first = builder.snapshot()
+    builder.clear()
+    builder.beginrecord()
+    builder.field("x")
+    builder.integer(2)
+    builder.endrecord()
+    assert awkward1.tolist(first) == [{"x": 1}]
+    assert awkward1.tolist(builder.snapshot()) == [{"x": 2}]
+
+    builder.clear()
+    builder.beginrecord()
+    builder.field("y")
+    builder.integer(3)
+    builder.endrecord()
+    assert awkward1.tolist(builder.snapshot()) == [{"y": 3}]
+    builder.clear()
+    builder.begintuple(1)
+    builder.index(0)
+    builder.real(4.5)
+    builder.endtuple()
+    assert str(awkward1.Array(builder.snapshot()).type) == "1 * (float64)"
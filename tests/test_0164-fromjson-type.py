@@ -0,0 +1,93 @@
+# BSD 3-Clause License; see https://github.com/jpivarski/awkward-1.0/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import os
+
+import pytest
+import numpy
+
+import awkward1
+
+def test_primitives():
+    float64 = awkward1.types.PrimitiveType("float64")
+    out = awkward1.fromjson("[1, 2.5, 3]", type=float64, highlevel=False)
+    assert isinstance(out, awkward1.layout.NumpyArray)
+    assert numpy.asarray(out).dtype == numpy.dtype(numpy.float64)
+    assert awkward1.tolist(out) == [1.0, 2.5, 3.0]
+
+    for name, dtype in [("int8", numpy.int8), ("uint16", numpy.uint16), ("int32", numpy.int32), ("float32", numpy.float32)]:
+        out = awkward1.fromjson("[1, 2, 3]", type=awkward1.types.PrimitiveType(name), highlevel=False)
+        assert numpy.asarray(out).dtype == numpy.dtype(dtype)
+        assert awkward1.tolist(out) == [1, 2, 3]
+
+    assert awkward1.tolist(awkward1.fromjson("[true, false]", type=awkward1.types.PrimitiveType("bool"))) == [True, False]
+
+def test_nested():
+    array = awkward1.Array([{"x": 1, "y": [1.1, 2.2], "z": "one"}, {"x": 2, "y": [], "z": "two"}])
+    text = awkward1.tojson(array)
+    out = awkward1.fromjson(text, type=array.type)
+    assert awkward1.tolist(out) == awkward1.tolist(array)
+    assert str(out.type) == str(array.type)
+    assert type(out.z) is type(array.z)
+
+    regular = awkward1.types.RegularType(awkward1.types.PrimitiveType("int64"), 2)
+    assert awkward1.tolist(awkward1.fromjson("[[1, 2], [3, 4]]", type=regular)) == [[1, 2], [3, 4]]
+    with pytest.raises(ValueError):
+        awkward1.fromjson("[[1, 2], [3]]", type=regular)
+
+def test_options():
+    recordtype = awkward1.types.RecordType({"x": awkward1.types.PrimitiveType("int64"), "y": awkward1.types.OptionType(awkward1.types.PrimitiveType("float64"))})
+    out = awkward1.fromjson("[{\"x\": 1, \"y\": 1.1}, {\"x\": 2, \"y\": null}, {\"x\": 3}]", type=recordtype)
+    assert awkward1.tolist(out) == [{"x": 1, "y": 1.1}, {"x": 2, "y": None}, {"x": 3, "y": None}]
+
+    listtype = awkward1.types.OptionType(awkward1.types.ListType(awkward1.types.PrimitiveType("int64")))
+    assert awkward1.tolist(awkward1.fromjson("[[1, 2], null, []]", type=listtype)) == [[1, 2], None, []]
+
+def test_nonconforming():
+    int64 = awkward1.types.PrimitiveType("int64")
+    recordtype = awkward1.types.RecordType({"x": int64})
+    with pytest.raises(ValueError) as err:
+        awkward1.fromjson("[1, 2.5]", type=int64)
+    assert "does not match type" in str(err.value)
+    with pytest.raises(ValueError):
+        awkward1.fromjson("[1, null]", type=int64)
+    with pytest.raises(ValueError):
+        awkward1.fromjson("[300]", type=awkward1.types.PrimitiveType("int8"))
+    with pytest.raises(ValueError):
+        awkward1.fromjson("[-1]", type=awkward1.types.PrimitiveType("uint32"))
+    with pytest.raises(ValueError):
+        awkward1.fromjson("[{\"x\": 1, \"y\": 2}]", type=recordtype)
+    with pytest.raises(ValueError):
+        awkward1.fromjson("[{}]", type=recordtype)
+    with pytest.raises(ValueError):
+        awkward1.fromjson("[[1]]", type=int64)
+    with pytest.raises(ValueError):
+        awkward1.fromjson("[1]", type=awkward1.types.UnionType([int64, recordtype]))
+    with pytest.raises(TypeError):
+        awkward1.fromjson("[1]", type="int64")
+
+def test_uint64():
+    uint64 = awkward1.types.PrimitiveType("uint64")
+    assert awkward1.tolist(awkward1.fromjson("[18446744073709551615, 0]", type=uint64)) == [18446744073709551615, 0]
+    assert awkward1.tolist(awkward1.fromjson("[18446744073709551615]", type=awkward1.types.PrimitiveType("float64"))) == [18446744073709551615.0]
+    assert awkward1.tolist(awkward1.fromjson("[18446744073709551615, null]", type=awkward1.types.OptionType(uint64))) == [18446744073709551615, None]
+    with pytest.raises(ValueError) as err:
+        awkward1.fromjson("[18446744073709551615]", type=awkward1.types.PrimitiveType("int64"))
+    assert "18446744073709551615 does not match type int64" in str(err.value)
+    with pytest.raises(ValueError):
+        awkward1.fromjson("[9223372036854775808]", type=awkward1.types.PrimitiveType("int64"))
+
+def test_file_and_lines(tmp_path):
+    filename = os.path.join(str(tmp_path), "tmp.json")
+    with open(filename, "w") as file:
+        file.write("[[1.1, 2.2], [], [3.3]]")
+    listtype = awkward1.types.ListType(awkward1.types.PrimitiveType("float64"))
+    assert awkward1.tolist(awkward1.fromjson(filename, type=listtype)) == [[1.1, 2.2], [], [3.3]]
+
+    with open(filename, "w") as file:
+        file.write("{\"x\": 1}\n{\"x\": 2}\n{\"x\": 3}\n")
+    recordtype = awkward1.types.RecordType({"x": awkward1.types.PrimitiveType("float32")})
+    chunks = list(awkward1.fromjson(filename, lines=True, chunksize=2, type=recordtype))
+    assert [awkward1.tolist(x) for x in chunks] == [[{"x": 1}, {"x": 2}], [{"x": 3}]]
+    assert str(chunks[0].type) == "2 * {\"x\": float32}"
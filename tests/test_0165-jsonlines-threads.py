@@ -0,0 +1,60 @@
+# BSD 3-Clause License; see https://github.com/jpivarski/awkward-1.0/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import os
+
+import pytest
+import numpy
+
+import awkward1
+
+def write(tmp_path, text):
+    filename = os.path.join(str(tmp_path), "tmp.jsonl")
+    with open(filename, "w") as file:
+        file.write(text)
+    return filename
+
+def test_parallel(tmp_path):
+    text = "".join("{{\"x\": {0}, \"y\": [{1}]}}\n".format(i, ", ".join(["1.5"] * (i % 4))) for i in range(1000))
+    filename = write(tmp_path, text)
+    expected = awkward1.tolist(awkward1.fromjson(filename, lines=True))
+    for num_threads in (1, 2, 3, 8, 64):
+        assert awkward1.tolist(awkward1.fromjson(filename, lines=True, num_threads=num_threads)) == expected
+    assert awkward1.tolist(awkward1.fromjson(text, lines=True, num_threads=4)) == expected
+
+    # more threads than lines
+    assert awkward1.tolist(awkward1.fromjson("[1]\n[]\n", lines=True, num_threads=16)) == [[1], []]
+    assert len(awkward1.fromjson(write(tmp_path, ""), lines=True, num_threads=4)) == 0
+
+def test_merge(tmp_path):
+    # partial snapshots with different types are merged into one array
+    filename = write(tmp_path, "1\n2\n3\n4\n" + "1.5\n" * 4 + "\"five\"\n")
+    out = awkward1.fromjson(filename, lines=True, num_threads=3)
+    assert awkward1.tolist(out) == [1, 2, 3, 4, 1.5, 1.5, 1.5, 1.5, "five"]
+
+    # the number of threads changes neither the values nor the type
+    for text in ["true\n1\n", "{\"a\": 1}\n{\"b\": 3}\n", "\"xxxxxxxx\"\n2.5\n1\n", "[1]\n[2.5]\n[true]\n[\"x\"]\n", "null\n{\"a\": [1]}\n{\"a\": [true]}\n"]:
+        filename = write(tmp_path, text)
+        expected = awkward1.fromjson(filename, lines=True, num_threads=1)
+        for num_threads in [2, 3]:
+            out = awkward1.fromjson(filename, lines=True, num_threads=num_threads)
+            assert awkward1.tolist(out) == awkward1.tolist(expected)
+            assert str(out.type) == str(expected.type)
+
+def test_typed(tmp_path):
+    filename = write(tmp_path, "".join("{{\"x\": {0}}}\n".format(i) for i in range(100)))
+    recordtype = awkward1.types.RecordType({"x": awkward1.types.PrimitiveType("int32")})
+    out = awkward1.fromjson(filename, lines=True, num_threads=4, type=recordtype)
+    assert str(out.type) == "100 * {\"x\": int32}"
+    assert awkward1.tolist(out.x) == list(range(100))
+
+def test_errors(tmp_path):
+    filename = write(tmp_path, "[1, 2]\n" * 50 + "[3\n" + "[4]\n" * 50)
+    with pytest.raises(ValueError) as err:
+        awkward1.fromjson(filename, lines=True, num_threads=4)
+    assert "at char {0}".format(len("[1, 2]\n" * 50) + 3) in str(err.value)
+    with pytest.raises(ValueError):
+        awkward1.fromjson(filename, num_threads=4)
+    with pytest.raises(ValueError):
+        awkward1.fromjson(filename, lines=True, num_threads=4, chunksize=10)
@@ -0,0 +1,65 @@
+# BSD 3-Clause License; see https://github.com/jpivarski/awkward-1.0/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import os
+
+import pytest
+import numpy
+
+import awkward1
+
+def write(tmp_path, text):
+    filename = os.path.join(str(tmp_path), "tmp.json")
+    with open(filename, "w") as file:
+        file.write(text)
+    return filename
+
+def test_engine_arguments():
+    with pytest.raises(ValueError):
+        awkward1.fromjson("[1, 2, 3]", engine="ujson")
+    with pytest.raises(ValueError):
+        awkward1.fromjson("[1, 2, 3]", engine="simdjson", type=awkward1.types.PrimitiveType("int64"))
+    with pytest.raises(ValueError):
+        awkward1.fromjson("[1]\n[2]\n", engine="simdjson", lines=True, chunksize=1)
+
+@pytest.mark.skipif(not awkward1._io.has_simdjson, reason="awkward1 was compiled without simdjson")
+def test_same_as_rapidjson(tmp_path):
+    texts = [
+        "[1, 2, 3]",
+        "[1.1, 2, null, 3]",
+        "[[1, 2], [], [3.3]]",
+        "[{\"x\": 1, \"y\": [1.1]}, {\"x\": 2, \"y\": []}, {\"y\": [2.2], \"x\": 3}]",
+        "[\"one\", \"two\", true, false, {\"z\": \"three\"}]",
+        "[]"]
+    for text in texts:
+        expected = awkward1.fromjson(text)
+        out = awkward1.fromjson(text, engine="simdjson")
+        assert awkward1.tolist(out) == awkward1.tolist(expected)
+        assert str(out.type) == str(expected.type)
+        assert awkward1.tolist(awkward1.fromjson(write(tmp_path, text), engine="simdjson")) == awkward1.tolist(expected)
+
+    assert awkward1.tolist(awkward1.fromjson(write(tmp_path, "{\"x\": 1}"), engine="simdjson")) == [{"x": 1}]
+
+def test_small_example():
+    filename = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "studies", "small-example.json")
+    if not awkward1._io.has_simdjson or not os.path.exists(filename):
+        pytest.skip("needs simdjson and studies/small-example.json")
+    assert awkward1.tolist(awkward1.fromjson(filename, engine="simdjson")) == awkward1.tolist(awkward1.fromjson(filename))
+
+@pytest.mark.skipif(not awkward1._io.has_simdjson, reason="awkward1 was compiled without simdjson")
+def test_lines(tmp_path):
+    text = "{\"x\": 1, \"y\": [1.1]}\n{\"x\": 2, \"y\": []}\n\n{\"x\": 3, \"y\": [2.2, 3.3]}\n"
+    expected = awkward1.tolist(awkward1.fromjson(text, lines=True))
+    assert awkward1.tolist(awkward1.fromjson(text, lines=True, engine="simdjson")) == expected
+    assert awkward1.tolist(awkward1.fromjson(write(tmp_path, text), lines=True, engine="simdjson")) == expected
+    assert awkward1.tolist(awkward1.fromjson(write(tmp_path, "[1, 2]\n[]\n[3]\n"), lines=True, engine="simdjson")) == [[1, 2], [], [3]]
+
+@pytest.mark.skipif(not awkward1._io.has_simdjson, reason="awkward1 was compiled without simdjson")
+def test_errors(tmp_path):
+    with pytest.raises(ValueError):
+        awkward1.fromjson("[1, 2", engine="simdjson")
+    with pytest.raises(ValueError):
+        awkward1.fromjson(write(tmp_path, "[1, 2]\n[3\n"), lines=True, engine="simdjson")
+    with pytest.raises(ValueError):
+        awkward1.fromjson(os.path.join(str(tmp_path), "nonexistent.json"), engine="simdjson")
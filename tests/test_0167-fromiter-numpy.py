@@ -0,0 +1,36 @@
+# BSD 3-Clause License; see https://github.com/jpivarski/awkward-1.0/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import pytest
+import numpy
+
+import awkward1
+
+def test_ndarrays():
+    events = [{"x": numpy.array([1.1, 2.2, 3.3]), "n": numpy.int32(3)}, {"x": numpy.array([], dtype=numpy.float64), "n": numpy.int32(0)}, {"x": numpy.array([4.4, 5.5]), "n": numpy.int32(2)}]
+    out = awkward1.Array(events)
+    assert awkward1.tolist(out) == [{"x": [1.1, 2.2, 3.3], "n": 3}, {"x": [], "n": 0}, {"x": [4.4, 5.5], "n": 2}]
+    assert str(out.type) == "3 * {\"x\": var * float64, \"n\": int64}"
+
+    assert awkward1.tolist(awkward1.Array([numpy.arange(6, dtype=numpy.int32).reshape(2, 3), numpy.arange(2, dtype=numpy.uint8).reshape(1, 2)])) == [[[0, 1, 2], [3, 4, 5]], [[0, 1]]]
+    assert str(awkward1.Array([numpy.array([True, False]), numpy.array([], dtype=numpy.bool_)]).type) == "2 * var * bool"
+    assert awkward1.tolist(awkward1.Array([numpy.arange(10)[::3], numpy.arange(4).reshape(2, 2).T])) == [[0, 3, 6, 9], [[0, 2], [1, 3]]]
+
+def test_type_promotion():
+    assert awkward1.tolist(awkward1.Array([numpy.array([1, 2]), numpy.array([1.5])])) == [[1.0, 2.0], [1.5]]
+    assert str(awkward1.Array([numpy.array([1, 2]), numpy.array([1.5])]).type) == "2 * var * float64"
+    assert awkward1.tolist(awkward1.Array([None, numpy.array([1, 2]), [None, 3], numpy.array([4.4])])) == [None, [1, 2], [None, 3], [4.4]]
+    assert awkward1.tolist(awkward1.Array([["one"], numpy.array([1, 2])])) == [["one"], [1, 2]]
+    assert awkward1.tolist(awkward1.Array([(numpy.array([1, 2]), numpy.array([True]))])) == [([1, 2], [True])]
+
+def test_scalars_and_other_dtypes():
+    assert awkward1.tolist(awkward1.Array([numpy.bool_(True), numpy.int8(1), numpy.float32(2.5)])) == [True, 1, 2.5]
+    assert awkward1.tolist(awkward1.Array([numpy.array(5), numpy.array(1.5)])) == [5, 1.5]
+    assert awkward1.tolist(awkward1.Array([numpy.array(["one", "two"])])) == [["one", "two"]]
+
+def test_uint64():
+    assert awkward1.tolist(awkward1.Array([numpy.array([2**63 - 1, 5], dtype=numpy.uint64)])) == [[2**63 - 1, 5]]
+    assert awkward1.tolist(awkward1.Array([numpy.array([], dtype=numpy.uint64)])) == [[]]
+    with pytest.raises(RuntimeError):
+        awkward1.Array([numpy.array([2**64 - 1], dtype=numpy.uint64)])
@@ -0,0 +1,43 @@
+# BSD 3-Clause License; see https://github.com/jpivarski/awkward-1.0/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import pytest
+import numpy
+
+import awkward1
+
+def test_key_order():
+    out = awkward1.Array([{"x": 1, "y": 1.1, "z": "one"}, {"z": "two", "x": 2, "y": 2.2}, {"y": 3.3, "z": "three", "x": 3}])
+    assert awkward1.keys(out) == ["x", "y", "z"]
+    assert awkward1.tolist(out) == [{"x": 1, "y": 1.1, "z": "one"}, {"x": 2, "y": 2.2, "z": "two"}, {"x": 3, "y": 3.3, "z": "three"}]
+
+    # missing and new keys, with many fields
+    keys = ["k{0}".format(i) for i in range(50)]
+    data = [dict((k, i) for k in keys[i % 7:]) for i in range(20)]
+    data.append(dict(data[0], extra=1.5))
+    out = awkward1.Array(data)
+    assert awkward1.keys(out) == keys + ["extra"]
+    assert awkward1.tolist(out) == [dict(dict((k, None) for k in keys + ["extra"]), **x) for x in data]
+
+def test_builder():
+    builder = awkward1.layout.ArrayBuilder()
+    for i in range(3):
+        builder.beginrecord()
+        for key in (["a", "b"] if i % 2 == 0 else ["b", "a"]):
+            builder.field(key)
+            builder.integer(i)
+        builder.endrecord()
+    assert awkward1.tolist(builder.snapshot()) == [{"a": 0, "b": 0}, {"a": 1, "b": 1}, {"a": 2, "b": 2}]
+
+    builder.beginrecord()
+    builder.field("a")
+    builder.integer(3)
+    builder.field("a")
+    builder.integer(4)
+    with pytest.raises(ValueError):
+        builder.endrecord()
+
+def test_unicode_keys():
+    out = awkward1.Array([{u"α": 1, u"β": 2}, {u"β": 3, u"α": 4}])
+    assert awkward1.tolist(out) == [{u"α": 1, u"β": 2}, {u"α": 4, u"β": 3}]
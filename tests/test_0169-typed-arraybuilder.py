@@ -0,0 +1,138 @@
+# BSD 3-Clause License; see https://github.com/jpivarski/awkward-1.0/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import pytest
+import numpy
+
+import awkward1
+
+def test_records():
+    array = awkward1.Array([{"x": 1, "y": [1.1, 2.2], "z": "one"}, {"x": 2, "y": [], "z": None}])
+    builder = awkward1.ArrayBuilder(type=array.type)
+    for x in awkward1.tolist(array):
+        builder.append(x)
+    assert awkward1.tolist(builder.snapshot()) == awkward1.tolist(array)
+    assert str(builder.snapshot().type) == str(array.type)
+
+    builder._layout.clear()
+    assert len(builder) == 0
+    builder.beginrecord()
+    builder.field("z")
+    builder.string("three")
+    builder.field("x")
+    builder.integer(3)
+    builder.field("y")
+    builder.beginlist()
+    builder.endlist()
+    builder.endrecord()
+    assert awkward1.tolist(builder.snapshot()) == [{"x": 3, "y": [], "z": "three"}]
+
+    # non-optional fields can't be left out
+    builder.beginrecord()
+    builder.field("x")
+    builder.integer(4)
+    with pytest.raises(ValueError):
+        builder.endrecord()
+
+def test_primitives():
+    builder = awkward1.ArrayBuilder(type=awkward1.types.PrimitiveType("float32"))
+    builder.integer(1)
+    builder.real(2.5)
+    out = builder.snapshot()
+    assert numpy.asarray(out.layout).dtype == numpy.dtype(numpy.float32)
+    assert awkward1.tolist(out) == [1.0, 2.5]
+
+    builder = awkward1.ArrayBuilder(type=awkward1.types.OptionType(awkward1.types.PrimitiveType("int8")))
+    builder.integer(1)
+    builder.null()
+    builder.integer(-1)
+    assert awkward1.tolist(builder.snapshot()) == [1, None, -1]
+    assert str(builder.type) == "3 * ?int8"
+
+def test_tuples():
+    tupletype = awkward1.types.RecordType((awkward1.types.PrimitiveType("int64"), awkward1.types.ListType(awkward1.types.PrimitiveType("bool"))))
+    builder = awkward1.layout.ArrayBuilder(type=tupletype)
+    builder.begintuple(2)
+    builder.index(0)
+    builder.integer(1)
+    builder.index(1)
+    builder.beginlist()
+    builder.boolean(True)
+    builder.boolean(False)
+    builder.endlist()
+    builder.endtuple()
+    builder.begintuple(2)
+    builder.index(1)
+    builder.beginlist()
+    builder.endlist()
+    builder.index(0)
+    builder.integer(2)
+    builder.endtuple()
+    assert awkward1.tolist(builder.snapshot()) == [(1, [True, False]), (2, [])]
+
+def test_mismatch():
+    int64 = awkward1.types.PrimitiveType("int64")
+    builder = awkward1.ArrayBuilder(type=int64)
+    builder.integer(1)
+    with pytest.raises(ValueError) as err:
+        builder.real(2.5)
+    assert "does not match type" in str(err.value)
+    with pytest.raises(ValueError):
+        builder.null()
+    with pytest.raises(ValueError):
+        builder.beginlist()
+    assert awkward1.tolist(builder.snapshot()) == [1]
+
+    builder = awkward1.ArrayBuilder(type=awkward1.types.RecordType({"x": int64}))
+    builder.beginrecord()
+    with pytest.raises(ValueError):
+        builder.field("y")
+
+    # a mismatch takes out the partly filled value and filling goes on
+    float64 = awkward1.types.PrimitiveType("float64")
+    builder = awkward1.ArrayBuilder(type=awkward1.types.RecordType({"x": int64, "y": float64}))
+    builder.beginrecord()
+    builder.field("x")
+    builder.integer(1)
+    builder.field("y")
+    builder.real(1.1)
+    builder.endrecord()
+    builder.beginrecord()
+    builder.field("x")
+    builder.integer(2)
+    builder.field("y")
+    with pytest.raises(ValueError):
+        builder.string("two")
+    assert [len(x) for x in builder.snapshot().layout.contents] == [1, 1]
+    builder.beginrecord()
+    builder.field("x")
+    builder.integer(3)
+    builder.field("y")
+    builder.real(3.3)
+    builder.endrecord()
+    with pytest.raises(ValueError):
+        builder.endrecord()
+    assert awkward1.tolist(builder.snapshot()) == [{"x": 1, "y": 1.1}, {"x": 3, "y": 3.3}]
+
+    builder = awkward1.ArrayBuilder(type=awkward1.types.ListType(awkward1.types.ListType(int64)))
+    builder.beginlist()
+    builder.beginlist()
+    builder.integer(1)
+    builder.endlist()
+    builder.beginlist()
+    builder.integer(2)
+    with pytest.raises(ValueError):
+        builder.real(2.5)
+    builder.beginlist()
+    builder.beginlist()
+    builder.integer(3)
+    builder.endlist()
+    builder.endlist()
+    assert awkward1.tolist(builder.snapshot()) == [[[3]]]
+    assert awkward1.tolist(builder.snapshot().layout.content) == [[3]]
+
+    with pytest.raises(ValueError):
+        awkward1.ArrayBuilder(type=awkward1.types.UnionType([int64, awkward1.types.ListType(int64)]))
+    with pytest.raises(TypeError):
+        awkward1.ArrayBuilder(type="int64")
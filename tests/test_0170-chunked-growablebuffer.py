@@ -0,0 +1,68 @@
+# BSD 3-Clause License; see https://github.com/jpivarski/awkward-1.0/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import pytest
+import numpy
+
+import awkward1
+
+def test_append():
+    builder = awkward1.layout.ArrayBuilder(initial=3, resize=1.5)
+    for i in range(1000):
+        builder.integer(i)
+    assert awkward1.tolist(builder.snapshot()) == list(range(1000))
+
+    # snapshots keep their data while the builder continues
+    first = builder.snapshot()
+    for i in range(1000, 2000):
+        builder.integer(i)
+    assert awkward1.tolist(first) == list(range(1000))
+    assert awkward1.tolist(builder.snapshot()) == list(range(2000))
+    assert awkward1.tolist(builder[1500:1503]) == [1500, 1501, 1502]
+
+    builder.clear()
+    builder.real(1.5)
+    assert awkward1.tolist(builder.snapshot()) == [1.5]
+
+def test_nested():
+    data = [{"x": i, "y": [j * 1.5 for j in range(i % 5)], "z": str(i)} for i in range(500)]
+    assert awkward1.tolist(awkward1.fromiter(data, initial=1, resize=1.1)) == data
+
+    data = [None if i % 7 == 0 else [i] * (i % 3) for i in range(500)]
+    assert awkward1.tolist(awkward1.fromiter(data, initial=2, resize=2.0)) == data
+
+    # promotion from int64 to float64 reads the chunks back
+    data = list(range(100)) + [1.5]
+    assert awkward1.tolist(awkward1.fromiter(data, initial=1)) == data
+
+def test_extend():
+    data = numpy.arange(1000)
+    out = awkward1.fromiter([data[:10], data[10:400], data[400:], data], initial=4, resize=1.5)
+    assert awkward1.tolist(out) == [list(range(10)), list(range(10, 400)), list(range(400, 1000)), list(range(1000))]
+
+def test_snapshot_interleaved():
+    # a snapshot joins the chunks once; appending afterward never changes
+    # what earlier snapshots contain
+    builder = awkward1.layout.ArrayBuilder(initial=2, resize=1.5)
+    snapshots = []
+    for i in range(300):
+        builder.integer(i)
+        if i % 7 == 0:
+            snapshots.append((i + 1, builder.snapshot()))
+    for length, snapshot in snapshots:
+        assert awkward1.tolist(snapshot) == list(range(length))
+    assert awkward1.tolist(builder.snapshot()) == list(range(300))
+
+def test_snapshot_shares():
+    # the joined buffer keeps the builder's reservation, so appending after a
+    # snapshot fills it in place and the next snapshot doesn't copy again
+    builder = awkward1.layout.ArrayBuilder(initial=2, resize=1.5)
+    for i in range(1000):
+        builder.integer(i)
+    first = numpy.asarray(builder.snapshot())
+    builder.integer(1000)
+    second = numpy.asarray(builder.snapshot())
+    assert second.ctypes.data == first.ctypes.data
+    assert first.tolist() == list(range(1000))
+    assert second.tolist() == list(range(1001))
@@ -0,0 +1,93 @@
+# BSD 3-Clause License; see https://github.com/jpivarski/awkward-1.0/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import ctypes
+import ctypes.util
+import sys
+
+import pytest
+import numpy
+
+import awkward1
+
+def test_finalize():
+    builder = awkward1.ArrayBuilder()
+    for i in range(10):
+        builder.beginrecord()
+        builder.field("x")
+        builder.integer(i)
+        builder.field("y")
+        builder.beginlist()
+        for j in range(i % 3):
+            builder.real(j * 1.5)
+        builder.endlist()
+        builder.endrecord()
+    expected = awkward1.tolist(builder.snapshot())
+
+    out = builder.snapshot(finalize=True)
+    assert awkward1.tolist(out) == expected
+    assert len(builder) == 0
+
+    # the builder starts over without touching the finalized array
+    builder.beginrecord()
+    builder.field("x")
+    builder.integer(100)
+    builder.field("y")
+    builder.beginlist()
+    builder.endlist()
+    builder.endrecord()
+    assert awkward1.tolist(builder.snapshot()) == [{"x": 100, "y": []}]
+    assert awkward1.tolist(out) == expected
+
+def test_trimmed():
+    out = awkward1.fromiter([[1, 2, 3], [], [4.5]], initial=1024)
+    assert awkward1.tolist(out) == [[1, 2, 3], [], [4.5]]
+    assert awkward1.tolist(awkward1.fromiter(numpy.arange(5000), initial=2, resize=1.5)) == list(range(5000))
+
+    typed = awkward1.layout.ArrayBuilder(type=awkward1.types.ListType(awkward1.types.PrimitiveType("float64")))
+    typed.beginlist()
+    typed.real(1.1)
+    typed.endlist()
+    assert awkward1.tolist(typed.snapshot(finalize=True)) == [[1.1]]
+    assert len(typed) == 0
+
+    assert awkward1.tolist(awkward1.fromjson("[[1, 2], [], [3.5]]")) == [[1, 2], [], [3.5]]
+    assert awkward1.tolist(awkward1.fromjson("[[1, 2], [], [3.5]]", type=awkward1.types.ListType(awkward1.types.PrimitiveType("float64")))) == [[1, 2], [], [3.5]]
+
+def test_ownership():
+    builder = awkward1.layout.ArrayBuilder(initial=1024)
+    for x in [[1.5, 2.5, 3.5], [], [4.5]]:
+        builder.beginlist()
+        for y in x:
+            builder.real(y)
+        builder.endlist()
+    before = builder.snapshot()
+    out = builder.snapshot(finalize=True)
+    offsets, content = numpy.asarray(out.offsets), numpy.asarray(out.content)
+
+    # the finalized buffers are trimmed copies, not the builder's reservation
+    assert offsets.ctypes.data != numpy.asarray(before.offsets).ctypes.data
+    assert content.ctypes.data != numpy.asarray(before.content).ctypes.data
+
+    # and the builder's new buffers don't overlap them
+    for i in range(2000):
+        builder.beginlist()
+        builder.real(-1.0)
+        builder.endlist()
+    after = builder.snapshot()
+    assert awkward1.tolist(out) == [[1.5, 2.5, 3.5], [], [4.5]]
+    assert offsets.tolist() == [0, 3, 3, 4]
+    assert numpy.asarray(after.offsets).ctypes.data not in (offsets.ctypes.data, content.ctypes.data)
+
+    if not sys.platform.startswith("linux"):
+        pytest.skip("malloc_usable_size is glibc-only")
+    libc = ctypes.CDLL(ctypes.util.find_library("c"))
+    if not hasattr(libc, "malloc_usable_size"):
+        pytest.skip("malloc_usable_size is glibc-only")
+    libc.malloc_usable_size.restype = ctypes.c_size_t
+    libc.malloc_usable_size.argtypes = [ctypes.c_void_p]
+    for array in (offsets, content):
+        allocated = libc.malloc_usable_size(ctypes.c_void_p(array.ctypes.data))
+        assert array.nbytes <= allocated < array.nbytes + 64
+    assert libc.malloc_usable_size(ctypes.c_void_p(numpy.asarray(before.offsets).ctypes.data)) >= 1024 * 8
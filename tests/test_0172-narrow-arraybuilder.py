@@ -0,0 +1,59 @@
+# BSD 3-Clause License; see https://github.com/jpivarski/awkward-1.0/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import pytest
+import numpy
+
+import awkward1
+
+def fill(builder, data):
+    for x in data:
+        builder.append(x)
+    return builder.snapshot().layout
+
+def test_integers():
+    for data, dtype in [([1, -2, 3], numpy.int8),
+                        ([1, 200], numpy.uint8),
+                        ([-1, 200], numpy.int16),
+                        ([1, 40000], numpy.uint16),
+                        ([-1, 40000], numpy.int32),
+                        ([1, 3000000000], numpy.uint32),
+                        ([-1, 3000000000], numpy.int64)]:
+        out = fill(awkward1.ArrayBuilder(narrow=True), data)
+        assert numpy.asarray(out).dtype == numpy.dtype(dtype)
+        assert awkward1.tolist(out) == data
+
+    out = fill(awkward1.ArrayBuilder(), [1, 2, 3])
+    assert numpy.asarray(out).dtype == numpy.dtype(numpy.int64)
+
+def test_offsets():
+    data = [[1, 2, 3], [], [4, 5]]
+    out = fill(awkward1.ArrayBuilder(narrow=True), data)
+    assert isinstance(out, awkward1.layout.ListOffsetArray32)
+    assert awkward1.tolist(out) == data
+
+    out = fill(awkward1.ArrayBuilder(narrow=True), ["one", "two", "three"])
+    assert isinstance(out, awkward1.layout.ListOffsetArray32)
+    assert awkward1.tolist(out) == ["one", "two", "three"]
+
+    data = [1, "two", [3]]
+    out = fill(awkward1.ArrayBuilder(narrow=True), data)
+    assert isinstance(out, awkward1.layout.UnionArray8_32)
+    assert awkward1.tolist(out) == data
+
+def test_options():
+    data = [1.1, None, 3.3, None, None, 6.6, 7.7, 8.8, None, 10.1]
+    out = fill(awkward1.ArrayBuilder(narrow=True), data)
+    assert isinstance(out, awkward1.layout.BitMaskedArray)
+    assert awkward1.tolist(out) == data
+    assert awkward1.tolist(out[1:4]) == data[1:4]
+    assert awkward1.tolist(awkward1.Array(out)[[0, 1, 2]]) == data[:3]
+
+    data = [[1], None, [2, 3]]
+    out = fill(awkward1.ArrayBuilder(narrow=True), data)
+    assert isinstance(out, awkward1.layout.IndexedOptionArray32)
+    assert awkward1.tolist(out) == data
+
+    out = fill(awkward1.ArrayBuilder(narrow=True), [{"x": 1, "y": None}, {"x": None, "y": 2.2}])
+    assert awkward1.tolist(out) == [{"x": 1, "y": None}, {"x": None, "y": 2.2}]
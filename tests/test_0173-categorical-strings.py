@@ -0,0 +1,76 @@
+# BSD 3-Clause License; see https://github.com/jpivarski/awkward-1.0/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import os
+
+import pytest
+import numpy
+
+import awkward1
+
+def test_builder():
+    data = ["one", "two", "one", "three", "two", "one"]
+    builder = awkward1.ArrayBuilder(categorical=True)
+    for x in data:
+        builder.string(x)
+    out = builder.snapshot()
+    assert isinstance(out.layout, awkward1.layout.IndexedArray32)
+    assert numpy.asarray(out.layout.index).tolist() == [0, 1, 0, 2, 1, 0]
+    assert awkward1.tolist(out.layout.content) == ["one", "two", "three"]
+    assert awkward1.tolist(out) == data
+    assert str(out.type) == "6 * string"
+
+    builder = awkward1.ArrayBuilder(categorical=True)
+    builder.beginlist()
+    builder.string("a")
+    builder.null()
+    builder.string("a")
+    builder.endlist()
+    assert awkward1.tolist(builder.snapshot()) == [["a", None, "a"]]
+
+def test_json(tmp_path):
+    text = "[" + ", ".join("{{\"x\": {0}, \"y\": \"{1}\"}}".format(i, "abc"[i % 3]) for i in range(30)) + "]"
+    out = awkward1.fromjson(text, categorical=True)
+    assert isinstance(out.y.layout, awkward1.layout.IndexedArray32)
+    assert len(out.y.layout.content) == 3
+    assert awkward1.tolist(out) == awkward1.tolist(awkward1.fromjson(text))
+
+    filename = os.path.join(str(tmp_path), "tmp.jsonl")
+    with open(filename, "w") as file:
+        file.write("\"x\"\n\"y\"\n\"x\"\n")
+    assert awkward1.tolist(awkward1.fromjson(filename, lines=True, categorical=True)) == ["x", "y", "x"]
+
+    with pytest.raises(ValueError):
+        awkward1.fromjson(filename, lines=True, num_threads=2, categorical=True)
+
+def test_equal():
+    data = ["one", "two", "one", "three", "", "one"]
+    other = ["one", "one", "one", "thr", "", "two"]
+    array = awkward1.fromiter(data)
+
+    builder = awkward1.ArrayBuilder(categorical=True)
+    for x in data + other:
+        builder.string(x)
+    both = builder.snapshot()
+    one, two = both[:6], both[6:]
+    assert awkward1.tolist(one == two) == [x == y for x, y in zip(data, other)]
+    assert awkward1.tolist(one == array) == [True] * 6
+    assert awkward1.tolist(array == one) == [True] * 6
+
+    builder = awkward1.ArrayBuilder(categorical=True)
+    for x in other:
+        builder.string(x)
+    assert awkward1.tolist(one == builder.snapshot()) == [x == y for x, y in zip(data, other)]
+    assert one.layout.iscategorical and one[[2, 0]].layout.iscategorical
+
+def test_equal_duplicates():
+    # an IndexedArray that the builder didn't mark may repeat strings in its
+    # content, so its indexes say nothing about equality
+    content = awkward1.fromiter(["a", "a", "b"]).layout
+    parameters = {"__array__": "string"}
+    one = awkward1.Array(awkward1.layout.IndexedArray64(awkward1.layout.Index64(numpy.array([0, 2])), content, parameters=parameters))
+    two = awkward1.Array(awkward1.layout.IndexedArray64(awkward1.layout.Index64(numpy.array([1, 2])), content, parameters=parameters))
+    assert not one.layout.iscategorical
+    assert awkward1.tolist(one) == awkward1.tolist(two) == ["a", "b"]
+    assert awkward1.tolist(one == two) == [True, True]
@@ -0,0 +1,124 @@
+# BSD 3-Clause License; see https://github.com/jpivarski/awkward-1.0/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import threading
+
+import pytest
+import numpy
+
+import awkward1
+
+def builders(*datasets):
+    out = []
+    for data in datasets:
+        builder = awkward1.ArrayBuilder()
+        for x in data:
+            builder.append(x)
+        out.append(builder)
+    return out
+
+def test_numbers():
+    out = awkward1.ArrayBuilder.merge(builders([1, 2], [3.5], [], [4]))
+    assert awkward1.tolist(out) == [1.0, 2.0, 3.5, 4.0]
+    assert str(out.type) == "4 * float64"
+
+    out = awkward1.ArrayBuilder.merge(builders([1, 2], [None, 3]))
+    assert awkward1.tolist(out) == [1, 2, None, 3]
+    assert str(out.type) == "4 * ?int64"
+
+    out = awkward1.ArrayBuilder.merge(builders([None], [1.5]))
+    assert awkward1.tolist(out) == [None, 1.5]
+    assert str(out.type) == "2 * ?float64"
+
+    assert len(awkward1.ArrayBuilder.merge(builders([], []))) == 0
+
+def test_nested():
+    one = [{"x": 1, "y": [1.1]}, {"x": 2, "y": []}]
+    two = [{"y": [2, 3], "x": 3.5}, None]
+    three = [{"x": 4, "y": [None]}]
+    out = awkward1.ArrayBuilder.merge(builders(one, two, three))
+    assert awkward1.tolist(out) == one + [{"x": 3.5, "y": [2, 3]}, None] + three
+    assert str(out.type) == "5 * ?{\"x\": float64, \"y\": var * ?float64}"
+
+    out = awkward1.ArrayBuilder.merge(builders(["one", "two"], ["three"]))
+    assert awkward1.tolist(out) == ["one", "two", "three"]
+    assert str(out.type) == "3 * string"
+
+    # different types fall back to unions
+    out = awkward1.ArrayBuilder.merge(builders([1, 2], ["three"], [[4]]))
+    assert awkward1.tolist(out) == [1, 2, "three", [4]]
+
+def serial(*datasets):
+    builder = awkward1.ArrayBuilder()
+    for data in datasets:
+        for x in data:
+            builder.append(x)
+    return builder.snapshot()
+
+@pytest.mark.parametrize("one,two", [
+    ([True], [1]),
+    ([[True]], [[1]]),
+    ([1, "a"], [2.5, "b"]),
+    ([{"x": 1}], [{"y": 2}]),
+    ([{"x": 1}], [{}]),
+    ([{"x": 1, "y": True}], [{"y": 2, "z": "three"}, None]),
+    ([(1, 2.2)], [(3, 4.4), (5,)]),
+])
+def test_same_as_serial(one, two):
+    out = awkward1.ArrayBuilder.merge(builders(one, two))
+    expected = serial(one, two)
+    assert awkward1.tolist(out) == awkward1.tolist(expected)
+    assert str(out.type) == str(expected.type)
+
+def test_threads():
+    parts = [awkward1.ArrayBuilder() for i in range(4)]
+    def fill(builder, i):
+        for j in range(100):
+            builder.beginlist()
+            for k in range(j % 3):
+                builder.integer(i * 1000 + j)
+            builder.endlist()
+    threads = [threading.Thread(target=fill, args=(builder, i)) for i, builder in enumerate(parts)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    out = awkward1.ArrayBuilder.merge(parts)
+    assert awkward1.tolist(out) == [[i * 1000 + j] * (j % 3) for i in range(4) for j in range(100)]
+
+def test_threads_bulk():
+    # large NumPy arrays are appended with the GIL released when asked,
+    # so these (unshared) builders are filled concurrently
+    data = [numpy.arange(i * 100000, (i + 1) * 100000) for i in range(4)]
+    parts = [awkward1.ArrayBuilder() for i in range(4)]
+    def fill(builder, i):
+        for j in range(3):
+            builder.append(data[i], releasegil=True)
+        builder.append([i, i])
+    threads = [threading.Thread(target=fill, args=(builder, i)) for i, builder in enumerate(parts)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    out = awkward1.ArrayBuilder.merge(parts)
+    assert str(out.type) == "16 * var * int64"
+    assert numpy.asarray(awkward1.num(out)).tolist() == [100000, 100000, 100000, 2] * 4
+    expected = numpy.concatenate([numpy.concatenate([x, x, x, [i, i]]) for i, x in enumerate(data)])
+    assert numpy.array_equal(numpy.asarray(awkward1.flatten(out)), expected)
+
+def test_threads_shared():
+    # by default the GIL is held, so threads can share one builder
+    data = numpy.arange(200000)
+    builder = awkward1.ArrayBuilder()
+    def fill():
+        builder.append(data)
+    threads = [threading.Thread(target=fill) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    out = builder.snapshot()
+    assert str(out.type) == "4 * var * int64"
+    for x in out:
+        assert numpy.array_equal(numpy.asarray(x), data)
@@ -0,0 +1,74 @@
+# BSD 3-Clause License; see https://github.com/jpivarski/awkward-1.0/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import struct
+
+import pytest
+import numpy
+
+import awkward1
+
+def serialize(entries, depth, item):
+    def vector(x, level):
+        if level == depth:
+            return item(x)
+        return struct.pack(">I", len(x)) + b"".join(vector(y, level + 1) for y in x)
+    byteoffsets = [0]
+    data = b""
+    for entry in entries:
+        data += vector(entry, 0)
+        byteoffsets.append(len(data))
+    return awkward1.layout.Index64(numpy.array(byteoffsets, dtype=numpy.int64)), awkward1.layout.NumpyArray(numpy.frombuffer(data, dtype=numpy.uint8))
+
+def string(x):
+    x = x.encode("utf-8")
+    if len(x) < 255:
+        return struct.pack(">B", len(x)) + x
+    return struct.pack(">BI", 255, len(x)) + x
+
+entries = [[[1, 2, 3], [], [4]], [], [[5, 6]], [[], []], [[7], [8, 9, 10, 11]]] * 20
+
+def test_native():
+    byteoffsets, rawdata = serialize(entries, 2, lambda x: struct.pack(">d", x))
+    for numthreads in (1, 2, 3, 8, 1000):
+        result = awkward1._io.fromroot_nestedvector(byteoffsets, rawdata, 2, 8, ">d", numthreads=numthreads)
+        assert awkward1.tolist(result) == entries
+        assert numpy.asarray(result.content.content).dtype == numpy.dtype(numpy.float64)
+
+    byteoffsets, rawdata = serialize(entries, 2, lambda x: struct.pack(">h", -x))
+    result = awkward1._io.fromroot_nestedvector(byteoffsets, rawdata, 2, 2, ">h", numthreads=4)
+    assert awkward1.tolist(result) == [[[-z for z in y] for y in x] for x in entries]
+
+def test_empty():
+    byteoffsets, rawdata = serialize([], 1, lambda x: struct.pack(">i", x))
+    result = awkward1._io.fromroot_nestedvector(byteoffsets, rawdata, 1, 4, ">i", numthreads=4)
+    assert awkward1.tolist(result) == []
+
+    byteoffsets, rawdata = serialize([[], []], 1, lambda x: struct.pack(">i", x))
+    assert awkward1.tolist(awkward1._io.fromroot_nestedvector(byteoffsets, rawdata, 1, 4, ">i", numthreads=2)) == [[], []]
+
+def test_bool():
+    data = [[True, False], [], [False, False, True]] * 10
+    byteoffsets, rawdata = serialize(data, 1, lambda x: struct.pack(">?", x))
+    result = awkward1._io.fromroot_nestedvector(byteoffsets, rawdata, 1, 1, "?", numthreads=3)
+    assert awkward1.tolist(result) == data
+    assert numpy.asarray(result.content).dtype == numpy.dtype(numpy.bool_)
+
+def test_string():
+    data = [["one", "two"], [], ["three", "x" * 300, ""]] * 10
+    byteoffsets, rawdata = serialize(data, 1, string)
+    for numthreads in (1, 4):
+        result = awkward1._io.fromroot_nestedvector(byteoffsets, rawdata, 1, 0, "string", numthreads=numthreads)
+        assert awkward1.tolist(result) == data
+    assert str(awkward1.Array(result).type) == "30 * var * string"
+
+    nested = [[["a", "bc"], []], [["def"]]]
+    byteoffsets, rawdata = serialize(nested, 2, string)
+    assert awkward1.tolist(awkward1._io.fromroot_nestedvector(byteoffsets, rawdata, 2, 0, "string")) == nested
+
+def test_truncated():
+    byteoffsets, rawdata = serialize(entries, 2, lambda x: struct.pack(">i", x))
+    rawdata = awkward1.layout.NumpyArray(numpy.asarray(rawdata)[:-2])
+    with pytest.raises(RuntimeError):
+        awkward1._io.fromroot_nestedvector(byteoffsets, rawdata, 2, 4, ">i", numthreads=2)
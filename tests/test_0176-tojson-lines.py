@@ -0,0 +1,65 @@
+# BSD 3-Clause License; see https://github.com/jpivarski/awkward-1.0/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import io
+import os
+import gzip
+import json
+
+import pytest
+import numpy
+
+import awkward1
+
+array = awkward1.Array([{"x": 1, "y": [1.1, 2.2]}, {"x": 2, "y": []}, None, {"x": 3, "y": [3.3]}])
+
+def test_string():
+    assert awkward1.tojson(array, lines=True) == '{"x":1,"y":[1.1,2.2]}\n{"x":2,"y":[]}\nnull\n{"x":3,"y":[3.3]}\n'
+    assert awkward1.tojson(awkward1.Array([]), lines=True) == ""
+    assert awkward1.tojson(array[0], lines=True) == '{"x":1,"y":[1.1,2.2]}\n'
+    assert awkward1.tojson(awkward1.Array(["one", "two"]), lines=True) == '"one"\n"two"\n'
+    with pytest.raises(ValueError):
+        awkward1.tojson(array, lines=True, pretty=True)
+
+def test_roundtrip(tmp_path):
+    filename = os.path.join(str(tmp_path), "tmp.jsonl")
+    awkward1.tojson(array, filename, lines=True)
+    assert awkward1.tolist(awkward1.fromjson(filename, lines=True)) == awkward1.tolist(array)
+
+def test_chunks():
+    class Writer(object):
+        def __init__(self):
+            self.chunks = []
+        def write(self, data):
+            self.chunks.append(data)
+
+    big = awkward1.Array([{"x": i, "y": [1.5] * (i % 5)} for i in range(1000)])
+    writer = Writer()
+    awkward1.tojson(big, writer, lines=True, buffersize=100)
+    assert all(isinstance(x, bytes) for x in writer.chunks)
+    assert all(len(x) == 100 for x in writer.chunks[:-1])
+    lines = b"".join(writer.chunks).decode("utf-8").split("\n")
+    assert lines[-1] == ""
+    assert [json.loads(x) for x in lines[:-1]] == awkward1.tolist(big)
+
+def test_file_like(tmp_path):
+    filename = os.path.join(str(tmp_path), "tmp.jsonl.gz")
+    with gzip.open(filename, "wb") as file:
+        awkward1.tojson(array, file, lines=True)
+    with gzip.open(filename, "rb") as file:
+        assert file.read().decode("utf-8") == awkward1.tojson(array, lines=True)
+
+    # text files get str, even when a chunk boundary splits a character
+    strings = awkward1.Array([u"αβγ" * 10] * 10)
+    text = io.StringIO()
+    awkward1.tojson(strings, text, lines=True, buffersize=7)
+    assert text.getvalue() == awkward1.tojson(strings, lines=True)
+
+    # without lines, a file-like object gets the whole array
+    binary = io.BytesIO()
+    awkward1.tojson(array, binary)
+    assert binary.getvalue().decode("utf-8") == awkward1.tojson(array)
+
+    with pytest.raises(ValueError):
+        awkward1.tojson(array, object(), lines=True)
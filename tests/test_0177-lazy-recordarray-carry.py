@@ -0,0 +1,91 @@
+# BSD 3-Clause License; see https://github.com/jpivarski/awkward-1.0/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import pickle
+
+import pytest
+import numpy
+
+import awkward1
+
+def test_lazy():
+    array = awkward1.Array([{"x": i, "y": [1.1] * (i % 3), "z": str(i)} for i in range(10)])
+    selected = array[array.x % 2 == 0]
+
+    # fields are wrapped, not carried
+    layout = selected.layout
+    assert isinstance(layout, awkward1.layout.RecordArray)
+    for content in layout.contents:
+        assert isinstance(content, awkward1.layout.IndexedArray64)
+        assert len(content.content) == 10
+
+    # reading a field projects it
+    assert isinstance(selected.x.layout, awkward1.layout.NumpyArray)
+    assert awkward1.tolist(selected.x) == [0, 2, 4, 6, 8]
+    assert awkward1.tolist(selected.z) == ["0", "2", "4", "6", "8"]
+    assert awkward1.tolist(selected) == [x for x in awkward1.tolist(array) if x["x"] % 2 == 0]
+    assert str(selected.type) == "5 * {\"x\": int64, \"y\": var * float64, \"z\": string}"
+
+def test_compose():
+    array = awkward1.Array([{"x": i, "y": float(i)} for i in range(10)])
+    twice = array[array.x > 2][[4, 0, 2]]
+    layout = twice.layout
+    assert numpy.asarray(layout.field("x").index).tolist() == [7, 3, 5]
+    assert len(layout.field("x").content) == 10
+
+    # all fields share one composed index
+    x, y = layout.field("x").index, layout.field("y").index
+    assert numpy.asarray(x).ctypes.data == numpy.asarray(y).ctypes.data
+
+    assert awkward1.tolist(twice) == [{"x": 7, "y": 7.0}, {"x": 3, "y": 3.0}, {"x": 5, "y": 5.0}]
+    assert awkward1.tolist(twice[1]) == {"x": 3, "y": 3.0}
+    assert awkward1.sum(twice.y) == 15.0
+
+def test_parameters():
+    # an IndexedArray64 with parameters is a real field, not a deferred carry
+    content = awkward1.layout.NumpyArray(numpy.array([1.1, 2.2, 3.3]))
+    indexed = awkward1.layout.IndexedArray64(awkward1.layout.Index64(numpy.array([2, 1, 0])), content)
+    indexed.setparameter("which", "mine")
+    record = awkward1.layout.RecordArray([indexed], ["x"])
+    out = record[[0, 2]]["x"]
+    assert isinstance(out, awkward1.layout.IndexedArray64)
+    assert out.parameter("which") == "mine"
+    assert awkward1.tolist(out) == [3.3, 1.1]
+
+def test_user_indexedarray():
+    # a parameterless IndexedArray64 the user built is not a deferred carry either
+    content = awkward1.layout.NumpyArray(numpy.array([1.1, 2.2, 3.3]))
+    indexed = awkward1.layout.IndexedArray64(awkward1.layout.Index64(numpy.array([2, 1, 0])), content)
+    assert not indexed.isdeferred
+    record = awkward1.layout.RecordArray([indexed], ["x"])
+    out = record["x"]
+    assert isinstance(out, awkward1.layout.IndexedArray64)
+    assert not out.isdeferred
+    assert isinstance(pickle.loads(pickle.dumps(record)).field("x"), awkward1.layout.IndexedArray64)
+
+    carried = record[[0, 2]]
+    assert carried.field("x").isdeferred
+    assert not carried["x"].isdeferred
+    assert awkward1.tolist(carried["x"]) == [3.3, 1.1]
+
+def test_serialize(tmp_path):
+    events = awkward1.Array(awkward1.layout.RecordArray([awkward1.layout.NumpyArray(numpy.arange(100000)), awkward1.layout.NumpyArray(numpy.arange(100000) * 1.1)], ["x", "y"]))
+    selected = events[events.x < 10]
+    expected = awkward1.tolist(selected)
+
+    # serializers write the selected rows, not the parent columns
+    pickled = pickle.dumps(selected)
+    assert len(pickled) < 10000
+    assert awkward1.tolist(pickle.loads(pickled)) == expected
+
+    form, buffers, length = awkward1.tobuffers(selected)
+    assert sum(x.nbytes for x in buffers.values()) < 1000
+    assert awkward1.tolist(awkward1.frombuffers(form, buffers, length)) == expected
+
+    filename = str(tmp_path / "selected.awkd")
+    awkward1.save(filename, selected)
+    assert awkward1.tolist(awkward1.load(filename)) == expected
+
+    pyarrow = pytest.importorskip("pyarrow")
+    assert awkward1.toarrow(selected).to_pylist() == expected
@@ -0,0 +1,81 @@
+# BSD 3-Clause License; see https://github.com/jpivarski/awkward-1.0/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import threading
+
+import pytest
+import numpy
+
+import awkward1
+
+def work(array):
+    return [
+        awkward1.tolist(array[array.x % 3 == 0].y),
+        awkward1.tolist(awkward1.sum(array.y, axis=1)),
+        awkward1.tolist(awkward1.flatten(array.y)),
+        awkward1.tolist(awkward1.num(array.y)),
+        awkward1.tolist(array.layout["y"].rpad(3, 1)),
+        awkward1.tojson(array),
+        awkward1.tolist(awkward1.fromjson(awkward1.tojson(array))),
+        awkward1.tojson(array, lines=True),
+    ]
+
+def run_threads(function, chunks):
+    results = [None] * len(chunks)
+    errors = []
+    def run(i):
+        try:
+            for repeat in range(5):
+                out = function(chunks[i])
+                assert results[i] is None or results[i] == out
+                results[i] = out
+        except Exception as err:
+            errors.append(err)
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(len(chunks))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    return results
+
+def test_chunks():
+    array = awkward1.Array([{"x": i, "y": [i * 1.5] * (i % 5)} for i in range(2000)])
+    chunks = [array[i:i + 250] for i in range(0, 2000, 250)]
+    expected = [work(chunk) for chunk in chunks]
+    assert run_threads(work, chunks) == expected
+
+def test_shared():
+    # every thread works on the same array (and the same numpy buffers)
+    array = awkward1.Array([{"x": i, "y": [i * 1.5] * (i % 5)} for i in range(500)])
+    expected = work(array)
+    assert run_threads(work, [array] * 8) == [expected] * 8
+
+def test_numpy_lifetime():
+    # layouts whose only reference to a numpy buffer is dropped in another thread
+    def function(i):
+        layout = awkward1.layout.NumpyArray(numpy.arange(1000) * i)
+        return awkward1.tolist(layout[numpy.arange(10, 20)].sum(axis=0))
+    assert run_threads(function, list(range(8))) == [sum(range(10, 20)) * i for i in range(8)]
+
+def test_reduce_sliced():
+    # offsets that don't start at zero (found by test_chunks)
+    array = awkward1.Array([[1.5] * (i % 5) for i in range(20)])
+    assert awkward1.tolist(awkward1.sum(array[5:10], axis=1)) == [0.0, 1.5, 3.0, 4.5, 6.0]
+
+def test_builder_getitem():
+    # slicing a builder snapshots it, while other threads keep appending
+    builder = awkward1.ArrayBuilder()
+    builder.append([1.5, 2.5])
+    def append(i):
+        for j in range(1000):
+            builder.append([i, j])
+        return True
+    def getitem(i):
+        return [awkward1.tolist(builder._layout[0:1]) for j in range(200)]
+    def function(i):
+        return append(i) if i % 2 == 0 else getitem(i)
+    results = run_threads(function, list(range(8)))
+    assert results[1] == [[[1.5, 2.5]]] * 200
+    assert len(builder) == 1 + 4 * 5 * 1000
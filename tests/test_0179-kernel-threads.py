@@ -0,0 +1,72 @@
+# BSD 3-Clause License; see https://github.com/jpivarski/awkward-1.0/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import pytest
+import numpy
+
+import awkward1
+
+@pytest.fixture
+def threads():
+    original = awkward1.get_num_threads()
+    yield
+    awkward1.set_num_threads(original)
+
+def jagged(array):
+    return numpy.asarray(awkward1.num(array)).tolist(), numpy.asarray(awkward1.flatten(array)).tolist()
+
+def work(array):
+    return [
+        jagged(array[array.x % 3 == 0].y[:, :1]),
+        jagged(array.y[numpy.arange(len(array))[::-2]]),
+        numpy.asarray(awkward1.flatten(array.y[::2])).tolist(),
+        numpy.asarray(array.z[array.z > 0.5]).tolist(),
+        numpy.asarray(array.y.layout.compact_offsets64()).tolist(),
+    ]
+
+def test_same_results(threads):
+    length = 200000
+    x = numpy.arange(length)
+    counts = x % 4
+    offsets = numpy.concatenate([[0], numpy.cumsum(counts)])
+    starts, stops = offsets[:-1], offsets[1:]
+    content = awkward1.layout.NumpyArray(numpy.arange(offsets[-1]) * 1.5)
+    y = awkward1.layout.ListArray64(awkward1.layout.Index64(starts), awkward1.layout.Index64(stops), content)
+    z = awkward1.layout.NumpyArray(numpy.random.RandomState(12345).uniform(0, 1, (length, 3)))
+    array = awkward1.Array(awkward1.layout.RecordArray([awkward1.layout.NumpyArray(x), y, z], ["x", "y", "z"]))
+
+    awkward1.set_num_threads(1)
+    assert awkward1.get_num_threads() == 1
+    expected = work(array)
+
+    for n in (2, 4, 7):
+        awkward1.set_num_threads(n)
+        assert awkward1.get_num_threads() == n
+        assert work(array) == expected
+
+    awkward1.set_num_threads(0)
+    assert awkward1.get_num_threads() >= 1
+
+def test_errors(threads):
+    # every thread count reports the first bad item, like the serial loop
+    content = awkward1.layout.NumpyArray(numpy.arange(10))
+    index = numpy.zeros(200000, dtype=numpy.int64)
+    index[150000] = 10
+    index[190000] = 20
+    indexed = awkward1.layout.IndexedArray64(awkward1.layout.Index64(index), content)
+
+    starts = numpy.arange(200000)
+    stops = starts + 1
+    stops[120000] = 0
+    stops[180000] = 0
+    listarray = awkward1.layout.ListArray64(awkward1.layout.Index64(starts), awkward1.layout.Index64(stops), awkward1.layout.NumpyArray(numpy.arange(200001)))
+
+    for n in (1, 4):
+        awkward1.set_num_threads(n)
+        with pytest.raises(ValueError) as err:
+            indexed.project()
+        assert "attempting to get 10, index out of range" in str(err.value)
+        with pytest.raises(ValueError) as err:
+            listarray.compact_offsets64()
+        assert "stops[i] < starts[i]" in str(err.value)
@@ -0,0 +1,66 @@
+# BSD 3-Clause License; see https://github.com/jpivarski/awkward-1.0/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import pytest
+import numpy
+
+import awkward1
+
+@pytest.fixture
+def threads():
+    original = awkward1.get_num_threads()
+    yield
+    awkward1.set_num_threads(original)
+
+def test_numpyarray():
+    data = numpy.arange(30).reshape(10, 3)
+    mask = numpy.array([True, False, False, True, True, False, True, False, False, True])
+    layout = awkward1.layout.NumpyArray(data)
+    assert awkward1.tolist(layout[mask]) == data[mask].tolist()
+    assert awkward1.tolist(layout[mask, 1:]) == data[mask, 1:].tolist()
+    assert awkward1.tolist(layout[mask, 2]) == data[mask, 2].tolist()
+    assert awkward1.tolist(layout[mask, [0, 1, 2, 0, 1]]) == data[mask, [0, 1, 2, 0, 1]].tolist()
+
+    strided = awkward1.layout.NumpyArray(data[::-2, ::2])
+    assert awkward1.tolist(strided[mask[:5]]) == data[::-2, ::2][mask[:5]].tolist()
+
+    assert awkward1.tolist(layout[numpy.zeros(10, dtype=numpy.bool_)]) == []
+    assert awkward1.tolist(layout[numpy.array([True, False, True])]) == [[0, 1, 2], [6, 7, 8]]
+    with pytest.raises(ValueError):
+        layout[numpy.ones(12, dtype=numpy.bool_)]
+
+def test_listoffsetarray():
+    array = awkward1.Array([[1.1, 2.2], [], [3.3], [4.4, 5.5, 6.6], [7.7]])
+    layout = array.layout
+    mask = numpy.array([True, True, False, True, False])
+    out = layout[mask]
+    assert isinstance(out, awkward1.layout.ListArray64)
+    assert awkward1.tolist(out) == awkward1.tolist(layout[[0, 1, 3]])
+    assert awkward1.tolist(layout[mask, :1]) == [[1.1], [], [4.4]]
+    assert awkward1.tolist(layout[1:][mask[1:]]) == [[], [4.4, 5.5, 6.6]]
+
+def test_recordarray():
+    array = awkward1.Array([{"x": i, "y": [i] * (i % 4)} for i in range(10)])
+    mask = numpy.arange(10) % 3 == 0
+    assert awkward1.tolist(array[mask]) == awkward1.tolist(array[[0, 3, 6, 9]])
+    assert awkward1.tolist(array[mask, "x"]) == [0, 3, 6, 9]
+    assert awkward1.tolist(array[mask].y) == [[], [3, 3, 3], [6, 6], [9]]
+
+def test_tostring():
+    assert awkward1.layout._slice_tostring(numpy.array([True, True, False, False, True])) == "[array([0, 1, 4])]"
+
+def test_threads(threads):
+    length = 300000
+    data = numpy.arange(length) * 1.5
+    mask = numpy.random.RandomState(12345).uniform(0, 1, length) > 0.3
+    counts = numpy.arange(length) % 4
+    offsets = numpy.concatenate([[0], numpy.cumsum(counts)])
+    listoffsetarray = awkward1.layout.ListOffsetArray64(awkward1.layout.Index64(offsets), awkward1.layout.NumpyArray(numpy.arange(offsets[-1])))
+
+    for n in (1, 4):
+        awkward1.set_num_threads(n)
+        assert numpy.asarray(awkward1.layout.NumpyArray(data)[mask]).tolist() == data[mask].tolist()
+        out = listoffsetarray[mask]
+        assert numpy.asarray(out.starts).tolist() == offsets[:-1][mask].tolist()
+        assert numpy.asarray(out.stops).tolist() == offsets[1:][mask].tolist()
@@ -0,0 +1,31 @@
+# BSD 3-Clause License; see https://github.com/jpivarski/awkward-1.0/blob/master/LICENSE
+
+from __future__ import absolute_import
+
+import pytest
+import numpy
+
+import awkward1
+
+def test_records():
+    events = awkward1.Array([{"x": i, "muons": [{"pt": i + 0.5 * j} for j in range(i % 3)]} for i in range(20)])
+    view = awkward1.selectionview(events)
+    assert awkward1.selectionview(view).layout is view.layout
+
+    out = view[view.x % 2 == 0][[0, 2, 4, 6, 8]][1:]["muons"]
+    assert isinstance(out.layout, awkward1.layout.IndexedArray64)
+    assert numpy.asarray(out.layout.index).tolist() == [4, 8, 12, 16]
+    assert len(out.layout.content) == 20
+    assert awkward1.tolist(out) == awkward1.tolist(events[events.x % 2 == 0][[0, 2, 4, 6, 8]][1:]["muons"])
+    assert awkward1.tolist(awkward1.sum(out.pt, axis=1)) == [4.0, 16.5, 0.0, 16.0]
+    assert awkward1.tolist(out[1]) == [{"pt": 8.0}, {"pt": 8.5}]
+
+def test_numpyarray():
+    data = numpy.arange(10) * 1.5
+    view = awkward1.selectionview(data)
+    out = view[view > 3][::2][numpy.array([True, False, True, True])]
+    assert numpy.asarray(out.layout.index).tolist() == [3, 7, 9]
+    assert numpy.shares_memory(numpy.asarray(out.layout.content), numpy.asarray(view.layout.content))
+    assert numpy.asarray(out).tolist() == [4.5, 10.5, 13.5]
+    assert awkward1.sum(out) == 28.5
+    assert awkward1.tolist(out + 1) == [5.5, 11.5, 14.5]